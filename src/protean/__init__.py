@@ -1,20 +1,59 @@
 __version__ = "0.17.0"
 
-from .core.aggregate import apply, atomic_change
-from .core.application_service import use_case
-from .core.entity import invariant
-from .core.index import Index
-from .core.queryset import QuerySet, ReadOnlyQuerySet, Record
-from .core.unit_of_work import UnitOfWork
-from .core.value_object import value_object_from_entity
-from .core.view import ReadView
-from .domain import Domain
-from .server import Engine
-from .utils import get_version
-from .utils.globals import current_domain, current_uow, g
-from .utils.mixins import handle, read
-from .utils.processing import Priority, current_priority, processing_priority
-from .utils.query import F, Q
+# The public API is resolved lazily (PEP 562). ``import protean`` is paid by
+# every consumer, including the CLI before it has parsed a single argument, so
+# it must not drag in the domain, the engine, the adapters or their optional
+# dependencies. Each name below is imported from its home module on first
+# attribute access and then cached in the module globals, so later lookups are
+# plain dictionary hits and never reach ``__getattr__`` again.
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .core.aggregate import apply, atomic_change
+    from .core.application_service import use_case
+    from .core.entity import invariant
+    from .core.index import Index
+    from .core.queryset import QuerySet, ReadOnlyQuerySet, Record
+    from .core.unit_of_work import UnitOfWork
+    from .core.value_object import value_object_from_entity
+    from .core.view import ReadView
+    from .domain import Domain
+    from .server import Engine
+    from .utils import get_version
+    from .utils.globals import current_domain, current_uow, g
+    from .utils.mixins import handle, read
+    from .utils.processing import Priority, current_priority, processing_priority
+    from .utils.query import F, Q
+
+# Public name -> the module that defines it.
+_LAZY_EXPORTS: dict[str, str] = {
+    "Domain": "protean.domain",
+    "Engine": "protean.server",
+    "F": "protean.utils.query",
+    "Index": "protean.core.index",
+    "Priority": "protean.utils.processing",
+    "Q": "protean.utils.query",
+    "QuerySet": "protean.core.queryset",
+    "ReadOnlyQuerySet": "protean.core.queryset",
+    "ReadView": "protean.core.view",
+    "Record": "protean.core.queryset",
+    "UnitOfWork": "protean.core.unit_of_work",
+    "apply": "protean.core.aggregate",
+    "atomic_change": "protean.core.aggregate",
+    "current_domain": "protean.utils.globals",
+    "current_priority": "protean.utils.processing",
+    "current_uow": "protean.utils.globals",
+    "g": "protean.utils.globals",
+    "get_version": "protean.utils",
+    "handle": "protean.utils.mixins",
+    "invariant": "protean.core.entity",
+    "processing_priority": "protean.utils.processing",
+    "read": "protean.utils.mixins",
+    "use_case": "protean.core.application_service",
+    "value_object_from_entity": "protean.core.value_object",
+}
 
 __all__ = [
     "Domain",
@@ -42,3 +81,22 @@ __all__ = [
     "use_case",
     "value_object_from_entity",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public name from its home module on first access (PEP 562).
+
+    Unknown names raise ``AttributeError`` so ``hasattr`` probing and
+    ``--doctest-modules`` collection behave as usual.
+    """
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -103,7 +103,9 @@ class InlineBroker(BaseBroker):
     def capabilities(self) -> BrokerCapabilities:
         """InlineBroker provides full manual broker capabilities for testing."""
         return (
-            BrokerCapabilities.RELIABLE_MESSAGING | BrokerCapabilities.DEAD_LETTER_QUEUE
+            BrokerCapabilities.RELIABLE_MESSAGING
+            | BrokerCapabilities.DEAD_LETTER_QUEUE
+            | BrokerCapabilities.DELAYED_REDELIVERY
         )
 
     def _publish(self, stream: str, message: dict[str, Any]) -> str:
@@ -270,8 +272,18 @@ class InlineBroker(BaseBroker):
             self._clear_operation_state(consumer_group, identifier)
             return False
 
-    def _nack(self, stream: str, identifier: str, consumer_group: str) -> bool:
-        """Template method for negative acknowledgment with common logic"""
+    def _nack(
+        self,
+        stream: str,
+        identifier: str,
+        consumer_group: str,
+        delay_seconds: float | None = None,
+    ) -> bool:
+        """Template method for negative acknowledgment with common logic
+
+        *delay_seconds* overrides the broker's own exponential backoff for the
+        redelivery of this message (see ``_nack_delayed``).
+        """
         try:
             # Clean up expired operation states first
             self._cleanup_expired_operation_states()
@@ -325,6 +337,7 @@ class InlineBroker(BaseBroker):
                     message,
                     retry_count,
                     new_retry_count,
+                    delay_seconds,
                 )
             else:
                 return self._handle_nack_max_retries_exceeded(
@@ -339,6 +352,18 @@ class InlineBroker(BaseBroker):
             self._clear_operation_state(consumer_group, identifier)
             return False
 
+    def _nack_delayed(
+        self,
+        stream: str,
+        identifier: str,
+        consumer_group: str,
+        delay_seconds: float,
+    ) -> bool:
+        """Negative acknowledge, redelivering no sooner than *delay_seconds*"""
+        return self._nack(
+            stream, identifier, consumer_group, delay_seconds=delay_seconds
+        )
+
     def _handle_nack_with_retry(
         self,
         stream: str,
@@ -347,6 +372,7 @@ class InlineBroker(BaseBroker):
         message: dict[str, Any],
         retry_count: int,
         new_retry_count: int,
+        delay_seconds: float | None = None,
     ) -> bool:
         """Handle nack with retry"""
         try:
@@ -361,8 +387,12 @@ class InlineBroker(BaseBroker):
             # Update retry count
             self._set_retry_count(stream, consumer_group, identifier, new_retry_count)
 
-            # Calculate next retry time with exponential backoff
-            delay = self._retry_delay * (self._backoff_multiplier**retry_count)
+            # Calculate next retry time with exponential backoff, unless the
+            # caller asked for a specific delay
+            if delay_seconds is None:
+                delay = self._retry_delay * (self._backoff_multiplier**retry_count)
+            else:
+                delay = max(delay_seconds, 0.0)
             next_retry_time = time.time() + delay
 
             # Remove any existing failed message entry
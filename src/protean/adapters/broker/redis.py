@@ -1,5 +1,6 @@
 import json
 import logging
+import math
 import time
 from typing import (
     TYPE_CHECKING,
@@ -35,6 +36,9 @@ PENDING_MESSAGES_MARK = "0"
 # ``__name__`` sentinel, which partition keys can never equal (rejected at
 # record creation), so an internal key never collides with a partition stream.
 PARTITIONS_INDEX_SUFFIX = "__partitions__"  # {category}:__partitions__ (a Set)
+# {stream}:{group}:__redelivery__ (a Sorted Set of message ids scored by the
+# epoch second before which ``nack_delayed`` holds them back).
+REDELIVERY_SCHEDULE_SUFFIX = "__redelivery__"
 
 # Lua scripts backing partition ownership. Each pairs a lease check with the
 # stream operation so the two happen atomically — the fencing token of ADR-0028
@@ -139,6 +143,18 @@ for s = 2, #KEYS do redis.call('DEL', KEYS[s]) end
 return 1
 """
 
+# Extend a key's expiry to an absolute time, never shortening it: what
+# ``EXPIREAT NX`` followed by ``EXPIREAT GT`` does, on servers older than
+# Redis 7.0, which have neither option.
+# KEYS[1]=key; ARGV[1]=unix time to expire at, ARGV[2]=seconds until then.
+_LUA_EXTEND_EXPIRY = """
+local ttl = redis.call('TTL', KEYS[1])
+if ttl == -1 or (ttl >= 0 and ttl < tonumber(ARGV[2])) then
+    return redis.call('EXPIREAT', KEYS[1], ARGV[1])
+end
+return 0
+"""
+
 
 class RedisBroker(BaseBroker):
     """Redis Streams as the Message Broker.
@@ -151,6 +167,8 @@ class RedisBroker(BaseBroker):
         - socket_timeout: Timeout for reading from a connection in seconds
         - socket_connect_timeout: Timeout for connecting to Redis in seconds
         - retry_on_timeout: Whether to retry on timeout (default: False)
+        - pool_timeout: With max_connections, wait up to this many seconds for
+          a free connection instead of failing when the pool is exhausted
     """
 
     __broker__ = "redis"
@@ -175,12 +193,25 @@ class RedisBroker(BaseBroker):
         self._pool_kwargs: dict[str, Any] = {
             key: value for key, value in conn_info.items() if key in self._POOL_KEYS
         }
+        pool_timeout = conn_info.get("pool_timeout")
+        self._pool_timeout: float | None = (
+            float(pool_timeout) if pool_timeout is not None else None
+        )
         self.redis_instance: redis.Redis[Any] | None = None
+        # The bounded pool ``_connect`` creates, if any, for ``close()``
+        self._blocking_pool: redis.BlockingConnectionPool | None = None
         self._connect()
         self._consumer_name = f"consumer-{int(time.time() * 1000)}"
         self._created_groups_set: set[str] = set()
         self._group_creation_times: dict[str, float] = {}  # creation times
 
+        # Redelivery schedule key -> ids held back there via ``nack_delayed``:
+        # by this broker, or found in the schedule when it first used the group
+        # or claimed pending entries. Pending reads only return this consumer's
+        # own entries, so reads and ACKs skip the schedule entirely while this
+        # is empty.
+        self._held_back: dict[str, set[str]] = {}
+
         # Partition-per-key Lua scripts (ADR-0028), registered once. redis-py's
         # register_script only wraps the source (the SHA is derived from it, no
         # server round-trip), so the Script objects survive reconnects; each call
@@ -191,6 +222,7 @@ class RedisBroker(BaseBroker):
         self._lua_read_fenced = self._client.register_script(_LUA_READ_FENCED)
         self._lua_ack_fenced = self._client.register_script(_LUA_ACK_FENCED)
         self._lua_reap_partition = self._client.register_script(_LUA_REAP_PARTITION)
+        self._lua_extend_expiry = self._client.register_script(_LUA_EXTEND_EXPIRY)
 
         # Add compatibility attributes for generic tests
         # Redis Streams handle these differently but tests expect these attributes
@@ -204,7 +236,24 @@ class RedisBroker(BaseBroker):
         # ``conn_info`` is typed ``dict[str, str | bool]`` by the broker port
         # contract; the URI is always a string at runtime.
         uri = cast(str, self.conn_info["URI"])
-        instance: redis.Redis[Any] = redis.Redis.from_url(uri, **self._pool_kwargs)
+        instance: redis.Redis[Any]
+        if self._pool_timeout is not None and "max_connections" in self._pool_kwargs:
+            # Bounded pool shared by every reader thread: a thread that finds
+            # it exhausted waits for a connection instead of raising. A client
+            # given a pool leaves it open on ``close()``, so ``close()``
+            # disconnects it.
+            if self._blocking_pool is not None:
+                # Reconnecting: drop the old pool's idle connections, leaving
+                # any a reader thread still holds to finish their call.
+                # types-redis predates the ``inuse_connections`` argument.
+                self._blocking_pool.disconnect(inuse_connections=False)  # type: ignore[call-arg]
+            pool = redis.BlockingConnectionPool.from_url(
+                uri, timeout=self._pool_timeout, **self._pool_kwargs
+            )
+            instance = redis.Redis(connection_pool=pool)
+            self._blocking_pool = pool
+        else:
+            instance = redis.Redis.from_url(uri, **self._pool_kwargs)
         self.redis_instance = instance
         return instance
 
@@ -226,13 +275,19 @@ class RedisBroker(BaseBroker):
     @property
     def capabilities(self) -> BrokerCapabilities:
         """Redis Streams provide ordered messaging with native consumer groups,
-        blocking reads, dead-letter queues, and partition-per-key streams
-        (ADR-0028)."""
+        blocking reads, dead-letter queues, partition-per-key streams
+        (ADR-0028), delayed redelivery of NACKed messages, pipelined batch
+        acknowledgement, XAUTOCLAIM takeover of idle pending messages, and
+        multi-stream XREADGROUP."""
         return (
             BrokerCapabilities.ORDERED_MESSAGING
             | BrokerCapabilities.BLOCKING_READ
             | BrokerCapabilities.DEAD_LETTER_QUEUE
             | BrokerCapabilities.STREAM_PARTITIONING
+            | BrokerCapabilities.DELAYED_REDELIVERY
+            | BrokerCapabilities.BATCH_ACK
+            | BrokerCapabilities.PENDING_RECLAIM
+            | BrokerCapabilities.MULTI_STREAM_READ
         )
 
     @property
@@ -366,21 +421,15 @@ class RedisBroker(BaseBroker):
             # If we didn't get enough messages, try reading pending messages
             if len(messages) < no_of_messages:
                 remaining = no_of_messages - len(messages)
-                response = self._client.xreadgroup(
-                    consumer_group, self._consumer_name, {stream: "0"}, count=remaining
-                )
-
-                if response and response[0][1]:
-                    seen_ids = {msg[0] for msg in messages}  # Avoid duplicates
-                    for message_id, fields in response[0][1]:
-                        if fields:
-                            redis_id_str = self._decode_if_bytes(message_id)
-                            if redis_id_str not in seen_ids:
-                                message = self._deserialize_message(fields)
-                                messages.append((redis_id_str, message))
-                                seen_ids.add(redis_id_str)
-                                if len(messages) >= no_of_messages:
-                                    break
+                seen_ids = {msg[0] for msg in messages}  # Avoid duplicates
+                for redis_id_str, message in self._read_pending(
+                    stream, consumer_group, self._consumer_name, remaining
+                ):
+                    if redis_id_str not in seen_ids:
+                        messages.append((redis_id_str, message))
+                        seen_ids.add(redis_id_str)
+                        if len(messages) >= no_of_messages:
+                            break
 
         except redis.ResponseError:
             logger.exception("broker.redis.read_failed")
@@ -400,6 +449,8 @@ class RedisBroker(BaseBroker):
         This method uses Redis's XREADGROUP with BLOCK parameter for efficient
         blocking reads, avoiding CPU waste from polling. It first checks for
         pending messages (from previous failed attempts) before reading new messages.
+        Pending messages held back by ``nack_delayed`` are skipped until their
+        delay elapses, so they neither spin nor starve new messages.
 
         Args:
             stream (str): The stream from which to read messages
@@ -414,27 +465,11 @@ class RedisBroker(BaseBroker):
         self._ensure_group(consumer_group, stream)
 
         try:
-            # First, try to read pending messages (messages that were delivered but not ACKed)
-            # Use "0" to read pending messages for this consumer
-            response = self._client.xreadgroup(
-                consumer_group,
-                consumer_name,
-                {stream: "0"},  # "0" means read pending messages
-                count=count,
-                block=0,  # Non-blocking for pending messages
-            )
-
-            # If we got pending messages, return them
-            if response:
-                messages = []
-                for _stream_name, stream_messages in response:
-                    for message_id, fields in stream_messages:
-                        if fields:  # Pending messages might have None fields if they've been claimed
-                            redis_id_str = self._decode_if_bytes(message_id)
-                            message = self._deserialize_message(fields)
-                            messages.append((redis_id_str, message))
-                if messages:
-                    return messages
+            # First, try to read pending messages (messages that were delivered
+            # but not ACKed), skipping any held back by ``nack_delayed``
+            messages = self._read_pending(stream, consumer_group, consumer_name, count)
+            if messages:
+                return messages
 
             # No pending messages, now try to read new messages with blocking
             # Limit blocking timeout to 1000ms (1 second) to ensure signal responsiveness
@@ -504,6 +539,97 @@ class RedisBroker(BaseBroker):
             logger.exception("broker.redis.read_blocking_failed")
             return []
 
+    def _read_blocking_multi(
+        self,
+        streams: list[str],
+        consumer_group: str,
+        consumer_name: str,
+        timeout_ms: int,
+        count: int,
+    ) -> dict[str, list[tuple[str, dict[str, Any]]]]:
+        """Read from several streams of one consumer group with XREADGROUP.
+
+        Pending messages are read first, with one XREADGROUP over every stream
+        (streams with messages held back by ``nack_delayed`` go through
+        ``_read_pending`` instead). Only when nothing is pending does a single
+        blocking XREADGROUP wait on all the streams for new messages.
+        """
+        for stream in streams:
+            self._ensure_group(consumer_group, stream)
+
+        try:
+            results: dict[str, list[tuple[str, dict[str, Any]]]] = {}
+            untracked = []
+            for stream in streams:
+                if self._held_back.get(
+                    self._redelivery_schedule_key(stream, consumer_group)
+                ):
+                    messages = self._read_pending(
+                        stream, consumer_group, consumer_name, count
+                    )
+                    if messages:
+                        results[stream] = messages
+                else:
+                    untracked.append(stream)
+
+            if untracked:
+                response = self._client.xreadgroup(
+                    consumer_group,
+                    consumer_name,
+                    dict.fromkeys(untracked, PENDING_MESSAGES_MARK),
+                    count=count,
+                )
+                results.update(self._group_by_stream(response))
+            if results:
+                return results
+
+            # Limit blocking timeout to 1000ms (1 second) to ensure signal
+            # responsiveness, as in ``_read_blocking``. BLOCK 0 would wait
+            # forever, so a zero timeout does not block at all.
+            response = self._client.xreadgroup(
+                consumer_group,
+                consumer_name,
+                dict.fromkeys(streams, NEW_MESSAGES_MARK),
+                count=count,
+                block=min(timeout_ms, 1000) if timeout_ms > 0 else None,
+            )
+            return self._group_by_stream(response)
+
+        except redis.ResponseError as e:
+            if "NOGROUP" in str(e):
+                # A group vanished (e.g. the stream was flushed): forget the
+                # cached groups so the next read recreates them
+                for stream in streams:
+                    self._created_groups_set.discard(
+                        f"{stream}{CONSUMER_GROUP_SEPARATOR}{consumer_group}"
+                    )
+                return {}
+            logger.exception("broker.redis.read_blocking_multi_failed")
+            return {}
+        except Exception as e:
+            if self._is_connection_error(e):
+                self._ensure_connection()
+            logger.exception("broker.redis.read_blocking_multi_failed")
+            return {}
+
+    def _group_by_stream(
+        self, response: Any
+    ) -> dict[str, list[tuple[str, dict[str, Any]]]]:
+        """Decode an XREADGROUP response into messages keyed by stream.
+
+        Entries without fields (deleted while pending) are skipped.
+        """
+        results: dict[str, list[tuple[str, dict[str, Any]]]] = {}
+        for stream_name, stream_messages in response or []:
+            messages = [
+                (self._decode_if_bytes(message_id), self._deserialize_message(fields))
+                for message_id, fields in stream_messages
+                if fields
+            ]
+            if messages:
+                results[self._decode_if_bytes(stream_name)] = messages
+        return results
+
     def _ack(self, stream: str, identifier: str, consumer_group: str) -> bool:
         """Acknowledge message using Redis Streams XACK
 
@@ -511,11 +637,22 @@ class RedisBroker(BaseBroker):
         the pending list and cannot be ACKed again.
         """
         try:
-            # redis-stubs leaves xack without type annotations, so mypy --strict
-            # flags the call as untyped. Stub gap, not a defect in this code.
-            result = self._client.xack(  # type: ignore[no-untyped-call]
-                stream, consumer_group, identifier
-            )
+            schedule_key = self._redelivery_schedule_key(stream, consumer_group)
+            if identifier in self._held_back.get(schedule_key, ()):
+                # Acknowledged while held back: clear its schedule entry in the
+                # same round-trip
+                pipe = self._client.pipeline(transaction=False)
+                pipe.xack(stream, consumer_group, identifier)
+                pipe.zrem(schedule_key, identifier)
+                result = pipe.execute()[0]
+                self._forget_held_back(schedule_key, [identifier])
+            else:
+                # redis-stubs leaves xack without type annotations, so mypy
+                # --strict flags the call as untyped. Stub gap, not a defect in
+                # this code. Pipeline methods are typed, so the call above is not.
+                result = self._client.xack(  # type: ignore[no-untyped-call]
+                    stream, consumer_group, identifier
+                )
             # result is the number of messages successfully acknowledged
             # 0 means the message was not pending (already ACKed or doesn't exist)
             # 1 means the message was successfully acknowledged
@@ -527,6 +664,36 @@ class RedisBroker(BaseBroker):
             logger.exception("broker.redis.ack_failed")
             return False
 
+    def _ack_many(
+        self, stream: str, identifiers: list[str], consumer_group: str
+    ) -> list[bool]:
+        """Acknowledge a batch with one pipelined round-trip.
+
+        A single variadic XACK only reports how many ids it removed, so each id
+        gets its own XACK inside a non-transactional pipeline to keep per-message
+        results. Held-back redelivery entries, if any, are cleared in the same
+        trip.
+        """
+        try:
+            pipe = self._client.pipeline(transaction=False)
+            for identifier in identifiers:
+                pipe.xack(stream, consumer_group, identifier)
+            schedule_key = self._redelivery_schedule_key(stream, consumer_group)
+            held_back = self._held_back.get(schedule_key, set()) & set(identifiers)
+            if held_back:
+                pipe.zrem(schedule_key, *held_back)
+            results = pipe.execute()
+            self._forget_held_back(schedule_key, held_back)
+            return [bool(result) for result in results[: len(identifiers)]]
+        except redis.ResponseError as e:
+            logger.warning(
+                f"Failed to ack {len(identifiers)} messages in {stream}: {e}"
+            )
+            return [False] * len(identifiers)
+        except Exception:
+            logger.exception("broker.redis.ack_many_failed")
+            return [False] * len(identifiers)
+
     def _nack(self, stream: str, identifier: str, consumer_group: str) -> bool:
         """Negative acknowledge - message remains in pending list for reprocessing
 
@@ -552,6 +719,164 @@ class RedisBroker(BaseBroker):
             logger.exception("broker.redis.nack_failed")
             return False
 
+    def _nack_delayed(
+        self,
+        stream: str,
+        identifier: str,
+        consumer_group: str,
+        delay_seconds: float,
+    ) -> bool:
+        """Negative acknowledge, holding the message back for *delay_seconds*.
+
+        The message stays in the pending list as with ``_nack``; its id is also
+        scored in ``{stream}:{group}:__redelivery__`` with the time it becomes
+        due, which ``_read_blocking`` consults before returning pending messages.
+        Keeping the delay in Redis means it survives a worker restart.
+        """
+        try:
+            self._ensure_group(consumer_group, stream)
+
+            if not self._is_message_pending(stream, consumer_group, identifier):
+                return False
+
+            schedule_key = self._redelivery_schedule_key(stream, consumer_group)
+            due = time.time() + max(delay_seconds, 0.0)
+            # Entries past their due time mean the same as no entry, so the key
+            # only needs to outlive its latest due time. The expiry is only
+            # ever extended; a schedule orphaned by a dead worker therefore
+            # expires instead of lingering.
+            expire_at = math.ceil(due) + 1
+            pipe = self._client.pipeline(transaction=False)
+            pipe.zadd(schedule_key, {identifier: due})
+            self._lua_extend_expiry(
+                keys=[schedule_key],
+                args=[expire_at, math.ceil(expire_at - time.time())],
+                client=pipe,
+            )
+            pipe.execute()
+            self._held_back.setdefault(schedule_key, set()).add(identifier)
+            logger.debug(
+                f"Message {identifier} in {stream} held back for "
+                f"{delay_seconds:.3f}s before redelivery"
+            )
+            return True
+
+        except Exception:
+            logger.exception("broker.redis.nack_delayed_failed")
+            return False
+
+    def _redelivery_schedule_key(self, stream: str, consumer_group: str) -> str:
+        """Return the Sorted Set key holding *consumer_group*'s held-back ids."""
+        return (
+            f"{stream}{CONSUMER_GROUP_SEPARATOR}{consumer_group}"
+            f"{CONSUMER_GROUP_SEPARATOR}{REDELIVERY_SCHEDULE_SUFFIX}"
+        )
+
+    def _adopt_redelivery_schedule(self, stream: str, consumer_group: str) -> None:
+        """Add the ids still held back in the persisted schedule to the local index.
+
+        The schedule outlives the process that wrote it. Reading it here, when
+        this broker first uses an existing group and whenever it claims pending
+        entries, keeps a restarted worker from redelivering held-back messages
+        before their delay elapses.
+        """
+        schedule_key = self._redelivery_schedule_key(stream, consumer_group)
+        not_due = self._client.zrangebyscore(schedule_key, f"({time.time()}", "+inf")
+        if not_due:
+            self._held_back.setdefault(schedule_key, set()).update(
+                self._decode_if_bytes(member) for member in not_due
+            )
+
+    def _forget_held_back(self, schedule_key: str, identifiers: Any) -> None:
+        """Drop *identifiers* from the local index of held-back messages."""
+        held_back = self._held_back.get(schedule_key)
+        if held_back is None:
+            return
+        held_back.difference_update(identifiers)
+        if not held_back:
+            del self._held_back[schedule_key]
+
+    def _read_pending(
+        self, stream: str, consumer_group: str, consumer_name: str, count: int
+    ) -> list[tuple[str, dict[str, Any]]]:
+        """Read up to *count* of this consumer's pending messages that are due.
+
+        Messages held back by ``nack_delayed`` are skipped until their delay
+        elapses. When this broker holds nothing back on the stream, this is a
+        single XREADGROUP; otherwise the schedule is pruned and the pending
+        list scanned in one pipelined round-trip, over-scanning by the
+        held-back count so those entries cannot crowd out due ones, and the due
+        entries are then fetched with XCLAIM.
+
+        Every entry a history XREADGROUP returns has its delivery counter
+        bumped, so reading past held-back entries would count a delivery on
+        each poll. XPENDING leaves the counter alone, and XCLAIM bumps it only
+        for the entries actually redelivered, which keeps ``delivery_count``
+        an exact attempt count across restarts.
+        """
+        schedule_key = self._redelivery_schedule_key(stream, consumer_group)
+        tracked = self._held_back.get(schedule_key)
+
+        if tracked:
+            now = time.time()
+            pipe = self._client.pipeline(transaction=False)
+            pipe.zremrangebyscore(schedule_key, "-inf", now)
+            pipe.zrangebyscore(schedule_key, f"({now}", "+inf")
+            pipe.xpending_range(
+                stream,
+                consumer_group,
+                min="-",
+                max="+",
+                count=count + len(tracked),
+                consumername=consumer_name,
+            )
+            _, not_due, pending = pipe.execute()
+            held_back = {self._decode_if_bytes(member) for member in not_due}
+            # Whatever is no longer scheduled has come due (or was cleared)
+            self._forget_held_back(schedule_key, tracked - held_back)
+
+            due = [
+                message_id
+                for message_id in (
+                    self._decode_if_bytes(entry["message_id"]) for entry in pending
+                )
+                if message_id not in held_back
+            ][:count]
+            stream_messages = (
+                # redis-stubs leaves xclaim without type annotations (stub gap)
+                self._client.xclaim(  # type: ignore[no-untyped-call]
+                    stream,
+                    consumer_group,
+                    consumer_name,
+                    min_idle_time=0,
+                    message_ids=due,
+                )
+                if due
+                else []
+            )
+            response = [(stream, stream_messages)]
+        else:
+            response = self._client.xreadgroup(
+                consumer_group,
+                consumer_name,
+                {stream: PENDING_MESSAGES_MARK},
+                count=count,
+            )
+
+        messages: list[tuple[str, dict[str, Any]]] = []
+        for _stream_name, stream_messages in response or []:
+            for message_id, fields in stream_messages:
+                # Pending messages might have None fields if they've been claimed
+                if not fields:
+                    continue
+                messages.append(
+                    (
+                        self._decode_if_bytes(message_id),
+                        self._deserialize_message(fields),
+                    )
+                )
+        return messages
+
     def _is_message_pending(
         self, stream: str, consumer_group: str, identifier: str
     ) -> bool:
@@ -582,6 +907,79 @@ class RedisBroker(BaseBroker):
 
         return True
 
+    def _reclaim_pending(
+        self,
+        stream: str,
+        consumer_group: str,
+        consumer_name: str,
+        min_idle_ms: int,
+        start_id: str,
+        count: int,
+    ) -> tuple[str, list[str]]:
+        """Claim one page of idle pending entries into *consumer_name*.
+
+        Pages through ``XPENDING ... IDLE`` and claims the page with
+        ``XCLAIM ... JUSTID``: only ownership moves, no payloads travel, and the
+        delivery counter is left for the redelivering read to bump. (redis-py
+        drops the cursor from ``XAUTOCLAIM ... JUSTID`` replies, so it cannot
+        page.) XCLAIM re-checks the idle time, so an entry another consumer
+        touched in between stays where it is. A missing group means there is
+        nothing to reclaim.
+        """
+        done = STREAM_ID_START + "-0"
+        try:
+            pending = self._client.xpending_range(
+                stream,
+                consumer_group,
+                min=start_id,
+                max="+",
+                count=count,
+                idle=min_idle_ms,
+            )
+            idle_ids = [self._decode_if_bytes(entry["message_id"]) for entry in pending]
+            reply = (
+                # redis-stubs leaves xclaim without type annotations (stub gap)
+                self._client.xclaim(  # type: ignore[no-untyped-call]
+                    stream,
+                    consumer_group,
+                    consumer_name,
+                    min_idle_time=min_idle_ms,
+                    message_ids=idle_ids,
+                    justid=True,
+                )
+                if idle_ids
+                else []
+            )
+        except redis.ResponseError as e:
+            if "NOGROUP" in str(e):
+                return done, []
+            raise
+        claimed = [self._decode_if_bytes(message_id) for message_id in reply]
+        if claimed:
+            # Claimed entries keep whatever delay their last consumer set
+            self._adopt_redelivery_schedule(stream, consumer_group)
+        if len(idle_ids) < count:
+            return done, claimed
+        # Resume just past the last entry examined
+        ms, seq = self._stream_id_sort_key(idle_ids[-1])
+        return f"{ms}-{seq + 1}", claimed
+
+    def _delivery_count(
+        self, stream: str, identifier: str, consumer_group: str
+    ) -> int | None:
+        """Read the delivery counter of a pending message from XPENDING."""
+        try:
+            pending_info = self._client.xpending_range(
+                stream, consumer_group, min=identifier, max=identifier, count=1
+            )
+        except redis.ResponseError as e:
+            logger.debug(f"Redis error during XPENDING: {e}")
+            return None
+
+        if not pending_info:
+            return None
+        return int(pending_info[0]["times_delivered"])
+
     # ------------------------------------------------------------------
     # DLQ Management
     # ------------------------------------------------------------------
@@ -852,6 +1250,10 @@ class RedisBroker(BaseBroker):
                 # Track creation time for existing groups too
                 if group_name not in self._group_creation_times:
                     self._group_creation_times[group_name] = time.time()
+                # An existing group may have messages held back by a worker
+                # that has since restarted, or by another worker
+                if stream is not None:
+                    self._adopt_redelivery_schedule(stream, group_name)
             else:
                 logger.warning(
                     f"Failed to create consumer group {group_name} for stream {stream}: {e}"
@@ -1325,6 +1727,9 @@ class RedisBroker(BaseBroker):
                 self.redis_instance.close()
                 self.redis_instance = None
                 logger.debug("Closed Redis broker connection: %s", self.name)
+            if self._blocking_pool is not None:
+                self._blocking_pool.disconnect()
+                self._blocking_pool = None
         except Exception:
             logger.exception("Error closing Redis broker %s", self.name)
 
@@ -1,23 +1,95 @@
 import collections.abc
+import heapq
+import json
 import math
 import time
-from collections.abc import Iterator
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
 from fnmatch import fnmatchcase
 from threading import RLock
 from typing import Any
 
 from protean.core.projection import BaseProjection
+from protean.exceptions import ConfigurationError
 from protean.port.cache import BaseCache, TTLValue
 from protean.utils.inflection import underscore
 from protean.utils.reflection import id_field
+from protean.utils.telemetry import get_domain_metrics
+
+# Separates a key's projection prefix from its identifier (`MemoryCache` keys
+# are `<projection>:::<id>`). `TTLDict` indexes keys by this prefix.
+PREFIX_SEPARATOR = ":::"
+
+EVICTION_POLICIES = ("lru", "lfu")
+
+
+def _prefix_of(key: str) -> str | None:
+    prefix, separator, _rest = key.partition(PREFIX_SEPARATOR)
+    return prefix if separator else None
+
+
+def _literal_prefix_of(key_pattern: str) -> str | None:
+    """The projection prefix every key matching `key_pattern` shares, if any."""
+    prefix = _prefix_of(key_pattern)
+    return None if prefix is None or any(c in prefix for c in "*?[") else prefix
+
+
+def _sizeof(value: Any) -> int:
+    """Approximate size of a cached value, in bytes of its JSON encoding."""
+    return len(json.dumps(value, default=str))
 
 
 class TTLDict(collections.abc.MutableMapping[str, Any]):
+    """A thread-safe mapping whose entries expire, optionally size-bounded.
+
+    Expiry is driven by a min-heap of `(expire, key)` pairs. Every operation
+    first pops the entries that have come due, so expired entries are dropped
+    in amortised `O(log n)` each instead of by scanning every key. A heap pair
+    whose key was since rewritten or re-timed is stale and skipped.
+
+    With `max_entries` or `max_bytes`, a write that takes the mapping past a
+    bound evicts entries until it fits: the least recently used one (`"lru"`)
+    or the least frequently used one, oldest first on ties (`"lfu"`). The size
+    of an entry is the length of its JSON encoding.
+
+    Keys of the form `<prefix>:::<rest>` are indexed by prefix, so
+    `keys_with_prefix` answers without a scan.
+
+    `on_evict`, when given, is called with the number of entries dropped and
+    the reason, `"expired"` or `"capacity"`.
+    """
+
     def __init__(
-        self, default_ttl: int | float | None, *args: Any, **kwargs: Any
+        self,
+        default_ttl: int | float | None,
+        *args: Any,
+        max_entries: int | None = None,
+        max_bytes: int | None = None,
+        eviction: str = "lru",
+        on_evict: Callable[[int, str], None] | None = None,
+        **kwargs: Any,
     ) -> None:
+        if eviction not in EVICTION_POLICIES:
+            raise ValueError(
+                f"Unknown eviction policy {eviction!r}, "
+                f"expected one of {', '.join(EVICTION_POLICIES)}"
+            )
         self._default_ttl = default_ttl
-        self._values: dict[str, tuple[float | None, Any]] = {}
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._eviction = eviction
+        self._on_evict = on_evict
+
+        # Insertion order doubles as recency order for LRU eviction
+        self._values: OrderedDict[str, tuple[float | None, Any]] = OrderedDict()
+        self._expiry_heap: list[tuple[float, str]] = []
+        self._by_prefix: dict[str, set[str]] = {}
+        self._sizes: dict[str, int] = {}
+        self._total_bytes = 0
+        # LFU bookkeeping: use count per key, and keys per count in use order
+        self._uses: dict[str, int] = {}
+        self._by_uses: dict[int, OrderedDict[str, None]] = {}
+
         self._lock = RLock()
         self.update(*args, **kwargs)
 
@@ -26,13 +98,20 @@ class TTLDict(collections.abc.MutableMapping[str, Any]):
             f"<TTLDict@{id(self):#08x}; ttl={self._default_ttl!r}, v={self._values!r};>"
         )
 
+    @property
+    def bounded(self) -> bool:
+        return self._max_entries is not None or self._max_bytes is not None
+
+    @property
+    def total_bytes(self) -> int:
+        """Approximate size of all entries; only tracked with `max_bytes`."""
+        return self._total_bytes
+
     def set_ttl(self, key: str, ttl: int | float, now: float | None = None) -> None:
         """Set TTL for the given key"""
         if now is None:
             now = time.time()
-        with self._lock:
-            _expire, value = self._values[key]
-            self._values[key] = (now + ttl, value)
+        self.expire_at(key, now + ttl)
 
     def get_ttl_or_none(self, key: str) -> float | None:
         """Remaining TTL for a key, or ``None`` when it is absent or expired.
@@ -60,6 +139,7 @@ class TTLDict(collections.abc.MutableMapping[str, Any]):
         with self._lock:
             _expire, value = self._values[key]
             self._values[key] = (timestamp, value)
+            self._schedule(key, timestamp)
 
     def is_expired(
         self, key: str, now: float | None = None, remove: bool = False
@@ -73,38 +153,182 @@ class TTLDict(collections.abc.MutableMapping[str, Any]):
                 return False
             expired = expire < now
             if expired and remove:
-                self.__delitem__(key)
+                self._discard(key)
+                self._evicted(1, "expired")
             return expired
 
+    def keys_with_prefix(self, prefix: str) -> list[str]:
+        """Live keys of the form `<prefix>:::<rest>`, read from the prefix index."""
+        with self._lock:
+            self._purge_expired()
+            return list(self._by_prefix.get(prefix, ()))
+
     def __len__(self) -> int:
         with self._lock:
-            for key in list(self._values.keys()):
-                self.is_expired(key, remove=True)
+            self._purge_expired()
             return len(self._values)
 
     def __iter__(self) -> Iterator[str]:
+        # Snapshot under the lock, so callers never hold it while iterating
         with self._lock:
-            for key in self._values:
-                if not self.is_expired(key):
-                    yield key
+            self._purge_expired()
+            keys = list(self._values)
+        yield from keys
+
+    def __contains__(self, key: object) -> bool:
+        with self._lock:
+            if key not in self._values:
+                return False
+            assert isinstance(key, str)
+            return not self.is_expired(key, remove=True)
 
     def __setitem__(self, key: str, value: Any) -> None:
         with self._lock:
+            self._purge_expired()
+
             expire: float | None
             if self._default_ttl is None:
                 expire = None
             else:
                 expire = time.time() + self._default_ttl
+
+            if key in self._values:
+                self._values.move_to_end(key)
+                self._touch(key)
+            else:
+                self._index(key)
             self._values[key] = (expire, value)
+            if expire is not None:
+                self._schedule(key, expire)
+
+            if self._max_bytes is not None:
+                size = _sizeof(value)
+                self._total_bytes += size - self._sizes.get(key, 0)
+                self._sizes[key] = size
+
+            if self.bounded:
+                self._evict_to_fit(keep=key)
 
     def __delitem__(self, key: str) -> None:
         with self._lock:
-            del self._values[key]
+            if key not in self._values:
+                raise KeyError(key)
+            self._discard(key)
 
     def __getitem__(self, key: str) -> Any:
         with self._lock:
             self.is_expired(key, remove=True)
-            return self._values[key][1]
+            _expire, value = self._values[key]
+            if self.bounded:
+                self._values.move_to_end(key)
+                self._touch(key)
+            return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+            self._expiry_heap.clear()
+            self._by_prefix.clear()
+            self._sizes.clear()
+            self._total_bytes = 0
+            self._uses.clear()
+            self._by_uses.clear()
+
+    def _schedule(self, key: str, expire: float) -> None:
+        heapq.heappush(self._expiry_heap, (expire, key))
+        # Rewrites and re-timings leave stale pairs behind; rebuild the heap
+        # from the live entries once they outnumber them.
+        if len(self._expiry_heap) > 2 * len(self._values) + 64:
+            self._expiry_heap = [
+                (entry_expire, entry_key)
+                for entry_key, (entry_expire, _value) in self._values.items()
+                if entry_expire is not None
+            ]
+            heapq.heapify(self._expiry_heap)
+
+    def _purge_expired(self, now: float | None = None) -> None:
+        if now is None:
+            now = time.time()
+        heap = self._expiry_heap
+        purged = 0
+        while heap and heap[0][0] < now:
+            expire, key = heapq.heappop(heap)
+            entry = self._values.get(key)
+            if entry is not None and entry[0] == expire:
+                self._discard(key)
+                purged += 1
+        if purged:
+            self._evicted(purged, "expired")
+
+    def _index(self, key: str) -> None:
+        prefix = _prefix_of(key)
+        if prefix is not None:
+            self._by_prefix.setdefault(prefix, set()).add(key)
+        if self._eviction == "lfu" and self.bounded:
+            self._uses[key] = 1
+            self._by_uses.setdefault(1, OrderedDict())[key] = None
+
+    def _touch(self, key: str) -> None:
+        if self._eviction != "lfu" or key not in self._uses:
+            return
+        uses = self._uses[key]
+        self._unlist_use(key, uses)
+        self._uses[key] = uses + 1
+        self._by_uses.setdefault(uses + 1, OrderedDict())[key] = None
+
+    def _unlist_use(self, key: str, uses: int) -> None:
+        bucket = self._by_uses[uses]
+        del bucket[key]
+        if not bucket:
+            del self._by_uses[uses]
+
+    def _discard(self, key: str) -> None:
+        """Drop *key* and its index entries. Heap pairs are left to go stale."""
+        del self._values[key]
+        prefix = _prefix_of(key)
+        if prefix is not None:
+            keys = self._by_prefix[prefix]
+            keys.discard(key)
+            if not keys:
+                del self._by_prefix[prefix]
+        self._total_bytes -= self._sizes.pop(key, 0)
+        uses = self._uses.pop(key, None)
+        if uses is not None:
+            self._unlist_use(key, uses)
+
+    def _over_capacity(self) -> bool:
+        return (
+            self._max_entries is not None and len(self._values) > self._max_entries
+        ) or (self._max_bytes is not None and self._total_bytes > self._max_bytes)
+
+    def _evict_to_fit(self, keep: str) -> None:
+        """Evict entries other than *keep* until the bounds hold again.
+
+        An entry that alone exceeds `max_bytes` is kept rather than evicting
+        everything else for nothing.
+        """
+        evicted = 0
+        while self._over_capacity() and len(self._values) > 1:
+            victim = self._victim(keep)
+            self._discard(victim)
+            evicted += 1
+        if evicted:
+            self._evicted(evicted, "capacity")
+
+    def _victim(self, keep: str) -> str:
+        if self._eviction == "lfu":
+            for uses in sorted(self._by_uses):
+                for key in self._by_uses[uses]:
+                    if key != keep:
+                        return key
+        for key in self._values:
+            if key != keep:
+                return key
+        raise KeyError("No entry to evict")  # pragma: no cover - len > 1 above
+
+    def _evicted(self, count: int, reason: str) -> None:
+        if self._on_evict is not None:
+            self._on_evict(count, reason)
 
 
 class MemoryCache(BaseCache):
@@ -115,11 +339,48 @@ class MemoryCache(BaseCache):
         conn_info["cache"] = "memory"
         super().__init__(name, domain, conn_info)
 
-        # The Data Cache
-        self._db = TTLDict(self.ttl)
+        # The Data Cache, optionally bounded by entry count and/or size
+        self._db = TTLDict(
+            self.ttl,
+            max_entries=self._bound("max_entries"),
+            max_bytes=self._bound("max_bytes"),
+            eviction=self._eviction_policy(),
+            on_evict=self._record_evictions,
+        )
 
         self._lock = RLock()
 
+    def _bound(self, option: str) -> int | None:
+        """Resolve a size bound from `conn_info`: unset, or a positive integer.
+
+        Like the TTL, a bound may arrive as a string from environment
+        substitution.
+        """
+        value = self.conn_info.get(option)
+        if value is None or value == "":
+            return None
+        text = str(value).strip()
+        if isinstance(value, bool) or not text.isdigit() or int(text) == 0:
+            raise ConfigurationError(
+                f"Cache '{self.name}': `{option}` must be a positive integer, "
+                f"got {value!r}"
+            )
+        return int(text)
+
+    def _eviction_policy(self) -> str:
+        policy = str(self.conn_info.get("eviction") or "lru").strip().lower()
+        if policy not in EVICTION_POLICIES:
+            raise ConfigurationError(
+                f"Cache '{self.name}': `eviction` must be one of "
+                f"{', '.join(EVICTION_POLICIES)}, got {self.conn_info['eviction']!r}"
+            )
+        return policy
+
+    def _record_evictions(self, count: int, reason: str) -> None:
+        get_domain_metrics(self.domain).cache_evictions.add(
+            count, {"cache": self.name, "reason": reason}
+        )
+
     def ping(self) -> bool:
         """Always returns True for memory cache"""
         return True
@@ -164,22 +425,39 @@ class MemoryCache(BaseCache):
         if explicit_ttl is not None:
             self._db.set_ttl(key, explicit_ttl)
 
+        self._projection_written(underscore(projection.__class__.__name__))
+
     def get(self, key: str) -> BaseProjection | None:
         projection_name = key.split(":::")[0]
         projection_cls = self._projections[projection_name]
 
         value = self._db.get(key)
-        return projection_cls(value) if value else None
+        metrics = get_domain_metrics(self.domain)
+        if value:
+            metrics.cache_hits.add(1, {"cache": self.name})
+            return projection_cls(value)
+        metrics.cache_misses.add(1, {"cache": self.name})
+        return None
+
+    def _candidate_keys(self, key_pattern: str) -> list[str]:
+        """Keys that may match *key_pattern*.
+
+        A pattern with a literal `<projection>:::` prefix reads that prefix's
+        keys from the store's index; any other pattern falls back to all keys.
+        """
+        prefix = key_pattern.partition(PREFIX_SEPARATOR)[0]
+        if PREFIX_SEPARATOR in key_pattern and not any(c in prefix for c in "*?["):
+            return self._db.keys_with_prefix(prefix)
+        # list() snapshots under the store's lock; matching then runs lock-free.
+        return list(self._db.keys())
 
     def _get_all(self, key_pattern: str) -> list[BaseProjection]:
         projection_name = key_pattern.split(":::")[0]
         projection_cls = self._projections[projection_name]
 
-        # Snapshot with list() so the matching below runs outside the store's
-        # lock: keys() is a lazy iterator that holds TTLDict's RLock for the
-        # whole traversal, so matching while iterating it would hold the lock
-        # across every fnmatch call.
-        key_list = list(self._db.keys())
+        # A snapshot of the candidates, so the matching below runs outside the
+        # store's lock.
+        key_list = self._candidate_keys(key_pattern)
         # Sort by key so the result is deterministic and in the same order the
         # Redis adapter returns, keeping this utility consistent across adapters.
         matches = sorted(key for key in key_list if fnmatchcase(key, key_pattern))
@@ -195,8 +473,7 @@ class MemoryCache(BaseCache):
         ]
 
     def count(self, key_pattern: str) -> int:
-        # list() snapshots under the store's lock; matching then runs lock-free.
-        key_list = list(self._db.keys())
+        key_list = self._candidate_keys(key_pattern)
         return sum(1 for key in key_list if fnmatchcase(key, key_pattern))
 
     def remove(self, projection: BaseProjection) -> None:
@@ -206,29 +483,41 @@ class MemoryCache(BaseCache):
         identifier = getattr(projection, id_f.field_name)
         key = f"{underscore(projection.__class__.__name__)}:::{identifier}"
         self._db.pop(key, None)
+        self._projection_written(underscore(projection.__class__.__name__))
 
     def remove_by_key(self, key: str) -> None:
         self._db.pop(key, None)
+        self._projection_written(_prefix_of(key))
 
     def remove_by_key_pattern(self, key_pattern: str) -> None:
-        # list() snapshots under the store's lock; matching then runs lock-free.
-        key_list = list(self._db.keys())
+        key_list = self._candidate_keys(key_pattern)
         keys_to_delete = [key for key in key_list if fnmatchcase(key, key_pattern)]
         # A key can expire between the scan above and this delete, so use
         # `pop` with a default, the same as `remove` and `remove_by_key`.
         for key in keys_to_delete:
             self._db.pop(key, None)
+        self._projection_written(_literal_prefix_of(key_pattern))
 
     def flush_all(self) -> None:
         # Clear in place so the TTLDict (and its configured default TTL) is
         # preserved — reassigning a plain {} broke set_ttl/get_ttl afterwards.
         self._db.clear()
+        self._projection_written()
 
     def set_ttl(self, key: str, ttl: TTLValue) -> None:
         resolved_ttl = self._ttl_for(ttl)
         if key in self._db:
             self._db.set_ttl(key, resolved_ttl)
 
+    def _get_raw(self, keys: list[str]) -> list[bytes | None]:
+        return [self._db.get(key) for key in keys]
+
+    def _set_raw(self, key: str, value: bytes, ttl: TTLValue | None = None) -> None:
+        explicit_ttl = self._explicit_ttl(ttl)
+        self._db[key] = value
+        if explicit_ttl is not None:
+            self._db.set_ttl(key, explicit_ttl)
+
     def get_ttl(self, key: str) -> float | None:
         # A never-added key and an expired-but-not-yet-evicted key both answer
         # `None`, matching how `get` already treats them. The check and the read
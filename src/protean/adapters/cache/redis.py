@@ -1,7 +1,10 @@
 import json
 import logging
 import math
-from typing import Any
+import time
+from collections import defaultdict
+from collections.abc import Callable, Iterable
+from typing import Any, cast
 
 import redis
 
@@ -21,6 +24,13 @@ class RedisCache(BaseCache):
         - socket_timeout: Timeout for reading from a connection in seconds
         - socket_connect_timeout: Timeout for connecting to Redis in seconds
         - retry_on_timeout: Whether to retry on timeout (default: False)
+
+    Each projection's keys are indexed in a sorted set, scored by the time the
+    key expires. `count` and `_get_all` on a whole projection (`name:::*`) read
+    that index instead of scanning the keyspace: `count` is one `ZCOUNT` over
+    the entries not yet expired, and `_get_all` reads the members with `MGET`
+    in batches. Keys written before the index existed are backfilled on the
+    first such read, with an incremental `SCAN` over the projection's keys.
     """
 
     # Keys from conn_info that are forwarded to Redis connection pool
@@ -38,6 +48,17 @@ class RedisCache(BaseCache):
     # at once.
     _DELETE_BATCH_SIZE = 500
 
+    # Projection indexes live outside the `name:::identifier` keyspace, so no
+    # projection pattern matches them. The ready marker is set once an index
+    # holds every key of its projection, after the backfill.
+    _INDEX_KEY = "protean:cache:index:{}"
+    _INDEX_READY_KEY = "protean:cache:index-ready:{}"
+
+    # Keys per `MGET` in `_get_all`, and per `PTTL`/`ZADD` pipeline during a
+    # backfill, so neither a reply nor a pipeline grows with the projection.
+    _MGET_BATCH_SIZE = 500
+    _BACKFILL_BATCH_SIZE = 500
+
     def __init__(self, name: str, domain: Any, conn_info: dict[str, Any]) -> None:
         """Initialize Cache with Connection/Adapter details"""
 
@@ -75,6 +96,117 @@ class RedisCache(BaseCache):
     def get_connection(self) -> "redis.Redis[Any]":
         return self._client
 
+    @staticmethod
+    def _key_for(projection: BaseProjection) -> str:
+        id_f = id_field(projection)
+        assert id_f is not None
+        assert id_f.field_name is not None
+        identifier = getattr(projection, id_f.field_name)
+        return f"{underscore(projection.__class__.__name__)}:::{identifier}"
+
+    @staticmethod
+    def _projection_of(key: str | bytes) -> str | None:
+        """The projection name of a `name:::identifier` key, if it is one."""
+        text = key.decode() if isinstance(key, bytes) else key
+        name, separator, _ = text.partition(":::")
+        return name if separator else None
+
+    @staticmethod
+    def _indexed_projection(key_pattern: str) -> str | None:
+        """The projection whose index answers `key_pattern`, if one does.
+
+        Only a pattern for a whole projection, `name:::*` with a literal name,
+        is every member of one index. Any other pattern scans the keyspace.
+        """
+        name, separator, rest = key_pattern.partition(":::")
+        if separator and rest == "*" and not any(c in name for c in "*?[\\"):
+            return name
+        return None
+
+    @staticmethod
+    def _now_ms() -> float:
+        return time.time() * 1000
+
+    def _index_read(self, name: str, read: Callable[[Any], Any]) -> Any:
+        """Run `read` against the index of `name`, backfilling it first if needed.
+
+        The ready check rides in the same round trip as the read. On the first
+        read of a projection whose index is not ready, the read is discarded,
+        the index is backfilled, and the read runs again.
+        """
+        pipe = self._client.pipeline(transaction=False)
+        pipe.exists(self._INDEX_READY_KEY.format(name))
+        read(pipe)
+        ready, result = pipe.execute()
+        if not ready:
+            self._backfill_index(name)
+            result = read(self._client)
+        return result
+
+    def _backfill_index(self, name: str) -> None:
+        """Index the keys of projection `name` that were written before its index.
+
+        Online and incremental: `SCAN` walks the projection's keys in batches,
+        and each batch's remaining TTLs are read and indexed with one pipeline
+        each, so Redis is never blocked for the length of the projection.
+        Writes that land meanwhile index themselves, and indexing a key twice
+        only rewrites its score. A key that expires between the scan and its
+        `PTTL` is skipped.
+        """
+        index = self._INDEX_KEY.format(name)
+        batch: list[bytes] = []
+
+        def flush() -> None:
+            pipe = self._client.pipeline(transaction=False)
+            for key in batch:
+                pipe.pttl(key)
+            now = self._now_ms()
+            # A key without an expiry scores `+inf`, inside every
+            # `(now, +inf]` range that `count` and `_get_all` read
+            scores: dict[str | bytes, float] = {
+                key: math.inf if remaining_ms == -1 else float(now + remaining_ms)
+                for key, remaining_ms in zip(batch, pipe.execute(), strict=True)
+                if remaining_ms != -2
+            }
+            if scores:
+                self._client.zadd(index, scores)
+            batch.clear()
+
+        for key in self._client.scan_iter(
+            match=f"{name}:::*", count=self._BACKFILL_BATCH_SIZE
+        ):
+            batch.append(key)
+            if len(batch) >= self._BACKFILL_BATCH_SIZE:
+                flush()
+        if batch:
+            flush()
+
+        self._client.set(self._INDEX_READY_KEY.format(name), 1)
+        logger.debug("Backfilled Redis cache index %s for %s", self.name, name)
+
+    def _read_values(self, keys: list[bytes]) -> list[bytes | str | None]:
+        """`MGET` `keys` in batches, answering one value (or `None`) per key."""
+        values: list[bytes | str | None] = []
+        for start in range(0, len(keys), self._MGET_BATCH_SIZE):
+            values.extend(
+                self._client.mget(keys[start : start + self._MGET_BATCH_SIZE])
+            )
+        return values
+
+    def _delete_keys(self, keys: Iterable[str | bytes]) -> None:
+        """Delete `keys` and drop them from their projections' indexes, atomically."""
+        keys = list(keys)
+        by_projection: dict[str, list[str | bytes]] = defaultdict(list)
+        for key in keys:
+            if (name := self._projection_of(key)) is not None:
+                by_projection[name].append(key)
+
+        pipe = self._client.pipeline(transaction=True)
+        pipe.delete(*keys)
+        for name, members in by_projection.items():
+            pipe.zrem(self._INDEX_KEY.format(name), *members)
+        pipe.execute()
+
     def add(self, projection: BaseProjection, ttl: TTLValue | None = None) -> None:
         """Add projection record to cache
 
@@ -93,19 +225,21 @@ class RedisCache(BaseCache):
             projection (BaseProjection): Projection Instance containing data
             ttl (int, float, str, optional): Timeout in seconds. Defaults to None.
         """
-        id_f = id_field(projection)
-        assert id_f is not None
-        assert id_f.field_name is not None
-        identifier = getattr(projection, id_f.field_name)
-        key = f"{underscore(projection.__class__.__name__)}:::{identifier}"
+        key = self._key_for(projection)
+        index = self._INDEX_KEY.format(underscore(projection.__class__.__name__))
 
-        resolved_ttl: int | float = self._ttl_for(ttl)
+        ttl_ms = int(self._ttl_for(ttl) * 1000)
+        now = self._now_ms()
 
-        # redis-py ships `py.typed` but leaves `psetex` without a return
-        # annotation, so mypy --strict flags the call as untyped. Not our bug.
-        self._client.psetex(  # type: ignore[no-untyped-call]
-            key, int(resolved_ttl * 1000), json.dumps(projection.to_dict())
-        )
+        # The value and its index entry are written in one transaction, and the
+        # entries that have expired since are pruned from the index on the way.
+        pipe = self._client.pipeline(transaction=True)
+        pipe.psetex(key, ttl_ms, json.dumps(projection.to_dict()))
+        pipe.zadd(index, {key: now + ttl_ms})
+        pipe.zremrangebyscore(index, "-inf", now)
+        pipe.execute()
+
+        self._projection_written(underscore(projection.__class__.__name__))
 
     def get(self, key: str) -> BaseProjection | None:
         projection_name = key.split(":::")[0]
@@ -118,30 +252,57 @@ class RedisCache(BaseCache):
         projection_name = key_pattern.split(":::")[0]
         projection_cls = self._projections[projection_name]
 
-        # Redis has no native key ordering, so read every matching key, sort,
-        # and materialise. That is a full keyspace scan; `_get_all` is a bounded
-        # utility, not a production read path. `SCAN` can return the same key
-        # more than once during a full iteration (rehashing, concurrent writes),
-        # so dedupe before sorting, or an entry would repeat in the result.
+        # Redis has no native key ordering, so collect every matching key, sort,
+        # and materialise. A whole-projection pattern reads its keys from the
+        # projection's index; any other pattern scans the keyspace. `SCAN` can
+        # return the same key more than once during a full iteration
+        # (rehashing, concurrent writes), so dedupe before sorting, or an entry
+        # would repeat in the result.
         #
         # The keys are `bytes` (this adapter does not set `decode_responses`).
         # Sorting them by raw bytes matches the memory adapter's `str` sort:
         # UTF-8 byte order preserves Unicode code-point order, so both adapters
         # return keys in the same order, non-ASCII included. Decoding to `str`
         # first would change nothing and would raise on a non-UTF-8 key.
-        keys = sorted(set(self._client.scan_iter(match=key_pattern)))
+        indexed = self._indexed_projection(key_pattern)
+        if indexed is not None:
+            index = self._INDEX_KEY.format(indexed)
+            now = self._now_ms()
+            members = self._index_read(
+                indexed, lambda client: client.zrangebyscore(index, f"({now}", "+inf")
+            )
+            keys = sorted(set(members))
+        else:
+            keys = sorted(set(self._client.scan_iter(match=key_pattern)))
         # Cap to the first GET_ALL_MAX in key order, warning if it truncated, so
-        # only that many GET round trips run below.
+        # only that many keys are read below.
         keys = self._capped(keys, key_pattern)
 
         results: list[BaseProjection] = []
-        for key in keys:
-            raw = self._client.get(key)
+        missing: list[bytes] = []
+        for key, raw in zip(keys, self._read_values(keys), strict=True):
             if raw is not None:
                 results.append(projection_cls(json.loads(raw)))
+            else:
+                missing.append(key)
+
+        # An indexed key with no value was deleted or evicted behind the
+        # index's back. Drop it so `count` stops seeing it too.
+        if indexed is not None and missing:
+            self._client.zrem(self._INDEX_KEY.format(indexed), *missing)
         return results
 
     def count(self, key_pattern: str) -> int:
+        indexed = self._indexed_projection(key_pattern)
+        if indexed is not None:
+            index = self._INDEX_KEY.format(indexed)
+            now = self._now_ms()
+            return int(
+                self._index_read(
+                    indexed, lambda client: client.zcount(index, f"({now}", "+inf")
+                )
+            )
+
         # `SCAN` can return the same key more than once during a full iteration
         # (rehashing, concurrent writes), so dedupe before counting. Without
         # this, `count` overcounts and disagrees with the number of distinct
@@ -149,15 +310,12 @@ class RedisCache(BaseCache):
         return len(set(self._client.scan_iter(match=key_pattern)))
 
     def remove(self, projection: BaseProjection) -> None:
-        id_f = id_field(projection)
-        assert id_f is not None
-        assert id_f.field_name is not None
-        identifier = getattr(projection, id_f.field_name)
-        key = f"{underscore(projection.__class__.__name__)}:::{identifier}"
-        self._client.delete(key)
+        self._delete_keys([self._key_for(projection)])
+        self._projection_written(underscore(projection.__class__.__name__))
 
     def remove_by_key(self, key: str) -> None:
-        self._client.delete(key)
+        self._delete_keys([key])
+        self._projection_written(self._projection_of(key))
 
     def remove_by_key_pattern(self, key_pattern: str) -> None:
         # `scan_iter` yields `bytes`: this adapter does not enable
@@ -168,18 +326,42 @@ class RedisCache(BaseCache):
         ):
             batch.append(key)
             if len(batch) >= self._DELETE_BATCH_SIZE:
-                self._client.delete(*batch)
+                self._delete_keys(batch)
                 batch.clear()
         # A pattern that matches nothing leaves `batch` empty, so no `DEL`
         # runs. `delete()` with zero keys is what Redis rejects.
         if batch:
-            self._client.delete(*batch)
+            self._delete_keys(batch)
+
+        name = self._projection_of(key_pattern)
+        self._projection_written(
+            None if name is None or any(c in name for c in "*?[\\") else name
+        )
 
     def flush_all(self) -> None:
         self._client.flushall()
+        self._projection_written()
 
     def set_ttl(self, key: str, ttl: TTLValue) -> None:
-        self._client.pexpire(key, int(self._ttl_for(ttl) * 1000))
+        ttl_ms = int(self._ttl_for(ttl) * 1000)
+        now = self._now_ms()
+        # Move the key's index entry to its new expiry, but only if the key is
+        # there: `XX` leaves a missing member missing.
+        if (
+            self._client.pexpire(key, ttl_ms)
+            and (name := self._projection_of(key)) is not None
+        ):
+            self._client.zadd(
+                self._INDEX_KEY.format(name), {key: now + ttl_ms}, xx=True
+            )
+
+    def _get_raw(self, keys: list[str]) -> list[bytes | None]:
+        # This adapter does not set `decode_responses`, so values are bytes
+        return cast("list[bytes | None]", self._client.mget(keys)) if keys else []
+
+    def _set_raw(self, key: str, value: bytes, ttl: TTLValue | None = None) -> None:
+        # redis-stubs leaves psetex without type annotations (stub gap)
+        self._client.psetex(key, int(self._ttl_for(ttl) * 1000), value)  # type: ignore[no-untyped-call]
 
     def get_ttl(self, key: str) -> float | None:
         # `PTTL` answers milliseconds. Every other TTL on this port is seconds
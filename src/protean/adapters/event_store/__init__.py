@@ -23,6 +23,9 @@ logger = logging.getLogger(__name__)
 EVENT_STORE_PROVIDERS = {
     "memory": "protean.adapters.event_store.memory.MemoryEventStore",
     "message_db": "protean.adapters.event_store.message_db.MessageDBStore",
+    "message_db_async": (
+        "protean.adapters.event_store.message_db_async.AsyncMessageDBStore"
+    ),
 }
 
 
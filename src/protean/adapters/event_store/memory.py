@@ -7,9 +7,11 @@ from pydantic import Field
 
 from protean.core.aggregate import BaseAggregate
 from protean.core.repository import BaseRepository
+from protean.port.checkpoint_store import BaseCheckpointStore, Checkpoint
 from protean.port.event_store import BaseEventStore
 from protean.utils.eventing import Metadata
-from protean.utils.globals import _domain_now, current_domain
+from protean.utils.globals import _domain_now, current_domain, current_uow
+from protean.utils.query import Q
 
 if TYPE_CHECKING:
     from protean.domain import Domain
@@ -142,6 +144,33 @@ class MemoryMessageRepository(BaseRepository):
         return [item.to_dict() for item in items]
 
 
+class MemoryCheckpointStore(BaseCheckpointStore):
+    """Checkpoints kept in a dict, one entry per checkpoint."""
+
+    def __init__(self) -> None:
+        self._checkpoints: dict[str, Checkpoint] = {}
+        self._lock = threading.Lock()
+
+    def read(self, name: str) -> Checkpoint | None:
+        with self._lock:
+            return self._checkpoints.get(name)
+
+    def write(self, name: str, position: int, updated_at: datetime) -> None:
+        with self._lock:
+            self._checkpoints[name] = Checkpoint(name, position, updated_at)
+
+    # Dict access never blocks, so there is no thread to hop to
+    async def aread(self, name: str) -> Checkpoint | None:
+        return self.read(name)
+
+    async def awrite(self, name: str, position: int, updated_at: datetime) -> None:
+        self.write(name, position, updated_at)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._checkpoints.clear()
+
+
 class MemoryEventStore(BaseEventStore):
     def __init__(self, domain: "Domain", conn_info: dict[str, Any]) -> None:
         super().__init__("Memory", domain, conn_info)
@@ -157,6 +186,9 @@ class MemoryEventStore(BaseEventStore):
             MemoryMessage, MemoryMessageRepository
         )
 
+        # Every write to an in-memory store happens in this process
+        self.wakeups.live = True
+
     def _write(
         self,
         stream_name: str,
@@ -166,7 +198,17 @@ class MemoryEventStore(BaseEventStore):
         expected_version: int | None = None,
     ) -> int:
         repo = cast(MemoryMessageRepository, self.domain.repository_for(MemoryMessage))
-        return repo.write(stream_name, message_type, data, metadata, expected_version)
+        position = repo.write(
+            stream_name, message_type, data, metadata, expected_version
+        )
+
+        # Inside a Unit of Work the message is only readable once it commits
+        category = self.category(stream_name)
+        if current_uow and current_uow.in_progress:
+            current_uow.wake_on_commit(self.wakeups, category)
+        else:
+            self.wakeups.notify(category)
+        return position
 
     def _read(
         self,
@@ -201,10 +243,19 @@ class MemoryEventStore(BaseEventStore):
                 identifiers.add(ident)
         return sorted(identifiers)
 
+    def _make_checkpoint_store(self) -> MemoryCheckpointStore:
+        return MemoryCheckpointStore()
+
+    def _delete_stream(self, stream_name: str) -> int:
+        repo = self.domain.repository_for(MemoryMessage)
+        return repo._dao._delete_all(Q(stream_name=stream_name))
+
     def _data_reset(self) -> None:
-        """Flush all events.
+        """Flush all events and checkpoints.
 
         Useful for running tests with a clean slate.
         """
         repo = self.domain.repository_for(MemoryMessage)
         repo._dao._delete_all()
+        if isinstance(self._checkpoint_store, MemoryCheckpointStore):
+            self._checkpoint_store.clear()
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from datetime import datetime
 from typing import TYPE_CHECKING, Any
 from urllib.parse import parse_qsl, urlparse
 
@@ -7,7 +8,9 @@ import psycopg2
 from message_db.client import MessageDB
 
 from protean.exceptions import ConfigurationError
+from protean.port.checkpoint_store import BaseCheckpointStore, Checkpoint
 from protean.port.event_store import BaseEventStore
+from protean.utils.wakeup import PG_KEEPALIVES, PgNotifyListener
 
 if TYPE_CHECKING:
     from protean.domain import Domain
@@ -37,22 +40,87 @@ def _truncate_message_store(database_uri: str) -> None:
     try:
         cursor = conn.cursor()
         cursor.execute("TRUNCATE message_store.messages RESTART IDENTITY;")
+        # The checkpoint table exists once a checkpoint has been written
+        cursor.execute("SELECT to_regclass(%s)", (MessageDBCheckpointStore.TABLE,))
+        if cursor.fetchone()[0] is not None:
+            cursor.execute(f"TRUNCATE {MessageDBCheckpointStore.TABLE};")
         conn.commit()  # psycopg2 requires a commit even for a TRUNCATE
         cursor.close()
     finally:
         conn.close()
 
 
+class MessageDBCheckpointStore(BaseCheckpointStore):
+    """Checkpoints kept in a side table of the message store, one row each.
+
+    A write upserts the row in place, so the table holds one row per
+    subscriber and stream category however long the subscriptions run. The
+    table is created on first use.
+    """
+
+    TABLE = "message_store.protean_checkpoints"
+
+    _CREATE_TABLE_SQL = (
+        f"CREATE TABLE IF NOT EXISTS {TABLE} ("
+        "name varchar PRIMARY KEY, "
+        "position bigint NOT NULL, "
+        "updated_at timestamptz NOT NULL)"
+    )
+    _READ_SQL = f"SELECT position, updated_at FROM {TABLE} WHERE name = %(name)s"
+    _WRITE_SQL = (
+        f"INSERT INTO {TABLE} (name, position, updated_at) "
+        "VALUES (%(name)s, %(position)s, %(updated_at)s) "
+        "ON CONFLICT (name) DO UPDATE "
+        "SET position = EXCLUDED.position, updated_at = EXCLUDED.updated_at"
+    )
+
+    def __init__(self, store: MessageDBStore) -> None:
+        self._store = store
+        self._table_ready = False
+
+    def _execute(self, sql: str, params: dict[str, Any]) -> tuple[Any, ...] | None:
+        """Run ``sql`` in its own transaction and return its first row, if any."""
+        pool = self._store.client.connection_pool
+        conn = pool.get_connection()
+        try:
+            with conn, conn.cursor() as cursor:
+                if not self._table_ready:
+                    cursor.execute(self._CREATE_TABLE_SQL)
+                cursor.execute(sql, params)
+                row = cursor.fetchone() if cursor.description else None
+            self._table_ready = True
+        finally:
+            pool.release(conn)
+        return row
+
+    def read(self, name: str) -> Checkpoint | None:
+        row = self._execute(self._READ_SQL, {"name": name})
+        return Checkpoint(name, row[0], row[1]) if row else None
+
+    def write(self, name: str, position: int, updated_at: datetime) -> None:
+        self._execute(
+            self._WRITE_SQL,
+            {"name": name, "position": position, "updated_at": updated_at},
+        )
+
+
 class MessageDBStore(BaseEventStore):
     """MessageDB event store adapter.
 
     Connection pool parameters can be configured via conn_info:
         - max_connections: Maximum number of connections in the pool
+
+    With ``notify`` on, every write also sends a Postgres ``NOTIFY`` on
+    ``NOTIFY_CHANNEL`` carrying the stream category, and ``push_listener``
+    listens for them, so event-store subscriptions wake on other processes'
+    writes instead of waiting for their next poll.
     """
 
     # Keys from conn_info that are forwarded to MessageDB connection pool
     _POOL_KEYS = frozenset({"max_connections"})
 
+    NOTIFY_CHANNEL = "protean_event_store"
+
     def __init__(self, domain: Domain, conn_info: dict[str, Any]) -> None:
         super().__init__("MessageDB", domain, conn_info)
 
@@ -60,6 +128,7 @@ class MessageDBStore(BaseEventStore):
         self._pool_kwargs: dict[str, Any] = {
             key: value for key, value in conn_info.items() if key in self._POOL_KEYS
         }
+        self._notify = bool(conn_info.get("notify", False))
 
     @property
     def client(self) -> MessageDB:
@@ -85,11 +154,65 @@ class MessageDBStore(BaseEventStore):
         expected_version: int | None = None,
     ) -> int:
         """Write a message to the event store."""
-        position: int = self.client.write(
-            stream_name, message_type, data, metadata, expected_version
-        )
+        category = self.category(stream_name)
+        if self._notify:
+            position = self._write_and_notify(
+                category, stream_name, message_type, data, metadata, expected_version
+            )
+        else:
+            position = self.client.write(
+                stream_name, message_type, data, metadata, expected_version
+            )
+
+        self.wakeups.notify(category)
         return position
 
+    def _write_and_notify(
+        self,
+        category: str,
+        stream_name: str,
+        message_type: str,
+        data: dict[str, Any],
+        metadata: dict[str, Any] | None,
+        expected_version: int | None,
+    ) -> int:
+        """Write a message and ``NOTIFY`` its category in one transaction.
+
+        Mirrors ``MessageDB.write``. Postgres delivers the notification only if
+        the write commits.
+        """
+        pool = self.client.connection_pool
+        conn = pool.get_connection()
+        try:
+            with conn:
+                position: int = self.client._write(
+                    conn, stream_name, message_type, data, metadata, expected_version
+                )
+                with conn.cursor() as cursor:
+                    cursor.execute(
+                        "SELECT pg_notify(%s, %s)", (self.NOTIFY_CHANNEL, category)
+                    )
+        finally:
+            pool.release(conn)
+
+        return position
+
+    def push_listener(self) -> PgNotifyListener | None:
+        """Listen for the ``NOTIFY`` every write sends, when ``notify`` is on."""
+        if not self._notify:
+            return None
+        return PgNotifyListener(
+            self._listen_connection, self.NOTIFY_CHANNEL, self.wakeups
+        )
+
+    def _listen_connection(self) -> Any:
+        try:
+            return psycopg2.connect(self.conn_info["database_uri"], **PG_KEEPALIVES)
+        except psycopg2.OperationalError as exc:
+            raise ConfigurationError(
+                f"Unable to connect to Event Store - {exc!s}"
+            ) from exc
+
     # The message-db client's built-in ``$all`` query is a strict, unordered
     # ``global_position > position LIMIT n`` — it skips the first position and,
     # having no ``ORDER BY`` before the ``LIMIT``, returns an arbitrary subset
@@ -165,6 +288,23 @@ class MessageDBStore(BaseEventStore):
         identifiers: list[str] = self.client.stream_identifiers(stream_category)
         return identifiers
 
+    def _make_checkpoint_store(self) -> BaseCheckpointStore:
+        return MessageDBCheckpointStore(self)
+
+    def _delete_stream(self, stream_name: str) -> int:
+        pool = self.client.connection_pool
+        conn = pool.get_connection()
+        try:
+            with conn, conn.cursor() as cursor:
+                cursor.execute(
+                    "DELETE FROM message_store.messages WHERE stream_name = %s",
+                    (stream_name,),
+                )
+                deleted: int = cursor.rowcount
+        finally:
+            pool.release(conn)
+        return deleted
+
     def close(self) -> None:
         """Close the event store and release all pooled connections."""
         if self._client is not None:
@@ -0,0 +1,319 @@
+"""MessageDB event store with a native async path for the engine.
+
+``MessageDBStore`` talks to MessageDB through psycopg2, so the engine reaches it
+with ``asyncio.to_thread``: every subscription tick holds a worker thread and a
+pooled connection for as long as the query runs, and the thread pool and
+``max_connections`` cap how many subscriptions a worker can poll at once.
+
+``AsyncMessageDBStore`` keeps the synchronous path (repositories, the unit of
+work, the CLI) on the psycopg2 client and serves the calls the engine awaits,
+``_aread``, ``_awrite``, ``_aread_last_message`` and the checkpoint reads and
+writes, from a psycopg 3
+``AsyncConnectionPool``. A subscription waiting on a query holds a connection
+only while the query runs, and no thread at all. Statements are prepared on
+their first execution on each connection.
+
+Requires ``psycopg`` and ``psycopg-pool``, installed with
+``protean[message-db-async]``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, ClassVar
+from uuid import uuid4
+
+import psycopg
+from psycopg.rows import dict_row
+from psycopg.types.json import Jsonb
+from psycopg_pool import AsyncConnectionPool, PoolTimeout
+
+from protean.adapters.event_store.message_db import (
+    MessageDBCheckpointStore,
+    MessageDBStore,
+)
+from protean.exceptions import ConfigurationError
+from protean.port.checkpoint_store import BaseCheckpointStore, Checkpoint
+
+if TYPE_CHECKING:
+    from protean.domain import Domain
+
+
+class AsyncMessageDBCheckpointStore(MessageDBCheckpointStore):
+    """The MessageDB checkpoint table, with reads and writes the engine awaits
+    served from the async pool."""
+
+    _store: AsyncMessageDBStore
+
+    async def _aexecute(
+        self, sql: str, params: dict[str, Any]
+    ) -> dict[str, Any] | None:
+        pool = await self._store._async_pool()
+        async with pool.connection() as conn:
+            if not self._table_ready:
+                await conn.execute(self._CREATE_TABLE_SQL)
+                self._table_ready = True
+            cursor = await conn.execute(sql, params)
+            row: dict[str, Any] | None = (
+                await cursor.fetchone() if cursor.description else None
+            )
+            return row
+
+    async def aread(self, name: str) -> Checkpoint | None:
+        row = await self._aexecute(self._READ_SQL, {"name": name})
+        return Checkpoint(name, row["position"], row["updated_at"]) if row else None
+
+    async def awrite(self, name: str, position: int, updated_at: datetime) -> None:
+        await self._aexecute(
+            self._WRITE_SQL,
+            {"name": name, "position": position, "updated_at": updated_at},
+        )
+
+
+class AsyncMessageDBStore(MessageDBStore):
+    """MessageDB event store adapter with an async connection pool.
+
+    Async pool parameters can be configured via conn_info:
+        - async_min_connections: Connections the pool keeps open (default: 1)
+        - async_max_connections: Most connections open at once (default: 10)
+        - async_pool_timeout: Seconds a query waits for a free connection
+          (default: 30)
+
+    ``max_connections`` still sizes the synchronous psycopg2 pool.
+    """
+
+    _ASYNC_POOL_DEFAULTS: ClassVar[dict[str, int]] = {
+        "async_min_connections": 1,
+        "async_max_connections": 10,
+        "async_pool_timeout": 30,
+    }
+
+    # The statements the message-db client runs, with explicit casts: psycopg 3
+    # sends a small ``int`` as ``int2``, and the casts pin each call to the
+    # MessageDB function signature whatever the values are.
+    _WRITE_SQL = (
+        "SELECT message_store.write_message("
+        "%(identifier)s::varchar, %(stream_name)s::varchar, %(type)s::varchar, "
+        "%(data)s::jsonb, %(metadata)s::jsonb, %(expected_version)s::bigint)"
+    )
+    _WRITE_NOTIFY_SQL = _WRITE_SQL + ", pg_notify(%(channel)s, %(category)s)"
+    _STREAM_SQL = (
+        "SELECT * FROM get_stream_messages("
+        "%(stream_name)s::varchar, %(position)s::bigint, %(batch_size)s::bigint)"
+    )
+    _CATEGORY_SQL = (
+        "SELECT * FROM get_category_messages("
+        "%(stream_name)s::varchar, %(position)s::bigint, %(batch_size)s::bigint)"
+    )
+    _LAST_STREAM_MESSAGE_SQL = (
+        "SELECT * FROM get_last_stream_message(%(stream_name)s::varchar)"
+    )
+
+    # ``get_last_stream_message`` resolves only specific streams. For ``$all``
+    # and a category, read the newest row directly: one indexed row, where the
+    # synchronous adapter pages in the whole stream (see
+    # ``MessageDBStore._read_last_message``).
+    _LAST_ROW_COLUMNS = (
+        "id::varchar, stream_name::varchar, type::varchar, position::bigint, "
+        "global_position::bigint, data::varchar, metadata::varchar, time::timestamp"
+    )
+    _LAST_ALL_MESSAGE_SQL = (
+        f"SELECT {_LAST_ROW_COLUMNS} FROM messages "
+        "ORDER BY global_position DESC LIMIT 1"
+    )
+    _LAST_CATEGORY_MESSAGE_SQL = (
+        f"SELECT {_LAST_ROW_COLUMNS} FROM messages "
+        "WHERE category(stream_name) = %(stream_name)s::varchar "
+        "ORDER BY global_position DESC LIMIT 1"
+    )
+
+    def __init__(self, domain: Domain, conn_info: dict[str, Any]) -> None:
+        super().__init__(domain, conn_info)
+
+        settings: dict[str, int] = {}
+        for key, default in self._ASYNC_POOL_DEFAULTS.items():
+            value = conn_info.get(key, default)
+            if isinstance(value, bool) or not isinstance(value, int) or value < 1:
+                raise ConfigurationError(
+                    f"Event store `{key}` must be a positive integer, got {value!r}"
+                )
+            settings[key] = value
+        if settings["async_min_connections"] > settings["async_max_connections"]:
+            raise ConfigurationError(
+                "Event store `async_min_connections` cannot exceed "
+                "`async_max_connections`"
+            )
+        self._async_pool_settings = settings
+
+        # A pool is bound to the event loop that opened it. A new loop (a
+        # restarted engine, a test) opens its own.
+        self._apool: AsyncConnectionPool[Any] | None = None
+        self._apool_loop: asyncio.AbstractEventLoop | None = None
+        # Serializes opening the pool, so callers racing on first use share
+        # one pool instead of each opening their own. Bound to a loop, too.
+        self._apool_lock: asyncio.Lock | None = None
+        self._apool_lock_loop: asyncio.AbstractEventLoop | None = None
+
+    async def _async_pool(self) -> AsyncConnectionPool[Any]:
+        """Return the async pool for the running loop, opening it on first use."""
+        loop = asyncio.get_running_loop()
+        if self._apool is not None and self._apool_loop is loop:
+            return self._apool
+
+        if self._apool_lock is None or self._apool_lock_loop is not loop:
+            self._apool_lock, self._apool_lock_loop = asyncio.Lock(), loop
+        async with self._apool_lock:
+            # Another caller may have opened it while this one waited
+            if self._apool is not None and self._apool_loop is loop:
+                return self._apool
+            pool = await self._open_async_pool()
+            self._apool, self._apool_loop = pool, loop
+            return pool
+
+    async def _open_async_pool(self) -> AsyncConnectionPool[Any]:
+        settings = self._async_pool_settings
+        pool: AsyncConnectionPool[Any] = AsyncConnectionPool(
+            self.conn_info["database_uri"],
+            min_size=settings["async_min_connections"],
+            max_size=settings["async_max_connections"],
+            timeout=settings["async_pool_timeout"],
+            # Prepare every statement on its first execution: the engine runs
+            # the same handful of statements on every tick.
+            kwargs={
+                "autocommit": True,
+                "prepare_threshold": 0,
+                "row_factory": dict_row,
+            },
+            open=False,
+        )
+        try:
+            await pool.open(wait=True, timeout=settings["async_pool_timeout"])
+        except (PoolTimeout, psycopg.OperationalError) as exc:
+            await pool.close()
+            raise ConfigurationError(
+                f"Unable to connect to Event Store - {exc!s}"
+            ) from exc
+        return pool
+
+    @staticmethod
+    def _decode(row: dict[str, Any]) -> dict[str, Any]:
+        """Decode a row the way the message-db client does: JSON data/metadata."""
+        row["data"] = json.loads(row["data"])
+        row["metadata"] = json.loads(row["metadata"]) if row["metadata"] else None
+        return row
+
+    async def _fetch(
+        self, sql: str, params: dict[str, Any], one: bool = False
+    ) -> list[dict[str, Any]]:
+        pool = await self._async_pool()
+        async with pool.connection() as conn:
+            cursor = await conn.execute(sql, params)
+            if one:
+                row = await cursor.fetchone()
+                return [row] if row is not None else []
+            rows: list[dict[str, Any]] = await cursor.fetchall()
+            return rows
+
+    async def _awrite(
+        self,
+        stream_name: str,
+        message_type: str,
+        data: dict[str, Any],
+        metadata: dict[str, Any] | None = None,
+        expected_version: int | None = None,
+    ) -> int:
+        """Write a message to the event store over the async pool.
+
+        A failed write raises ``ValueError("<SQLSTATE>-ERROR:  <message>")``,
+        the shape the message-db client raises, so the unit of work maps a
+        version conflict (``P0001``) to ``ExpectedVersionError`` on either path.
+        With ``notify`` on, the same statement ``NOTIFY``s the category.
+        """
+        category = self.category(stream_name)
+        params = {
+            "identifier": str(uuid4()),
+            "stream_name": stream_name,
+            "type": message_type,
+            "data": Jsonb(data),
+            "metadata": Jsonb(metadata) if metadata else None,
+            "expected_version": expected_version,
+            "channel": self.NOTIFY_CHANNEL,
+            "category": category,
+        }
+        sql = self._WRITE_NOTIFY_SQL if self._notify else self._WRITE_SQL
+        try:
+            (row,) = await self._fetch(sql, params, one=True)
+        except psycopg.DatabaseError as exc:
+            raise ValueError(
+                f"{exc.sqlstate}-ERROR:  {exc.diag.message_primary}"
+            ) from exc
+
+        self.wakeups.notify(category)
+        position: int = row["write_message"]
+        return position
+
+    async def _aread(
+        self,
+        stream_name: str,
+        sql: str | None = None,
+        position: int = 0,
+        no_of_messages: int = 1000,
+    ) -> list[dict[str, Any]]:
+        """Read messages from the event store over the async pool.
+
+        Picks the same statement as the synchronous read: the corrected
+        ``$all`` query, ``get_stream_messages`` for a specific stream, and
+        ``get_category_messages`` for a category.
+        """
+        if sql is None:
+            if stream_name == "$all":
+                sql = self._ALL_STREAM_SQL
+            elif "-" in stream_name:
+                sql = self._STREAM_SQL
+            else:
+                sql = self._CATEGORY_SQL
+
+        rows = await self._fetch(
+            sql,
+            {
+                "stream_name": stream_name,
+                "position": position,
+                "batch_size": no_of_messages,
+            },
+        )
+        return [self._decode(row) for row in rows]
+
+    async def _aread_last_message(self, stream_name: str) -> dict[str, Any] | None:
+        """Read the last message from ``stream_name`` over the async pool."""
+        if stream_name == "$all":
+            sql = self._LAST_ALL_MESSAGE_SQL
+        elif "-" in stream_name:
+            sql = self._LAST_STREAM_MESSAGE_SQL
+        else:
+            sql = self._LAST_CATEGORY_MESSAGE_SQL
+
+        rows = await self._fetch(sql, {"stream_name": stream_name}, one=True)
+        return self._decode(rows[0]) if rows else None
+
+    def _make_checkpoint_store(self) -> BaseCheckpointStore:
+        return AsyncMessageDBCheckpointStore(self)
+
+    async def aclose(self) -> None:
+        """Close the async pool, on the loop that opened it."""
+        pool, self._apool = self._apool, None
+        loop, self._apool_loop = self._apool_loop, None
+        if pool is not None and loop is asyncio.get_running_loop():
+            await pool.close()
+
+    def close(self) -> None:
+        """Close the synchronous pool and drop the async one.
+
+        The async pool can only be closed from its own loop, which ``aclose``
+        does; by the time ``close`` runs the loop may be gone, so the pool is
+        dropped and its connections close with it.
+        """
+        super().close()
+        self._apool = None
+        self._apool_loop = None
@@ -306,6 +306,9 @@ class MemoryProvider(BaseProvider):
         # A temporary cache of already constructed model classes
         self._database_model_classes: dict[str, type[typing.Any]] = {}
 
+        # Every commit to an in-memory database happens in this process
+        self.wakeups.live = True
+
     def get_session(self) -> MemorySession:
         """Return a session object
 
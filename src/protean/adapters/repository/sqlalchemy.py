@@ -73,6 +73,7 @@ from protean.utils.globals import current_domain, current_uow
 from protean.utils.logging import get_logging_config_value
 from protean.utils.query import F, Q
 from protean.utils.reflection import attributes, fields, id_field
+from protean.utils.wakeup import PG_KEEPALIVES, PgNotifyListener
 
 if TYPE_CHECKING:
     from protean.core.entity import BaseEntity
@@ -1478,7 +1479,8 @@ class SAProvider(BaseProvider):
             {
                 key: value
                 for key, value in self.conn_info.items()
-                if key not in ["provider", "database_uri", "schema", "managed"]
+                if key
+                not in ["provider", "database_uri", "schema", "managed", "notify"]
             }
         )
 
@@ -1848,8 +1850,49 @@ class SAProvider(BaseProvider):
 
 
 class PostgresqlProvider(SAProvider):
+    """SQLAlchemy provider for PostgreSQL.
+
+    With ``notify`` on, every transaction that writes outbox rows also sends a
+    ``NOTIFY`` on ``OUTBOX_NOTIFY_CHANNEL`` carrying the target broker, and
+    ``push_listener`` listens for them, so outbox processors in other
+    processes wake when rows commit. Listening needs the psycopg2 driver.
+    """
+
     __database__ = SAProvider.databases.postgresql.value
 
+    OUTBOX_NOTIFY_CHANNEL = "protean_outbox"
+
+    def notify_on_commit(self, session: typing.Any, topic: str) -> None:
+        """Queue a ``NOTIFY`` for ``topic`` in the open transaction."""
+        if self.conn_info.get("notify", False):
+            session.execute(
+                text("SELECT pg_notify(:channel, :topic)"),
+                {"channel": self.OUTBOX_NOTIFY_CHANNEL, "topic": topic},
+            )
+
+    def push_listener(self) -> PgNotifyListener | None:
+        """Listen for the outbox ``NOTIFY``s, when ``notify`` is on."""
+        if not self.conn_info.get("notify", False):
+            return None
+        if self._engine.dialect.driver != "psycopg2":
+            logger.warning(
+                "repository.sqlalchemy.push_listener_unsupported",
+                extra={"provider": self.name, "driver": self._engine.dialect.driver},
+            )
+            return None
+        return PgNotifyListener(
+            self._listen_connection, self.OUTBOX_NOTIFY_CHANNEL, self.wakeups
+        )
+
+    def _listen_connection(self) -> typing.Any:
+        """Open a psycopg2 connection outside the engine's pool."""
+        import psycopg2  # noqa: PLC0415
+
+        dsn = self._engine.url.set(drivername="postgresql").render_as_string(
+            hide_password=False
+        )
+        return psycopg2.connect(dsn, **PG_KEEPALIVES)
+
     @property
     def capabilities(self) -> DatabaseCapabilities:
         """PostgreSQL supports relational capabilities plus native JSON and arrays."""
@@ -38,6 +38,7 @@ from protean.cli.events import app as events_app
 from protean.cli.eventstore import app as eventstore_app
 from protean.cli.idempotency import app as idempotency_app
 from protean.cli.ir import app as ir_app
+from protean.cli.manifest import app as manifest_app
 from protean.cli.new import new
 from protean.cli.observatory import observatory
 from protean.cli.outbox import app as outbox_app
@@ -51,7 +52,6 @@ from protean.cli.test import app as test_app
 from protean.cli.upgrade import upgrade_check
 from protean.cli.verify import verify
 from protean.exceptions import NoDomainException
-from protean.server.engine import Engine
 from protean.utils.domain_discovery import derive_domain
 from protean.utils.logging import configure_logging, get_logger
 
@@ -77,6 +77,7 @@ app.add_typer(outbox_app, name="outbox")
 app.add_typer(events_app, name="events")
 app.add_typer(eventstore_app, name="eventstore")
 app.add_typer(ir_app, name="ir")
+app.add_typer(manifest_app, name="manifest")
 app.add_typer(schema_app, name="schema")
 app.add_typer(docs_app, name="docs")
 app.add_typer(projection_app, name="projection")
@@ -259,6 +260,8 @@ def server(
             # Single-worker path: identical to previous behavior, zero overhead.
             # Traverse and initialize domain — loads all aggregates, entities,
             # services, and other domain elements.
+            from protean.server.engine import Engine  # noqa: PLC0415
+
             derived_domain.init()
 
             with derived_domain.domain_context():
@@ -21,6 +21,7 @@ from protean.utils.logging import get_logger
 
 if TYPE_CHECKING:
     from protean.domain import Domain
+    from protean.ir.cache import IRCache
 
 logger = get_logger(__name__)
 
@@ -44,15 +45,7 @@ def _abort_load(
     raise typer.Abort() from exc
 
 
-def load_domain(domain_path: str, *, as_json: bool = False) -> Domain:
-    """Import and initialise a live domain, returning the Domain object.
-
-    Imports the domain module at *domain_path* and initialises it. Callers can
-    introspect the returned domain's registered element classes (e.g. their
-    index declarations). On failure the function reports a diagnostic and
-    raises ``typer.Abort()`` (or exits with the error envelope under
-    ``as_json``).
-    """
+def _derive(domain_path: str, *, as_json: bool) -> Domain:
     try:
         derived_domain = derive_domain(domain_path)
     except NoDomainException as exc:
@@ -61,7 +54,10 @@ def load_domain(domain_path: str, *, as_json: bool = False) -> Domain:
         )
 
     assert derived_domain is not None
+    return derived_domain
+
 
+def _initialise(derived_domain: Domain, *, as_json: bool) -> None:
     try:
         derived_domain.init()
     except Exception as exc:
@@ -69,24 +65,53 @@ def load_domain(domain_path: str, *, as_json: bool = False) -> Domain:
             f"Error initialising Protean domain: {exc}", as_json=as_json, exc=exc
         )
 
+
+def load_domain(domain_path: str, *, as_json: bool = False) -> Domain:
+    """Import and initialise a live domain, returning the Domain object.
+
+    Imports the domain module at *domain_path* and initialises it. Callers can
+    introspect the returned domain's registered element classes (e.g. their
+    index declarations). On failure the function reports a diagnostic and
+    raises ``typer.Abort()`` (or exits with the error envelope under
+    ``as_json``).
+    """
+    derived_domain = _derive(domain_path, as_json=as_json)
+    _initialise(derived_domain, as_json=as_json)
     return derived_domain
 
 
-def load_domain_ir(domain_path: str, *, as_json: bool = False) -> dict[str, Any]:
+def load_domain_ir(
+    domain_path: str, *, as_json: bool = False, cache: IRCache | None = None
+) -> dict[str, Any]:
     """Build and return the IR from a live domain.
 
     Loads and initialises the domain (via :func:`load_domain`), then returns
     the full IR dict. On failure it reports a diagnostic and raises
     ``typer.Abort()`` (or exits with the error envelope under ``as_json``).
-    """
-    derived_domain = load_domain(domain_path, as_json=as_json)
 
-    try:
-        return derived_domain.to_ir()
-    except Exception as exc:
-        _abort_load(
-            f"Error generating IR from Protean domain: {exc}", as_json=as_json, exc=exc
-        )
+    With a *cache*, the domain is only imported, and the IR is taken from the
+    cache while the domain's sources are unchanged. The outcome of the lookup
+    is reported on stderr, leaving stdout to the IR.
+    """
+    derived_domain = _derive(domain_path, as_json=as_json)
+
+    def build() -> dict[str, Any]:
+        _initialise(derived_domain, as_json=as_json)
+        try:
+            return derived_domain.to_ir()
+        except Exception as exc:
+            _abort_load(
+                f"Error generating IR from Protean domain: {exc}",
+                as_json=as_json,
+                exc=exc,
+            )
+
+    if cache is None:
+        return build()
+
+    ir, report = cache.get_or_build(derived_domain, "ir", build)
+    typer.echo(report.summary(), err=True)
+    return ir
 
 
 def load_ir_file(path: str, *, as_json: bool = False) -> dict[str, Any]:
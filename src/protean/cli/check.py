@@ -20,6 +20,12 @@ Usage::
     # Quiet mode (counts only, for CI scripts)
     protean check --domain=my_app --quiet
 
+    # Reuse the last report while the domain's sources are unchanged
+    protean check --domain=my_app --cache
+
+    # Report only what changed since a git ref could have caused
+    protean check --domain=my_app --changed-since=main
+
 Under ``--format json`` the result is the shared CLI envelope (see
 :mod:`protean.cli.result`): the check report under ``data``, the diagnostics
 list at the top level, and a coarse ``status``.
@@ -40,6 +46,7 @@ that fails CI; ``--level`` only affects display.
     "info"  — errors, warnings, and info all gate
 """
 
+import hashlib
 import importlib.util
 import json
 import os
@@ -120,6 +127,26 @@ def check(
             help="Quiet mode: show only counts and exit code",
         ),
     ] = False,
+    cache: Annotated[
+        bool,
+        typer.Option(
+            "--cache",
+            help=(
+                "Reuse the report of an earlier run while the domain's sources "
+                "are unchanged (kept in .protean/cache/)"
+            ),
+        ),
+    ] = False,
+    changed_since: Annotated[
+        str | None,
+        typer.Option(
+            "--changed-since",
+            help=(
+                "Report only findings on elements changed since this git ref, "
+                "and on the elements related to them"
+            ),
+        ),
+    ] = None,
 ) -> None:
     """Validate a Protean domain and report errors, warnings, and diagnostics."""
     # Route logs to stderr before ``derive_domain`` imports the domain module, so
@@ -180,7 +207,20 @@ def check(
     if suppressions_error:
         _fail_usage(format, f"Invalid config: {suppressions_error}")
 
-    result = derived_domain.check()
+    changed = None
+    if changed_since is not None:
+        from protean.ir.git import GitError, changed_files  # noqa: PLC0415
+
+        try:
+            changed = changed_files(changed_since)
+        except GitError as exc:
+            _fail_usage(format, f"Invalid --changed-since: {exc}")
+
+    module_map = None
+    if cache:
+        result, module_map = _cached_check(derived_domain, quiet=quiet, changed=changed)
+    else:
+        result = derived_domain.check(changed_files=changed)
 
     # Exit code and every machine format come from the UNFILTERED result;
     # ``--level`` is a display filter that shapes only the human rich/quiet views
@@ -203,13 +243,13 @@ def check(
     elif format == "sarif":
         typer.echo(
             json.dumps(
-                _format_sarif(result, derived_domain),
+                _format_sarif(result, derived_domain, module_map),
                 indent=2,
                 sort_keys=True,
             )
         )
     elif format == "github-annotations":
-        typer.echo(_format_github_annotations(result, derived_domain))
+        typer.echo(_format_github_annotations(result, derived_domain, module_map))
     else:
         # Human views only: apply the ``--level`` display filter, then render.
         _filter_for_display(result, level, gates)
@@ -225,6 +265,34 @@ def check(
         raise typer.Exit(code=EXIT_FAILURE)
 
 
+def _cached_check(
+    derived_domain: Any, *, quiet: bool, changed: tuple[str, ...] | None = None
+) -> tuple[dict[str, Any], dict[str, str]]:
+    """Run ``Domain.check()`` through the IR cache.
+
+    The element-to-module map is cached with the report, because on a hit the
+    domain is never initialised and its registry cannot supply it. A report
+    narrowed to changed files is cached per set of files.
+    """
+    from protean.ir.cache import IRCache  # noqa: PLC0415
+
+    kind = "check"
+    if changed is not None:
+        digest = hashlib.sha256("\n".join(changed).encode("utf-8")).hexdigest()
+        kind = f"check:{digest[:12]}"
+
+    def build() -> dict[str, Any]:
+        return {
+            "result": derived_domain.check(changed_files=changed),
+            "element_modules": _element_module_map(derived_domain),
+        }
+
+    cached, report = IRCache().get_or_build(derived_domain, kind, build)
+    if not quiet:
+        typer.echo(report.summary(), err=True)
+    return cached["result"], cached["element_modules"]
+
+
 def _filter_for_display(result: dict[str, Any], level: str, gates: bool) -> None:
     """Apply the ``--level`` severity threshold to the human view, in place.
 
@@ -438,7 +506,11 @@ def _resolve_sarif_location(
     }
 
 
-def _format_sarif(result: dict[str, Any], domain: Any) -> dict[str, Any]:
+def _format_sarif(
+    result: dict[str, Any],
+    domain: Any,
+    module_map: dict[str, str] | None = None,
+) -> dict[str, Any]:
     """Render a check result as a SARIF 2.1.0 document.
 
     ``errors`` and ``diagnostics`` are mutually exclusive per run and carry
@@ -448,7 +520,8 @@ def _format_sarif(result: dict[str, Any], domain: Any) -> dict[str, Any]:
     resolution. ``reportingDescriptor`` objects are deduplicated by code across
     both lists (first occurrence wins).
     """
-    module_map = _element_module_map(domain)
+    if module_map is None:
+        module_map = _element_module_map(domain)
     rules: dict[str, dict[str, Any]] = {}
     sarif_results: list[dict[str, Any]] = []
 
@@ -544,14 +617,19 @@ def _escape_property(value: str) -> str:
     return _escape_annotation(value).replace(":", "%3A").replace(",", "%2C")
 
 
-def _format_github_annotations(result: dict[str, Any], domain: Any) -> str:
+def _format_github_annotations(
+    result: dict[str, Any],
+    domain: Any,
+    module_map: dict[str, str] | None = None,
+) -> str:
     """Render a check result as GitHub Actions workflow-command annotations.
 
     One ``::error``/``::warning``/``::notice`` command per finding. Validator
     ``errors`` emit ``::error`` with no ``file=`` (no resolvable FQN); rule
     ``diagnostics`` include ``file=<path>`` when the element resolves to a file.
     """
-    module_map = _element_module_map(domain)
+    if module_map is None:
+        module_map = _element_module_map(domain)
     lines: list[str] = []
 
     for err in result.get("errors", []):
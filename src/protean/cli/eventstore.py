@@ -7,6 +7,9 @@ Usage::
 
     # Machine-readable result (the shared CLI envelope)
     protean eventstore verify --domain=my_domain --json
+
+    # Move read positions out of legacy position streams
+    protean eventstore compact-positions --domain=my_domain --dry-run
 """
 
 import json
@@ -17,7 +20,13 @@ from rich import print
 from rich.table import Table
 
 from protean.cli._helpers import CTX_LOG_CONFIGURED, handle_cli_exceptions, load_domain
-from protean.cli.result import EXIT_FAILURE, build_envelope, route_logs_to_stderr
+from protean.cli.result import (
+    EXIT_FAILURE,
+    build_envelope,
+    emit_usage_error,
+    route_logs_to_stderr,
+)
+from protean.exceptions import NotSupportedError
 
 app = typer.Typer(no_args_is_help=True)
 
@@ -94,3 +103,49 @@ def verify(
         f"message(s) and {report.stream_count} stream(s)."
     )
     raise typer.Exit(code=EXIT_FAILURE)
+
+
+@app.command("compact-positions")
+@handle_cli_exceptions("eventstore compact-positions")
+def compact_positions(
+    ctx: typer.Context,
+    domain: Annotated[str, typer.Option(help="Domain module path")] = ".",
+    dry_run: Annotated[
+        bool, typer.Option("--dry-run", help="Report what would change, change nothing")
+    ] = False,
+    as_json: Annotated[
+        bool, typer.Option("--json", help="Emit the report as the shared CLI envelope")
+    ] = False,
+) -> None:
+    """Move subscription read positions out of legacy position streams.
+
+    Copies the last position of every ``position-*`` stream into the event
+    store's checkpoint store, unless a checkpoint is already there, and deletes
+    the stream. Run it once every worker writes checkpoints. Exits 2 when the
+    event store has no checkpoint store to compact into.
+    """
+    if as_json:
+        route_logs_to_stderr(
+            log_already_configured=bool((ctx.obj or {}).get(CTX_LOG_CONFIGURED))
+        )
+
+    derived_domain = load_domain(domain, as_json=as_json)
+    with derived_domain.domain_context():
+        store = derived_domain.event_store.store
+        assert store is not None  # guaranteed by load_domain -> init()
+        try:
+            report = store.compact_position_streams(dry_run=dry_run)
+        except NotSupportedError as exc:
+            emit_usage_error(as_json=as_json, message=str(exc))
+
+    if as_json:
+        envelope = build_envelope(status="pass", data=report.as_dict(), diagnostics=[])
+        typer.echo(json.dumps(envelope, indent=2, sort_keys=True, default=str))
+        return
+
+    verb = "Would compact" if report.dry_run else "Compacted"
+    print(
+        f"{verb} {len(report.streams)} position stream(s): "
+        f"{report.migrated_count} migrated to checkpoints, "
+        f"{report.message_count} message(s) removed."
+    )
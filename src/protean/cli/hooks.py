@@ -197,6 +197,15 @@ def _build_staleness_parser() -> argparse.ArgumentParser:
             "stage the updated file."
         ),
     )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        default=False,
+        help=(
+            "Reuse the IR built by an earlier run while the domain's sources "
+            "are unchanged (kept in <dir>/cache/)."
+        ),
+    )
     return parser
 
 
@@ -206,10 +215,18 @@ def _check_staleness_single(
     *,
     fix: bool,
     config: Any,
+    cache: bool = False,
 ) -> bool:
     """Check staleness for a single domain.  Returns ``True`` if OK."""
+    from protean.ir.cache import IRCache  # noqa: PLC0415
+
     try:
-        result = check_staleness(domain_module, protean_dir, config=config)
+        result = check_staleness(
+            domain_module,
+            protean_dir,
+            config=config,
+            cache=IRCache(protean_dir) if cache else None,
+        )
     except NoDomainException as exc:
         print(f"Error ({domain_module}): {exc.args[0]}", file=sys.stderr)
         return False
@@ -217,6 +234,9 @@ def _check_staleness_single(
         print(f"Error ({domain_module}): {exc}", file=sys.stderr)
         return False
 
+    if result.cache_report is not None:
+        print(result.cache_report.summary(), file=sys.stderr)
+
     if result.status == StalenessStatus.FRESH:
         return True
 
@@ -308,7 +328,7 @@ def check_staleness_hook() -> None:
     all_ok = True
     for domain_module, protean_dir in domains:
         ok = _check_staleness_single(
-            domain_module, protean_dir, fix=args.fix, config=config
+            domain_module, protean_dir, fix=args.fix, config=config, cache=args.cache
         )
         if not ok:
             all_ok = False
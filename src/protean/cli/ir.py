@@ -21,6 +21,9 @@ Usage::
     protean ir diff --domain=my_app --base=HEAD
     protean ir diff --domain=my_app --base=main
 
+    # Reuse the IR built by an earlier run while the sources are unchanged
+    protean ir show --domain=my_domain --cache
+
     # Check whether the materialized IR is fresh or stale
     protean ir check --domain=my_domain
     protean ir check --domain=my_domain --dir=.protean --format=json
@@ -29,7 +32,7 @@ Usage::
 import json
 from dataclasses import asdict
 from pathlib import Path, PurePosixPath
-from typing import Annotated, Any
+from typing import TYPE_CHECKING, Annotated, Any
 
 import typer
 from rich import print
@@ -50,6 +53,9 @@ from protean.ir.staleness import (
     load_stored_ir,
 )
 
+if TYPE_CHECKING:
+    from protean.ir.cache import IRCache
+
 app = typer.Typer(no_args_is_help=True)
 
 
@@ -87,9 +93,26 @@ def show(
             ),
         ),
     ] = False,
+    cache: Annotated[
+        bool,
+        typer.Option(
+            "--cache",
+            help=(
+                "Reuse the IR built by an earlier run while the domain's "
+                "sources are unchanged (kept in --dir/cache/)"
+            ),
+        ),
+    ] = False,
+    dir: Annotated[
+        str,
+        typer.Option(
+            "--dir",
+            help="Path to the .protean/ directory holding the cache (default: .protean)",
+        ),
+    ] = ".protean",
 ) -> None:
     """Show the domain's IR."""
-    ir = load_domain_ir(domain)
+    ir = load_domain_ir(domain, cache=_ir_cache(dir) if cache else None)
 
     if format == "summary":
         _print_summary(ir)
@@ -155,6 +178,16 @@ def diff(
             help="Output format: 'text' (default) or 'json'",
         ),
     ] = "text",
+    cache: Annotated[
+        bool,
+        typer.Option(
+            "--cache",
+            help=(
+                "Reuse the IR built by an earlier run while the domain's "
+                "sources are unchanged (kept in --dir/cache/)"
+            ),
+        ),
+    ] = False,
 ) -> None:
     """Compare two IR snapshots and show differences.
 
@@ -211,17 +244,18 @@ def diff(
     # ------------------------------------------------------------------ #
     # Load IRs based on mode                                              #
     # ------------------------------------------------------------------ #
+    ir_cache = _ir_cache(dir) if cache else None
     if base:
         # Mode 4: git baseline — load IR from a commit
         baseline_ir = _load_ir_from_git(base, dir)
-        current_ir = load_domain_ir(domain)
+        current_ir = load_domain_ir(domain, cache=ir_cache)
     elif domain and not right:
         # Mode 3: auto-baseline — load .protean/ir.json as baseline
         baseline_ir = _load_auto_baseline(dir)
-        current_ir = load_domain_ir(domain)
+        current_ir = load_domain_ir(domain, cache=ir_cache)
     elif domain and right:
         # Mode 2: domain (left) vs file (right)
-        baseline_ir = load_domain_ir(domain)
+        baseline_ir = load_domain_ir(domain, cache=ir_cache)
         current_ir = load_ir_file(right)
     else:
         # Mode 1: explicit files
@@ -278,6 +312,14 @@ def diff(
         raise typer.Exit(code=2)
 
 
+def _ir_cache(protean_dir: str) -> "IRCache":
+    # Imported here to keep ``protean --help`` from pulling in the source
+    # analysis package
+    from protean.ir.cache import IRCache  # noqa: PLC0415
+
+    return IRCache(protean_dir)
+
+
 def _load_ir_from_git(commit: str, protean_dir: str) -> dict[str, Any]:
     """Load .protean/ir.json from a git commit, or abort on error."""
     from protean.ir.git import load_ir_from_commit  # noqa: PLC0415
@@ -567,6 +609,16 @@ def check(
             help="Output format: 'text' (default) or 'json'",
         ),
     ] = "text",
+    cache: Annotated[
+        bool,
+        typer.Option(
+            "--cache",
+            help=(
+                "Reuse the IR built by an earlier run while the domain's "
+                "sources are unchanged (kept in --dir/cache/)"
+            ),
+        ),
+    ] = False,
 ) -> None:
     """Check whether the materialized IR is fresh or stale.
 
@@ -583,7 +635,12 @@ def check(
         raise typer.Exit(code=2) from exc
 
     try:
-        result = check_staleness(domain, Path(dir), config=config)
+        result = check_staleness(
+            domain,
+            Path(dir),
+            config=config,
+            cache=_ir_cache(dir) if cache else None,
+        )
     except NoDomainException as exc:
         print(f"[red]Error:[/red] {exc.args[0]}")
         raise typer.Exit(code=2) from exc
@@ -591,6 +648,9 @@ def check(
         print(f"[red]Error:[/red] {exc}")
         raise typer.Exit(code=2) from exc
 
+    if result.cache_report is not None:
+        typer.echo(result.cache_report.summary(), err=True)
+
     if format == "json":
         payload = {
             "status": result.status.value,
@@ -0,0 +1,89 @@
+"""CLI commands for the precompiled element manifest.
+
+Usage::
+
+    # Record which domain modules register elements, so init() loads only those.
+    protean manifest build --domain=my_domain
+
+    # Exit non-zero when the manifest no longer matches the domain files.
+    protean manifest check --domain=my_domain
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Annotated
+
+import typer
+from rich import print
+
+from protean.cli._helpers import handle_cli_exceptions
+from protean.exceptions import NoDomainException
+from protean.utils.domain_discovery import derive_domain
+from protean.utils.logging import get_logger
+
+if TYPE_CHECKING:
+    from protean.domain import Domain
+
+logger = get_logger(__name__)
+
+app = typer.Typer(no_args_is_help=True)
+
+
+@app.callback()
+def callback() -> None:
+    """Manage the precompiled element manifest."""
+
+
+def _derive(domain_path: str) -> Domain:
+    """Import the domain without initializing it, or abort cleanly."""
+    try:
+        derived_domain = derive_domain(domain_path)
+    except NoDomainException as exc:
+        msg = f"Error loading Protean domain: {exc.args[0]}"
+        print(msg)
+        logger.error(msg)
+        raise typer.Abort() from exc
+
+    assert derived_domain is not None
+    return derived_domain
+
+
+@app.command()
+@handle_cli_exceptions("manifest build")
+def build(
+    domain: Annotated[str, typer.Option(help="Domain module path")] = ".",
+) -> None:
+    """Build the element manifest used to speed up ``Domain.init()``.
+
+    Loads every domain module once and records those that register elements.
+    Rebuild after adding or editing domain files; until then ``init()`` detects
+    the change and falls back to loading every module.
+    """
+    # Imported here so ``protean --help`` does not load the domain package.
+    from protean.domain.manifest import build_manifest  # noqa: PLC0415
+
+    path = build_manifest(_derive(domain))
+    print(f"Element manifest written to {path}")
+
+
+@app.command()
+@handle_cli_exceptions("manifest check")
+def check(
+    domain: Annotated[str, typer.Option(help="Domain module path")] = ".",
+) -> None:
+    """Report whether the element manifest matches the domain files."""
+    from protean.domain.manifest import (  # noqa: PLC0415
+        ManifestStatus,
+        manifest_status,
+    )
+
+    status = manifest_status(_derive(domain))
+    if status == ManifestStatus.FRESH:
+        print("Element manifest is fresh.")
+        return
+
+    if status == ManifestStatus.STALE:
+        print("Element manifest is stale; run `protean manifest build` to update.")
+    else:
+        print("No element manifest found; run `protean manifest build` to create.")
+    raise typer.Exit(code=1)
@@ -6,7 +6,6 @@ import logging
 import typing
 from collections import defaultdict
 from enum import Enum
-from functools import partial
 from typing import TYPE_CHECKING, Any, ClassVar, TypeVar, cast
 
 from pydantic import Field as PydanticField
@@ -41,10 +40,7 @@ from protean.utils.globals import current_domain
 from protean.utils.reflection import (
     _FIELDS,
     _ID_FIELD_NAME,
-    association_fields,
     fields,
-    reference_fields,
-    value_object_fields,
 )
 from protean.utils.telemetry import inject_traceparent_from_context
 
@@ -109,6 +105,10 @@ class BaseAggregate(BaseEntity):
         ("abstract", False),
         ("aggregate_cluster", None),
         ("auto_add_id_field", True),
+        # Defer invariant checks from every field assignment to explicit
+        # boundaries (end of ``atomic_change``, ``repository.add``, UnitOfWork
+        # commit), re-evaluating only the entities changed since the last one.
+        ("defer_invariants", False),
         ("fact_events", False),
         ("indexes", ()),
         ("is_event_sourced", False),
@@ -383,6 +383,8 @@ class BaseAggregate(BaseEntity):
             "_temp_cache": AssociationCache(),
             "_events": [],
             "_disable_invariant_checks": True,  # Suppress during replay
+            "_invariants_dirty": {},
+            "_atomic_depth": 0,
             "_invariants": defaultdict(dict),
         }
         object.__setattr__(aggregate, "__pydantic_private__", private)
@@ -394,52 +396,11 @@ class BaseAggregate(BaseEntity):
         for fname in cls.model_fields:
             aggregate.__dict__[fname] = None  # pyright: ignore[reportIndexIssue]
 
-        # --- Initialize VO shadow fields ---
-        # ``value_object_fields`` filters on ``ValueObject`` at runtime, so each
-        # field carries ``get_shadow_fields``; narrow the generic ``Field`` type.
-        for vo_field in value_object_fields(cls).values():
-            for _, shadow_field in cast(ValueObject, vo_field).get_shadow_fields():
-                # ``attribute_name`` is ``str | None`` on the base field but is
-                # always resolved to a concrete name by reconstitution time.
-                assert shadow_field.attribute_name is not None
-                aggregate.__dict__[shadow_field.attribute_name] = None  # pyright: ignore[reportIndexIssue]
-
-        # --- Initialize Reference shadow fields ---
-        # ``reference_fields`` filters on ``Reference`` at runtime, so each field
-        # carries ``get_shadow_field``; narrow the generic ``Field`` type.
-        for ref_field in reference_fields(cls).values():
-            shadow_name, _ = cast(Reference, ref_field).get_shadow_field()
-            # ``shadow_name`` is ``str | None`` but always resolved for a bound
-            # reference field, so this assert never fires at runtime.
-            assert shadow_name is not None  # pragma: no cover
-            aggregate.__dict__[shadow_name] = None  # pyright: ignore[reportIndexIssue]
-
-        # --- Setup association pseudo-methods (add_*, remove_*, etc.) ---
-        for field_name, field_obj in association_fields(cls).items():
-            if isinstance(field_obj, HasMany):
-                setattr(
-                    aggregate,
-                    f"add_{field_name}",
-                    partial(field_obj.add, aggregate),
-                )
-                setattr(
-                    aggregate,
-                    f"remove_{field_name}",
-                    partial(field_obj.remove, aggregate),
-                )
-                setattr(
-                    aggregate,
-                    f"get_one_from_{field_name}",
-                    partial(field_obj.get, aggregate),
-                )
-                setattr(
-                    aggregate,
-                    f"filter_{field_name}",
-                    partial(field_obj.filter, aggregate),
-                )
-
-        # --- Discover invariants from MRO ---
-        aggregate._discover_invariants()
+        # --- Initialize VO and Reference shadow fields ---
+        # The plan also discovers invariants and installs the association
+        # pseudo-methods (add_*, remove_*, etc.) on the class.
+        for attr_name in cls._construction_plan().shadow_defaults:
+            aggregate.__dict__[attr_name] = None  # pyright: ignore[reportIndexIssue]
 
         aggregate._initialized = True
         return aggregate
@@ -718,12 +679,20 @@ class atomic_change:
     def __enter__(self) -> None:
         # Capture status field snapshots BEFORE precheck
         self._capture_status_snapshots()
+        deferred = self.aggregate.meta_.defer_invariants
+        if deferred:
+            # Start the block from a checked state; changes made inside it are
+            # pre-checked and tracked entity by entity as they happen.
+            self.aggregate._flush_invariants()
+        else:
+            self.aggregate._precheck()
         # Temporary disable invariant checks
-        self.aggregate._precheck()
+        self.aggregate._atomic_depth += 1
         self.aggregate._disable_invariant_checks = True
 
     def __exit__(self, exc_type: Any, *args: Any) -> None:
         # Re-enable invariant checks
+        self.aggregate._atomic_depth -= 1
         self.aggregate._disable_invariant_checks = False
 
         # Validate status transitions (start -> end) before post-invariants.
@@ -731,7 +700,10 @@ class atomic_change:
         if exc_type is None:
             self._validate_status_transitions()
 
-        self.aggregate._postcheck()
+        if self.aggregate.meta_.defer_invariants:
+            self.aggregate._flush_invariants()
+        else:
+            self.aggregate._postcheck()
 
     def _capture_status_snapshots(self) -> None:
         """Snapshot all status fields with transition rules."""
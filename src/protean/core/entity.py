@@ -6,6 +6,7 @@ import logging
 import threading
 from collections import defaultdict
 from collections.abc import Callable
+from dataclasses import dataclass
 from enum import Enum
 from functools import partial
 from typing import (
@@ -63,8 +64,6 @@ from protean.utils.reflection import (
     _ID_FIELD_NAME,
     association_fields,
     declared_fields,
-    reference_fields,
-    value_object_fields,
 )
 
 if TYPE_CHECKING:
@@ -146,6 +145,54 @@ class _EntityState:
     fields_cache = _FieldsCacheDescriptor()
 
 
+# Class attribute holding an entity class's ``_ConstructionPlan``
+_PLAN = "__construction_plan__"
+
+
+@dataclass(frozen=True)
+class _ConstructionPlan:
+    """The parts of entity construction that depend only on the class.
+
+    Built once per class on first construction (see
+    ``BaseEntity._construction_plan``), so ``__init__`` and ``model_post_init``
+    do not rescan the MRO or re-query field reflection for every instance.
+    Dropped by ``BaseEntity._reset_construction_plan`` whenever the class's
+    fields change, at registration and when the domain resolves a reference.
+    """
+
+    # Shadow attributes of Reference and ValueObject fields (e.g. ``order_id``),
+    # passed around Pydantic at construction
+    shadow_field_names: frozenset[str]
+    # Names bound to association/VO descriptors anywhere in the MRO
+    descriptor_names: frozenset[str]
+    # Required ValueObject/Reference fields, each with the shadow attributes
+    # any one of which satisfies it when the field itself is not passed
+    required_descriptors: tuple[tuple[str, tuple[str, ...]], ...]
+    # ValueObject fields, each with its (VO field name, shadow attribute) pairs
+    value_objects: tuple[tuple[str, ValueObject, tuple[tuple[str, str], ...]], ...]
+    # Shadow attributes initialised to ``None`` when construction left them unset
+    shadow_defaults: tuple[str, ...]
+    # HasOne/HasMany field names
+    associations: tuple[str, ...]
+
+
+class _AssociationMethod:
+    """An ``add_*``/``remove_*``/``get_one_from_*``/``filter_*`` pseudo-method
+    of a ``HasMany`` field, bound to the entity it is read from.
+
+    Installed on the class once, instead of four ``partial`` objects on every
+    instance.
+    """
+
+    def __init__(self, method: Callable[..., Any]) -> None:
+        self.method = method
+
+    def __get__(self, instance: Any, owner: type[Any] | None = None) -> Any:
+        if instance is None:
+            return self
+        return partial(self.method, instance)
+
+
 # ---------------------------------------------------------------------------
 # BaseEntity
 # ---------------------------------------------------------------------------
@@ -220,6 +267,12 @@ class BaseEntity(Element, BaseModel, OptionsMixin):
     _temp_cache: AssociationCache = PrivateAttr(default_factory=AssociationCache)
     _events: list[Any] = PrivateAttr(default_factory=list)
     _disable_invariant_checks: bool = PrivateAttr(default=False)
+    # Deferred invariant evaluation (aggregate ``defer_invariants=True``).
+    # Tracked on the aggregate root: the entities changed since the last
+    # boundary, keyed by ``id()``, and the depth of open ``atomic_change``
+    # blocks (whose mutations are tracked even though checks are disabled).
+    _invariants_dirty: dict[int, Any] = PrivateAttr(default_factory=dict)
+    _atomic_depth: int = PrivateAttr(default=0)
 
     def __new__(cls, *args: Any, **kwargs: Any) -> "BaseEntity":
         if cls is BaseEntity:
@@ -431,24 +484,16 @@ class BaseEntity(Element, BaseModel, OptionsMixin):
         descriptor_kwargs: dict[str, Any] = {}
         shadow_kwargs: dict[str, Any] = {}
 
-        # Build the set of known shadow field names from descriptors in
-        # __container_fields__.  This prevents silently swallowing truly
-        # unknown kwargs that Pydantic should reject.
-        _shadow_field_names: set[str] = set()
-        for fobj in getattr(type(self), _FIELDS, {}).values():
-            if isinstance(fobj, Reference):
-                attr_name = fobj.get_attribute_name()
-                if attr_name:
-                    _shadow_field_names.add(attr_name)
-            elif isinstance(fobj, ValueObject):
-                for sf in fobj.embedded_fields.values():
-                    if sf.attribute_name is not None:
-                        _shadow_field_names.add(sf.attribute_name)
+        # Only known shadow field names are set aside, so truly unknown kwargs
+        # still reach Pydantic and are rejected.
+        plan = type(self)._construction_plan()
+        _shadow_field_names = plan.shadow_field_names
+        _descriptor_names = plan.descriptor_names
 
         for name in list(kwargs):
             if name in _shadow_field_names:
                 shadow_kwargs[name] = kwargs.pop(name)
-            elif self._get_class_descriptor(type(self), name) is not None:
+            elif name in _descriptor_names:
                 descriptor_kwargs[name] = kwargs.pop(name)
 
         # Support template dict pattern: Entity({"key": "val"}, key2="val2")
@@ -466,7 +511,7 @@ class BaseEntity(Element, BaseModel, OptionsMixin):
                 for tname in list(template):
                     if tname in _shadow_field_names:
                         shadow_kwargs[tname] = template.pop(tname)
-                    elif self._get_class_descriptor(type(self), tname) is not None:
+                    elif tname in _descriptor_names:
                         descriptor_kwargs[tname] = template.pop(tname)
                 merged.update(template)
             merged.update(kwargs)
@@ -496,26 +541,13 @@ class BaseEntity(Element, BaseModel, OptionsMixin):
         except PydanticValidationError as e:
             collected_errors.update(convert_pydantic_errors(e))
 
-        # Check required descriptor fields (ValueObject, Reference, etc.)
-        for field_name, field_obj in getattr(type(self), _FIELDS, {}).items():
-            if (
-                isinstance(field_obj, (ValueObject, Reference))
-                and getattr(field_obj, "required", False)
-                and field_name not in descriptor_kwargs
+        # Check required descriptor fields (ValueObject, Reference), which are
+        # also satisfied by their shadow fields (e.g. region_id for region)
+        for field_name, shadow_names in plan.required_descriptors:
+            if field_name not in descriptor_kwargs and not any(
+                shadow_name in shadow_kwargs for shadow_name in shadow_names
             ):
-                # Check if shadow fields are present (e.g. region_id for region Reference)
-                has_shadow = False
-                if isinstance(field_obj, ValueObject):
-                    has_shadow = any(
-                        sf.attribute_name in shadow_kwargs
-                        for sf in field_obj.embedded_fields.values()
-                    )
-                elif isinstance(field_obj, Reference):
-                    shadow_name = field_obj.get_attribute_name()
-                    has_shadow = shadow_name in shadow_kwargs
-
-                if not has_shadow:
-                    collected_errors.setdefault(field_name, []).append("is required")
+                collected_errors.setdefault(field_name, []).append("is required")
 
         if collected_errors:
             raise ValidationError(collected_errors)
@@ -556,13 +588,11 @@ class BaseEntity(Element, BaseModel, OptionsMixin):
         for name, value in shadow_kwargs.items():
             self.__dict__[name] = value  # pyright: ignore[reportIndexIssue]
 
+        plan = type(self)._construction_plan()
+
         # Reconstruct ValueObjects from shadow kwargs when the VO itself
         # wasn't explicitly provided (e.g. during repository retrieval).
-        for field_name, base_field_obj in value_object_fields(self).items():
-            # ``value_object_fields`` filters on ``isinstance(_, ValueObject)``,
-            # so every entry is a ``ValueObject`` at runtime; narrow the
-            # base-typed reflection return so the VO-only attributes resolve.
-            field_obj = cast(ValueObject, base_field_obj)
+        for field_name, field_obj, embedded in plan.value_objects:
             # Identity, not truthiness: an already-set all-default VO is
             # falsy but present and must not be clobbered by a shadow rebuild.
             if (
@@ -570,18 +600,10 @@ class BaseEntity(Element, BaseModel, OptionsMixin):
                 and getattr(self, field_name, None) is None
             ):
                 # Gather shadow field values from shadow_kwargs
-                vo_kwargs: dict[str, Any] = {}
-                for embedded_field in field_obj.embedded_fields.values():
-                    if (
-                        embedded_field.attribute_name is None
-                        or embedded_field.field_name is None
-                    ):
-                        # ``embedded_fields`` yields fully-bound fields, so both
-                        # names are always set; guard never fires at runtime.
-                        continue  # pragma: no cover
-                    vo_kwargs[embedded_field.field_name] = shadow_kwargs.get(
-                        embedded_field.attribute_name
-                    )
+                vo_kwargs: dict[str, Any] = {
+                    vo_field_name: shadow_kwargs.get(attribute_name)
+                    for vo_field_name, attribute_name in embedded
+                }
                 # Only reconstruct if at least one value is not None
                 if any(v is not None for v in vo_kwargs.values()):
                     # ``value_object_cls`` is a resolved class at this point; the
@@ -598,39 +620,19 @@ class BaseEntity(Element, BaseModel, OptionsMixin):
         for name, value in descriptor_kwargs.items():
             object.__setattr__(self, name, value)
 
-        # Discover invariants from MRO
-        self._discover_invariants()
-
         self.defaults()
 
-        # Initialize VO shadow fields to None when the VO itself is not set
-        for base_field_obj in value_object_fields(self).values():
-            field_obj = cast(ValueObject, base_field_obj)
-            for _, shadow_field in field_obj.get_shadow_fields():
-                attr_name = shadow_field.attribute_name
-                if attr_name is not None and attr_name not in self.__dict__:
-                    # pyright models pydantic ``__dict__`` as a read-only
-                    # MappingProxyType; writing to it is valid at runtime.
-                    self.__dict__[attr_name] = None  # pyright: ignore[reportIndexIssue]
-
-        # Initialize Reference shadow fields to None when not already set
-        for base_ref_obj in reference_fields(self).values():
-            ref_obj = cast(Reference, base_ref_obj)
-            shadow_name, _shadow = ref_obj.get_shadow_field()
-            if shadow_name is not None and shadow_name not in self.__dict__:
-                self.__dict__[shadow_name] = None  # pyright: ignore[reportIndexIssue]
-
-        # Setup association pseudo-methods (add_*, remove_*, get_one_from_*, filter_*)
-        for field_name, assoc_obj in association_fields(self).items():
-            getattr(self, field_name)  # Initialize/refresh associations
-
-            if isinstance(assoc_obj, HasMany):
-                setattr(self, f"add_{field_name}", partial(assoc_obj.add, self))
-                setattr(self, f"remove_{field_name}", partial(assoc_obj.remove, self))
-                setattr(
-                    self, f"get_one_from_{field_name}", partial(assoc_obj.get, self)
-                )
-                setattr(self, f"filter_{field_name}", partial(assoc_obj.filter, self))
+        # Initialize VO and Reference shadow fields to None when not already set
+        for attr_name in plan.shadow_defaults:
+            if attr_name not in self.__dict__:
+                # pyright models pydantic ``__dict__`` as a read-only
+                # MappingProxyType; writing to it is valid at runtime.
+                self.__dict__[attr_name] = None  # pyright: ignore[reportIndexIssue]
+
+        # Initialize/refresh associations. Their add_*, remove_*,
+        # get_one_from_* and filter_* pseudo-methods live on the class.
+        for field_name in plan.associations:
+            getattr(self, field_name)
 
         # Run post-invariants after init
         fired_codes: list[str] = []
@@ -647,12 +649,125 @@ class BaseEntity(Element, BaseModel, OptionsMixin):
 
         self._initialized = True
 
-    def _discover_invariants(self) -> None:
+    @classmethod
+    def _discover_invariants(cls) -> None:
         """Scan class MRO for @invariant decorated methods and register them."""
-        for klass in type(self).__mro__:
+        for klass in cls.__mro__:
             for name, attr in vars(klass).items():
                 if callable(attr) and hasattr(attr, "_invariant"):
-                    self._invariants[attr._invariant][name] = attr
+                    cls._invariants[attr._invariant][name] = attr
+
+    @classmethod
+    def _construction_plan(cls) -> _ConstructionPlan:
+        """Return the class's construction plan, building it on first use."""
+        plan: _ConstructionPlan | None = vars(cls).get(_PLAN)
+        if plan is None:
+            plan = cls._build_construction_plan()
+            setattr(cls, _PLAN, plan)
+        return plan
+
+    @classmethod
+    def _reset_construction_plan(cls) -> None:
+        """Drop the construction plan, after the class's fields change."""
+        if _PLAN in vars(cls):
+            delattr(cls, _PLAN)
+
+    @classmethod
+    def _build_construction_plan(cls) -> _ConstructionPlan:
+        cls._discover_invariants()
+
+        shadow_field_names: set[str] = set()
+        required_descriptors: list[tuple[str, tuple[str, ...]]] = []
+        value_objects: list[tuple[str, ValueObject, tuple[tuple[str, str], ...]]] = []
+        vo_shadow_defaults: list[str] = []
+        ref_shadow_defaults: list[str] = []
+        associations: list[str] = []
+
+        for field_name, field_obj in getattr(cls, _FIELDS, {}).items():
+            if isinstance(field_obj, Reference):
+                attr_name = field_obj.get_attribute_name()
+                if attr_name:
+                    shadow_field_names.add(attr_name)
+                if getattr(field_obj, "required", False):
+                    required_descriptors.append((field_name, (attr_name,)))
+            elif isinstance(field_obj, ValueObject):
+                embedded_fields = field_obj.embedded_fields.values()
+                shadow_field_names.update(
+                    sf.attribute_name
+                    for sf in embedded_fields
+                    if sf.attribute_name is not None
+                )
+                if getattr(field_obj, "required", False):
+                    required_descriptors.append(
+                        (
+                            field_name,
+                            tuple(
+                                sf.attribute_name
+                                for sf in embedded_fields
+                                if sf.attribute_name is not None
+                            ),
+                        )
+                    )
+
+        # ``declared_fields`` leaves out ``_version`` and ``_metadata``
+        for field_name, field_obj in declared_fields(cls).items():
+            if isinstance(field_obj, ValueObject):
+                # ``embedded_fields`` yields fully-bound fields, so both
+                # names are always set.
+                embedded = tuple(
+                    (sf.field_name, sf.attribute_name)
+                    for sf in field_obj.embedded_fields.values()
+                    if sf.field_name is not None and sf.attribute_name is not None
+                )
+                value_objects.append((field_name, field_obj, embedded))
+                vo_shadow_defaults.extend(
+                    attr_name
+                    for attr_name, _ in field_obj.get_shadow_fields()
+                    if attr_name is not None
+                )
+            elif isinstance(field_obj, Reference):
+                shadow_name, _shadow = field_obj.get_shadow_field()
+                if shadow_name is not None:
+                    ref_shadow_defaults.append(shadow_name)
+            elif isinstance(field_obj, Association):
+                associations.append(field_name)
+                if isinstance(field_obj, HasMany):
+                    setattr(cls, f"add_{field_name}", _AssociationMethod(field_obj.add))
+                    setattr(
+                        cls,
+                        f"remove_{field_name}",
+                        _AssociationMethod(field_obj.remove),
+                    )
+                    setattr(
+                        cls,
+                        f"get_one_from_{field_name}",
+                        _AssociationMethod(field_obj.get),
+                    )
+                    setattr(
+                        cls,
+                        f"filter_{field_name}",
+                        _AssociationMethod(field_obj.filter),
+                    )
+
+        # The names ``_get_class_descriptor`` answers a descriptor for: the
+        # first binding of each name in the MRO decides
+        descriptor_names: set[str] = set()
+        seen: set[str] = set()
+        for klass in cls.__mro__:
+            for name, attr in vars(klass).items():
+                if name not in seen:
+                    seen.add(name)
+                    if isinstance(attr, _DESCRIPTOR_TYPES):
+                        descriptor_names.add(name)
+
+        return _ConstructionPlan(
+            shadow_field_names=frozenset(shadow_field_names),
+            descriptor_names=frozenset(descriptor_names),
+            required_descriptors=tuple(required_descriptors),
+            value_objects=tuple(value_objects),
+            shadow_defaults=(*vo_shadow_defaults, *ref_shadow_defaults),
+            associations=tuple(associations),
+        )
 
     def defaults(self) -> None:
         """Placeholder for defaults.
@@ -727,6 +842,48 @@ class BaseEntity(Element, BaseModel, OptionsMixin):
         failed_invariants: list[str] = []
         codes = fired_codes if fired_codes is not None else []
 
+        self._collect_own_invariant_errors(stage, errors, failed_invariants, codes)
+
+        # Recursively run invariants on associated entities
+        for field_name in type(self)._construction_plan().associations:
+            value = getattr(self, field_name)
+            if value is not None:
+                items = value if isinstance(value, list) else [value]
+                for item in items:
+                    if stage == "pre":
+                        item_errors = item._precheck(
+                            return_errors=True, fired_codes=codes
+                        )
+                    else:
+                        item_errors = item._postcheck(
+                            return_errors=True, fired_codes=codes
+                        )
+                    if item_errors:
+                        for sub_field, error_list in item_errors.items():
+                            errors[sub_field].extend(error_list)
+
+        if return_errors:
+            return dict(errors) if errors else {}
+
+        if errors:
+            self._emit_invariant_failed(stage, failed_invariants, errors)
+            raise ValidationError(
+                errors,
+                codes=codes,
+                location=type(self).__qualname__,
+            )
+
+        return None
+
+    def _collect_own_invariant_errors(
+        self,
+        stage: str,
+        errors: dict[str, list[str]],
+        failed_invariants: list[str],
+        codes: list[str],
+    ) -> None:
+        """Run this entity's own ``stage`` invariants, without descending into
+        associations, and accumulate their failures into the given containers."""
         for method_name, invariant_method in self._invariants.get(stage, {}).items():
             try:
                 invariant_method(self)
@@ -738,37 +895,79 @@ class BaseEntity(Element, BaseModel, OptionsMixin):
                 for field_name in err_messages:
                     errors[field_name].extend(err_messages[field_name])
 
-        # Recursively run invariants on associated entities
-        for field_name, field_obj in declared_fields(self).items():
-            if isinstance(field_obj, Association):
-                value = getattr(self, field_name)
-                if value is not None:
-                    items = value if isinstance(value, list) else [value]
-                    for item in items:
-                        if stage == "pre":
-                            item_errors = item._precheck(
-                                return_errors=True, fired_codes=codes
-                            )
-                        else:
-                            item_errors = item._postcheck(
-                                return_errors=True, fired_codes=codes
-                            )
-                        if item_errors:
-                            for sub_field, error_list in item_errors.items():
-                                errors[sub_field].extend(error_list)
+    def _check_entities_invariants(self, stage: str, entities: list[Any]) -> None:
+        """Run the own ``stage`` invariants of ``entities`` and raise on failure.
 
-        if return_errors:
-            return dict(errors) if errors else {}
+        Used by deferred evaluation, where only the entities that actually
+        changed are checked instead of walking the whole aggregate tree. Runs
+        regardless of ``_disable_invariant_checks``: callers decide when a
+        check is due.
+        """
+        errors: dict[str, list[str]] = defaultdict(list)
+        failed_invariants: list[str] = []
+        codes: list[str] = []
+        for entity in entities:
+            entity._collect_own_invariant_errors(
+                stage, errors, failed_invariants, codes
+            )
 
         if errors:
             self._emit_invariant_failed(stage, failed_invariants, errors)
             raise ValidationError(
-                errors,
+                dict(errors),
                 codes=codes,
                 location=type(self).__qualname__,
             )
 
-        return None
+    # ------------------------------------------------------------------
+    # Deferred invariant evaluation
+    # ------------------------------------------------------------------
+    def _defer_change_checks(self) -> bool:
+        """Record a change to this entity on an aggregate that defers invariants.
+
+        Returns ``False`` when the aggregate checks invariants eagerly, in
+        which case the caller runs the usual ``_precheck``/``_postcheck`` walk
+        from the root. Otherwise the change is tracked on the root and
+        ``True`` is returned so the caller skips the walk.
+
+        The first change to an entity since the last boundary runs its own
+        pre-invariants (and the root's, for the first change overall) against
+        the state before the change. Post-invariants run later, once, at the
+        next boundary: see `_flush_invariants`.
+        """
+        root = self._root if self._root is not None else self
+        if not getattr(root.meta_, "defer_invariants", False):
+            return False
+
+        # Replay (``from_events``) disables checks outside any atomic block;
+        # its mutations are neither checked nor tracked.
+        if root._disable_invariant_checks and not root._atomic_depth:
+            return True
+
+        dirty = root._invariants_dirty
+        if id(self) not in dirty:
+            pending = [self] if self is root or dirty else [root, self]
+            root._check_entities_invariants("pre", pending)
+            if not dirty:
+                dirty[id(root)] = root
+            dirty[id(self)] = self
+        return True
+
+    def _flush_invariants(self) -> None:
+        """Run deferred post-invariants on the root and every changed entity.
+
+        Called at the boundaries of a deferring aggregate: the end of an
+        ``atomic_change`` block, ``repository.add`` and UnitOfWork commit.
+        A no-op when nothing changed since the last boundary. On failure the
+        pending set is kept, so a later boundary reports the violation again
+        instead of letting the invalid state through.
+        """
+        dirty = self._invariants_dirty
+        if not dirty or self._disable_invariant_checks:
+            return
+
+        self._check_entities_invariants("post", list(dirty.values()))
+        dirty.clear()
 
     def _emit_invariant_failed(
         self,
@@ -943,8 +1142,10 @@ class BaseEntity(Element, BaseModel, OptionsMixin):
             if not target._disable_invariant_checks:
                 self._validate_status_transition(name, value)
 
-            # Pre-check invariants
-            target._precheck()
+            # Pre-check invariants (or track the change for a deferred check)
+            deferred = self._defer_change_checks()
+            if not deferred:
+                target._precheck()
 
             # Delegate to Pydantic (validates via validate_assignment)
             try:
@@ -953,7 +1154,8 @@ class BaseEntity(Element, BaseModel, OptionsMixin):
                 raise ValidationError(convert_pydantic_errors(e)) from e
 
             # Post-check invariants
-            target._postcheck()
+            if not deferred:
+                target._postcheck()
 
             # Mark entity state as changed
             self._state.mark_changed()
@@ -962,12 +1164,16 @@ class BaseEntity(Element, BaseModel, OptionsMixin):
         ):
             # Descriptor field: use object.__setattr__ to trigger descriptor protocol
             target = self._root if self._root is not None else self
-            target._precheck()
+            deferred = self._defer_change_checks()
+            if not deferred:
+                target._precheck()
             object.__setattr__(self, name, value)
-            target._postcheck()
+            if not deferred:
+                target._postcheck()
             self._state.mark_changed()
         elif name.startswith(("add_", "remove_", "get_one_from_", "filter_")):
-            # Association pseudo-methods set during model_post_init
+            # Names of association pseudo-methods; an instance value
+            # shadows the class-level method
             object.__setattr__(self, name, value)
         elif (
             getattr(self, "_initialized", False)
@@ -1237,6 +1443,9 @@ def entity_factory(element_cls: type[_T], domain: Any, **opts: Any) -> type[_T]:
                 if shadow_field_name is not None:
                     shadow_field.__set_name__(entity_cls, shadow_field_name)
 
+    # Registration may have added fields; plan construction afresh
+    entity_cls._reset_construction_plan()
+
     # Iterate through methods marked as `@invariant` and record them for later use
     for klass in entity_cls.__mro__:
         for method_name, method in vars(klass).items():
@@ -24,7 +24,9 @@ Example::
             self.mark_as_complete()
 """
 
+import copy
 import logging
+from collections import OrderedDict
 from collections.abc import Callable
 from datetime import date, datetime
 from typing import (
@@ -150,6 +152,7 @@ class BaseProcessManager(Element, BaseModel, HandlerMixin, OptionsMixin):
     | ``subscription_profile`` | ``str`` | A predefined configuration profile. |
     | ``subscription_config`` | ``dict`` | Dictionary of custom configuration overrides. |
     | ``sequential_by`` | ``bool`` | Opt in to per-instance sequential processing (ADR-0028). |
+    | ``instance_cache_size`` | ``int`` | Live instances kept in an in-process LRU (``0`` disables it). |
     """
 
     element_type: ClassVar[DomainObjects] = DomainObjects.PROCESS_MANAGER
@@ -168,6 +171,12 @@ class BaseProcessManager(Element, BaseModel, HandlerMixin, OptionsMixin):
     # ClassVar set during _setup_process_managers — the auto-generated transition event
     _transition_event_cls: ClassVar[type[BaseEvent] | None] = None
 
+    # In-process LRU of the latest persisted state per correlation value,
+    # ``(version, state, is_complete)``. Populated only when the PM sets
+    # ``instance_cache_size``. Each subclass gets its own (see
+    # ``__init_subclass__``), and it is reset on every ``domain.init()``.
+    _instance_cache: ClassVar[OrderedDict[str, tuple[int, dict[str, Any], bool]]]
+
     def __new__(cls, *args: Any, **kwargs: Any) -> "BaseProcessManager":
         if cls is BaseProcessManager:
             raise NotSupportedError("BaseProcessManager cannot be instantiated")
@@ -203,6 +212,14 @@ class BaseProcessManager(Element, BaseModel, HandlerMixin, OptionsMixin):
         # field that category's ``correlate`` spec maps to the correlation
         # value. ``None``/``False`` disables partitioning.
         ("sequential_by", None),
+        # Number of live PM instances to keep in an in-process LRU, keyed by
+        # correlation value. ``0`` disables the cache. A cached entry skips the
+        # event store read on load; it is safe because the transition write
+        # still carries the cached version as its expected version, so a stale
+        # entry fails the write (and is evicted) instead of overwriting newer
+        # state. Pair it with ``sequential_by=True`` so each instance is owned
+        # by one worker and the cache actually hits.
+        ("instance_cache_size", 0),
         # Subscription configuration options
         ("subscription_type", None),
         ("subscription_profile", None),
@@ -215,6 +232,9 @@ class BaseProcessManager(Element, BaseModel, HandlerMixin, OptionsMixin):
         # Set empty __container_fields__ placeholder
         setattr(cls, _FIELDS, {})
 
+        # Per-class instance cache, so PMs never share correlation keys
+        cls._instance_cache = OrderedDict()
+
         # Resolve FieldSpec declarations before Pydantic processes annotations
         cls._resolve_fieldspecs()
 
@@ -407,6 +427,16 @@ class BaseProcessManager(Element, BaseModel, HandlerMixin, OptionsMixin):
     ) -> Optional["BaseProcessManager"]:
         """Load an existing PM from its event store stream, or create a new one.
 
+        Every transition event carries the PM's full field state, so only the
+        newest one is needed: the stream is tail-read with
+        ``read_last_message`` and the PM's version is taken from that
+        message's stream position. Loading costs one point read no matter how
+        many transitions the PM has accumulated.
+
+        When the PM opts into ``instance_cache_size``, a PM whose last
+        transition this process wrote is served from the in-process cache
+        without touching the event store at all.
+
         Args:
             correlation_value: The value used to identify this PM instance.
             is_start: If True and no existing PM is found, create a new instance.
@@ -415,33 +445,31 @@ class BaseProcessManager(Element, BaseModel, HandlerMixin, OptionsMixin):
             The loaded or newly created PM instance, or None if not found and
             not a start event.
         """
+        cached = cls._instance_cache.get(correlation_value)
+        if cached is not None:
+            cls._instance_cache.move_to_end(correlation_value)
+            version, state, is_complete = cached
+            # Hand the handler its own copy: it may mutate list and dict fields
+            # in place, and a failed handler must not leak into the cache.
+            return cls._from_state(
+                correlation_value, copy.deepcopy(state), version, is_complete
+            )
+
         stream_name = f"{cls.meta_.stream_category}-{correlation_value}"
         store = current_domain.event_store.store
         if store is None:
             raise ConfigurationError("Event store is not configured")
-        messages = store.read(stream_name)
+        message = store.read_last_message(stream_name)
 
-        if messages:
-            return cls._from_transitions(messages, correlation_value)
+        if message is not None:
+            return cls._from_last_transition(message, correlation_value)
         elif is_start:
-            pm = cls.__new__(cls)
-            # Initialize Pydantic internals
-            object.__setattr__(pm, "__dict__", {})
-            object.__setattr__(pm, "__pydantic_extra__", None)
-            object.__setattr__(pm, "__pydantic_fields_set__", set())
-            object.__setattr__(
-                pm,
-                "__pydantic_private__",
-                {
-                    "_version": -1,
-                    "_is_complete": False,
-                    "_correlation_value": correlation_value,
-                },
-            )
+            pm = cls._blank_instance(correlation_value)
 
-            # ``vars(pm)`` is the instance ``__dict__`` we just installed above;
-            # bind it here so writes are typed as ``dict[str, Any]`` rather than
-            # the read-only ``MappingProxyType`` that ``pm.__dict__`` exposes.
+            # ``vars(pm)`` is the instance ``__dict__`` installed by
+            # ``_blank_instance``; bind it here so writes are typed as
+            # ``dict[str, Any]`` rather than the read-only ``MappingProxyType``
+            # that ``pm.__dict__`` exposes.
             pm_dict = vars(pm)
 
             # Initialize all model fields to defaults
@@ -467,17 +495,12 @@ class BaseProcessManager(Element, BaseModel, HandlerMixin, OptionsMixin):
             return None
 
     @classmethod
-    def _from_transitions(
-        cls, messages: list[Message], correlation_value: str
-    ) -> "BaseProcessManager":
-        """Reconstitute a PM from its transition events.
-
-        Args:
-            messages: List of Message objects from the PM's event store stream.
-            correlation_value: The correlation value for this PM instance.
+    def _blank_instance(cls, correlation_value: str) -> "BaseProcessManager":
+        """Build an uninitialized PM instance, bypassing Pydantic validation.
 
-        Returns:
-            The fully reconstituted PM instance.
+        Transition state was validated when it was captured, so loading
+        installs the Pydantic internals directly instead of running the model
+        validator again.
         """
         pm = cls.__new__(cls)
         # Initialize Pydantic internals
@@ -493,30 +516,103 @@ class BaseProcessManager(Element, BaseModel, HandlerMixin, OptionsMixin):
                 "_correlation_value": correlation_value,
             },
         )
+        return pm
+
+    @classmethod
+    def _from_state(
+        cls,
+        correlation_value: str,
+        state: dict[str, Any],
+        version: int,
+        is_complete: bool,
+    ) -> "BaseProcessManager":
+        """Reconstitute a PM from a captured state snapshot.
+
+        Args:
+            correlation_value: The correlation value for this PM instance.
+            state: The PM field values recorded by a transition.
+            version: The stream position of that transition.
+            is_complete: Whether the PM was complete after that transition.
+
+        Returns:
+            The reconstituted PM instance.
+        """
+        pm = cls._blank_instance(correlation_value)
 
         # ``vars(pm)`` is the instance ``__dict__`` installed above; bind it so
         # writes are typed as ``dict[str, Any]`` (not the read-only proxy).
         pm_dict = vars(pm)
-
-        # Initialize all model fields to None
         for fname in cls.model_fields:
-            pm_dict[fname] = None
-
-        # Apply each transition event in order
-        for message in messages:
-            domain_obj = message.to_domain_object()
-            # ``state`` and ``is_complete`` are dynamic fields on the runtime-
-            # generated ``_<PM>Transition`` event, not declared on the base event.
-            state: dict[str, Any] = getattr(domain_obj, "state")
-            for key, value in state.items():
-                if key in cls.model_fields:
-                    pm_dict[key] = value
-            pm._version += 1
-            if getattr(domain_obj, "is_complete"):
-                pm._is_complete = True
+            pm_dict[fname] = state.get(fname)
 
+        pm._version = version
+        pm._is_complete = is_complete
         return pm
 
+    @classmethod
+    def _from_last_transition(
+        cls, message: Message, correlation_value: str
+    ) -> "BaseProcessManager":
+        """Reconstitute a PM from the newest transition event in its stream.
+
+        Args:
+            message: The last Message in the PM's event store stream.
+            correlation_value: The correlation value for this PM instance.
+
+        Returns:
+            The fully reconstituted PM instance, versioned at the message's
+            stream position.
+        """
+        event_store_meta = message.metadata.event_store if message.metadata else None
+        position = event_store_meta.position if event_store_meta else None
+        if position is None:
+            raise ConfigurationError(
+                f"Cannot load Process Manager `{cls.__name__}` with correlation "
+                f"`{correlation_value}`: its last transition carries no stream "
+                f"position"
+            )
+
+        domain_obj = message.to_domain_object()
+        # ``state`` and ``is_complete`` are dynamic fields on the runtime-
+        # generated ``_<PM>Transition`` event, not declared on the base event.
+        state: dict[str, Any] = getattr(domain_obj, "state")
+        is_complete = bool(getattr(domain_obj, "is_complete"))
+
+        pm = cls._from_state(correlation_value, state, position, is_complete)
+        cls._cache_instance(correlation_value, state, position, is_complete)
+        return pm
+
+    @classmethod
+    def _cache_instance(
+        cls,
+        correlation_value: str,
+        state: dict[str, Any],
+        version: int,
+        is_complete: bool,
+    ) -> None:
+        """Remember a PM's latest persisted state in the in-process LRU cache.
+
+        A no-op unless the PM sets ``instance_cache_size``. Completed PMs are
+        evicted rather than cached: they never handle another event, so
+        holding them only pushes live instances out.
+        """
+        capacity = cls.meta_.instance_cache_size
+        if not capacity:
+            return
+
+        if is_complete:
+            cls._instance_cache.pop(correlation_value, None)
+            return
+
+        cls._instance_cache[correlation_value] = (
+            version,
+            copy.deepcopy(state),
+            is_complete,
+        )
+        cls._instance_cache.move_to_end(correlation_value)
+        while len(cls._instance_cache) > capacity:
+            cls._instance_cache.popitem(last=False)
+
     @classmethod
     def _persist_transition(
         cls, pm_instance: "BaseProcessManager", handler_name: str
@@ -592,7 +688,22 @@ class BaseProcessManager(Element, BaseModel, HandlerMixin, OptionsMixin):
         store = current_domain.event_store.store
         if store is None:
             raise ConfigurationError("Event store is not configured")
-        store.append(transition_event)
+        try:
+            store.append(transition_event)
+        except ValueError:
+            # Event stores report a wrong expected version as ``ValueError``
+            # (the UoW translates it to ``ExpectedVersionError`` on commit).
+            # Another writer moved the stream past the state this instance was
+            # loaded from, so drop any cached copy and let the retry reload it.
+            cls._instance_cache.pop(str(pm_instance._correlation_value), None)
+            raise
+
+        cls._cache_instance(
+            str(pm_instance._correlation_value),
+            state,
+            pm_instance._version,
+            pm_instance._is_complete,
+        )
 
 
 _T = TypeVar("_T", bound=OptionsMixin)
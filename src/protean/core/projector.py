@@ -29,6 +29,7 @@ class BaseProjector(Element, HandlerMixin, OptionsMixin):
     | ``retries`` | ``int`` | Max retry attempts on transient exceptions. Overrides ``server.transient_retry``; ``None`` defers to it. |
     | ``backoff`` | ``str`` | Retry delay strategy: ``"exponential"``, ``"linear"``, or ``"fixed"``. |
     | ``retry_exceptions`` | ``list`` | Exception types (classes or dotted paths) treated as transient for retry. |
+    | ``micro_batch`` | ``bool`` | Apply each subscription batch in one transaction, writing each projection row once. Default ``False``. |
 
     Example::
 
@@ -92,6 +93,12 @@ class BaseProjector(Element, HandlerMixin, OptionsMixin):
         # read-model write, so a redelivered event is applied exactly once
         # on a transactional provider. See ADR-0017.
         ("idempotent", False),
+        # Micro-batching: when True, the engine applies each subscription
+        # batch in one UnitOfWork that holds the projection rows it loads and
+        # adds, and writes each changed row once at commit instead of once
+        # per event. Repository-backed projections only. See
+        # ``Engine.handle_batch``.
+        ("micro_batch", False),
         ("suppress_checks", ()),
     ]
 
@@ -118,6 +125,16 @@ def projector_factory(element_cls: type[_T], domain: Any, **opts: Any) -> type[_
             f"Projector `{element_cls.__name__}` needs to be associated with at least one Aggregate or Stream Category"
         )
 
+    projection_cls = element_cls.meta_.projector_for
+    if element_cls.meta_.micro_batch and getattr(
+        getattr(projection_cls, "meta_", None), "cache", None
+    ):
+        raise IncorrectUsageError(
+            f"Projector `{element_cls.__name__}` cannot use `micro_batch`: "
+            f"`{projection_cls.__name__}` is cache-backed, and cache writes "
+            f"cannot be held back and rolled back with the batch"
+        )
+
     return element_cls
 
 
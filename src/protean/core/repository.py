@@ -162,6 +162,7 @@ class BaseRepository(Element, OptionsMixin):
                 def adults(self):
                     return self.query.filter(age__gte=18).all().items
         """
+        self._flush_held_rows()
         return self._dao.query
 
     def find_by(self, **kwargs: Any) -> Any:
@@ -177,6 +178,7 @@ class BaseRepository(Element, OptionsMixin):
                 def find_by_email(self, email: str) -> Person:
                     return self.find_by(email=email)
         """
+        self._flush_held_rows()
         item = self._dao.find_by(**kwargs)
         self._prewarm_associations(item)
         return item
@@ -251,10 +253,21 @@ class BaseRepository(Element, OptionsMixin):
 
     def _do_add(self, item: Any) -> Any:
         """Internal add logic wrapped by the ``protean.repository.add`` span."""
+        uow = self._coalescing_uow()
+        if uow is not None:
+            # Written once, when the UnitOfWork commits
+            uow._hold_projection_row(item, dirty=True)
+            return item
+
         # `add` is typically invoked in handler methods in Command Handlers and Event Handlers, which are
         #   enclosed in a UoW automatically. Therefore, if there is a UoW in progress, we can assume
         #   that it is the active session. If not, we will start a new UoW and commit it after the operation
         #   is complete.
+        # Persisting is a boundary for aggregates that defer their invariant
+        # checks: evaluate whatever changed before anything is written.
+        if item.element_type == DomainObjects.AGGREGATE:
+            item._flush_invariants()
+
         own_current_uow = None
         if not (current_uow and current_uow.in_progress):
             own_current_uow = UnitOfWork()
@@ -518,9 +531,7 @@ class BaseRepository(Element, OptionsMixin):
             span.set_attribute("protean.provider", self._provider.name)
 
             try:
-                item = self._dao.get(identifier)
-                self._prewarm_associations(item)
-                return item
+                return self._get(identifier)
             except Exception as exc:
                 set_span_error(span, exc)
                 raise
@@ -551,15 +562,51 @@ class BaseRepository(Element, OptionsMixin):
             span.set_attribute("protean.provider", self._provider.name)
 
             try:
-                item = self._dao.get(identifier)
-                self._prewarm_associations(item)
-                return item
+                return self._get(identifier)
             except ObjectNotFoundError:
                 return None
             except Exception as exc:
                 set_span_error(span, exc)
                 raise
 
+    def _get(self, identifier: Any) -> Any:
+        """Load an item, or serve a projection row the active UnitOfWork holds."""
+        uow = self._coalescing_uow()
+        if uow is not None:
+            item = uow._projection_row(self.meta_.part_of, identifier)
+            if item is not None:
+                if item.state_.is_destroyed:
+                    raise ObjectNotFoundError(
+                        f"`{self.meta_.part_of.__name__}` object with identifier "
+                        f"{identifier} does not exist."
+                    )
+                return item
+
+        item = self._dao.get(identifier)
+        self._prewarm_associations(item)
+        if uow is not None:
+            uow._hold_projection_row(item)
+        return item
+
+    def _coalescing_uow(self) -> UnitOfWork | None:
+        """The active UnitOfWork, if it coalesces writes to this projection.
+
+        See ``UnitOfWork.coalesce_projections``.
+        """
+        if (
+            self.meta_.part_of.element_type == DomainObjects.PROJECTION
+            and current_uow
+            and current_uow.coalesces_projections
+        ):
+            return current_uow
+        return None
+
+    def _flush_held_rows(self) -> None:
+        """Write held projection rows out, so a query sees them."""
+        uow = self._coalescing_uow()
+        if uow is not None:
+            uow._flush_projection_rows()
+
 
 _T = TypeVar("_T")
 
@@ -12,7 +12,7 @@ from protean.exceptions import (
     ValidationError,
 )
 from protean.port.provider import DatabaseCapabilities
-from protean.utils import Processing
+from protean.utils import DomainObjects, Processing
 from protean.utils.globals import _uow_context_stack, current_domain, g
 from protean.utils.processing import current_priority
 from protean.utils.reflection import id_field
@@ -25,6 +25,7 @@ from protean.utils.telemetry import (
 
 if TYPE_CHECKING:
     from protean.port.provider import SessionProtocol
+    from protean.utils.wakeup import Wakeups
 
 
 class _UoWStack(Protocol):
@@ -91,6 +92,15 @@ class UnitOfWork:
         self._sessions: dict[str, SessionProtocol] = {}
         self._messages_to_dispatch: list[tuple[str, dict[str, Any], str | None]] = []
         self._identity_map: defaultdict[str, dict[Any, Any]] = defaultdict(dict)
+        # Consumers to wake once the commit lands: (hub, topic) pairs
+        self._wakeups: list[tuple[Wakeups, str]] = []
+        # Projections whose cached query results go stale once the commit lands
+        self._stale_projections: set[type] = set()
+        # Projection rows held for one write each at commit, keyed by
+        # (projection class, identifier); ``None`` unless
+        # ``coalesce_projections`` was called. See that method.
+        self._projection_rows: dict[tuple[type, str], Any] | None = None
+        self._dirty_projection_rows: dict[tuple[type, str], None] = {}
 
         # A UnitOfWork started while another is already active on this context is
         # a participant in the outer transaction (see ``start``). ``_nested`` marks
@@ -135,6 +145,59 @@ class UnitOfWork:
         identifier = getattr(aggregate, id_f.field_name)
         self._identity_map[aggregate.meta_.provider][identifier] = aggregate
 
+    def coalesce_projections(self) -> None:
+        """Hold projection writes in memory and write each row once, on commit.
+
+        While the UnitOfWork is in progress, a repository ``get`` of a
+        projection row it already holds returns that same object, and ``add``
+        only marks the row dirty. Commit then saves every dirty row once,
+        however many times it changed. Queries on a projection repository write
+        the dirty rows out first, so they see every change made so far.
+
+        The engine applies a micro-batch projector's events this way (see
+        ``Engine.handle_batch``).
+        """
+        self._projection_rows = {}
+
+    @property
+    def coalesces_projections(self) -> bool:
+        return self._projection_rows is not None
+
+    @staticmethod
+    def _projection_key(projection_cls: type, identifier: Any) -> tuple[type, str]:
+        return projection_cls, str(identifier)
+
+    def _projection_row(self, projection_cls: type, identifier: Any) -> Any | None:
+        """Return the held row of ``projection_cls`` with ``identifier``, if any."""
+        if self._projection_rows is None:
+            return None
+        return self._projection_rows.get(
+            self._projection_key(projection_cls, identifier)
+        )
+
+    def _hold_projection_row(self, row: Any, dirty: bool = False) -> None:
+        """Hold ``row`` for the rest of the UnitOfWork, to be written if ``dirty``."""
+        assert self._projection_rows is not None
+        id_f = id_field(row)
+        assert id_f is not None and id_f.field_name is not None
+        key = self._projection_key(type(row), getattr(row, id_f.field_name))
+        self._projection_rows[key] = row
+        if dirty:
+            self._dirty_projection_rows[key] = None
+
+    def _flush_projection_rows(self) -> None:
+        """Write every dirty held projection row, once each, in hold order."""
+        if not self._dirty_projection_rows:
+            return
+        assert self._projection_rows is not None
+        dirty, self._dirty_projection_rows = self._dirty_projection_rows, {}
+        for key in dirty:
+            row = self._projection_rows[key]
+            if row.state_.is_destroyed:
+                continue  # Deleted since: ``BaseDAO.delete`` flushed it first
+            if not row.state_.is_persisted or row.state_.is_changed:
+                self.domain.repository_for(type(row))._dao.save(row)
+
     def _gather_events(self) -> defaultdict[str, list[Any]]:
         """Gather all events from items in the identity map"""
         all_events: defaultdict[str, list[Any]] = defaultdict(list)
@@ -262,6 +325,17 @@ class UnitOfWork:
             Outbox,
         )
 
+        # Write coalesced projection rows before anything else, so they commit
+        # with the rest of the transaction.
+        self._flush_projection_rows()
+
+        # Aggregates that defer invariant checks may have been changed after
+        # they were added; commit is their last boundary before persistence.
+        for identity_map in self._identity_map.values():
+            for item in identity_map.values():
+                if item.element_type == DomainObjects.AGGREGATE:
+                    item._flush_invariants()
+
         # Gather all events from identity map using helper method
         all_events = self._gather_events()
 
@@ -343,6 +417,7 @@ class UnitOfWork:
                     self._initialize_session(provider_name)
 
                 outbox_repo = self.domain._get_outbox_repo(provider_name)
+                outbox_brokers: set[str] = set()
 
                 for event in events:
                     # Extract trace context for outbox denormalized fields
@@ -375,6 +450,7 @@ class UnitOfWork:
                         partition_key=partition_key,
                     )
                     outbox_repo._dao.save(outbox_message)
+                    outbox_brokers.add(internal_broker)
 
                     # External outbox rows for published events — one per
                     # external broker.  Each row is processed independently
@@ -396,6 +472,15 @@ class UnitOfWork:
                                 partition_key=partition_key,
                             )
                             outbox_repo._dao.save(ext_outbox)
+                            outbox_brokers.add(ext_broker)
+
+                # Wake the outbox processors of each target broker when the rows
+                # commit: in other processes through the provider's push
+                # channel, if it has one, and in this one after the commit.
+                provider = self.domain.providers[provider_name]
+                for broker in sorted(outbox_brokers):
+                    provider.notify_on_commit(self._sessions[provider_name], broker)
+                    self.wake_on_commit(provider.wakeups, broker)
 
         # Record final session count after all lazy sessions have been initialised
         span.set_attribute("protean.uow.session_count", len(self._sessions))
@@ -435,6 +520,11 @@ class UnitOfWork:
             for session in self._sessions.values():
                 session.commit()
 
+            for wakeups, topic in self._wakeups:
+                wakeups.notify(topic)
+
+            self._invalidate_cached_queries()
+
             # Dispatch messages to their designated broker
             for stream, message, broker_name in self._messages_to_dispatch:
                 if broker_name and broker_name in self.domain.brokers:
@@ -545,6 +635,10 @@ class UnitOfWork:
         self._sessions = {}
         self._messages_to_dispatch = []
         self._identity_map = defaultdict(dict)
+        self._wakeups = []
+        self._stale_projections = set()
+        self._projection_rows = None
+        self._dirty_projection_rows = {}
         self._in_progress = False
 
     def rollback(self) -> None:
@@ -664,3 +758,31 @@ class UnitOfWork:
         self, stream: str, message: dict[str, Any], broker_name: str | None = None
     ) -> None:
         self._messages_to_dispatch.append((stream, message, broker_name))
+
+    def wake_on_commit(self, wakeups: "Wakeups", topic: str) -> None:
+        """Wake the consumers of ``topic`` on ``wakeups`` once this UoW commits.
+
+        Nothing is woken if it rolls back.
+        """
+        self._wakeups.append((wakeups, topic))
+
+    def invalidate_queries_on_commit(self, projection_cls: type) -> None:
+        """Invalidate cached query results read from ``projection_cls`` once
+        this UoW commits.
+
+        Nothing is invalidated if it rolls back: the cached results still
+        match what was committed.
+        """
+        self._stale_projections.add(projection_cls)
+
+    def _invalidate_cached_queries(self) -> None:
+        # The transaction has committed, so a cache that cannot be reached
+        # must not fail it. Entries it could not invalidate expire with their TTL.
+        for projection_cls in self._stale_projections:
+            try:
+                self.domain._query_processor.invalidate(projection_cls)
+            except Exception:
+                logger.exception(
+                    "query_cache.invalidation_failed",
+                    extra={"projection": projection_cls.__name__},
+                )
@@ -3,7 +3,7 @@
 import contextlib
 import logging
 from collections import defaultdict
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 from typing import (
     TYPE_CHECKING,
     Annotated,
@@ -38,6 +38,10 @@ from protean.utils.reflection import fields as get_fields
 
 logger = logging.getLogger(__name__)
 
+# Class attribute marking that a value object class has scanned its MRO for
+# invariants, so later instances skip the scan
+_INVARIANTS_DISCOVERED = "__invariants_discovered__"
+
 
 # ---------------------------------------------------------------------------
 # BaseValueObject
@@ -218,8 +222,10 @@ class BaseValueObject(Element, BaseModel, OptionsMixin):
                 f" and cannot be instantiated"
             )
 
-        # Discover invariants from MRO (supports VOs used without domain registration)
-        self._discover_invariants()
+        # Discover invariants from MRO (supports VOs used without domain
+        # registration). Only the first instance of a class scans.
+        if _INVARIANTS_DISCOVERED not in vars(type(self)):
+            self._discover_invariants()
 
         self.defaults()
 
@@ -234,12 +240,14 @@ class BaseValueObject(Element, BaseModel, OptionsMixin):
 
         object.__setattr__(self, "_initialized", True)
 
-    def _discover_invariants(self) -> None:
+    @classmethod
+    def _discover_invariants(cls) -> None:
         """Scan class MRO for @invariant decorated methods and register them."""
-        for klass in type(self).__mro__:
+        for klass in cls.__mro__:
             for name, attr in vars(klass).items():
                 if callable(attr) and hasattr(attr, "_invariant"):
-                    self._invariants[attr._invariant][name] = attr
+                    cls._invariants[attr._invariant][name] = attr
+        setattr(cls, _INVARIANTS_DISCOVERED, True)
 
     def __setattr__(self, name: str, value: Any) -> None:
         if not getattr(self, "_initialized", False):
@@ -328,15 +336,55 @@ class BaseValueObject(Element, BaseModel, OptionsMixin):
             result[fname] = shim.as_dict(getattr(self, fname, None))
         return result
 
+    def _field_values(self) -> tuple[Any, ...]:
+        return tuple(getattr(self, fname, None) for fname in getattr(self, _FIELDS, {}))
+
     def __eq__(self, other: object) -> bool:
         if type(other) is not type(self):
             return False
+        if other is self:
+            return True
         # The exact-type guard above guarantees ``other`` is the same
         # ``BaseValueObject`` subclass, which static checkers narrow for us.
-        return self.to_dict() == other.to_dict()
+        # Hashes already computed on both sides settle most inequalities.
+        own_hash = self.__dict__.get("_hash")
+        other_hash = other.__dict__.get("_hash")
+        if own_hash is not None and other_hash is not None and own_hash != other_hash:
+            return False
+        return self._field_values() == other._field_values()
 
     def __hash__(self) -> int:
-        return hash(frozenset(self.to_dict().items()))
+        # Value objects are immutable once initialized, so the hash is
+        # computed on first use and kept. It is left out of pickled state
+        # (see ``__getstate__``): string hashes differ between processes.
+        cached = self.__dict__.get("_hash")
+        if cached is None:
+            cached = hash(
+                frozenset(
+                    (fname, _hashable(getattr(self, fname, None)))
+                    for fname in getattr(self, _FIELDS, {})
+                )
+            )
+            if getattr(self, "_initialized", False):
+                object.__setattr__(self, "_hash", cached)
+        return cached
+
+    def model_copy(
+        self, *, update: Mapping[str, Any] | None = None, deep: bool = False
+    ) -> Self:
+        copied = super().model_copy(update=update, deep=deep)
+        if update:
+            # Pydantic writes ``update`` straight into the copy's fields
+            copied.__dict__.pop("_hash", None)
+        return copied
+
+    def __getstate__(self) -> dict[Any, Any]:
+        state = super().__getstate__()
+        if "_hash" in state["__dict__"]:
+            state["__dict__"] = {
+                key: value for key, value in state["__dict__"].items() if key != "_hash"
+            }
+        return state
 
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__}: {self}>"
@@ -354,6 +402,22 @@ class BaseValueObject(Element, BaseModel, OptionsMixin):
         )
 
 
+def _hashable(value: Any) -> Any:
+    """A hashable stand-in for a value object field's value.
+
+    Lists, tuples, sets and dicts (``List``/``Dict`` fields, and lists of
+    value objects) become tuples and frozensets of their hashable contents.
+    Nested value objects are hashable themselves.
+    """
+    if isinstance(value, (list, tuple)):
+        return tuple(_hashable(item) for item in value)
+    if isinstance(value, dict):
+        return frozenset((key, _hashable(item)) for key, item in value.items())
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_hashable(item) for item in value)
+    return value
+
+
 # ---------------------------------------------------------------------------
 # Factory
 # ---------------------------------------------------------------------------
@@ -56,7 +56,7 @@ import os
 import pathlib
 import sys
 from collections import defaultdict
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from datetime import datetime, timedelta
 from functools import lru_cache
 from pathlib import Path
@@ -75,6 +75,8 @@ if TYPE_CHECKING:
 
     from protean.port.cache import BaseCache
     from protean.port.event_store import BaseEventStore
+    from protean.server.tracing import TraceEmitter
+    from protean.utils.mixins import _RetryPolicy
     from protean.utils.outbox import OutboxRepository
     from protean.utils.projection_rebuilder import RebuildResult
     from protean.utils.upcasting import UpcasterChain
@@ -105,6 +107,8 @@ from protean.core.subscriber import subscriber_factory
 from protean.core.upcaster import BaseUpcaster, upcaster_factory
 from protean.core.value_object import value_object_factory
 from protean.core.view import ReadView
+from protean.domain.manifest import fresh_manifest_files
+from protean.domain.offload import OffloadExecutor
 from protean.domain.registry import DomainRecord, _DomainRegistry
 from protean.exceptions import (
     ConfigurationError,
@@ -140,10 +144,8 @@ from protean.integrations.logging import (
     protean_correlation_processor,
     protean_otel_processor,
 )
-from protean.ir.builder import IRBuilder
 from protean.ir.diagnostics import DiagnosticCode
 from protean.port.event_store import CausationNode
-from protean.server.tracing import TraceEmitter
 from protean.utils import (
     Clock,
     DomainObjects,
@@ -398,6 +400,8 @@ class Domain:
         self._resolver = ElementResolver(self)
         self._type_manager = TypeManager(self)
         self._validator = DomainValidator(self)
+        # Thread pool behind ``aprocess()``/``adispatch()``, created on first use
+        self._offload_executor: OffloadExecutor | None = None
 
         #: A list of functions that are called when the domain context
         #: is destroyed.  This is the place to store code that cleans up and
@@ -414,6 +418,11 @@ class Domain:
         # outbox row. Empty when no handler opts in.
         self._partition_keys: dict[str, str] = {}
 
+        # Handler class -> its resolved version/transient retry policy. Built
+        # by ``HandlerConfigurator`` during ``init()`` and read by the
+        # ``@handle`` wrapper on every invocation.
+        self._retry_policies: dict[type, _RetryPolicy] = {}
+
         # Event classes that have already emitted a raise-time deprecation
         # warning, so a deprecated event warns once per type, not per instance.
         self._deprecated_events_warned: set[type] = set()
@@ -495,7 +504,7 @@ class Domain:
         return self._idempotency_store
 
     @property
-    def trace_emitter(self) -> TraceEmitter:
+    def trace_emitter(self) -> "TraceEmitter":
         """Lazily initialize and return a TraceEmitter for command tracing.
 
         Used by CommandProcessor to emit handler.started/completed/failed
@@ -503,6 +512,9 @@ class Domain:
         in the Observatory dashboard.
         """
         if self._trace_emitter is None:
+            # Lazy startup: tracing is only needed once a command is processed.
+            from protean.server.tracing import TraceEmitter  # noqa: PLC0415
+
             observatory_config = self.config.get("observatory", {})
             try:
                 trace_retention_days = int(
@@ -645,6 +657,9 @@ class Domain:
         if validate:
             self._validate_domain()
 
+            # Resolve handler retry policies; an invalid policy fails here
+            self._handler_configurator.resolve_retry_policies()
+
     def init(self, traverse: bool = True) -> None:
         """Parse the domain folder, and attach elements dynamically to the domain.
 
@@ -720,7 +735,12 @@ class Domain:
                 file=sys.stderr,
             )
 
-    def check(self, traverse: bool = True) -> dict[str, Any]:
+    def check(
+        self,
+        traverse: bool = True,
+        *,
+        changed_files: Iterable[str | Path] | None = None,
+    ) -> dict[str, Any]:
         """Validate the domain and return a structured diagnostic report.
 
         Unlike [`init`][protean.domain.Domain.init], this method does **not** initialize adapters.
@@ -746,6 +766,11 @@ class Domain:
 
         Diagnostics have a ``level`` field (``"warning"`` or ``"info"``)
         used to compute the ``counts`` and determine the overall ``status``.
+
+        With ``changed_files``, only the diagnostics those files can affect
+        are reported, as worked out by
+        [`ChangeScope`][protean.ir.impact.ChangeScope]; ``counts`` and
+        ``status`` follow. Validator errors are always reported.
         """
         self._prepare(traverse=traverse, validate=False)
 
@@ -762,6 +787,12 @@ class Domain:
                 diagnostics = ir.get("diagnostics", [])
             except Exception:
                 pass
+            else:
+                if changed_files is not None:
+                    from protean.ir.impact import ChangeScope  # noqa: PLC0415
+
+                    scope = ChangeScope.from_files(self, ir, changed_files)
+                    diagnostics = [d for d in diagnostics if scope.includes(d)]
 
         total_errors = len(errors)
         total_warnings = sum(1 for d in diagnostics if d.get("level") == "warning")
@@ -789,15 +820,42 @@ class Domain:
         }
 
     def _traverse(self) -> None:
-        # Ensure root_path is a directory path
+        root_dir = self._domain_root_dir()
+        logger.debug(f"Loading domain from {root_dir}...")
+
+        domain_files = self._discover_domain_files(root_dir)
+
+        # A fresh element manifest (``protean manifest build``) narrows the
+        # walk to the modules that registered elements last time. A stale or
+        # missing one falls back to loading every file.
+        manifest_files = fresh_manifest_files(root_dir, domain_files)
+        if manifest_files is not None:
+            logger.debug(
+                f"Using element manifest: loading {len(manifest_files)} of "
+                f"{len(domain_files)} domain modules"
+            )
+            domain_files = manifest_files
+
+        for module_name, file_path in domain_files:
+            self._load_domain_module(module_name, file_path)
+
+    def _domain_root_dir(self) -> Path:
+        """Return the directory holding the domain file."""
         root_path = Path(self.root_path)
         if root_path.is_file():
             # If it's a file path (e.g. from __file__), get the parent directory
-            root_dir = root_path.parent
-        else:
-            # It's already a directory
-            root_dir = root_path
+            return root_path.parent
+
+        # It's already a directory
+        return root_path
 
+    def _discover_domain_files(self, root_dir: Path) -> list[tuple[str, str]]:
+        """List the ``(module name, file path)`` pairs traversal would load.
+
+        Covers the domain directory and its immediate subdirectories, skipping
+        subdirectories that carry their own domain config and the domain file
+        itself.
+        """
         # Parent Directory of the directory containing the domain file
         #
         #   We need this to decipher paths from the root. For example,
@@ -809,8 +867,6 @@ class Domain:
         # This makes relative imports possible
         system_folder_path = pathlib.Path(root_dir).parent
 
-        logger.debug(f"Loading domain from {root_dir}...")
-
         # Identify subdirectories
         subdirectories = [
             name
@@ -833,7 +889,7 @@ class Domain:
             ):
                 directories_to_traverse.append(subdirectory_path)
 
-        # Traverse directories one by one
+        domain_files: list[tuple[str, str]] = []
         for directory in directories_to_traverse:
             for filename in os.listdir(directory):
                 package_path = directory[len(str(system_folder_path)) + 1 :]
@@ -851,22 +907,36 @@ class Domain:
                         file_module_name = module_name + "." + sub_module_name
                     else:
                         file_module_name = module_name
-                    full_file_path = os.path.join(root_dir, filename)
 
-                    spec = importlib.util.spec_from_file_location(
-                        file_module_name, os.path.join(directory, filename)
-                    )
-                    assert spec is not None and spec.loader is not None
-                    module = importlib.util.module_from_spec(spec)
+                    domain_files.append((file_module_name, full_file_path))
+
+        return domain_files
+
+    def _load_domain_module(self, module_name: str, file_path: str) -> bool:
+        """Execute a domain module, unless it is already loaded.
 
-                    # Register in sys.modules before execution to prevent
-                    # duplicate loading if another module imports this one
-                    # during execution (e.g., circular or relative imports).
-                    if module.__name__ not in sys.modules:
-                        sys.modules[module.__name__] = module
-                        spec.loader.exec_module(module)
+        Returns ``True`` when the module may have registered elements: it
+        grew the registry while executing, or it was already loaded and so
+        cannot be ruled out.
+        """
+        if module_name in sys.modules:
+            return True
+
+        spec = importlib.util.spec_from_file_location(module_name, file_path)
+        assert spec is not None and spec.loader is not None
+        module = importlib.util.module_from_spec(spec)
+
+        registered_before = self._domain_registry._element_count()
+
+        # Register in sys.modules before execution to prevent
+        # duplicate loading if another module imports this one
+        # during execution (e.g., circular or relative imports).
+        sys.modules[module.__name__] = module
+        spec.loader.exec_module(module)
 
-                    logger.debug(f"Loaded {filename}")
+        logger.debug(f"Loaded {os.path.basename(file_path)}")
+
+        return self._domain_registry._element_count() > registered_before
 
     def _is_domain_file(self, file_path: str) -> bool:
         """Check if this is the domain file itself, to avoid self-import.
@@ -915,6 +985,9 @@ class Domain:
             except Exception:
                 logger.exception("Error closing %s", name)
 
+        if self._offload_executor is not None:
+            self._offload_executor.shutdown()
+
         logger.info("Domain infrastructure closed")
 
     def load_config(self, config: dict[str, Any] | None = None) -> Config2:
@@ -1383,6 +1456,8 @@ class Domain:
     def _setup_query_handlers(self) -> None:
         """Build the handler map for all registered query handlers."""
         self._handler_configurator.setup_query_handlers()
+        # Routes resolved against the previous handler map are stale now
+        self._query_processor._reset()
 
     def _generate_fact_event_classes(self) -> None:
         self._type_manager.generate_fact_event_classes()
@@ -1397,6 +1472,9 @@ class Domain:
         The domain must be initialised (``init()`` called) before invoking
         this method.
         """
+        # Lazy startup: the IR builder is large and only needed by tooling.
+        from protean.ir.builder import IRBuilder  # noqa: PLC0415
+
         return IRBuilder(self).build()
 
     ######################
@@ -2267,6 +2345,51 @@ class Domain:
             timeout=timeout,
         )
 
+    async def aprocess(
+        self,
+        command: Any,
+        asynchronous: bool | None = None,
+        idempotency_key: str | None = None,
+        raise_on_duplicate: bool = False,
+        priority: int | None = None,
+        correlation_id: str | None = None,
+        deadline: datetime | None = None,
+        timeout: timedelta | None = None,
+    ) -> Any | None:
+        """Process a command without blocking the event loop.
+
+        Runs ``process()`` on the domain's bounded thread pool (see the
+        ``offload`` config section), in a copy of the caller's context: the
+        active domain context, ``g`` and the current OpenTelemetry span carry
+        over. Takes the same arguments and returns the same result.
+
+        Raises:
+            ServiceUnavailableError: If every worker is busy and the queue is
+                full. The command was not processed.
+        """
+        return await self._offload().run(
+            "process",
+            self.process,
+            command,
+            asynchronous=asynchronous,
+            idempotency_key=idempotency_key,
+            raise_on_duplicate=raise_on_duplicate,
+            priority=priority,
+            correlation_id=correlation_id,
+            deadline=deadline,
+            timeout=timeout,
+        )
+
+    def _offload(self) -> OffloadExecutor:
+        if self._offload_executor is None:
+            offload_config = self.config.get("offload") or {}
+            self._offload_executor = OffloadExecutor(
+                self,
+                max_workers=offload_config.get("max_workers"),
+                max_queue=offload_config.get("max_queue", 100),
+            )
+        return self._offload_executor
+
     def command_handler_for(self, command: Any) -> type[BaseCommandHandler] | None:
         """Return Command Handler for a specific command."""
         return self._command_processor.handler_for(command)
@@ -2398,6 +2521,14 @@ class Domain:
         """Dispatch a query to its registered QueryHandler and return results."""
         return self._query_processor.dispatch(query)
 
+    async def adispatch(self, query: Any) -> Any:
+        """Dispatch a query without blocking the event loop.
+
+        Runs ``dispatch()`` on the same thread pool and in the same way as
+        ``aprocess()``.
+        """
+        return await self._offload().run("dispatch", self.dispatch, query)
+
     def _query_handler_for(self, query: Any) -> type | None:
         return self._query_processor.handler_for(query)
 
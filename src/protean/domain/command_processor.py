@@ -14,6 +14,7 @@ from uuid import uuid4
 
 from protean.core.command import BaseCommand
 from protean.core.command_handler import BaseCommandHandler
+from protean.domain.mailbox import AggregateMailbox
 from protean.exceptions import (
     CommandExpiredError,
     DuplicateCommandError,
@@ -34,7 +35,7 @@ from protean.utils.eventing import (
     ensure_utc,
     new_correlation_id,
 )
-from protean.utils.globals import g
+from protean.utils.globals import current_uow, g
 from protean.utils.processing import current_priority, processing_priority
 from protean.utils.reflection import id_field
 from protean.utils.telemetry import (
@@ -123,6 +124,7 @@ class CommandProcessor:
 
     def __init__(self, domain: Domain) -> None:
         self._domain = domain
+        self._mailbox = AggregateMailbox()
 
     def _default_deadline_for(self, command: BaseCommand) -> datetime | None:
         """Resolve a default deadline from the handler option or domain config.
@@ -467,7 +469,7 @@ class CommandProcessor:
                         # Set the processing priority context so that UoW.commit()
                         # can read it when creating outbox records
                         with processing_priority(resolved_priority):
-                            result = handler_class._handle(command_with_metadata)
+                            result = self._execute(handler_class, command_with_metadata)
                     except Exception as exc:
                         duration_ms = (time.monotonic() - start_time) * 1000
                         duration_s = time.monotonic() - process_start
@@ -550,6 +552,34 @@ class CommandProcessor:
 
             return position
 
+    def _execute(
+        self, handler_class: type[BaseCommandHandler], command: BaseCommand
+    ) -> Any:
+        """Run ``command``'s handler, through the aggregate's mailbox if enabled.
+
+        With ``command_mailbox.enabled``, commands for the same aggregate run
+        one at a time, in arrival order (see ``protean.domain.mailbox``).
+        Commands without an identity field, and commands processed inside an
+        active UnitOfWork (which must join it), run directly.
+        """
+        mailbox_config = self._domain.config.get("command_mailbox") or {}
+        if (
+            not mailbox_config.get("enabled", False)
+            or id_field(command) is None
+            or (current_uow and current_uow.in_progress)
+        ):
+            return handler_class._handle(command)
+
+        max_batch = 1
+        if mailbox_config.get("combine", False):
+            max_batch = max(int(mailbox_config.get("max_batch", 1)), 1)
+
+        return self._mailbox.submit(
+            command._metadata.headers.stream,
+            lambda: handler_class._handle(command),
+            max_batch=max_batch,
+        )
+
     def handler_for(self, command: Any) -> type[BaseCommandHandler] | None:
         """Return Command Handler for a specific command.
 
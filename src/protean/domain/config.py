@@ -46,6 +46,25 @@ def _default_config() -> dict[str, Any]:
         # handling command handler declares no ``timeout`` option. ``None``
         # disables the default (commands never expire unless asked to).
         "command_default_timeout": None,
+        # Per-aggregate command mailboxes. When enabled, commands for the same
+        # aggregate identity run one at a time, in arrival order, instead of
+        # racing to commit and retrying on version conflicts: in
+        # ``domain.process()`` across threads, and in the engine by combining
+        # a batch's commands per aggregate. Opt-in.
+        "command_mailbox": {
+            "enabled": False,
+            # Run commands waiting for the same aggregate in one UnitOfWork
+            "combine": False,
+            "max_batch": 50,  # Most commands combined into one UnitOfWork
+        },
+        # Thread pool behind ``domain.aprocess()`` and ``domain.adispatch()``,
+        # which run synchronous domain calls off the event loop. A call that
+        # finds every worker busy and ``max_queue`` calls already waiting is
+        # rejected with ``ServiceUnavailableError`` (HTTP 503).
+        "offload": {
+            "max_workers": None,  # None = min(32, CPU count + 4)
+            "max_queue": 100,  # None = unbounded
+        },
         "message_processing": Processing.ASYNC.value,
         "event_store": {
             "provider": "memory",
@@ -71,6 +90,7 @@ def _default_config() -> dict[str, Any]:
             "messages_per_tick": 50,  # Process outbox in efficient batches
             "tick_interval": 0.01,  # 10ms check interval for outbox
             "max_tick_interval": None,  # Cap for adaptive backoff; None = no backoff
+            "push_poll_interval_seconds": 5,  # Idle poll interval while push wakeups are live
             "retry": {
                 "max_attempts": 3,
                 "base_delay_seconds": 1,  # Faster initial retry
@@ -104,13 +124,15 @@ def _default_config() -> dict[str, Any]:
                 "retry_delay_seconds": 1,  # Delay between recovery retries
                 "enable_recovery": True,  # Enable failed position recovery
                 "recovery_interval_seconds": 30,  # How often to run recovery pass
+                "push_poll_interval_seconds": 30,  # Idle poll interval while push wakeups are live
             },
             # Stream subscription settings
             # Used when subscription_type is "stream"
             "stream_subscription": {
                 "blocking_timeout_ms": 100,  # 100ms blocking read - balance between responsiveness and CPU
                 "max_retries": 3,  # Max retry attempts before DLQ
-                "retry_delay_seconds": 1,  # Delay between retries
+                "retry_delay_seconds": 1,  # Base delay, doubled per retry
+                "retry_max_delay_seconds": 60,  # Cap on the retry backoff
                 "enable_dlq": True,  # Enable dead letter queue
             },
             # Broker subscription settings
@@ -190,6 +212,27 @@ def _default_config() -> dict[str, Any]:
                 "alert_callback": None,  # Optional dotted path to callable
                 "check_interval_seconds": 60,  # How often to run maintenance
             },
+            # Pending-message reclaim for stream subscriptions
+            # Takes over messages left unacknowledged by crashed or scaled-down
+            # consumers. Only runs against brokers advertising PENDING_RECLAIM.
+            "pending_reclaim": {
+                "enabled": True,
+                # Idle time before a pending message is claimed. Keep it above
+                # the slowest handler and stream_subscription.retry_max_delay_seconds.
+                "min_idle_ms": 120000,
+                "batch_size": 100,  # Messages claimed per stream per cycle
+                "check_interval_seconds": 30,  # How often to scan
+            },
+            # Shared reads for stream subscriptions of one consumer group
+            # (multi-category projectors and process managers): one
+            # multi-stream read serves them all. Only used with brokers
+            # advertising MULTI_STREAM_READ.
+            "read_multiplexer": {
+                "enabled": True,
+                # Longest read while some member is still processing a batch;
+                # bounds how long it waits to rejoin the shared read.
+                "busy_timeout_ms": 50,
+            },
             # Health check HTTP server for Kubernetes liveness/readiness probes
             "health": {
                 "enabled": True,
@@ -219,6 +262,9 @@ def _default_config() -> dict[str, Any]:
         # Consume-side idempotency for projectors (the ProcessedMessage marker,
         # distinct from the command idempotency store above). See ADR-0017.
         "consume_idempotency": {
+            # Recently committed markers remembered per provider, so that their
+            # redelivery skips the marker read. 0 = off.
+            "recent_window": 0,
             "cleanup": {
                 "retention_hours": 168,  # 7 days — prune markers older than this
                 "batch_size": 5000,  # Rows deleted per bounded cleanup batch
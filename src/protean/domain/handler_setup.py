@@ -17,8 +17,13 @@ from protean.core.command import BaseCommand
 from protean.core.event import BaseEvent
 from protean.core.process_manager import _generate_pm_transition_event
 from protean.core.query import BaseQuery
-from protean.exceptions import IncorrectUsageError, NotSupportedError
+from protean.exceptions import (
+    ConfigurationError,
+    IncorrectUsageError,
+    NotSupportedError,
+)
 from protean.utils import DomainObjects
+from protean.utils.mixins import _RetryPolicy
 
 if TYPE_CHECKING:
     from protean.core.process_manager import BaseProcessManager
@@ -288,6 +293,10 @@ class HandlerConfigurator:
         # Store transition event class on PM
         pm_cls._transition_event_cls = transition_cls
 
+        # Cached instances were loaded against the previous wiring (and possibly
+        # a different event store), so start each init with an empty cache.
+        pm_cls._instance_cache.clear()
+
     @staticmethod
     def _infer_stream_categories(pm_cls: type[BaseProcessManager]) -> None:
         """Infer stream categories from the aggregates of handled events."""
@@ -348,6 +357,37 @@ class HandlerConfigurator:
 
                 element.cls._handlers[query_type].add(method)
 
+    # ------------------------------------------------------------------
+    # Retry policies
+    # ------------------------------------------------------------------
+
+    def resolve_retry_policies(self) -> None:
+        """Resolve the version and transient retry policy of every handler
+        whose ``@handle`` methods retry: command handlers, event handlers, and
+        projectors.
+
+        The result is stored on ``domain._retry_policies`` for the handler
+        wrapper to read, so an invocation never re-reads retry config. A
+        handler whose policy cannot be resolved yet (e.g. a retry exception
+        that is not importable) is left out and resolved when it is invoked,
+        where the ``ConfigurationError`` surfaces as before.
+        """
+        registry = self._domain._domain_registry
+        policies: dict[type, _RetryPolicy] = {}
+        for element_type in (
+            DomainObjects.COMMAND_HANDLER,
+            DomainObjects.EVENT_HANDLER,
+            DomainObjects.PROJECTOR,
+        ):
+            for element in registry._elements[element_type.value].values():
+                try:
+                    policies[element.cls] = _RetryPolicy.resolve(
+                        element.cls, self._domain
+                    )
+                except ConfigurationError:
+                    continue
+        self._domain._retry_policies = policies
+
     # ------------------------------------------------------------------
     # Partition keys (sequential_by, ADR-0028)
     # ------------------------------------------------------------------
@@ -564,4 +604,16 @@ class HandlerConfigurator:
                 f"projection as the Query Handler"
             )
 
+        for projection_cls in getattr(method, "_cache_projections", None) or ():
+            if (
+                getattr(projection_cls, "element_type", None)
+                != DomainObjects.PROJECTION
+            ):
+                raise IncorrectUsageError(
+                    f"Method `{method_name}` in Query Handler "
+                    f"`{handler_cls.__name__}` caches its results against "
+                    f"`{getattr(projection_cls, '__name__', projection_cls)}`, "
+                    f"which is not a Projection"
+                )
+
         return target_cls
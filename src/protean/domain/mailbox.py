@@ -0,0 +1,210 @@
+"""Per-aggregate command mailboxes.
+
+When many callers process commands against the same aggregate at once, each
+handler loads the aggregate, changes it and races the others to commit. All
+but one fail with ``ExpectedVersionError`` and are retried after a backoff
+and a full reload, so throughput on a hot aggregate falls as concurrency
+rises.
+
+An ``AggregateMailbox`` serializes commands by aggregate identity instead.
+The first caller for an identity becomes its runner and executes the
+command. Callers that arrive while it runs queue behind it and wait. When it
+finishes, the runner hands the mailbox to the oldest waiter, which runs next
+against the state just committed, so none of them conflicts with another.
+
+A runner may also take several waiting commands at once and run them in one
+``UnitOfWork`` that commits once (``max_batch`` above one). Each command runs
+in the context its caller submitted it from, so ``g``, the message in
+context and the processing priority are the caller's own. If any of them
+fails, or the combined commit does, the transaction is rolled back and every
+command in it runs again on its own, so each caller gets the outcome its
+command would have had alone. Handlers are already expected to be safe to
+run again, as version and transient retries do.
+
+Commands for different identities never wait for one another.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import logging
+import threading
+from collections import deque
+from collections.abc import Callable
+from typing import Any
+
+from protean.core.unit_of_work import UnitOfWork, _uow_stack
+
+logger = logging.getLogger(__name__)
+
+
+class _Job:
+    """A submitted command, its caller's context and its outcome."""
+
+    __slots__ = ("context", "done", "error", "fn", "promoted", "result")
+
+    def __init__(self, fn: Callable[[], Any]) -> None:
+        self.fn = fn
+        self.context = contextvars.copy_context()
+        self.done = threading.Event()
+        # Set instead of ``done`` when the job becomes the mailbox's runner
+        self.promoted = False
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+    def run(self) -> None:
+        """Run alone, in the caller's context, and record the outcome."""
+        try:
+            self.result = self.context.run(self.fn)
+        except Exception as exc:
+            self.error = exc
+
+    def run_joined(self, uow: UnitOfWork) -> Any:
+        """Run in the caller's context as a participant in ``uow``."""
+        return self.context.run(_joined, uow, self.fn)
+
+    def outcome(self) -> Any:
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+def _joined(uow: UnitOfWork, fn: Callable[[], Any]) -> Any:
+    # A handler's own UnitOfWork, started with ``uow`` on top of the stack,
+    # joins it as a participant instead of committing on its own.
+    _uow_stack.push(uow)
+    try:
+        return fn()
+    finally:
+        _uow_stack.pop()
+
+
+class AggregateMailbox:
+    """Run commands one at a time per aggregate identity, in arrival order.
+
+    Thread-safe. A command submitted from a thread that is already running
+    commands for the same identity (for example, from a synchronous event
+    handler dispatched by the command's commit) runs immediately instead of
+    queueing behind itself.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        # Waiting jobs per identity. A key is present while a runner holds it.
+        self._queues: dict[str, deque[_Job]] = {}
+        self._running = threading.local()
+
+    def _held(self) -> set[str]:
+        held = getattr(self._running, "keys", None)
+        if held is None:
+            held = self._running.keys = set()
+        return held
+
+    def submit(self, key: str, fn: Callable[[], Any], max_batch: int = 1) -> Any:
+        """Run ``fn`` once every earlier command for ``key`` has finished.
+
+        Args:
+            key: The aggregate identity commands are serialized on.
+            fn: Runs the command and returns the handler's result.
+            max_batch: How many waiting commands a runner may combine into one
+                ``UnitOfWork``. ``1`` runs every command in its own.
+
+        Returns:
+            Whatever ``fn`` returned. Whatever it raised is raised here.
+        """
+        held = self._held()
+        if key in held:
+            return fn()
+
+        job = _Job(fn)
+        with self._lock:
+            queue = self._queues.get(key)
+            if queue is None:
+                self._queues[key] = deque()
+            else:
+                queue.append(job)
+
+        if queue is not None:
+            job.done.wait()
+            if not job.promoted:
+                return job.outcome()
+
+        held.add(key)
+        try:
+            batch = [job]
+            if max_batch > 1:
+                with self._lock:
+                    queue = self._queues[key]
+                    while queue and len(batch) < max_batch:
+                        batch.append(queue.popleft())
+            self._run(batch)
+        finally:
+            held.discard(key)
+            self._hand_over(key)
+            for other in batch[1:]:
+                other.done.set()
+
+        return job.outcome()
+
+    def _hand_over(self, key: str) -> None:
+        """Promote the oldest waiter for ``key`` to runner, or release the key."""
+        with self._lock:
+            queue = self._queues[key]
+            if not queue:
+                del self._queues[key]
+                return
+            successor = queue.popleft()
+        successor.promoted = True
+        successor.done.set()
+
+    def _run(self, batch: list[_Job]) -> None:
+        if len(batch) == 1:
+            # The runner's own job, in its own context: nothing to copy back
+            job = batch[0]
+            try:
+                job.result = job.fn()
+            except Exception as exc:
+                job.error = exc
+            return
+
+        try:
+            if self._run_combined(batch):
+                return
+        except BaseException as exc:
+            # Interrupted: the waiters must not wait forever
+            for job in batch:
+                job.error = exc
+            raise
+
+        logger.debug(
+            "mailbox.batch_split",
+            extra={"batch_size": len(batch)},
+        )
+        for job in batch:
+            job.result, job.error = None, None
+            job.run()
+
+    def _run_combined(self, batch: list[_Job]) -> bool:
+        """Run ``batch`` in one UnitOfWork; ``False`` if it was rolled back."""
+        uow = UnitOfWork()
+        uow.start()
+        try:
+            for job in batch:
+                job.result = job.run_joined(uow)
+                if uow._rollback_only:
+                    uow.rollback()
+                    return False
+        except Exception:
+            uow.rollback()
+            return False
+        except BaseException:
+            uow.rollback()
+            raise
+
+        try:
+            uow.commit()
+        except Exception:
+            if uow.in_progress:
+                uow.rollback()
+            return False
+        return True
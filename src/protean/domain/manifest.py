@@ -0,0 +1,178 @@
+"""Precompiled element manifest for faster ``Domain.init()``.
+
+Traversal executes every ``.py`` file under the domain directory on each
+``Domain.init()``, and every worker spawned by the ``Supervisor`` repeats it.
+The manifest records which of those modules actually registered elements, so a
+later ``init()`` can execute only those and skip helpers, scripts and other
+element-free files.
+
+The manifest lives at ``<domain dir>/.protean/manifest.json`` and is built with
+``protean manifest build``. It is opt-in: without the file, traversal is
+unchanged. Like the IR staleness check, it carries a fingerprint of the files it
+was built from (relative path, ``mtime_ns`` and size of every traversed file).
+Adding, removing or editing any of them, or upgrading Protean, makes the manifest
+stale, and ``init()`` silently falls back to the full walk until it is rebuilt.
+
+Usage::
+
+    from protean.domain.manifest import build_manifest
+
+    path = build_manifest(domain)  # before domain.init()
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from enum import StrEnum
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from protean import __version__
+
+if TYPE_CHECKING:
+    from protean.domain import Domain
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "ManifestStatus",
+    "build_manifest",
+    "fresh_manifest_files",
+    "manifest_path",
+    "manifest_status",
+]
+
+MANIFEST_VERSION = 1
+
+_MANIFEST_DIR = ".protean"
+_MANIFEST_FILENAME = "manifest.json"
+
+
+class ManifestStatus(StrEnum):
+    """Outcome of a manifest freshness check."""
+
+    FRESH = "fresh"
+    """The manifest matches the domain files on disk."""
+
+    STALE = "stale"
+    """Domain files, the manifest format or the Protean version changed."""
+
+    NO_MANIFEST = "no_manifest"
+    """No manifest file exists, or it could not be read."""
+
+
+def manifest_path(root_dir: Path | str) -> Path:
+    """Return the manifest location for the domain directory *root_dir*."""
+    return Path(root_dir) / _MANIFEST_DIR / _MANIFEST_FILENAME
+
+
+def _fingerprint(
+    root_dir: Path, domain_files: list[tuple[str, str]]
+) -> dict[str, list[int]]:
+    fingerprint: dict[str, list[int]] = {}
+    for _, file_path in domain_files:
+        stat = os.stat(file_path)
+        relative = Path(file_path).relative_to(root_dir).as_posix()
+        fingerprint[relative] = [stat.st_mtime_ns, stat.st_size]
+    return fingerprint
+
+
+def _load(root_dir: Path) -> dict[str, Any] | None:
+    path = manifest_path(root_dir)
+    if not path.exists():
+        return None
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError) as exc:
+        logger.warning(f"Ignoring unreadable element manifest {path}: {exc}")
+        return None
+    if not isinstance(data, dict):
+        logger.warning(f"Ignoring malformed element manifest {path}")
+        return None
+    return data
+
+
+def _status(
+    data: dict[str, Any] | None,
+    root_dir: Path,
+    domain_files: list[tuple[str, str]],
+) -> ManifestStatus:
+    if data is None:
+        return ManifestStatus.NO_MANIFEST
+    if (
+        data.get("manifest_version") != MANIFEST_VERSION
+        or data.get("protean_version") != __version__
+        or data.get("files") != _fingerprint(root_dir, domain_files)
+    ):
+        return ManifestStatus.STALE
+    return ManifestStatus.FRESH
+
+
+def manifest_status(domain: Domain) -> ManifestStatus:
+    """Check *domain*'s manifest against its files on disk.
+
+    Only lists and stats the domain files; no domain module is executed.
+    """
+    root_dir = domain._domain_root_dir()
+    domain_files = domain._discover_domain_files(root_dir)
+    return _status(_load(root_dir), root_dir, domain_files)
+
+
+def fresh_manifest_files(
+    root_dir: Path, domain_files: list[tuple[str, str]]
+) -> list[tuple[str, str]] | None:
+    """Return the ``(module name, file path)`` pairs to load from a fresh manifest.
+
+    *domain_files* is the full traversal list. Returns ``None`` when there is
+    no manifest or it is stale, in which case the caller loads everything.
+    """
+    data = _load(root_dir)
+    status = _status(data, root_dir, domain_files)
+    if status != ManifestStatus.FRESH:
+        if status == ManifestStatus.STALE:
+            logger.debug(
+                f"Element manifest {manifest_path(root_dir)} is stale; "
+                "loading all domain modules"
+            )
+        return None
+
+    assert data is not None
+    return [
+        (module_name, str(root_dir / relative))
+        for module_name, relative in data["modules"]
+    ]
+
+
+def build_manifest(domain: Domain) -> Path:
+    """Traverse *domain*'s files and write the element manifest.
+
+    Call this on a domain that has not been initialized: it loads every domain
+    module (like ``init()``'s traversal) and records the ones that registered
+    elements. A module that was already imported is recorded too, because its
+    contribution cannot be observed.
+
+    Returns the path of the written manifest.
+    """
+    root_dir = domain._domain_root_dir()
+    domain_files = domain._discover_domain_files(root_dir)
+
+    modules = [
+        [module_name, Path(file_path).relative_to(root_dir).as_posix()]
+        for module_name, file_path in domain_files
+        if domain._load_domain_module(module_name, file_path)
+    ]
+
+    data = {
+        "manifest_version": MANIFEST_VERSION,
+        "protean_version": __version__,
+        "domain": domain.name,
+        "files": _fingerprint(root_dir, domain_files),
+        "modules": modules,
+    }
+
+    path = manifest_path(root_dir)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
+    return path
@@ -0,0 +1,152 @@
+"""Off-loop execution of synchronous domain calls.
+
+``domain.process()`` and ``domain.dispatch()`` are synchronous: repository,
+event store and broker I/O all block the calling thread. Called from an async
+web endpoint, they block the event loop, and one slow commit stalls every
+other request the process is serving.
+
+``domain.aprocess()`` and ``domain.adispatch()`` run the same calls on an
+``OffloadExecutor``, a bounded thread pool shared by the domain. Each call runs
+in a copy of its caller's context, so the active domain context, the ``g``
+values set for the request (such as its correlation ID) and the current
+OpenTelemetry span all carry over to the worker thread.
+
+The pool holds at most ``max_workers`` running calls and ``max_queue`` waiting
+ones. A call that arrives when both are full is rejected at once with
+``ServiceUnavailableError`` rather than queueing without bound, which
+``register_exception_handlers`` maps to HTTP 503.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import os
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any
+
+from protean.exceptions import ConfigurationError, ServiceUnavailableError
+from protean.utils.telemetry import get_domain_metrics
+
+if TYPE_CHECKING:
+    from protean.domain import Domain
+
+
+def _default_max_workers() -> int:
+    # The same default as ``ThreadPoolExecutor``
+    return min(32, (os.cpu_count() or 1) + 4)
+
+
+class OffloadExecutor:
+    """A bounded thread pool for running synchronous domain calls off the
+    event loop.
+
+    Thread-safe. The pool's threads are started on first use and stopped by
+    ``shutdown()``, which ``Domain.close()`` calls.
+    """
+
+    def __init__(
+        self,
+        domain: Domain,
+        max_workers: int | None = None,
+        max_queue: int | None = 100,
+    ) -> None:
+        if max_workers is None:
+            max_workers = _default_max_workers()
+        if not isinstance(max_workers, int) or max_workers < 1:
+            raise ConfigurationError(
+                f"`offload.max_workers` must be a positive integer, got {max_workers!r}"
+            )
+        if max_queue is not None and (not isinstance(max_queue, int) or max_queue < 0):
+            raise ConfigurationError(
+                f"`offload.max_queue` must be a non-negative integer or None, "
+                f"got {max_queue!r}"
+            )
+
+        self._domain = domain
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+
+        self._lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
+        # Calls submitted and not yet finished, running or waiting
+        self._in_flight = 0
+
+    @property
+    def queue_depth(self) -> int:
+        """Calls waiting for a free worker."""
+        return max(self._in_flight - self.max_workers, 0)
+
+    async def run(
+        self, operation: str, fn: Callable[..., Any], *args: Any, **kwargs: Any
+    ) -> Any:
+        """Run ``fn(*args, **kwargs)`` on the pool and await its result.
+
+        Args:
+            operation: Names the call in metrics (``process``, ``dispatch``).
+            fn: The synchronous callable to run.
+
+        Returns:
+            Whatever ``fn`` returned. Whatever it raised is raised here.
+
+        Raises:
+            ServiceUnavailableError: If every worker is busy and the queue is
+                full.
+
+        Cancelling the awaiting task does not stop a call that has already
+        started; it runs to completion on its worker. A call still waiting
+        for a worker is dropped, and its place in the queue freed.
+        """
+        context = contextvars.copy_context()
+        metrics = get_domain_metrics(self._domain)
+        attributes = {"operation": operation}
+
+        submitted_at = time.perf_counter()
+
+        def _call() -> Any:
+            metrics.offload_queue_wait.record(
+                time.perf_counter() - submitted_at, attributes
+            )
+            return context.run(fn, *args, **kwargs)
+
+        def _release(_: Future[Any]) -> None:
+            with self._lock:
+                self._in_flight -= 1
+
+        with self._lock:
+            if (
+                self.max_queue is not None
+                and self._in_flight >= self.max_workers + self.max_queue
+            ):
+                metrics.offload_rejected.add(1, attributes)
+                raise ServiceUnavailableError(
+                    f"Cannot {operation}: all {self.max_workers} workers are busy "
+                    f"and {self.max_queue} calls are already waiting"
+                )
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="protean-offload",
+                )
+            future = self._executor.submit(_call)
+            self._in_flight += 1
+
+        # A done callback, not a ``finally`` in ``_call``: cancelling the
+        # awaiting task cancels a call still waiting in the queue, and a
+        # cancelled call never runs. Added outside the lock, since it runs
+        # at once on a future that is already done.
+        future.add_done_callback(_release)
+        return await asyncio.wrap_future(future)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the pool's threads once the calls already submitted finish.
+
+        The pool starts again on the next call.
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
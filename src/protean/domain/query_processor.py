@@ -2,23 +2,71 @@
 
 The ``QueryProcessor`` resolves query handlers and dispatches queries
 to them, returning results synchronously.
+
+A ``@read(Query, cache_ttl=...)`` method's results are cached in the domain's
+``default`` cache, keyed by the query's type and payload. Each entry carries
+the *stamps* of the projections the query reads: a random token per
+projection, stored in the same cache and replaced whenever a write to the
+projection commits. An entry is served only while every stamp it carries is
+still current, so a cached result never outlives the next committed write to
+what it was read from, in this process or any other sharing the cache.
+
+A stamp that is missing (never written, expired, or evicted) is replaced by a
+new token before the handler runs, so entries stamped with an earlier token
+cannot come back into use.
+
+Entries are JSON, so reading one back never runs code from the cache. Plain
+JSON values are stored as they are; projections, ``ResultSet``s and
+``Record``s are tagged with what they are and rebuilt from their ``to_dict()``,
+projections only into a class registered with the domain. A result holding
+anything else is returned uncached.
 """
 
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
+import uuid
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
+from protean.core.projection import BaseProjection
 from protean.core.query import BaseQuery
-from protean.exceptions import IncorrectUsageError
+from protean.core.queryset import Record, ResultSet
+from protean.exceptions import (
+    IncorrectUsageError,
+    NotSupportedError,
+    ValidationError,
+)
 from protean.utils import DomainObjects, fqn
+from protean.utils.globals import current_uow
+from protean.utils.telemetry import get_domain_metrics
 
 if TYPE_CHECKING:
     from protean.core.query_handler import BaseQueryHandler
     from protean.domain import Domain
+    from protean.port.cache import BaseCache
 
 logger = logging.getLogger(__name__)
 
+_STAMP_KEY = "protean:query-stamp:{}"
+_RESULT_KEY = "protean:query:{}:{}"
+
+# Marks a JSON object in a cached result as an encoded value, not a plain dict
+_TAG = "__protean__"
+
+
+@dataclass(frozen=True)
+class _Route:
+    """Where a query type is handled, and how its results are cached."""
+
+    handler_cls: type[BaseQueryHandler]
+    # ``None`` when the handler method does not cache its results
+    cache_ttl: int | float | None = None
+    # Fully qualified names of the projections whose writes invalidate them
+    projections: tuple[str, ...] = ()
+
 
 class QueryProcessor:
     """Dispatch queries to their registered handlers.
@@ -29,6 +77,16 @@ class QueryProcessor:
 
     def __init__(self, domain: Domain) -> None:
         self._domain = domain
+        self._routes: dict[str, _Route] = {}
+        # Projections read by a caching handler; built with the routes
+        self._cached_projections: frozenset[str] | None = None
+        # Whether the ``default`` cache was found unable to hold results
+        self._warned_unsupported = False
+
+    def _reset(self) -> None:
+        """Forget resolved routes, after the handler map is rebuilt."""
+        self._routes.clear()
+        self._cached_projections = None
 
     def dispatch(self, query: Any) -> Any:
         """Dispatch a query to its registered QueryHandler and return results.
@@ -60,8 +118,8 @@ class QueryProcessor:
                 f"in domain {self._domain.name}"
             )
 
-        handler_cls = self.handler_for(query)
-        if handler_cls is None:
+        route = self._route_for(query)
+        if route is None:
             raise IncorrectUsageError(
                 f"No Query Handler registered for `{query.__class__.__name__}`"
             )
@@ -69,18 +127,253 @@ class QueryProcessor:
         tracer = self._domain.tracer
         with tracer.start_as_current_span("protean.query.dispatch") as span:
             span.set_attribute("protean.query.type", query.__class__.__type__)
-            span.set_attribute("protean.handler.name", handler_cls.__name__)
-            return handler_cls._handle(query)
+            span.set_attribute("protean.handler.name", route.handler_cls.__name__)
+            if route.cache_ttl is None:
+                return route.handler_cls._handle(query)
+            return self._dispatch_cached(query, route, span)
 
     def handler_for(self, query: Any) -> type[BaseQueryHandler] | None:
         """Find the QueryHandler class registered to handle *query*.
 
         Returns ``None`` when no handler is registered.
         """
+        route = self._route_for(query)
+        return route.handler_cls if route is not None else None
+
+    def _route_for(self, query: Any) -> _Route | None:
+        """Resolve *query*'s route, once per query type."""
+        query_type = query.__class__.__type__
+        route = self._routes.get(query_type)
+        if route is not None:
+            return route
+
         for record in self._domain.registry._elements[
             DomainObjects.QUERY_HANDLER.value
         ].values():
             handler_cls: type[BaseQueryHandler] = record.cls
-            if query.__class__.__type__ in handler_cls._handlers:
-                return handler_cls
+            if query_type in handler_cls._handlers:
+                route = self._routes[query_type] = self._route(handler_cls, query_type)
+                return route
         return None
+
+    @staticmethod
+    def _route(handler_cls: type[BaseQueryHandler], query_type: str) -> _Route:
+        cache_ttl: int | float | None = None
+        projections: tuple[str, ...] = ()
+        for method in handler_cls._handlers[query_type]:
+            cache_ttl = getattr(method, "_cache_ttl", None)
+            if cache_ttl is not None:
+                projections = tuple(
+                    fqn(projection_cls)
+                    for projection_cls in getattr(method, "_cache_projections", None)
+                    or (handler_cls.meta_.part_of,)
+                )
+        return _Route(handler_cls, cache_ttl, projections)
+
+    # ------------------------------------------------------------------
+    # Result caching
+    # ------------------------------------------------------------------
+
+    def _dispatch_cached(self, query: BaseQuery, route: _Route, span: Any) -> Any:
+        """Answer *query* from the cache when a current result is there.
+
+        Inside a UnitOfWork the handler may read the transaction's own
+        uncommitted writes, so the cache is neither read nor filled there.
+        A cache that cannot be reached is logged and bypassed, as is one
+        whose adapter does not store raw values.
+        """
+        if current_uow and current_uow.in_progress:
+            span.set_attribute("protean.query.cache", "bypass")
+            return route.handler_cls._handle(query)
+
+        query_type = query.__class__.__type__
+        cache = self._cache()
+        result_key = _RESULT_KEY.format(query_type, _payload_digest(query))
+        try:
+            stamps = self._stamps(cache, route, result_key)
+        except NotSupportedError:
+            if not self._warned_unsupported:
+                self._warned_unsupported = True
+                logger.warning(
+                    "query_cache.unsupported",
+                    extra={"cache": cache.name, "adapter": type(cache).__name__},
+                )
+            span.set_attribute("protean.query.cache", "bypass")
+            return route.handler_cls._handle(query)
+        except Exception:
+            logger.warning(
+                "query_cache.unavailable",
+                extra={"cache": cache.name, "query": query_type},
+                exc_info=True,
+            )
+            span.set_attribute("protean.query.cache", "bypass")
+            return route.handler_cls._handle(query)
+
+        metrics = get_domain_metrics(self._domain)
+        attributes = {"cache": cache.name, "query": query_type}
+        if isinstance(stamps, _Hit):
+            metrics.cache_hits.add(1, attributes)
+            span.set_attribute("protean.query.cache", "hit")
+            return stamps.result
+
+        metrics.cache_misses.add(1, attributes)
+        span.set_attribute("protean.query.cache", "miss")
+        result = route.handler_cls._handle(query)
+        try:
+            entry = json.dumps(
+                {"stamps": [stamp.hex() for stamp in stamps], "result": _encode(result)}
+            ).encode()
+        except (TypeError, ValueError):
+            logger.warning(
+                "query_cache.unserializable_result",
+                extra={"query": query_type, "result": type(result).__name__},
+                exc_info=True,
+            )
+            return result
+        try:
+            cache._set_raw(result_key, entry, route.cache_ttl)
+        except Exception:
+            logger.warning(
+                "query_cache.unavailable",
+                extra={"cache": cache.name, "query": query_type},
+                exc_info=True,
+            )
+        return result
+
+    def _stamps(
+        self, cache: BaseCache, route: _Route, result_key: str
+    ) -> _Hit | tuple[bytes, ...]:
+        """Read the route's current stamps and *result_key* in one round trip.
+
+        Returns the cached result when the entry's stamps are all current, and
+        otherwise the stamps a fresh result is to be stored with, writing a
+        new token for each stamp that is missing.
+        """
+        stamp_keys = [_STAMP_KEY.format(name) for name in route.projections]
+        *current, entry = cache._get_raw([*stamp_keys, result_key])
+
+        stamps: list[bytes] = []
+        for stamp_key, stamp in zip(stamp_keys, current, strict=True):
+            if stamp is None:
+                stamp = _new_stamp()
+                cache._set_raw(stamp_key, stamp)
+            stamps.append(stamp)
+
+        if entry is not None and None not in current:
+            try:
+                cached = json.loads(entry)
+                if cached["stamps"] == [stamp.hex() for stamp in stamps]:
+                    return _Hit(self._decode(cached["result"]))
+            # An entry that does not decode, say one written by an older
+            # release or for a projection since renamed, is a miss
+            except (ValueError, TypeError, KeyError, ValidationError):
+                logger.debug("query_cache.undecodable_entry", exc_info=True)
+        return tuple(stamps)
+
+    def _decode(self, value: Any) -> Any:
+        """Rebuild a result from what ``_encode`` made of it."""
+        if isinstance(value, list):
+            return [self._decode(item) for item in value]
+        if not isinstance(value, dict):
+            return value
+        tag = value.get(_TAG)
+        if tag is None:
+            return {key: self._decode(item) for key, item in value.items()}
+        if tag == "projection":
+            projections = self._domain.registry._elements[
+                DomainObjects.PROJECTION.value
+            ]
+            return projections[value["class"]].cls(value["data"])
+        if tag == "resultset":
+            return ResultSet(
+                offset=value["offset"],
+                limit=value["limit"],
+                total=value["total"],
+                items=self._decode(value["items"]),
+            )
+        if tag == "record":
+            return Record(value["entity"], self._decode(value["data"]))
+        raise ValueError(f"Unknown cached value `{tag}`")
+
+    def _cache(self) -> BaseCache:
+        caches = self._domain.caches
+        if "default" not in caches:
+            caches._initialize()
+        return caches["default"]
+
+    def _caches_results_of(self, projection_cls: type) -> bool:
+        """Whether any caching query handler reads *projection_cls*."""
+        if self._cached_projections is None:
+            self._cached_projections = frozenset(
+                name
+                for record in self._domain.registry._elements[
+                    DomainObjects.QUERY_HANDLER.value
+                ].values()
+                for query_type in list(record.cls._handlers)
+                for name in self._route(record.cls, query_type).projections
+            )
+        return fqn(projection_cls) in self._cached_projections
+
+    def invalidate(self, projection_cls: type) -> None:
+        """Invalidate every cached query result read from *projection_cls*.
+
+        Writes to the projection call this once they are visible to readers:
+        the DAO when its transaction commits (see
+        ``UnitOfWork.invalidate_queries_on_commit``), a cache adapter right
+        after it writes. Does nothing unless a caching handler reads the
+        projection.
+        """
+        if not self._caches_results_of(projection_cls):
+            return
+        try:
+            self._cache()._set_raw(_STAMP_KEY.format(fqn(projection_cls)), _new_stamp())
+        except NotSupportedError:
+            # A cache without raw values holds no results to invalidate
+            return
+
+
+@dataclass(frozen=True)
+class _Hit:
+    result: Any
+
+
+def _new_stamp() -> bytes:
+    return uuid.uuid4().bytes
+
+
+def _encode(value: Any) -> Any:
+    """*value* as plain JSON, tagging what ``QueryProcessor._decode`` rebuilds.
+
+    Raises ``TypeError`` for a value that cannot be stored. Tuples are stored,
+    and come back, as lists.
+    """
+    if value is None or isinstance(value, (str, int, float)):
+        return value
+    if isinstance(value, (list, tuple)):
+        return [_encode(item) for item in value]
+    if isinstance(value, dict):
+        if _TAG in value or not all(isinstance(key, str) for key in value):
+            raise TypeError("Only dicts with string keys can be cached")
+        return {key: _encode(item) for key, item in value.items()}
+    if isinstance(value, BaseProjection):
+        return {_TAG: "projection", "class": fqn(type(value)), "data": value.to_dict()}
+    if isinstance(value, ResultSet):
+        return {
+            _TAG: "resultset",
+            "offset": value.offset,
+            "limit": value.limit,
+            "total": value.total,
+            "items": _encode(value.items),
+        }
+    if isinstance(value, Record):
+        return {
+            _TAG: "record",
+            "entity": value._entity_name,
+            "data": _encode(value._data),
+        }
+    raise TypeError(f"`{type(value).__name__}` results cannot be cached")
+
+
+def _payload_digest(query: BaseQuery) -> str:
+    payload = json.dumps(query.payload, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
@@ -133,6 +133,10 @@ class _DomainRegistry:
         for element_type in DomainObjects:
             self._elements[element_type.value] = {}
 
+    def _element_count(self) -> int:
+        """Return the number of registered elements, internal ones included."""
+        return sum(len(records) for records in self._elements.values())
+
     def _is_invalid_element_cls(self, element_cls: type[Element]) -> bool:
         """Ensure that we are dealing with an element class, that:
 
@@ -13,6 +13,7 @@ from typing import TYPE_CHECKING, Any
 
 from protean.core.aggregate import BaseAggregate
 from protean.core.command_handler import derive_command_stream_category
+from protean.core.entity import BaseEntity
 from protean.core.process_manager import BaseProcessManager
 from protean.exceptions import ConfigurationError, NotSupportedError
 from protean.utils import DomainObjects
@@ -57,6 +58,7 @@ class ElementResolver:
                                 ),
                             )
                             field_obj._resolve_to_cls(self._domain, to_cls, owner_cls)
+                            self._reset_construction_plan(owner_cls)
                         case "ValueObject":
                             field_obj, owner_cls = params
                             to_cls = self._domain.fetch_element_cls_from_registry(
@@ -64,6 +66,7 @@ class ElementResolver:
                                 (DomainObjects.VALUE_OBJECT,),
                             )
                             field_obj._resolve_to_cls(self._domain, to_cls, owner_cls)
+                            self._reset_construction_plan(owner_cls)
                         case "AggregateCls":
                             cls = params
                             to_cls = self._domain.fetch_element_cls_from_registry(
@@ -105,6 +108,16 @@ class ElementResolver:
             if resolved:
                 del pending[name]
 
+    @staticmethod
+    def _reset_construction_plan(owner_cls: Any) -> None:
+        """Rebuild an entity's construction plan on its next instantiation.
+
+        Resolving a reference renames shadow fields and binds new descriptors,
+        which the plan has captured if the class was instantiated before.
+        """
+        if isinstance(owner_cls, type) and issubclass(owner_cls, BaseEntity):
+            owner_cls._reset_construction_plan()
+
     def _finalize_aggregate_link(self, cls: Any, aggregate_cls: Any) -> None:
         """Complete element wiring deferred when ``part_of`` was a string.
 
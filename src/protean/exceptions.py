@@ -39,6 +39,7 @@ __all__ = [
     "ProteanException",
     "ProteanExceptionWithMessage",
     "SendError",
+    "ServiceUnavailableError",
     "TooManyObjectsError",
     "TransactionError",
     "ValidationError",
@@ -326,6 +327,13 @@ class CommandExpiredError(ProteanException):
         self.deadline = deadline
 
 
+class ServiceUnavailableError(ProteanException):
+    """Raised when a call is turned away because the domain is at capacity,
+    such as when ``domain.aprocess()`` finds every worker busy and its queue
+    full. The call was not attempted and may be retried later.
+    """
+
+
 class DeserializationError(ProteanException):
     """Exception raised when message deserialization fails.
 
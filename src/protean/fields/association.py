@@ -525,7 +525,11 @@ class HasOne(Association):
                     elif isinstance(field_obj, HasOne):
                         setattr(old_value, field_name, None)
 
-        if instance._initialized and instance._root is not None:
+        if (
+            instance._initialized
+            and instance._root is not None
+            and not instance._defer_change_checks()
+        ):
             instance._root._postcheck()  # Trigger validations from the top
 
     def _fetch_objects(self, instance: Any, key: str, value: Any) -> Any:
@@ -618,7 +622,11 @@ class HasMany(Association):
         super().__set__(instance, items)
 
         # Pre-check invariants before mutation
-        if instance._initialized and instance._root is not None:
+        if (
+            instance._initialized
+            and instance._root is not None
+            and not instance._defer_change_checks()
+        ):
             instance._root._precheck()
 
         assert self.field_name is not None
@@ -706,7 +714,11 @@ class HasMany(Association):
         # aggregates that have no database tables.
         self.set_cached_value(instance, new_data)
 
-        if instance._initialized and instance._root is not None:
+        if (
+            instance._initialized
+            and instance._root is not None
+            and not instance._defer_change_checks()
+        ):
             instance._root._postcheck()  # Trigger validations from the top
 
     def remove(self, instance: Any, items: Any) -> None:
@@ -722,7 +734,11 @@ class HasMany(Association):
             items (list | BaseEntity): The linked entity or entities to be removed.
         """
         # Pre-check invariants before mutation
-        if instance._initialized and instance._root is not None:
+        if (
+            instance._initialized
+            and instance._root is not None
+            and not instance._defer_change_checks()
+        ):
             instance._root._precheck()
 
         assert self.field_name is not None
@@ -773,7 +789,11 @@ class HasMany(Association):
             ]
             self.set_cached_value(instance, new_data)
 
-        if instance._initialized and instance._root is not None:
+        if (
+            instance._initialized
+            and instance._root is not None
+            and not instance._defer_change_checks()
+        ):
             instance._root._postcheck()  # Trigger validations from the top
 
     def _fetch_objects(self, instance: Any, key: str, value: Any) -> list[Any]:
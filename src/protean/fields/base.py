@@ -189,21 +189,18 @@ class Field(FieldBase, FieldDescriptorMixin, metaclass=ABCMeta):
         value = self._load(value)
 
         # The hasattr check is necessary to avoid running invariant checks on unrelated elements
-        if (
+        check_invariants = (
             instance._initialized
             and hasattr(instance, "_root")
             and instance._root is not None
-        ):
+            and not instance._defer_change_checks()
+        )
+        if check_invariants:
             instance._root._precheck()  # Trigger validations from the top
 
         instance.__dict__[self.field_name] = value
 
-        # The hasattr check is necessary to avoid running invariant checks on unrelated elements
-        if (
-            instance._initialized
-            and hasattr(instance, "_root")
-            and instance._root is not None
-        ):
+        if check_invariants:
             instance._root._postcheck()  # Trigger validations from the top
 
         # Mark Entity as Dirty
@@ -17,6 +17,7 @@ from protean.exceptions import (
     InvalidOperationError,
     InvalidStateError,
     ObjectNotFoundError,
+    ServiceUnavailableError,
     ValidationError,
 )
 from protean.utils.globals import g
@@ -97,3 +98,12 @@ def register_exception_handlers(app: FastAPI) -> None:
             status_code=422,
             content=_error_body(str(exc), _get_correlation_id()),
         )
+
+    @app.exception_handler(ServiceUnavailableError)
+    async def service_unavailable_handler(
+        request: Request, exc: ServiceUnavailableError
+    ) -> JSONResponse:
+        return JSONResponse(
+            status_code=503,
+            content=_error_body(str(exc), _get_correlation_id()),
+        )
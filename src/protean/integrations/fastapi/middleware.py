@@ -25,17 +25,19 @@ Usage::
 from __future__ import annotations
 
 import logging
+import re
 import time
-from collections.abc import Callable, Iterable
+from collections.abc import Callable, Iterable, Mapping
 from contextlib import nullcontext
+from dataclasses import dataclass
 from typing import Any
 from uuid import uuid4
 
 import structlog
-from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
-from starlette.responses import PlainTextResponse, Response
-from starlette.types import ASGIApp
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from protean.domain import Domain
 from protean.integrations.logging import LOG_RECORD_RESERVED_ATTRS
@@ -98,7 +100,21 @@ _HTTP_FRAMEWORK_FIELDS = frozenset(
 )
 
 
-class DomainContextMiddleware(BaseHTTPMiddleware):
+# Forbidden keys for app-provided wide-event context (see ``_emit_http_wide_event``)
+_FORBIDDEN_CONTEXT_KEYS = _HTTP_FRAMEWORK_FIELDS | LOG_RECORD_RESERVED_ATTRS
+
+
+@dataclass(frozen=True)
+class _HttpLoggingConfig:
+    """The effective ``[logging.http]`` settings for requests to one domain."""
+
+    enabled: bool = True
+    exclude_paths: frozenset[str] = frozenset()
+    log_request_headers: bool = False
+    log_response_headers: bool = False
+
+
+class DomainContextMiddleware:
     """ASGI middleware that activates the correct Protean domain context per request.
 
     Maps URL path prefixes to Domain instances. For each incoming request, finds
@@ -119,14 +135,19 @@ class DomainContextMiddleware(BaseHTTPMiddleware):
     activity with the domain-layer ``protean.access`` wide events produced by
     :func:`protean.utils.logging.access_log_handler`.
 
+    A plain ASGI middleware: the endpoint runs in the request's own task, and
+    the response passes through untouched except for its headers. Each
+    domain's ``[logging.http]`` section is read once, when the middleware is
+    built (or, for a domain returned by ``resolver``, on its first request).
+
     Args:
         app: The ASGI application (injected by Starlette).
         route_domain_map: Dict mapping URL path prefixes to Domain instances.
-            Sorted by prefix length descending for longest-prefix-first matching.
+            Matched longest prefix first.
         resolver: Optional custom callable that maps a URL path to a Domain
             (or None). When provided, ``route_domain_map`` is ignored.
-        emit_http_wide_event: When ``True`` (default), emit one wide event per
-            HTTP request on ``protean.access.http``. When ``False``, suppress
+        emit_http_wide_event: When ``True``, emit one wide event per HTTP
+            request on ``protean.access.http``. When ``False``, suppress
             wide events entirely. When ``None`` (default), defer to the
             ``[logging.http].enabled`` flag on the resolved domain's config.
         exclude_paths: Iterable of exact request paths to exclude from wide
@@ -150,7 +171,7 @@ class DomainContextMiddleware(BaseHTTPMiddleware):
         log_request_headers: bool | None = None,
         log_response_headers: bool | None = None,
     ) -> None:
-        super().__init__(app)
+        self.app = app
 
         if resolver is None and not route_domain_map:
             raise ValueError(
@@ -167,6 +188,19 @@ class DomainContextMiddleware(BaseHTTPMiddleware):
         )
         self._resolver = resolver
 
+        # The prefixes compiled into one alternation, longest first, whose
+        # matching group numbers the domain it maps to. ``None`` without a map.
+        self._prefix_pattern = (
+            re.compile(
+                "|".join(f"({re.escape(prefix)})" for prefix in self._route_domain_map)
+            )
+            if self._route_domain_map
+            else None
+        )
+        self._prefix_domains: tuple[Domain, ...] = tuple(
+            self._route_domain_map.values()
+        )
+
         # Explicit middleware overrides win over per-domain [logging.http]
         # config values; a ``None`` override defers to the domain config.
         self._emit_http_wide_event_override = emit_http_wide_event
@@ -184,19 +218,28 @@ class DomainContextMiddleware(BaseHTTPMiddleware):
             iter(self._route_domain_map.values()), None
         )
 
+        # The effective HTTP logging config per domain (``None`` for unmapped
+        # paths), precomputed for every mapped domain
+        self._http_configs: dict[Domain | None, _HttpLoggingConfig] = {
+            domain: self._build_http_logging_config(domain)
+            for domain in (None, *self._prefix_domains)
+        }
+
     def _resolve_domain(self, path: str) -> Domain | None:
         """Resolve a URL path to a Domain instance."""
         if self._resolver:
             return self._resolver(path)
 
-        for prefix, domain in self._route_domain_map.items():
-            if path.startswith(prefix):
-                return domain
-
-        return None
+        if self._prefix_pattern is None:
+            return None
+        match = self._prefix_pattern.match(path)
+        if match is None:
+            return None
+        assert match.lastindex is not None  # every alternative is a group
+        return self._prefix_domains[match.lastindex - 1]
 
     @staticmethod
-    def _extract_correlation_id(request: Request) -> str | None:
+    def _extract_correlation_id(headers: Headers) -> str | None:
         """Extract correlation ID from request headers.
 
         Checks ``X-Correlation-ID`` first, then falls back to ``X-Request-ID``.
@@ -205,19 +248,27 @@ class DomainContextMiddleware(BaseHTTPMiddleware):
         so a malformed or oversized client-supplied header cannot balloon
         log volume.
         """
-        raw = request.headers.get(_CORRELATION_HEADER) or request.headers.get(
-            _REQUEST_ID_HEADER
-        )
+        raw = headers.get(_CORRELATION_HEADER) or headers.get(_REQUEST_ID_HEADER)
         return _sanitize_id_header(raw)
 
-    def _resolve_http_logging_config(
+    def _http_logging_config(self, domain: Domain | None) -> _HttpLoggingConfig:
+        """Return the effective HTTP logging config for requests to ``domain``."""
+        config = self._http_configs.get(domain)
+        if config is None:
+            # A domain only the resolver knows about, seen for the first time
+            config = self._http_configs[domain] = self._build_http_logging_config(
+                domain
+            )
+        return config
+
+    def _build_http_logging_config(
         self, request_domain: Domain | None
-    ) -> dict[str, Any]:
-        """Build the effective HTTP logging config for this request.
+    ) -> _HttpLoggingConfig:
+        """Build the effective HTTP logging config for a domain.
 
         Explicit middleware constructor overrides win; otherwise the
-        resolved domain's ``[logging.http]`` section is used, falling back
-        to the middleware's default domain, and finally built-in defaults.
+        domain's ``[logging.http]`` section is used, falling back to the
+        middleware's default domain, and finally built-in defaults.
         """
         domain = request_domain or self._default_domain
         domain_cfg: dict[str, Any] = (
@@ -229,49 +280,71 @@ class DomainContextMiddleware(BaseHTTPMiddleware):
         def _pick(override: Any, key: str, default: Any) -> Any:
             return override if override is not None else domain_cfg.get(key, default)
 
-        exclude_paths = _pick(self._exclude_paths_override, "exclude_paths", [])
-        if not isinstance(exclude_paths, frozenset):
-            exclude_paths = frozenset(exclude_paths)
-
-        return {
-            "enabled": bool(
-                _pick(self._emit_http_wide_event_override, "enabled", True)
+        return _HttpLoggingConfig(
+            enabled=bool(_pick(self._emit_http_wide_event_override, "enabled", True)),
+            exclude_paths=frozenset(
+                _pick(self._exclude_paths_override, "exclude_paths", [])
             ),
-            "exclude_paths": exclude_paths,
-            "log_request_headers": bool(
+            log_request_headers=bool(
                 _pick(self._log_request_headers_override, "log_request_headers", False)
             ),
-            "log_response_headers": bool(
+            log_response_headers=bool(
                 _pick(
                     self._log_response_headers_override, "log_response_headers", False
                 )
             ),
-        }
+        )
 
-    async def dispatch(
-        self, request: Request, call_next: RequestResponseEndpoint
-    ) -> Response:
-        """Push domain context for the request and forward to the next handler."""
-        domain = self._resolve_domain(request.url.path)
-        correlation_id = self._extract_correlation_id(request)
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Push domain context for the request and forward to the app."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        path: str = scope["path"]
+        domain = self._resolve_domain(path)
+        request_headers = Headers(scope=scope)
+        correlation_id = self._extract_correlation_id(request_headers)
         request_id = (
-            _sanitize_id_header(request.headers.get(_REQUEST_ID_HEADER)) or uuid4().hex
+            _sanitize_id_header(request_headers.get(_REQUEST_ID_HEADER)) or uuid4().hex
         )
 
-        http_config = self._resolve_http_logging_config(domain)
-        emit_wide_event = http_config["enabled"] and (
-            request.url.path not in http_config["exclude_paths"]
-        )
+        http_config = self._http_logging_config(domain)
+        emit_wide_event = http_config.enabled and path not in http_config.exclude_paths
 
         started_at = time.perf_counter()
         commands_dispatched: list[str] = []
         # ``http_extras`` is mutated by reference through ``g`` so that
         # ``bind_event_context`` calls made inside the endpoint are visible
-        # back here. Starlette runs ``call_next`` in a child asyncio task
-        # whose ``contextvars`` copy is not observable from the parent, so
-        # structlog bindings alone would be lost at the HTTP boundary.
+        # back here. A sync endpoint runs in a worker thread whose
+        # ``contextvars`` copy is not observable from this task, so structlog
+        # bindings alone would be lost at the HTTP boundary.
         http_extras: dict[str, Any] = {}
 
+        status_code = 500
+        response_headers: MutableHeaders | None = None
+
+        async def send_with_headers(message: Message) -> None:
+            nonlocal status_code, response_headers
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                response_headers = MutableHeaders(scope=message)
+                response_headers[_REQUEST_ID_HEADER] = request_id
+                if domain is not None:
+                    # Prefer the correlation id command processing actually
+                    # used (set by CommandProcessor.enrich), falling back to
+                    # the request-supplied one when no command ran.
+                    # ``correlation_id`` is guaranteed non-None in this branch
+                    # because the request auto-generates one when absent.
+                    assert correlation_id is not None
+                    used_id: str = (
+                        getattr(g, "used_correlation_id", None) or correlation_id
+                    )
+                    response_headers[_CORRELATION_HEADER] = used_id
+            await send(message)
+
+        error_info: Exception | None = None
+        reraise = False
         ctx = domain.domain_context() if domain is not None else nullcontext()
         with ctx:
             if domain is not None:
@@ -285,44 +358,40 @@ class DomainContextMiddleware(BaseHTTPMiddleware):
                 g._http_commands_dispatched = commands_dispatched
                 g._http_wide_event_extras = http_extras
 
-            response, status_code, error_info = await self._run_endpoint(
-                request, call_next
-            )
-
-            # Unhandled exceptions produce no response; synthesise a plain 500
-            # here so ``X-Request-ID`` (and ``X-Correlation-ID`` when a domain
-            # is active) are always echoed back. Returning from the middleware
-            # pre-empts Starlette's ``ServerErrorMiddleware``, which would
-            # otherwise strip our request-scoped headers.
-            if response is None:
-                response = PlainTextResponse(
-                    "Internal Server Error",
-                    status_code=status_code,
-                )
-
-            response.headers[_REQUEST_ID_HEADER] = request_id
-            if domain is not None:
-                # Prefer the correlation id command processing actually used
-                # (set by CommandProcessor.enrich), falling back to the
-                # request-supplied one when no command ran. ``correlation_id``
-                # is guaranteed non-None in this branch because the block
-                # above auto-generates one when absent.
-                assert correlation_id is not None
-                used_id: str = getattr(g, "used_correlation_id", None) or correlation_id
-                response.headers[_CORRELATION_HEADER] = used_id
+            # ``Exception`` is caught (not ``BaseException``) so
+            # ``SystemExit`` and ``KeyboardInterrupt`` still propagate
+            # immediately as intended.
+            try:
+                await self.app(scope, receive, send_with_headers)
+            except Exception as exc:
+                error_info = exc
+                status_code = 500
+                # Once the response has started it cannot be replaced: the
+                # error is logged below and re-raised to the server.
+                reraise = response_headers is not None
+                if not reraise:
+                    # Unhandled exceptions produce no response; synthesise a
+                    # plain 500 here so ``X-Request-ID`` (and
+                    # ``X-Correlation-ID`` when a domain is active) are always
+                    # echoed back. Answering here pre-empts Starlette's
+                    # ``ServerErrorMiddleware``, which would otherwise strip
+                    # our request-scoped headers.
+                    await PlainTextResponse("Internal Server Error", status_code=500)(
+                        scope, receive, send_with_headers
+                    )
 
         if emit_wide_event:
             duration_ms = round((time.perf_counter() - started_at) * 1000, 2)
-            # Merge structlog contextvars (parent-task bindings) with the
-            # extras dict shared through ``g`` (child-task bindings from
-            # ``bind_event_context``). Child-task writes win on conflict.
+            # Merge structlog contextvars (bindings made in this task) with the
+            # extras dict shared through ``g`` (bindings from ``bind_event_context``
+            # in a sync endpoint's thread). The latter win on conflict.
             app_context = {
                 **structlog.contextvars.get_contextvars(),
                 **http_extras,
             }
             self._emit_http_wide_event(
-                request=request,
-                response=response,
+                request=Request(scope),
+                response_headers=response_headers,
                 status_code=status_code,
                 duration_ms=duration_ms,
                 request_id=request_id,
@@ -333,33 +402,15 @@ class DomainContextMiddleware(BaseHTTPMiddleware):
                 config=http_config,
             )
 
-        return response
-
-    @staticmethod
-    async def _run_endpoint(
-        request: Request,
-        call_next: Callable[[Request], Any],
-    ) -> tuple[Response | None, int, Exception | None]:
-        """Run the downstream handler and normalise the result.
-
-        Returns a ``(response, status_code, error)`` tuple. When the
-        downstream raises, ``response`` is ``None``, ``status_code`` is
-        ``500``, and ``error`` carries the exception for later re-raising
-        after the wide event has been emitted. ``Exception`` is caught (not
-        ``BaseException``) so ``SystemExit`` and ``KeyboardInterrupt`` still
-        propagate immediately as intended.
-        """
-        try:
-            response = await call_next(request)
-        except Exception as exc:
-            return None, 500, exc
-        return response, response.status_code, None
+        if reraise:
+            assert error_info is not None
+            raise error_info
 
     @staticmethod
     def _emit_http_wide_event(
         *,
         request: Request,
-        response: Response | None,
+        response_headers: Mapping[str, str] | None,
         status_code: int,
         duration_ms: float,
         request_id: str,
@@ -367,7 +418,7 @@ class DomainContextMiddleware(BaseHTTPMiddleware):
         commands_dispatched: list[str],
         error_info: Exception | None,
         app_context: dict[str, Any],
-        config: dict[str, Any],
+        config: _HttpLoggingConfig,
     ) -> None:
         """Build and log the HTTP wide event.
 
@@ -399,9 +450,8 @@ class DomainContextMiddleware(BaseHTTPMiddleware):
             # collide with framework-reserved names or stdlib LogRecord
             # attributes, to avoid silent overwrites and KeyError on the
             # logging side.
-            forbidden = _HTTP_FRAMEWORK_FIELDS | LOG_RECORD_RESERVED_ATTRS
             extra: dict[str, Any] = {
-                k: v for k, v in app_context.items() if k not in forbidden
+                k: v for k, v in app_context.items() if k not in _FORBIDDEN_CONTEXT_KEYS
             }
             extra.update(
                 {
@@ -420,10 +470,10 @@ class DomainContextMiddleware(BaseHTTPMiddleware):
                 }
             )
 
-            if config["log_request_headers"]:
+            if config.log_request_headers:
                 extra["http_request_headers"] = dict(request.headers)
-            if config["log_response_headers"] and response is not None:
-                extra["http_response_headers"] = dict(response.headers)
+            if config.log_response_headers and response_headers is not None:
+                extra["http_response_headers"] = dict(response_headers)
 
             if error_info is not None:
                 extra["error_type"] = type(error_info).__name__
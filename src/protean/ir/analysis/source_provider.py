@@ -181,6 +181,13 @@ class SourceProvider:
             self._module_names = tuple(name for name, _ in self._walk())
         return self._module_names
 
+    def files(self) -> tuple[tuple[str, Path], ...]:
+        """``(module_name, path)`` for :meth:`modules`, in that order.
+
+        The same walk, with the file each name was found at. Nothing is read.
+        """
+        return self._walk()
+
     def iter_trees(self) -> Iterator[tuple[str, ast.Module]]:
         """Yield ``(module_name, tree)`` for :meth:`modules`, in that order.
 
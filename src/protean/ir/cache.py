@@ -0,0 +1,304 @@
+"""Source-keyed cache for the IR and check reports the CLI builds.
+
+Building the IR means importing every module of the domain, initialising it
+and walking every element, and ``protean check``, ``protean ir show``,
+``protean ir diff`` and ``protean ir check`` all did that on every run. With
+``--cache`` they keep what they built under ``.protean/cache/`` and reuse it
+while the domain's sources are unchanged.
+
+Usage::
+
+    from protean.ir.cache import IRCache
+
+    def build():
+        domain.init()
+        return domain.to_ir()
+
+    ir, report = IRCache(".protean").get_or_build(domain, "ir", build)
+    print(report.summary())
+
+The key is a fingerprint of everything the build reads:
+
+- the SHA-256 of every module in the domain's package, found by the same walk
+  the diagnostic rules use (:class:`~protean.ir.analysis.SourceProvider`), so
+  an added or removed module changes it too;
+- the SHA-256 of every other module the last build depended on: modules under
+  the domain's directory imported during the build, modules of registered
+  elements that live outside the package, and the custom lint rules named in
+  ``[lint].rules``;
+- the domain's resolved configuration, the IR schema version and the Protean
+  version.
+
+An entry is reused whole or not at all. The IR is extracted from the live,
+initialised domain, and initialising it imports every module, so once any
+source has changed there is nothing left to skip by reusing parts of the old
+IR. The report says which modules changed and how many were unchanged.
+
+Elements registered from anything but source and configuration, such as an
+environment variable read at import time, are not tracked. Leave ``--cache``
+off for such domains.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sys
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, TypeGuard
+
+import protean
+from protean.ir import SCHEMA_VERSION
+from protean.ir.analysis.source_provider import SourceProvider
+from protean.utils.logging import get_logger
+
+if TYPE_CHECKING:
+    from protean.domain import Domain
+
+__all__ = ["CacheReport", "IRCache"]
+
+logger = get_logger(__name__)
+
+_CACHE_DIRNAME = "cache"
+
+# Bumped when the layout of an entry changes, so older entries read as misses
+_ENTRY_FORMAT = 1
+
+
+@dataclass(frozen=True)
+class CacheReport:
+    """What :meth:`IRCache.get_or_build` found in the cache."""
+
+    kind: str
+    """The kind of result looked up, ``"ir"`` or ``"check"``."""
+
+    hit: bool
+    """Whether the cached result was reused."""
+
+    modules_total: int
+    """Source modules the fingerprint covers."""
+
+    changed_modules: tuple[str, ...]
+    """Modules added, removed or edited since the cached build, sorted. Every
+    module when there was no usable entry to compare against."""
+
+    hits: int
+    """Lookups of this kind answered from the cache, this one included."""
+
+    misses: int
+    """Lookups of this kind that had to build, this one included."""
+
+    @property
+    def modules_unchanged(self) -> int:
+        return self.modules_total - len(self.changed_modules)
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of all lookups of this kind answered from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def summary(self) -> str:
+        """A one-line account of the lookup for a terminal."""
+        outcome = "hit" if self.hit else "miss"
+        line = (
+            f"IR cache {outcome}: {self.modules_unchanged}/{self.modules_total} "
+            f"modules unchanged, hit rate {self.hit_rate:.0%} "
+            f"({self.hits} of {self.hits + self.misses} runs)"
+        )
+        if self.changed_modules and self.modules_unchanged:
+            shown = ", ".join(self.changed_modules[:5])
+            more = len(self.changed_modules) - 5
+            line += f"; changed: {shown}" + (f" and {more} more" if more > 0 else "")
+        return line
+
+
+class IRCache:
+    """Builds, stores and reuses results keyed by a domain's sources.
+
+    One entry is kept per domain, holding a result per kind. A miss replaces
+    the entry's fingerprint, dropping results of other kinds built against
+    the old one. Reading or writing the cache never fails a build: a corrupt
+    entry is a miss and a failed write is logged.
+    """
+
+    def __init__(self, protean_dir: Path | str = ".protean") -> None:
+        self.directory = Path(protean_dir) / _CACHE_DIRNAME
+
+    def get_or_build(
+        self, domain: Domain, kind: str, build: Callable[[], dict[str, Any]]
+    ) -> tuple[dict[str, Any], CacheReport]:
+        """Return the cached result of *kind* for *domain*, or build it.
+
+        Args:
+            domain: The domain, loaded but not necessarily initialised.
+            kind: Names the result, so one domain can cache several.
+            build: Produces the result, initialising the domain if it must.
+                Must return a JSON-serializable dict.
+
+        Returns:
+            The result and a :class:`CacheReport` of the lookup.
+        """
+        path = self._entry_path(domain)
+        entry = self._read_json(path)
+        stats = self._read_json(self._stats_path(path))
+        if (
+            not isinstance(entry, dict)
+            or entry.get("format") != _ENTRY_FORMAT
+            or not isinstance(entry.get("results"), dict)
+        ):
+            entry = {}
+        if not isinstance(stats, dict):
+            stats = {}
+
+        key = _static_key(domain)
+        package = {name: str(file) for name, file in SourceProvider(domain).files()}
+        hashes = {name: _hash_file(file) for name, file in package.items()}
+        candidate = entry.get("sources") if entry.get("key") == key else None
+        stored: dict[str, Any] = candidate if _valid_sources(candidate) else {}
+        # Sources the last build read outside the package walk: hashed at the
+        # path it recorded, so a deleted file reads as changed
+        for name, source in stored.items():
+            if name not in hashes:
+                hashes[name] = _hash_file(source["path"])
+
+        changed = tuple(
+            sorted(
+                name
+                for name in hashes.keys() | stored.keys()
+                if name not in stored or hashes.get(name) != stored[name]["sha256"]
+            )
+        )
+        previous = stats.get(kind)
+        if not isinstance(previous, dict):
+            previous = {}
+        counts = {
+            "hits": int(previous.get("hits", 0)),
+            "misses": int(previous.get("misses", 0)),
+        }
+        result = entry["results"].get(kind) if stored else None
+
+        if stored and not changed and result is not None:
+            counts["hits"] += 1
+            report = CacheReport(kind, True, len(hashes), (), **counts)
+            stats[kind] = counts
+            self._write_json(self._stats_path(path), stats)
+            return result, report
+
+        result = build()
+
+        sources = {
+            name: {"path": file, "sha256": hashes[name]}
+            for name, file in package.items()
+        }
+        for name, file in _build_dependencies(domain).items():
+            if name not in sources:
+                sources[name] = {"path": file, "sha256": _hash_file(file)}
+
+        # Keep results of other kinds only while they match these sources
+        results = entry["results"] if stored and not changed else {}
+        results[kind] = result
+        self._write_json(
+            path,
+            {
+                "format": _ENTRY_FORMAT,
+                "key": key,
+                "sources": sources,
+                "results": results,
+            },
+        )
+
+        counts["misses"] += 1
+        if not stored:
+            changed = tuple(sorted(sources))
+        report = CacheReport(kind, False, len(sources), changed, **counts)
+        stats[kind] = counts
+        self._write_json(self._stats_path(path), stats)
+        return result, report
+
+    def _entry_path(self, domain: Domain) -> Path:
+        # Two domains can share a name; their root paths tell them apart
+        root = os.path.abspath(str(domain.root_path or ""))
+        digest = hashlib.sha256(root.encode("utf-8")).hexdigest()[:12]
+        return self.directory / f"{domain.normalized_name}-{digest}.json"
+
+    @staticmethod
+    def _stats_path(entry_path: Path) -> Path:
+        # Kept apart from the entry so a hit does not rewrite the stored IR
+        return entry_path.with_suffix(".stats.json")
+
+    @staticmethod
+    def _read_json(path: Path) -> Any:
+        try:
+            return json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+    def _write_json(self, path: Path, data: dict[str, Any]) -> None:
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            ignore = self.directory / ".gitignore"
+            if not ignore.exists():
+                ignore.write_text("# Created by protean\n*\n", encoding="utf-8")
+            # Written aside and moved into place, so a concurrent run never
+            # reads half an entry
+            partial = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            partial.write_text(json.dumps(data), encoding="utf-8")
+            os.replace(partial, path)
+        except (OSError, TypeError, ValueError) as exc:
+            logger.warning("Could not write IR cache %s: %s", path, exc)
+
+
+def _static_key(domain: Domain) -> str:
+    """Fingerprint of what the build reads besides source files."""
+    config = json.dumps(domain.config, sort_keys=True, default=str)
+    material = "\n".join([protean.__version__, SCHEMA_VERSION, config])
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+def _valid_sources(sources: Any) -> TypeGuard[dict[str, Any]]:
+    return isinstance(sources, dict) and all(
+        isinstance(source, dict) and {"path", "sha256"} <= source.keys()
+        for source in sources.values()
+    )
+
+
+def _hash_file(path: str | Path) -> str | None:
+    try:
+        return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+    except OSError:
+        return None
+
+
+def _build_dependencies(domain: Domain) -> dict[str, str]:
+    """Module name to file for sources a finished build read outside the
+    package walk."""
+    raw_root = str(domain.root_path or "")
+    root_dir = None
+    if raw_root.strip():
+        root = Path(raw_root)
+        root_dir = os.path.abspath(root.parent if root.is_file() else root)
+
+    names = {
+        record.cls.__module__
+        for records in domain._domain_registry._elements.values()
+        for record in records.values()
+        if not getattr(record, "internal", False)
+    }
+    for rule in domain.config.get("lint", {}).get("rules", []):
+        names.add(str(rule).rpartition(".")[0])
+
+    dependencies: dict[str, str] = {}
+    for name, module in list(sys.modules.items()):
+        file = getattr(module, "__file__", None)
+        if not isinstance(file, str):
+            continue
+        file = os.path.abspath(file)
+        if name in names or (
+            root_dir is not None and file.startswith(root_dir + os.sep)
+        ):
+            dependencies[name] = file
+    return dependencies
@@ -198,6 +198,14 @@ class CodeMeta:
     ``None``, so the fix stays prose. The code to command map lives in one place,
     here in the registry. ``kind`` and ``resolution`` are independent: a lint
     code could grow a resolution, and a staleness code need not have one.
+
+    ``scope`` says what a finding of the code depends on, which is what
+    ``protean check --changed-since`` matches a change against (see
+    :mod:`protean.ir.impact`). ``"element"``: the element the finding names and
+    the elements it relates to in the IR. ``"cluster"``: any element of the
+    aggregate cluster it names. ``"module"``: the source module it names.
+    ``"domain"``: anything in the domain, as for a finding about configuration
+    or one that joins facts from across clusters.
     """
 
     category: str
@@ -207,6 +215,7 @@ class CodeMeta:
     fix: str
     kind: Literal["lint", "raise", "staleness"] = "lint"
     resolution: ResolvingOperation | None = None
+    scope: Literal["element", "cluster", "module", "domain"] = "element"
 
 
 REGISTRY: dict[DiagnosticCode, CodeMeta] = {
@@ -269,6 +278,7 @@ REGISTRY: dict[DiagnosticCode, CodeMeta] = {
             "Split the aggregate into smaller aggregates, or raise `[lint] "
             "aggregate_size_limit` if the size is intentional."
         ),
+        scope="cluster",
     ),
     DiagnosticCode.AGGREGATE_WITHOUT_COMMAND_HANDLER: CodeMeta(
         category="handler_completeness",
@@ -282,6 +292,7 @@ REGISTRY: dict[DiagnosticCode, CodeMeta] = {
             "Add a command handler for the aggregate, or model it as a "
             "read-only projection if no writes are expected."
         ),
+        scope="cluster",
     ),
     DiagnosticCode.CIRCULAR_CLUSTER_DEPENDENCY: CodeMeta(
         category="bounded_context",
@@ -297,6 +308,7 @@ REGISTRY: dict[DiagnosticCode, CodeMeta] = {
             "a domain event or a process manager that coordinates the two "
             "aggregates asynchronously."
         ),
+        scope="domain",
     ),
     DiagnosticCode.COMMAND_HANDLER_CROSS_CLUSTER: CodeMeta(
         category="handler_completeness",
@@ -408,6 +420,7 @@ REGISTRY: dict[DiagnosticCode, CodeMeta] = {
             "Migrate off the deprecated configuration block before the "
             "scheduled removal version."
         ),
+        scope="domain",
     ),
     DiagnosticCode.DEPRECATED_ELEMENT: CodeMeta(
         category="deprecation",
@@ -455,6 +468,7 @@ REGISTRY: dict[DiagnosticCode, CodeMeta] = {
             "Stop using the deprecated import surface before the scheduled "
             "removal version."
         ),
+        scope="module",
     ),
     DiagnosticCode.DEPRECATED_OPTION: CodeMeta(
         category="deprecation",
@@ -478,6 +492,7 @@ REGISTRY: dict[DiagnosticCode, CodeMeta] = {
             "`event_sourced=True` if the aggregate is not meant to be "
             "event-sourced."
         ),
+        scope="cluster",
     ),
     DiagnosticCode.ES_EVENT_MISSING_APPLY: CodeMeta(
         category="handler_completeness",
@@ -705,6 +720,7 @@ REGISTRY: dict[DiagnosticCode, CodeMeta] = {
             "Configure `outbox.external_brokers`, or remove `published=True` "
             "if the events are internal."
         ),
+        scope="domain",
     ),
     DiagnosticCode.QUERY_HANDLER_WITHOUT_QUERY: CodeMeta(
         category="handler_completeness",
@@ -747,6 +763,7 @@ REGISTRY: dict[DiagnosticCode, CodeMeta] = {
             "its domain, or remove it from the index if it does not need to be "
             "indexed."
         ),
+        scope="cluster",
     ),
     DiagnosticCode.UNHANDLED_EVENT: CodeMeta(
         category="handler_completeness",
@@ -776,6 +793,7 @@ REGISTRY: dict[DiagnosticCode, CodeMeta] = {
             '(`indexes=[Index("field")]`), or suppress the check when the '
             "table is small or the query is a one-off (admin/reporting)."
         ),
+        scope="domain",
     ),
     DiagnosticCode.UNRAISED_EVENT: CodeMeta(
         category="handler_completeness",
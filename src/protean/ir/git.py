@@ -1,22 +1,25 @@
-"""Git utilities for loading IR files from specific commits.
+"""Git utilities for loading IR files from specific commits and listing the
+files changed since one.
 
 Usage::
 
-    from protean.ir.git import load_ir_from_commit
+    from protean.ir.git import changed_files, load_ir_from_commit
 
     ir_dict = load_ir_from_commit("HEAD", ".protean/ir.json")
     ir_dict = load_ir_from_commit("main", ".protean/ir.json")
     ir_dict = load_ir_from_commit("v0.15.0", ".protean/ir.json")
+
+    paths = changed_files("main")
 """
 
 from __future__ import annotations
 
 import json
 import subprocess
-from pathlib import PurePosixPath
+from pathlib import Path, PurePosixPath
 from typing import Any
 
-__all__ = ["GitError", "load_ir_from_commit"]
+__all__ = ["GitError", "changed_files", "load_ir_from_commit"]
 
 
 class GitError(Exception):
@@ -82,3 +85,52 @@ def load_ir_from_commit(
         ) from exc
 
     return ir_dict
+
+
+def changed_files(commit: str) -> tuple[str, ...]:
+    """List the files that differ from a commit in the working tree.
+
+    Covers committed, staged and unstaged changes since ``commit``, deleted
+    files, and untracked files that are not ignored, so a new module counts
+    as changed before it is added.
+
+    Parameters
+    ----------
+    commit:
+        A git commit reference — branch name, tag, SHA, ``HEAD``,
+        ``HEAD~1``, etc.
+
+    Returns
+    -------
+    tuple[str, ...]
+        Absolute paths, sorted.
+
+    Raises
+    ------
+    GitError
+        If the git command fails (e.g. commit not found, not a git
+        repository).
+    """
+    toplevel = _git("rev-parse", "--show-toplevel").strip()
+    # Both list paths relative to the repository root
+    diffed = _git("diff", "--name-only", commit, "--", cwd=toplevel)
+    untracked = _git("ls-files", "--others", "--exclude-standard", cwd=toplevel)
+    names = set(diffed.splitlines()) | set(untracked.splitlines())
+    return tuple(sorted(str(Path(toplevel, name)) for name in names if name))
+
+
+def _git(*args: str, cwd: str | None = None) -> str:
+    try:
+        result = subprocess.run(
+            ["git", *args],
+            capture_output=True,
+            text=True,
+            encoding="utf-8",
+            check=True,
+            cwd=cwd,
+        )
+    except FileNotFoundError as exc:
+        raise GitError("git is not installed or not found on PATH") from exc
+    except subprocess.CalledProcessError as exc:
+        raise GitError(f"git {args[0]} failed: {exc.stderr.strip()}") from exc
+    return result.stdout
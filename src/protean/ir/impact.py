@@ -0,0 +1,264 @@
+"""Which diagnostics a source change can affect.
+
+``protean check --changed-since <ref>`` reports only the findings a diff can
+have caused: those on elements defined in a changed module, and on the
+elements that depend on them or that they depend on.
+
+Usage::
+
+    from protean.ir.git import changed_files
+    from protean.ir.impact import ChangeScope
+
+    scope = ChangeScope.from_files(domain, domain.to_ir(), changed_files("main"))
+    findings = [d for d in ir["diagnostics"] if scope.includes(d)]
+
+Every rule declares the scope of what it reports in
+:attr:`~protean.ir.diagnostics.CodeMeta.scope`, and that decides which part of
+the change a finding is matched against:
+
+- ``"element"``: the finding is about one element, kept when that element is
+  affected. Affected means defined in a changed module, or one hop away from
+  such an element in the IR, in either direction: a handler is affected when
+  the event it handles changed, and the event is affected when the handler
+  changed, since ``UNHANDLED_EVENT`` on the event depends on it.
+- ``"cluster"``: the finding is about an aggregate cluster as a whole, kept
+  when any element of the cluster is affected.
+- ``"module"``: the finding is about a source module, kept when the module
+  changed.
+- ``"domain"``: the finding can depend on anything in the domain, as one about
+  its configuration does, and is always kept.
+
+A change to the domain's configuration files, to the module defining the
+domain or to a custom lint rule can change any finding, so it keeps them all.
+Findings of codes the registry does not know, or on elements the IR does not
+hold, are kept too: a finding is only dropped when it is known to be out of
+reach of the change.
+
+The relations come from the IR as it is now, so a relation the change removed
+is not followed: a handler that stopped handling an event does not bring the
+event's new ``UNHANDLED_EVENT`` into scope. Nor is anything an element depends
+on without the IR recording it, such as a helper module it imports. Run the
+full check before merging; the narrowed one is for quick feedback on a branch.
+"""
+
+from __future__ import annotations
+
+import ast
+import os
+import sys
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from protean.ir.analysis.source_provider import SourceProvider
+from protean.ir.diagnostics import REGISTRY, DiagnosticCode
+
+if TYPE_CHECKING:
+    from protean.domain import Domain
+
+__all__ = ["ChangeScope"]
+
+# Files any of which can change every finding. The same names
+# ``Config2.load_from_path`` reads configuration from.
+_CONFIG_FILES = ("domain.toml", ".domain.toml", "pyproject.toml")
+
+# How many directories above the domain's own ``Config2.load_from_path`` looks
+# for a configuration file
+_CONFIG_SEARCH_DEPTH = 2
+
+
+@dataclass(frozen=True)
+class ChangeScope:
+    """The elements, clusters and modules a set of changed files reaches."""
+
+    changed_modules: frozenset[str]
+    """Modules of the domain whose files changed."""
+
+    affected_elements: frozenset[str]
+    """FQNs of elements defined in a changed module, and their neighbours."""
+
+    affected_clusters: frozenset[str]
+    """FQNs of the clusters holding an affected element."""
+
+    everything: bool = False
+    """Whether the change reaches every finding, as a configuration change
+    does."""
+
+    @classmethod
+    def from_files(
+        cls, domain: Domain, ir: dict[str, Any], files: Iterable[str | Path]
+    ) -> ChangeScope:
+        """Work out what changing *files* reaches in *domain*.
+
+        Args:
+            domain: The loaded domain, whose modules have been imported.
+            ir: The domain's IR, for the elements and how they relate.
+            files: Paths of the changed files. Files that are not modules of
+                the domain are ignored, as are files that no longer exist.
+        """
+        paths = {_real(path) for path in files}
+        changed_modules = frozenset(
+            name for name, file in _module_files(domain) if file in paths
+        )
+
+        rules = domain.config.get("lint", {}).get("rules", [])
+        everything = (
+            _touches_configuration(domain, paths)
+            or any(_defines(name, domain) for name in changed_modules)
+            or bool({str(rule).rpartition(".")[0] for rule in rules} & changed_modules)
+        )
+
+        return cls.from_modules(ir, changed_modules, everything=everything)
+
+    @classmethod
+    def from_modules(
+        cls,
+        ir: dict[str, Any],
+        changed_modules: Iterable[str],
+        *,
+        everything: bool = False,
+    ) -> ChangeScope:
+        """Work out what changing *changed_modules* reaches, from *ir* alone."""
+        changed_modules = frozenset(changed_modules)
+        elements = dict(_iter_elements(ir))
+        aliases = {fqn: fqn for fqn in elements}
+        for fqn, (element, _) in elements.items():
+            # Handlers name the messages they handle by type, not FQN
+            if isinstance(element.get("__type__"), str):
+                aliases[element["__type__"]] = fqn
+
+        touched = {
+            fqn
+            for fqn, (element, _) in elements.items()
+            if element.get("module") in changed_modules
+        }
+        affected = set(touched)
+        for fqn, (element, _) in elements.items():
+            mentions = {aliases[m] for m in _iter_strings(element) if m in aliases}
+            mentions.discard(fqn)
+            if fqn in touched:
+                affected |= mentions
+            elif mentions & touched:
+                affected.add(fqn)
+
+        clusters = frozenset(
+            cluster for fqn in affected if (cluster := elements[fqn][1]) is not None
+        )
+        return cls(
+            changed_modules=changed_modules,
+            affected_elements=frozenset(affected),
+            affected_clusters=clusters,
+            everything=everything,
+        )
+
+    def includes(self, diagnostic: dict[str, Any]) -> bool:
+        """Whether the change can have produced *diagnostic*."""
+        if self.everything:
+            return True
+        try:
+            scope = REGISTRY[DiagnosticCode(diagnostic.get("code", ""))].scope
+        except ValueError:
+            return True
+
+        element = diagnostic.get("element", "")
+        if scope == "domain":
+            return True
+        if scope == "module":
+            return element in self.changed_modules
+        if scope == "cluster":
+            # Also emitted for projections, which belong to no cluster
+            return (
+                element in self.affected_clusters or element in self.affected_elements
+            )
+        return element in self.affected_elements
+
+
+def _real(path: str | Path) -> str:
+    return os.path.realpath(os.path.abspath(path))
+
+
+def _module_files(domain: Domain) -> Iterator[tuple[str, str]]:
+    """``(module_name, real_path)`` for the domain's package and every
+    imported module, so elements defined outside the package are covered."""
+    for name, path in SourceProvider(domain).files():
+        yield name, _real(path)
+    for name, module in list(sys.modules.items()):
+        file = getattr(module, "__file__", None)
+        if isinstance(file, str):
+            yield name, _real(file)
+
+
+def _touches_configuration(domain: Domain, paths: set[str]) -> bool:
+    raw_root = str(domain.root_path or "")
+    if not raw_root.strip():
+        return False
+    root = Path(_real(raw_root))
+    directory = root.parent if root.is_file() else root
+    for _ in range(_CONFIG_SEARCH_DEPTH + 1):
+        if any(str(directory / name) in paths for name in _CONFIG_FILES):
+            return True
+        directory = directory.parent
+    return False
+
+
+def _defines(module_name: str, domain: Domain) -> bool:
+    """Whether the module constructs *domain*, and with it the configuration
+    passed in code. Modules that import the domain hold it too, so the call
+    is looked for in the source."""
+    module = sys.modules.get(module_name)
+    if module is None or not any(value is domain for value in vars(module).values()):
+        return False
+    try:
+        tree = ast.parse(Path(module.__file__ or "").read_bytes())
+    # Broad for the reasons ``SourceProvider._parse`` gives: any failure to
+    # read or parse means the module is not known to define the domain
+    except Exception:
+        return False
+    return any(
+        isinstance(node, ast.Call)
+        and (
+            (isinstance(node.func, ast.Name) and node.func.id == "Domain")
+            or (isinstance(node.func, ast.Attribute) and node.func.attr == "Domain")
+        )
+        for node in ast.walk(tree)
+    )
+
+
+def _iter_elements(
+    ir: dict[str, Any],
+) -> Iterator[tuple[str, tuple[dict[str, Any], str | None]]]:
+    """``(fqn, (element, cluster_fqn))`` for every element in *ir*.
+
+    Elements of a cluster carry the cluster's FQN; every other element
+    carries ``None``.
+    """
+    for cluster_fqn, cluster in ir.get("clusters", {}).items():
+        for element in _find_elements(cluster):
+            yield element["fqn"], (element, cluster_fqn)
+    for section in ("projections", "flows"):
+        for element in _find_elements(ir.get(section, {})):
+            yield element["fqn"], (element, None)
+
+
+def _find_elements(value: Any) -> Iterator[dict[str, Any]]:
+    if isinstance(value, dict):
+        if "element_type" in value and isinstance(value.get("fqn"), str):
+            yield value
+            return
+        for item in value.values():
+            yield from _find_elements(item)
+
+
+def _iter_strings(value: Any) -> Iterator[str]:
+    """Every string in *value*, dict keys included."""
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, dict):
+        for key, item in value.items():
+            if isinstance(key, str):
+                yield key
+            yield from _iter_strings(item)
+    elif isinstance(value, list):
+        for item in value:
+            yield from _iter_strings(item)
@@ -27,12 +27,12 @@ from typing import TYPE_CHECKING, Any
 
 from protean.exceptions import NoDomainException
 from protean.ir import SCHEMA_VERSION
-from protean.ir.builder import IRBuilder
 from protean.ir.config import load_config
 from protean.ir.diagnostics import Diagnostic, DiagnosticCode, build_diagnostic
 from protean.utils.domain_discovery import derive_domain
 
 if TYPE_CHECKING:
+    from protean.ir.cache import CacheReport, IRCache
     from protean.ir.config import CompatConfig
 
 __all__ = [
@@ -93,6 +93,10 @@ class StalenessResult:
     """Current schema version the live domain builds against, or ``None`` if
     the version was not compared (e.g. FRESH/STALE/NO_IR outcomes)."""
 
+    cache_report: CacheReport | None = None
+    """How the live IR was found in the cache, when :func:`check_staleness`
+    was given one and built the live IR."""
+
 
 def load_stored_ir(protean_dir: Path | str) -> tuple[dict[str, Any], Path] | None:
     """Load the stored IR from *protean_dir*/ir.json.
@@ -119,6 +123,7 @@ def check_staleness(
     protean_dir: Path | str = ".protean",
     *,
     config: CompatConfig | None = None,
+    cache: IRCache | None = None,
 ) -> StalenessResult:
     """Compare the live domain's IR checksum against the materialized IR.
 
@@ -133,6 +138,9 @@ def check_staleness(
     config:
         Optional :class:`~protean.ir.config.CompatConfig`.  When ``None``,
         loaded automatically from *protean_dir*/config.toml.
+    cache:
+        Optional :class:`~protean.ir.cache.IRCache` to take the live IR from
+        while the domain's sources are unchanged.
 
     Returns
     -------
@@ -204,8 +212,16 @@ def check_staleness(
         raise NoDomainException(
             f"Could not derive a Protean domain from {domain_module!r}"
         )
-    domain.init()
-    live_ir = IRBuilder(domain).build()
+
+    def build() -> dict[str, Any]:
+        domain.init()
+        return domain.to_ir()
+
+    cache_report = None
+    if cache is None:
+        live_ir = build()
+    else:
+        live_ir, cache_report = cache.get_or_build(domain, "ir", build)
     domain_checksum: str = live_ir["checksum"]
 
     # ------------------------------------------------------------------ #
@@ -221,6 +237,7 @@ def check_staleness(
         domain_checksum=domain_checksum,
         stored_checksum=stored_checksum,
         ir_file=ir_path.resolve(),
+        cache_report=cache_report,
     )
 
 
@@ -99,6 +99,10 @@ class BrokerCapabilities(Flag):
     DEAD_LETTER_QUEUE = auto()  # Handle failed messages (depends on ACK_NACK)
     REPLAY = auto()  # Re-read historical messages (depends on PERSISTENCE)
     STREAM_PARTITIONING = auto()  # Partition streams for scalability
+    DELAYED_REDELIVERY = auto()  # NACK with a not-before delay (depends on ACK_NACK)
+    BATCH_ACK = auto()  # ACK many messages in one round-trip (depends on ACK_NACK)
+    PENDING_RECLAIM = auto()  # Take over idle pending messages (depends on ACK_NACK)
+    MULTI_STREAM_READ = auto()  # One read over many streams (depends on BLOCKING_READ)
 
     # Convenience Capability Sets
     BASIC_PUBSUB = PUBLISH | SUBSCRIBE
@@ -139,6 +143,44 @@ class BaseBroker(metaclass=ABCMeta):
             count: int = 1,
         ) -> list[tuple[str, dict[str, Any]]]: ...
 
+        # Implemented by brokers advertising MULTI_STREAM_READ. Declared here
+        # so the capability-gated ``read_blocking_multi`` below type-checks.
+        def _read_blocking_multi(
+            self,
+            streams: list[str],
+            consumer_group: str,
+            consumer_name: str,
+            timeout_ms: int,
+            count: int,
+        ) -> dict[str, list[tuple[str, dict[str, Any]]]]: ...
+
+        # Implemented by brokers advertising DELAYED_REDELIVERY. Declared here
+        # so the capability-gated ``nack_delayed`` below type-checks.
+        def _nack_delayed(
+            self,
+            stream: str,
+            identifier: str,
+            consumer_group: str,
+            delay_seconds: float,
+        ) -> bool: ...
+
+        # Implemented by brokers advertising PENDING_RECLAIM. Declared here so
+        # the capability-gated ``reclaim_pending`` and ``delivery_count`` below
+        # type-check.
+        def _reclaim_pending(
+            self,
+            stream: str,
+            consumer_group: str,
+            consumer_name: str,
+            min_idle_ms: int,
+            start_id: str,
+            count: int,
+        ) -> tuple[str, list[str]]: ...
+
+        def _delivery_count(
+            self, stream: str, identifier: str, consumer_group: str
+        ) -> int | None: ...
+
         # Partition-per-key methods (ADR-0028), implemented only by brokers
         # advertising STREAM_PARTITIONING (the Redis Streams adapter). Declared
         # here so the capability-gated public wrappers below type-check; there is
@@ -545,6 +587,57 @@ class BaseBroker(metaclass=ABCMeta):
             else:
                 raise
 
+    def ack_many(
+        self, stream: str, identifiers: list[str], consumer_group: str
+    ) -> list[bool]:
+        """Acknowledge several messages from the same stream at once.
+
+        Brokers advertising ``BATCH_ACK`` do this in a single round-trip; the
+        rest fall back to one ``ack`` per identifier.
+
+        Args:
+            stream (str): The stream from which the messages were received
+            identifiers (list[str]): The identifiers of the messages to acknowledge
+            consumer_group (str): The consumer group that processed the messages
+
+        Returns:
+            list[bool]: Per identifier, in order, whether it was acknowledged
+        """
+        if not self.has_capability(BrokerCapabilities.ACK_NACK):
+            logger.warning(
+                f"Broker {self.name} does not support message acknowledgment"
+            )
+            return [False] * len(identifiers)
+
+        if not identifiers:
+            return []
+
+        try:
+            return self._ack_many(stream, identifiers, consumer_group)
+        except Exception as e:
+            # Check if this is a connection-related error and attempt recovery
+            if self._is_connection_error(e):
+                logger.warning(f"Connection error during ack_many: {e}")
+                if self._ensure_connection():
+                    # Retry the operation once after reconnection
+                    return self._ack_many(stream, identifiers, consumer_group)
+                else:
+                    raise
+            else:
+                raise
+
+    def _ack_many(
+        self, stream: str, identifiers: list[str], consumer_group: str
+    ) -> list[bool]:
+        """Acknowledge each message in turn.
+
+        Brokers that advertise ``BATCH_ACK`` override this to acknowledge the
+        whole batch in one round-trip.
+        """
+        return [
+            self._ack(stream, identifier, consumer_group) for identifier in identifiers
+        ]
+
     def nack(self, stream: str, identifier: str, consumer_group: str) -> bool:
         """Negative acknowledge - mark message for reprocessing.
 
@@ -577,6 +670,158 @@ class BaseBroker(metaclass=ABCMeta):
             else:
                 raise
 
+    def nack_delayed(
+        self,
+        stream: str,
+        identifier: str,
+        consumer_group: str,
+        delay_seconds: float,
+    ) -> bool:
+        """Negative acknowledge, holding the message back for *delay_seconds*.
+
+        Like :meth:`nack`, but the broker does not redeliver the message before
+        the delay elapses. The delay lives in the broker, so the caller returns
+        immediately instead of sleeping before it NACKs, and messages behind the
+        failed one keep flowing. Requires the ``DELAYED_REDELIVERY`` capability.
+
+        Args:
+            stream (str): The stream from which the message was received
+            identifier (str): The unique identifier of the message to nack
+            consumer_group (str): The consumer group that failed to process the message
+            delay_seconds (float): Minimum time before the message is redelivered
+
+        Returns:
+            bool: True if the message was scheduled for redelivery, False otherwise
+
+        Raises:
+            NotSupportedError: If the broker does not advertise DELAYED_REDELIVERY
+        """
+        if not self.has_capability(BrokerCapabilities.DELAYED_REDELIVERY):
+            raise NotSupportedError(
+                f"Broker {self.name} does not advertise DELAYED_REDELIVERY, "
+                f"required for `nack_delayed`."
+            )
+
+        try:
+            return self._nack_delayed(stream, identifier, consumer_group, delay_seconds)
+        except Exception as e:
+            # Check if this is a connection-related error and attempt recovery
+            if self._is_connection_error(e):
+                logger.warning(f"Connection error during nack_delayed: {e}")
+                if self._ensure_connection():
+                    # Retry the operation once after reconnection
+                    return self._nack_delayed(
+                        stream, identifier, consumer_group, delay_seconds
+                    )
+                else:
+                    raise
+            else:
+                raise
+
+    def reclaim_pending(
+        self,
+        stream: str,
+        consumer_group: str,
+        consumer_name: str,
+        min_idle_ms: int,
+        start_id: str = "0-0",
+        count: int = 100,
+    ) -> tuple[str, list[str]]:
+        """Take over pending messages idle for at least *min_idle_ms*.
+
+        Claims one page of at most *count* pending entries of *consumer_group*,
+        whatever consumer owns them, into *consumer_name*. The claimed messages
+        are then redelivered to *consumer_name* with its own pending messages.
+        This is how messages held by a crashed or scaled-down consumer get
+        processed.
+
+        Pass the returned cursor as *start_id* to continue the scan with the
+        next page. A cursor of ``"0-0"`` means the scan has wrapped around.
+        Requires the ``PENDING_RECLAIM`` capability.
+
+        Args:
+            stream (str): The stream whose pending messages to scan
+            consumer_group (str): The consumer group owning the pending messages
+            consumer_name (str): The consumer that takes over the claimed messages
+            min_idle_ms (int): Minimum idle time for a message to be claimed
+            start_id (str): Cursor to resume the scan from
+            count (int): Maximum number of messages to claim in this page
+
+        Returns:
+            tuple[str, list[str]]: The next cursor and the claimed identifiers
+
+        Raises:
+            NotSupportedError: If the broker does not advertise PENDING_RECLAIM
+        """
+        self._require_pending_reclaim("reclaim_pending")
+
+        try:
+            return self._reclaim_pending(
+                stream, consumer_group, consumer_name, min_idle_ms, start_id, count
+            )
+        except Exception as e:
+            # Check if this is a connection-related error and attempt recovery
+            if self._is_connection_error(e):
+                logger.warning(f"Connection error during reclaim_pending: {e}")
+                if self._ensure_connection():
+                    # Retry the operation once after reconnection
+                    return self._reclaim_pending(
+                        stream,
+                        consumer_group,
+                        consumer_name,
+                        min_idle_ms,
+                        start_id,
+                        count,
+                    )
+                else:
+                    raise
+            else:
+                raise
+
+    def delivery_count(
+        self, stream: str, identifier: str, consumer_group: str
+    ) -> int | None:
+        """Return how many times a pending message has been delivered.
+
+        The count is kept by the broker across consumers, so it survives a
+        consumer crash and a takeover by ``reclaim_pending``. Requires the
+        ``PENDING_RECLAIM`` capability.
+
+        Args:
+            stream (str): The stream from which the message was received
+            identifier (str): The unique identifier of the message
+            consumer_group (str): The consumer group the message is pending in
+
+        Returns:
+            int | None: The delivery count, or None if the message is not pending
+
+        Raises:
+            NotSupportedError: If the broker does not advertise PENDING_RECLAIM
+        """
+        self._require_pending_reclaim("delivery_count")
+
+        try:
+            return self._delivery_count(stream, identifier, consumer_group)
+        except Exception as e:
+            # Check if this is a connection-related error and attempt recovery
+            if self._is_connection_error(e):
+                logger.warning(f"Connection error during delivery_count: {e}")
+                if self._ensure_connection():
+                    # Retry the operation once after reconnection
+                    return self._delivery_count(stream, identifier, consumer_group)
+                else:
+                    raise
+            else:
+                raise
+
+    def _require_pending_reclaim(self, operation: str) -> None:
+        """Raise ``NotSupportedError`` if the broker cannot reclaim pending messages."""
+        if not self.has_capability(BrokerCapabilities.PENDING_RECLAIM):
+            raise NotSupportedError(
+                f"Broker {self.name} does not advertise PENDING_RECLAIM, "
+                f"required for `{operation}`."
+            )
+
     @abstractmethod
     def _read(
         self, stream: str, consumer_group: str, no_of_messages: int
@@ -638,6 +883,60 @@ class BaseBroker(metaclass=ABCMeta):
             else:
                 raise
 
+    def read_blocking_multi(
+        self,
+        streams: list[str],
+        consumer_group: str,
+        consumer_name: str,
+        timeout_ms: int = 5000,
+        count: int = 1,
+    ) -> dict[str, list[tuple[str, dict[str, Any]]]]:
+        """Read from several streams of one consumer group in a single call.
+
+        Behaves like ``read_blocking`` on each stream, pending messages first,
+        but waits on all *streams* at once and returns as soon as any of them
+        has messages. Lets one reader serve every subscription that shares
+        *consumer_group*. Requires the ``MULTI_STREAM_READ`` capability.
+
+        Args:
+            streams (list[str]): The streams from which to read messages
+            consumer_group (str): The consumer group identifier
+            consumer_name (str): The consumer name used on every stream
+            timeout_ms (int): Timeout in milliseconds to wait for messages
+                (0 = do not wait)
+            count (int): Maximum number of messages to read per stream
+
+        Returns:
+            dict[str, list[tuple[str, dict]]]: ``(identifier, message)`` tuples
+            keyed by stream. Streams without messages are left out.
+
+        Raises:
+            NotSupportedError: If the broker does not advertise MULTI_STREAM_READ
+        """
+        if not self.has_capability(BrokerCapabilities.MULTI_STREAM_READ):
+            raise NotSupportedError(
+                f"Broker {self.name} does not advertise MULTI_STREAM_READ, "
+                f"required for `read_blocking_multi`."
+            )
+
+        try:
+            return self._read_blocking_multi(
+                streams, consumer_group, consumer_name, timeout_ms, count
+            )
+        except Exception as e:
+            # Check if this is a connection-related error and attempt recovery
+            if self._is_connection_error(e):
+                logger.warning(f"Connection error during read_blocking_multi: {e}")
+                if self._ensure_connection():
+                    # Retry the operation once after reconnection
+                    return self._read_blocking_multi(
+                        streams, consumer_group, consumer_name, timeout_ms, count
+                    )
+                else:
+                    raise
+            else:
+                raise
+
     @abstractmethod
     def _ack(self, stream: str, identifier: str, consumer_group: str) -> bool:
         """Acknowledge successful processing of a message.
@@ -4,7 +4,8 @@ from abc import ABCMeta, abstractmethod
 from typing import Any, TypeVar
 
 from protean.core.projection import BaseProjection
-from protean.exceptions import ConfigurationError
+from protean.exceptions import ConfigurationError, NotSupportedError
+from protean.utils.globals import current_domain
 from protean.utils.inflection import underscore
 
 logger = logging.getLogger(__name__)
@@ -174,6 +175,25 @@ class BaseCache(metaclass=ABCMeta):
         resources (e.g. the in-memory cache) work without changes.
         """
 
+    def _projection_written(self, projection_name: str | None = None) -> None:
+        """Invalidate cached query results read from a projection in this cache.
+
+        Adapters call this after every write to a projection's entries:
+        `projection_name` is the projection's key prefix, or `None` when a
+        write may have touched every projection the cache holds. Cache writes
+        are not transactional, so this runs at once rather than on commit.
+        """
+        if not current_domain:
+            return
+        if projection_name is None:
+            projections = list(self._projections.values())
+        elif projection_name in self._projections:
+            projections = [self._projections[projection_name]]
+        else:
+            return
+        for projection_cls in projections:
+            current_domain._query_processor.invalidate(projection_cls)
+
     @abstractmethod
     def ping(self) -> bool:
         """Healthcheck to verify cache is active and accessible"""
@@ -212,14 +232,15 @@ class BaseCache(metaclass=ABCMeta):
 
         Private and unpaginated on purpose. A cache is for point reads by key;
         enumerating a match set is not what it is for. This reads every matching
-        entry, so on a store with no native ordering (Redis) it scans the whole
-        keyspace, and it materialises the entire match set in one list. It is a
-        convenience for tests and small, bounded stores, not a production read
-        path.
+        entry and materialises the entire match set in one list. Adapters
+        answer a whole-projection pattern (`name:::*`) from a per-projection
+        index; any other pattern may scan the whole keyspace on a store with no
+        native ordering (Redis). It is a convenience for tests and small,
+        bounded stores, not a production read path.
 
         To page a large projection set, query the projection's repository
         (`repository_for(Projection).query`), which has indexes and native
-        pagination. `count` shares the same full-scan cost.
+        pagination. `count` shares the same cost model.
 
         `key_pattern` is a glob. `*` matches any run of characters, `?`
         matches one, `[...]` is a character class, and other characters,
@@ -242,8 +263,9 @@ class BaseCache(metaclass=ABCMeta):
         """Number of entries whose key matches `key_pattern`.
 
         `key_pattern` is a glob. See `_get_all` for the syntax. Like `_get_all`,
-        this walks the whole keyspace on a store with no native ordering
-        (Redis), so it is O(number of keys) per call.
+        a whole-projection pattern (`name:::*`) is answered from the
+        projection's index, while any other pattern may walk the whole keyspace
+        on a store with no native ordering (Redis), O(number of keys) per call.
         """
 
     @abstractmethod
@@ -284,6 +306,27 @@ class BaseCache(metaclass=ABCMeta):
         Otherwise, does nothing if the key is absent.
         """
 
+    def _get_raw(self, keys: list[str]) -> list[bytes | None]:
+        """The raw values stored under `keys`, `None` for each one absent.
+
+        Private, like `_set_raw`: the two hold opaque bytes outside the
+        `name:::identifier` projection keyspace, for the framework's own use
+        (cached query results and their stamps). Adapters read every key in
+        one round trip.
+
+        Optional: an adapter that does not implement the two raises
+        `NotSupportedError`, and queries dispatched with it as the `default`
+        cache run uncached.
+        """
+        raise NotSupportedError(f"{type(self).__name__} does not support raw values")
+
+    def _set_raw(self, key: str, value: bytes, ttl: TTLValue | None = None) -> None:
+        """Store the raw `value` under `key`, replacing any value there.
+
+        `ttl` follows the same rules as in `add`.
+        """
+        raise NotSupportedError(f"{type(self).__name__} does not support raw values")
+
     @abstractmethod
     def get_ttl(self, key: str) -> float | None:
         """Seconds remaining before `key` expires.
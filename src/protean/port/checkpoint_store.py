@@ -0,0 +1,159 @@
+"""Port for subscription checkpoints: the last position each subscriber read.
+
+An event-store subscription used to record its read position by appending a
+``Read`` message to its ``position-{subscriber}-{category}`` stream. Those
+streams only ever need their last message, yet they grow with the data they
+track and weigh on every ``$all`` scan, ``verify`` and backup. A checkpoint
+store keeps one row per checkpoint instead, overwritten in place.
+
+Adapters with a natural home for such a row provide their own store (see
+``BaseEventStore._make_checkpoint_store``). Any other adapter falls back to
+[`PositionStreamCheckpointStore`][protean.port.checkpoint_store.PositionStreamCheckpointStore],
+which keeps the position-stream layout.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from abc import ABCMeta, abstractmethod
+from dataclasses import dataclass
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+from uuid import uuid4
+
+from protean.utils.eventing import MessageType
+
+if TYPE_CHECKING:
+    from protean.port.event_store import BaseEventStore
+
+# Category of the legacy position streams (``position-{subscriber}-{category}``).
+# A checkpoint keeps that stream's name, so migrating one is a straight copy.
+POSITION_STREAM_CATEGORY = "position"
+
+# Message type of a read-position write on a position stream
+READ_MESSAGE_TYPE = "Read"
+
+
+@dataclass(frozen=True)
+class Checkpoint:
+    """A subscriber's read position and when it was last written."""
+
+    name: str
+    position: int
+    updated_at: datetime | None = None
+
+
+class BaseCheckpointStore(metaclass=ABCMeta):
+    """Key-value store of checkpoints, one per subscriber and stream category.
+
+    ``write`` overwrites the checkpoint in place. The async methods are what
+    the engine awaits; their defaults run the sync method in a worker thread,
+    and an adapter with an async driver overrides them.
+    """
+
+    @abstractmethod
+    def read(self, name: str) -> Checkpoint | None:
+        """Return the checkpoint called ``name``, or ``None`` if there is none."""
+
+    @abstractmethod
+    def write(self, name: str, position: int, updated_at: datetime) -> None:
+        """Create or overwrite the checkpoint called ``name``."""
+
+    async def aread(self, name: str) -> Checkpoint | None:
+        """Read a checkpoint without blocking the event loop."""
+        return await asyncio.to_thread(self.read, name)
+
+    async def awrite(self, name: str, position: int, updated_at: datetime) -> None:
+        """Write a checkpoint without blocking the event loop."""
+        await asyncio.to_thread(self.write, name, position, updated_at)
+
+
+class PositionStreamCheckpointStore(BaseCheckpointStore):
+    """Checkpoints kept as ``Read`` messages on position streams.
+
+    The layout every adapter used before checkpoint stores: each write appends
+    a message, and a read takes the stream's last one. It is the default for
+    adapters without a checkpoint store of their own, and how legacy position
+    streams are read during migration.
+    """
+
+    def __init__(self, store: BaseEventStore) -> None:
+        self._store = store
+
+    def read(self, name: str) -> Checkpoint | None:
+        return self.from_message(name, self._store._read_last_message(name))
+
+    def write(self, name: str, position: int, updated_at: datetime) -> None:
+        self._store._write(
+            name,
+            READ_MESSAGE_TYPE,
+            {"position": position},
+            self._metadata(name, updated_at),
+        )
+
+    async def aread(self, name: str) -> Checkpoint | None:
+        return self.from_message(name, await self._store._aread_last_message(name))
+
+    async def awrite(self, name: str, position: int, updated_at: datetime) -> None:
+        await self._store._awrite(
+            name,
+            READ_MESSAGE_TYPE,
+            {"position": position},
+            self._metadata(name, updated_at),
+        )
+
+    @staticmethod
+    def _metadata(name: str, updated_at: datetime) -> dict[str, Any]:
+        return {
+            "headers": {
+                "id": str(uuid4()),
+                "type": READ_MESSAGE_TYPE,
+                "time": updated_at.isoformat(),
+                "stream": name,
+            },
+            "domain": {"kind": MessageType.READ_POSITION.value},
+        }
+
+    @staticmethod
+    def from_message(name: str, message: dict[str, Any] | None) -> Checkpoint | None:
+        """Build a checkpoint from the last raw message of a position stream.
+
+        The write time is the store's own ``time`` column where it has one,
+        else the ``metadata.headers.time`` stamped at write. ``None`` when
+        there is no message or it is not a read-position write.
+        """
+        if not message or message.get("type") != READ_MESSAGE_TYPE:
+            return None
+        return Checkpoint(
+            name=name,
+            position=message["data"]["position"],
+            updated_at=_message_time(message),
+        )
+
+
+def _as_dict(value: object) -> dict[str, Any] | None:
+    """Return *value* as a dict, JSON-decoding a string first, else ``None``."""
+    if isinstance(value, str):
+        try:
+            value = json.loads(value)
+        except (ValueError, TypeError):
+            return None
+    return value if isinstance(value, dict) else None
+
+
+def _message_time(message: dict[str, Any]) -> datetime | None:
+    raw = message.get("time")
+    if not raw:
+        metadata = _as_dict(message.get("metadata"))
+        headers = _as_dict(metadata.get("headers")) if metadata else None
+        raw = headers.get("time") if headers else None
+    if isinstance(raw, datetime):
+        return raw
+    if not isinstance(raw, str):
+        return None
+    try:
+        # ``fromisoformat`` does not reliably accept a trailing ``Z``
+        return datetime.fromisoformat(raw.replace("Z", "+00:00"))
+    except ValueError:
+        return None
@@ -217,6 +217,19 @@ class BaseDAO(metaclass=ABCMeta):
         if current_uow and entity.element_type == DomainObjects.AGGREGATE:
             current_uow._add_to_identity_map(entity)
 
+    def _invalidate_cached_queries(self) -> None:
+        """Invalidate cached query results read from this DAO's projection.
+
+        A write in a Unit of Work invalidates them when it commits, so a
+        reader never caches the state the write replaced after the fact.
+        """
+        if self.entity_cls.element_type != DomainObjects.PROJECTION:
+            return
+        if self._is_standalone:
+            self.domain._query_processor.invalidate(self.entity_cls)
+        else:
+            current_uow.invalidate_queries_on_commit(self.entity_cls)
+
     def outside_uow(self) -> "BaseDAO":
         """When called, the DAO is instructed to work outside active transactions."""
         self._outside_uow = True
@@ -726,6 +739,7 @@ class BaseDAO(metaclass=ABCMeta):
 
             # Set Entity status to saved to let everybody know it has been persisted
             entity_obj.state_.mark_saved()
+            self._invalidate_cached_queries()
 
             # Track aggregate at the UoW level, to be able to perform actions on UoW commit,
             #   like persisting events raised by the aggregate.
@@ -829,6 +843,7 @@ class BaseDAO(metaclass=ABCMeta):
 
             # Set Entity status to saved to let everybody know it has been persisted
             entity_obj.state_.mark_saved()
+            self._invalidate_cached_queries()
 
             # Track aggregate at the UoW level, to be able to perform actions on UoW commit,
             #   like persisting events raised by the aggregate.
@@ -929,16 +944,47 @@ class BaseDAO(metaclass=ABCMeta):
 
             filters[field_name] = lookup_value
 
-        # Lookup the objects by filters and raise error if objects exist
-        for filter_key, lookup_value in filters.items():
-            if self.exists(excludes, **{filter_key: lookup_value}):
-                field_obj = declared_fields(self.entity_cls)[filter_key]
-                field_obj.fail(
-                    "unique",
-                    entity_name=self.entity_cls.__name__,
-                    field_name=filter_key,
-                    value=lookup_value,
-                )
+        if not filters:
+            return
+
+        # Check every unique field in one round-trip: OR the lookups together.
+        # Each unique value is held by at most one stored record, so fetching
+        # ``len(filters)`` records is enough to see every collision.
+        results = (
+            self.query.filter(Q(*filters.items(), _connector=Q.OR))
+            .exclude(**excludes)
+            .limit(len(filters))
+            .all(with_total=False)
+        )
+        if not results.items:
+            return
+
+        collisions = [
+            filter_key
+            for filter_key, lookup_value in filters.items()
+            if any(
+                getattr(item, filter_key, None) == lookup_value
+                for item in results.items
+            )
+        ]
+        if not collisions:
+            # The store matched a value Python compares unequal (a
+            # case-insensitive collation, a coerced type). Fall back to one
+            # lookup per field to name the colliding one.
+            collisions = [
+                filter_key
+                for filter_key, lookup_value in filters.items()
+                if self.exists(excludes, **{filter_key: lookup_value})
+            ]
+
+        for filter_key in collisions[:1]:
+            field_obj = declared_fields(self.entity_cls)[filter_key]
+            field_obj.fail(
+                "unique",
+                entity_name=self.entity_cls.__name__,
+                field_name=filter_key,
+                value=filters[filter_key],
+            )
 
     def delete(self, entity_obj: Any) -> Any:
         """Delete a record in the data store.
@@ -951,12 +997,22 @@ class BaseDAO(metaclass=ABCMeta):
 
         :param entity_obj: Entity object to be deleted from data store
         """
+        # A UnitOfWork coalescing projection writes may hold this row, or
+        # others, unwritten: write them out so the delete applies in order.
+        if (
+            entity_obj.element_type == DomainObjects.PROJECTION
+            and current_uow
+            and current_uow.coalesces_projections
+        ):
+            current_uow._flush_projection_rows()
+
         try:
             if not entity_obj.state_.is_destroyed:
                 self._delete(self.database_model_cls.from_entity(entity_obj))
 
                 # Set Entity status to destroyed to let everybody know the object is no longer referable
                 entity_obj.state_.mark_destroyed()
+                self._invalidate_cached_queries()
 
             return entity_obj
         except Exception as exc:
@@ -971,6 +1027,7 @@ class BaseDAO(metaclass=ABCMeta):
         """
         try:
             self._delete_all()
+            self._invalidate_cached_queries()
         except Exception as exc:
             logger.error(f"Failed deletion of all records because of {exc}")
             raise
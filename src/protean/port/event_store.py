@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from abc import ABCMeta, abstractmethod
 from collections import defaultdict, deque
 from collections.abc import Iterator
@@ -14,9 +15,20 @@ if TYPE_CHECKING:
 from protean.core.aggregate import BaseAggregate
 from protean.core.command import BaseCommand
 from protean.core.event import BaseEvent
-from protean.exceptions import IncorrectUsageError, ObjectNotFoundError
+from protean.exceptions import (
+    IncorrectUsageError,
+    NotSupportedError,
+    ObjectNotFoundError,
+)
+from protean.port.checkpoint_store import (
+    POSITION_STREAM_CATEGORY,
+    BaseCheckpointStore,
+    Checkpoint,
+    PositionStreamCheckpointStore,
+)
 from protean.utils.eventing import Message
 from protean.utils.telemetry import set_span_error
+from protean.utils.wakeup import PgNotifyListener, Wakeups
 
 # Snapshot rows are written with ``message_type="SNAPSHOT"`` and no metadata
 # (see ``_load_aggregate_current`` and ``create_snapshot``). They hold an
@@ -107,6 +119,33 @@ class IntegrityReport:
         }
 
 
+@dataclass(frozen=True)
+class CompactionReport:
+    """The result of [`compact_position_streams`][protean.port.event_store.BaseEventStore.compact_position_streams].
+
+    ``streams`` are the position streams compacted (or, on a ``dry_run``,
+    that would be); ``migrated_count`` is how many of them had no checkpoint
+    yet and were copied into the checkpoint store; ``message_count`` is the
+    messages deleted with them. This shape is the contract behind
+    ``protean eventstore compact-positions --json``.
+    """
+
+    streams: tuple[str, ...]
+    migrated_count: int
+    message_count: int
+    dry_run: bool = False
+
+    def as_dict(self) -> dict[str, Any]:
+        """Serialize to the ``--json`` ``data`` payload."""
+        return {
+            "streams": list(self.streams),
+            "stream_count": len(self.streams),
+            "migrated_count": self.migrated_count,
+            "message_count": self.message_count,
+            "dry_run": self.dry_run,
+        }
+
+
 class BaseEventStore(metaclass=ABCMeta):
     """This class outlines the base event store capabilities
     to be implemented in all supported event store adapters.
@@ -120,6 +159,23 @@ class BaseEventStore(metaclass=ABCMeta):
         self.domain = domain
         self.conn_info = conn_info
 
+        # Wakes event-store subscriptions when a stream category gets a new
+        # message. Adapters notify it on every write they make; an adapter whose
+        # store other processes write to also returns a ``push_listener``.
+        self.wakeups = Wakeups()
+
+        # Built on first use; see ``checkpoints``
+        self._checkpoint_store: BaseCheckpointStore | None = None
+
+    def push_listener(self) -> PgNotifyListener | None:
+        """Return a listener delivering other processes' writes to ``wakeups``.
+
+        The engine starts it alongside its subscriptions. ``None``, the
+        default, means the store has no push channel, and subscriptions only
+        see other processes' writes when they poll.
+        """
+        return None
+
     def close(self) -> None:
         """Close the event store and release all connections.
 
@@ -129,6 +185,14 @@ class BaseEventStore(metaclass=ABCMeta):
         resources (e.g. the in-memory store) work without changes.
         """
 
+    async def aclose(self) -> None:
+        """Release resources bound to the running event loop.
+
+        The engine awaits this on shutdown, before ``close``, so an adapter
+        with an async connection pool can close it on the loop that opened it.
+        The default is a no-op.
+        """
+
     @abstractmethod
     def _write(
         self,
@@ -165,6 +229,51 @@ class BaseEventStore(metaclass=ABCMeta):
         Implemented by the concrete event store adapter.
         """
 
+    # Async counterparts of the raw read/write methods, awaited by the engine's
+    # event-store subscriptions. The defaults run the sync method in a worker
+    # thread, which is what the engine did before adapters could override them;
+    # an adapter with an async driver overrides them so a waiting subscription
+    # holds neither a thread nor, between queries, a connection. They resolve
+    # the sync method at call time, so patching it still takes effect.
+
+    async def _awrite(
+        self,
+        stream_name: str,
+        message_type: str,
+        data: dict[str, Any],
+        metadata: dict[str, Any] | None = None,
+        expected_version: int | None = None,
+    ) -> int:
+        """Write a message to the event store without blocking the event loop."""
+        return await asyncio.to_thread(
+            self._write,
+            stream_name,
+            message_type,
+            data,
+            metadata=metadata,
+            expected_version=expected_version,
+        )
+
+    async def _aread(
+        self,
+        stream_name: str,
+        sql: str | None = None,
+        position: int = 0,
+        no_of_messages: int = 1000,
+    ) -> list[dict[str, Any]]:
+        """Read raw messages from the event store without blocking the event loop."""
+        return await asyncio.to_thread(
+            self._read,
+            stream_name,
+            sql=sql,
+            position=position,
+            no_of_messages=no_of_messages,
+        )
+
+    async def _aread_last_message(self, stream_name: str) -> dict[str, Any] | None:
+        """Read the last raw message of a stream without blocking the event loop."""
+        return await asyncio.to_thread(self._read_last_message, stream_name)
+
     def category(self, stream: str) -> str:
         if not stream:
             return ""
@@ -192,7 +301,36 @@ class BaseEventStore(metaclass=ABCMeta):
         raw_messages = self._read(
             stream, sql=sql, position=position, no_of_messages=no_of_messages
         )
+        return self._deserialize_rows(raw_messages)
+
+    async def aread(
+        self,
+        stream: str,
+        sql: str | None = None,
+        position: int = 0,
+        no_of_messages: int = 1000,
+    ) -> list[Message]:
+        """Async ``read``: the same messages, read through ``_aread``.
 
+        A store without a native ``_aread`` runs ``read`` itself in a thread,
+        as the engine did before stores had an async path.
+        """
+        if type(self)._aread is BaseEventStore._aread:
+            kwargs: dict[str, Any] = {"sql": sql} if sql is not None else {}
+            return await asyncio.to_thread(
+                self.read,
+                stream,
+                position=position,
+                no_of_messages=no_of_messages,
+                **kwargs,
+            )
+
+        raw_messages = await self._aread(
+            stream, sql=sql, position=position, no_of_messages=no_of_messages
+        )
+        return self._deserialize_rows(raw_messages)
+
+    def _deserialize_rows(self, raw_messages: list[dict[str, Any]]) -> list[Message]:
         # Skip snapshot rows: they carry an aggregate's state with no metadata,
         # so they are neither events nor commands and would raise on deserialize.
         # A scope that spans snapshot streams (``$all``, a ``:snapshot-`` stream)
@@ -1051,6 +1189,131 @@ class BaseEventStore(metaclass=ABCMeta):
         """
         return self._stream_head_position(stream_category)
 
+    # ------------------------------------------------------------------
+    # Subscription checkpoints
+    # ------------------------------------------------------------------
+
+    @property
+    def checkpoints(self) -> BaseCheckpointStore:
+        """The store that keeps subscription read positions.
+
+        Built on first use by ``_make_checkpoint_store``.
+        """
+        if self._checkpoint_store is None:
+            self._checkpoint_store = self._make_checkpoint_store()
+        return self._checkpoint_store
+
+    def _make_checkpoint_store(self) -> BaseCheckpointStore:
+        """Return the checkpoint store for this adapter.
+
+        Adapters with a place to keep a checkpoint as a single row override
+        this. The default keeps checkpoints as ``Read`` messages on position
+        streams, as every adapter did before checkpoint stores.
+        """
+        return PositionStreamCheckpointStore(self)
+
+    @property
+    def _has_checkpoint_store(self) -> bool:
+        """Whether checkpoints live outside the position streams."""
+        return not isinstance(self.checkpoints, PositionStreamCheckpointStore)
+
+    def read_checkpoint(self, name: str) -> Checkpoint | None:
+        """Return the checkpoint called ``name``, or ``None`` if there is none.
+
+        A checkpoint not yet in the checkpoint store is read from its legacy
+        position stream, so a subscription resumes where it left off before
+        its positions were migrated.
+        """
+        checkpoint = self.checkpoints.read(name)
+        if checkpoint is None and self._has_checkpoint_store:
+            checkpoint = PositionStreamCheckpointStore.from_message(
+                name, self._read_last_message(name)
+            )
+        return checkpoint
+
+    async def aread_checkpoint(self, name: str) -> Checkpoint | None:
+        """Async counterpart of ``read_checkpoint``, awaited by the engine."""
+        checkpoint = await self.checkpoints.aread(name)
+        if checkpoint is None and self._has_checkpoint_store:
+            checkpoint = PositionStreamCheckpointStore.from_message(
+                name, await self._aread_last_message(name)
+            )
+        return checkpoint
+
+    def write_checkpoint(self, name: str, position: int, updated_at: datetime) -> None:
+        """Create or overwrite the checkpoint called ``name``."""
+        self.checkpoints.write(name, position, updated_at)
+
+    async def awrite_checkpoint(
+        self, name: str, position: int, updated_at: datetime
+    ) -> None:
+        """Async counterpart of ``write_checkpoint``, awaited by the engine."""
+        await self.checkpoints.awrite(name, position, updated_at)
+
+    def _delete_stream(self, stream_name: str) -> int:
+        """Delete every message of ``stream_name`` and return how many there were.
+
+        Only used to compact legacy position streams. Adapters that provide a
+        checkpoint store implement it.
+        """
+        raise NotSupportedError(
+            f"{type(self).__name__} does not support deleting streams"
+        )
+
+    def compact_position_streams(self, dry_run: bool = False) -> CompactionReport:
+        """Move read positions out of legacy position streams and delete them.
+
+        For each ``position-*`` stream, its last read position is copied into
+        the checkpoint store unless a checkpoint is already there (the store
+        is authoritative once written), and the stream is deleted. With
+        ``dry_run`` nothing is changed and the report says what would be.
+
+        Run it once every worker runs a version that writes checkpoints;
+        a worker still appending to a position stream would re-create it.
+
+        Raises:
+            NotSupportedError: The adapter keeps its checkpoints in position
+                streams, so there is nothing to compact them into.
+        """
+        if not self._has_checkpoint_store:
+            raise NotSupportedError(
+                f"{type(self).__name__} keeps read positions in position streams "
+                "and has no checkpoint store to compact them into"
+            )
+
+        streams: list[str] = []
+        migrated = 0
+        removed = 0
+        for identifier in self._stream_identifiers(POSITION_STREAM_CATEGORY):
+            name = f"{POSITION_STREAM_CATEGORY}-{identifier}"
+            legacy = PositionStreamCheckpointStore.from_message(
+                name, self._read_last_message(name)
+            )
+            # Not a position stream (e.g. an identifier matched loosely)
+            if legacy is None:
+                continue
+
+            streams.append(name)
+            if self.checkpoints.read(name) is None:
+                migrated += 1
+                if not dry_run:
+                    self.checkpoints.write(
+                        name,
+                        legacy.position,
+                        legacy.updated_at or self.domain.clock.now(),
+                    )
+            if dry_run:
+                removed += len(self._read(name, no_of_messages=1_000_000))
+            else:
+                removed += self._delete_stream(name)
+
+        return CompactionReport(
+            streams=tuple(streams),
+            migrated_count=migrated,
+            message_count=removed,
+            dry_run=dry_run,
+        )
+
     # ------------------------------------------------------------------
     # Integrity verification
     # ------------------------------------------------------------------
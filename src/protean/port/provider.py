@@ -8,9 +8,11 @@ from typing import TYPE_CHECKING, Any, ClassVar, Protocol, cast, runtime_checkab
 
 from protean.exceptions import ConfigurationError, NotSupportedError
 from protean.utils.query import RegisterLookupMixin
+from protean.utils.wakeup import Wakeups
 
 if TYPE_CHECKING:
     from protean.port.dao import BaseLookup
+    from protean.utils.wakeup import PgNotifyListener
 
 logger = logging.getLogger(__name__)
 
@@ -227,6 +229,10 @@ class BaseProvider(RegisterLookupMixin, metaclass=ABCMeta):
         self.conn_info = conn_info
         self.managed = conn_info.get("managed", True)
 
+        # Wakes outbox processors when outbox rows for a target broker commit.
+        # The Unit of Work notifies it after each commit that wrote outbox rows.
+        self.wakeups = Wakeups()
+
     @property
     @abstractmethod
     def capabilities(self) -> DatabaseCapabilities:
@@ -308,6 +314,22 @@ class BaseProvider(RegisterLookupMixin, metaclass=ABCMeta):
         - Clean up any other resources (engines, clients, etc.)
         """
 
+    def notify_on_commit(self, session: Any, topic: str) -> None:
+        """Have ``session``'s commit wake ``topic``'s consumers in other processes.
+
+        Called by the Unit of Work before it commits outbox rows. Providers
+        with a cross-process push channel queue a notification in the open
+        transaction; the default does nothing.
+        """
+
+    def push_listener(self) -> "PgNotifyListener | None":
+        """Return a listener delivering other processes' commits to ``wakeups``.
+
+        The engine starts it for providers whose outbox it processes. ``None``,
+        the default, means the provider has no push channel.
+        """
+        return None
+
     @abstractmethod
     def get_dao(self, entity_cls: type[Any], database_model_cls: type[Any]) -> Any:
         """Return a DAO object configured with a live connection"""
@@ -1,9 +1,32 @@
 """Server module for Protean."""
 
-from .engine import Engine
-from .supervisor import Supervisor
+# ``Engine`` and ``Supervisor`` are resolved lazily (PEP 562): importing a
+# lightweight submodule such as ``protean.server.tracing`` must not pull in the
+# engine, the supervisor and the subscription machinery behind them.
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .engine import Engine
+    from .supervisor import Supervisor
+
+_LAZY_EXPORTS: dict[str, str] = {
+    "Engine": "protean.server.engine",
+    "Supervisor": "protean.server.supervisor",
+}
 
 __all__ = [
     "Engine",
     "Supervisor",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
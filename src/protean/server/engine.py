@@ -14,6 +14,7 @@ from protean.core.event import BaseEvent
 from protean.core.event_handler import BaseEventHandler
 from protean.core.process_manager import BaseProcessManager
 from protean.core.subscriber import BaseSubscriber
+from protean.core.unit_of_work import UnitOfWork
 from protean.exceptions import ConfigurationError
 from protean.port.broker import BrokerCapabilities
 from protean.utils.eventing import (
@@ -24,6 +25,7 @@ from protean.utils.eventing import (
     new_correlation_id,
 )
 from protean.utils.globals import g
+from protean.utils.mixins import _BackoffDeferred, deferred_backoff
 from protean.utils.processing import processing_priority
 from protean.utils.telemetry import (
     create_observation,
@@ -38,16 +40,20 @@ from protean.utils.telemetry import (
 from .dlq_maintenance import DLQMaintenanceTask
 from .health import HealthServer
 from .outbox_processor import OutboxProcessor
+from .pending_reclaimer import PendingReclaimTask
 from .subscription.broker_subscription import BrokerSubscription
 from .subscription.factory import (
     SubscriptionFactory,
     broker_supports_partitioning,
 )
+from .subscription.read_multiplexer import StreamReadMultiplexer
+from .subscription.stream_subscription import StreamSubscription
 from .tracing import TraceEmitter
 
 if TYPE_CHECKING:
     from protean.domain import Domain
     from protean.server.subscription import BaseSubscription
+    from protean.utils.wakeup import PgNotifyListener
 
 logger = logging.getLogger(__name__)
 
@@ -65,6 +71,7 @@ class CommandDispatcher:
         stream_category: str,
         handler_map: dict[str, type[BaseCommandHandler]],
         source_handler_cls: type[BaseCommandHandler],
+        combine_max_batch: int = 0,
     ) -> None:
         """
         Args:
@@ -72,9 +79,13 @@ class CommandDispatcher:
             handler_map: Dict mapping command __type__ string to handler class.
             source_handler_cls: One of the handler classes, used to inherit
                 subscription configuration (meta_) for the factory.
+            combine_max_batch: When above zero, a batch's commands for the same
+                aggregate run in one UnitOfWork, at most this many at a time
+                (see ``Engine.handle_batch``).
         """
         self._stream_category = stream_category
         self._handler_map = handler_map
+        self.combine_max_batch = combine_max_batch
         self._last_resolved_handler: type[BaseCommandHandler] | None = None
         self._last_resolved_item: BaseCommand | BaseEvent | None = None
 
@@ -269,10 +280,21 @@ class Engine:
         # Initialize subscription factory for creating subscriptions
         self._subscription_factory = SubscriptionFactory(self)
 
+        # Push listeners delivering other processes' writes to subscriptions'
+        # wakeups, started in ``run`` (see ``_start_push_listeners``)
+        self._push_listeners: list[PgNotifyListener] = []
+
         # Gather all handler subscriptions
         self._subscriptions: dict[str, BaseSubscription] = {}
         self._register_handler_subscriptions()
 
+        # Shared readers for consumer groups with several stream subscriptions
+        self._read_multiplexers: dict[str, StreamReadMultiplexer] = {}
+        try:
+            self._attach_read_multiplexers()
+        except Exception:
+            logger.debug("engine.read_multiplexer_init_skipped", exc_info=True)
+
         # Gather broker subscriptions
         self._broker_subscriptions: dict[str, BrokerSubscription] = {}
 
@@ -390,6 +412,23 @@ class Engine:
         except Exception:
             logger.debug("engine.dlq_maintenance_init_skipped", exc_info=True)
 
+        # Pending reclaim task — takes over messages left pending by dead
+        # consumers. On by default wherever a broker can reclaim.
+        self._pending_reclaim: PendingReclaimTask | None = None
+        try:
+            reclaim_enabled = (
+                self.domain.config.get("server", {})
+                .get("pending_reclaim", {})
+                .get("enabled", True)
+            )
+            if reclaim_enabled and any(
+                broker.has_capability(BrokerCapabilities.PENDING_RECLAIM)
+                for broker in self.domain.brokers.values()
+            ):
+                self._pending_reclaim = PendingReclaimTask(self)
+        except Exception:
+            logger.debug("engine.pending_reclaim_init_skipped", exc_info=True)
+
     def _has_dlq_capable_broker(self) -> bool:
         """Return True if any configured broker supports DLQ."""
         for broker in self.domain.brokers.values():
@@ -397,6 +436,51 @@ class Engine:
                 return True
         return False
 
+    def _attach_read_multiplexers(self) -> None:
+        """Serve each consumer group's stream subscriptions with one shared read.
+
+        A handler subscribed to several stream categories gets one stream
+        subscription per category, all in the same consumer group. When the
+        default broker advertises ``MULTI_STREAM_READ``, those subscriptions
+        share a ``StreamReadMultiplexer`` instead of each blocking in its own
+        read. Priority-lane and partitioned subscriptions read on their own.
+        """
+        multiplexer_config = self.domain.config.get("server", {}).get(
+            "read_multiplexer", {}
+        )
+        if not multiplexer_config.get("enabled", True):
+            return
+
+        broker = self.domain.brokers.get("default")
+        if broker is None or not broker.has_capability(
+            BrokerCapabilities.MULTI_STREAM_READ
+        ):
+            return
+
+        by_group: dict[str, list[StreamSubscription]] = defaultdict(list)
+        for subscription in self._subscriptions.values():
+            if (
+                type(subscription) is StreamSubscription
+                and not subscription._lanes_enabled
+            ):
+                by_group[subscription.consumer_group].append(subscription)
+
+        busy_timeout_ms = int(multiplexer_config.get("busy_timeout_ms", 50))
+        for consumer_group, subscriptions in by_group.items():
+            if len(subscriptions) < 2:
+                continue
+            multiplexer = StreamReadMultiplexer(self, consumer_group, busy_timeout_ms)
+            for subscription in subscriptions:
+                multiplexer.attach(subscription)
+            self._read_multiplexers[consumer_group] = multiplexer
+            logger.debug(
+                "engine.read_multiplexer_attached",
+                extra={
+                    "consumer_group": consumer_group,
+                    "streams": multiplexer.streams,
+                },
+            )
+
     @property
     def subscription_factory(self) -> SubscriptionFactory:
         """Get the subscription factory used to create subscriptions."""
@@ -435,6 +519,18 @@ class Engine:
             stream_category = self._infer_stream_category(handler_cls)
             handlers_by_stream[stream_category].append(handler_cls)
 
+        # Handlers already run one message at a time per subscription, so the
+        # engine's mailbox only needs to combine each aggregate's commands
+        combine_max_batch = 0
+        try:
+            mailbox_config = self.domain.config.get("command_mailbox", {})
+            if mailbox_config.get("enabled", False) and mailbox_config.get(
+                "combine", False
+            ):
+                combine_max_batch = max(int(mailbox_config.get("max_batch", 1)), 1)
+        except (AttributeError, TypeError, ValueError):
+            combine_max_batch = 0
+
         for stream_category, handler_classes in handlers_by_stream.items():
             # Build command_type -> handler_cls mapping
             handler_map = {}
@@ -446,7 +542,10 @@ class Engine:
                         handler_map[command_type] = handler_cls
 
             dispatcher = CommandDispatcher(
-                stream_category, handler_map, handler_classes[0]
+                stream_category,
+                handler_map,
+                handler_classes[0],
+                combine_max_batch=combine_max_batch,
             )
 
             subscription_key = f"commands:{stream_category}"
@@ -884,7 +983,7 @@ class Engine:
                                 message.metadata.domain, "priority", 0
                             )
                         with processing_priority(msg_priority):
-                            handler_cls._handle(message)
+                            await Engine._handle_deferring_backoff(handler_cls, message)
                     except Exception as exc:
                         set_span_error(span, exc)
                         raise
@@ -913,8 +1012,11 @@ class Engine:
                     causation_id=causation_id,
                 )
 
-                # Emit pm.transition trace for process managers
-                if issubclass(handler_cls, BaseProcessManager):
+                # Emit pm.transition trace for process managers (a command
+                # dispatcher is an instance, not a handler class)
+                if isinstance(handler_cls, type) and issubclass(
+                    handler_cls, BaseProcessManager
+                ):
                     self.emitter.emit(
                         event="pm.transition",
                         stream=stream,
@@ -971,6 +1073,165 @@ class Engine:
             finally:
                 g.pop("message_in_context", None)
 
+    @staticmethod
+    async def _handle_deferring_backoff(
+        handler_cls: type[BaseCommandHandler | BaseEventHandler],
+        message: Message,
+    ) -> None:
+        """Invoke the handler, awaiting its retry backoffs on the event loop.
+
+        A handler retrying a version conflict or a transient failure would
+        otherwise sleep on the loop and stall every subscription, the outbox
+        processor, and the health server of this worker. Here its backoff is
+        handed back instead: the loop serves everything else meanwhile, then
+        the message is dispatched again to resume the retries.
+        """
+        with deferred_backoff():
+            while True:
+                try:
+                    handler_cls._handle(message)
+                    return
+                except _BackoffDeferred as deferral:
+                    await asyncio.sleep(deferral.delay)
+
+    async def handle_batch(
+        self,
+        handler_cls: type[BaseCommandHandler | BaseEventHandler],
+        messages: list[Message],
+        worker_id: str | None = None,
+    ) -> list[bool]:
+        """Apply a batch of messages to a ``micro_batch`` projector at once.
+
+        Every message is handled as ``handle_message`` would, inside one
+        UnitOfWork that coalesces projection writes: a row loaded or added by
+        several of the events is read once and written once, when the batch
+        commits. The caller advances its read position only after this returns,
+        so the position never gets ahead of the written rows.
+
+        When a message fails, or its retries roll the transaction back, nothing
+        in the batch is written. The messages ahead of it are applied again as
+        a smaller batch, a message that succeeded on retry is handled again on
+        its own, a failed one keeps its failed result, and the rest of the
+        batch carries on as a batch of its own. A failed commit applies every
+        message again one at a time.
+
+        A command dispatcher that combines commands (``command_mailbox.combine``)
+        gets the same treatment per aggregate: each aggregate's commands run in
+        read order, at most ``max_batch`` to a UnitOfWork, so a hot aggregate
+        is loaded and committed once per run instead of once per command.
+
+        Args:
+            handler_cls: The projector class, or the command dispatcher.
+            messages: The messages, in read order.
+            worker_id: The handling subscription, for traces.
+
+        Returns:
+            Whether each message was handled successfully, in order.
+        """
+        max_batch = getattr(handler_cls, "combine_max_batch", 0)
+        if max_batch > 0 and not self.shutting_down:
+            runs = self._aggregate_runs(messages, max_batch)
+            if len(runs) > 1:
+                outcomes: dict[int, bool] = {}
+                for run in runs:
+                    results = await self.handle_batch(
+                        handler_cls, run, worker_id=worker_id
+                    )
+                    outcomes.update(zip(map(id, run), results, strict=True))
+                return [outcomes[id(message)] for message in messages]
+
+        if len(messages) <= 1 or self.shutting_down:
+            return [
+                await self.handle_message(handler_cls, message, worker_id=worker_id)
+                for message in messages
+            ]
+
+        with self.domain.domain_context():
+            uow = UnitOfWork()
+            uow.start()
+            uow.coalesce_projections()
+
+            failed_at: int | None = None
+            is_successful = True
+            try:
+                for index, message in enumerate(messages):
+                    is_successful = await self.handle_message(
+                        handler_cls, message, worker_id=worker_id
+                    )
+                    if not is_successful or uow._rollback_only:
+                        failed_at = index
+                        break
+            except BaseException:
+                uow.rollback()
+                raise
+
+            if failed_at is None:
+                try:
+                    uow.commit()
+                except Exception:
+                    if uow.in_progress:
+                        uow.rollback()
+                    logger.exception(
+                        "engine.batch_commit_failed",
+                        extra={
+                            "handler": handler_cls.__name__,
+                            "batch_size": len(messages),
+                        },
+                    )
+                    return [
+                        await self.handle_message(
+                            handler_cls, message, worker_id=worker_id
+                        )
+                        for message in messages
+                    ]
+                return [True] * len(messages)
+
+            uow.rollback()
+
+        logger.info(
+            "engine.batch_split",
+            extra={
+                "handler": handler_cls.__name__,
+                "batch_size": len(messages),
+                "failed_at": failed_at,
+            },
+        )
+        results = await self.handle_batch(
+            handler_cls, messages[:failed_at], worker_id=worker_id
+        )
+        if is_successful:
+            # Succeeded on retry, but its failed attempt doomed the batch
+            is_successful = await self.handle_message(
+                handler_cls, messages[failed_at], worker_id=worker_id
+            )
+        results.append(is_successful)
+        results.extend(
+            await self.handle_batch(
+                handler_cls, messages[failed_at + 1 :], worker_id=worker_id
+            )
+        )
+        return results
+
+    @staticmethod
+    def _aggregate_runs(messages: list[Message], max_batch: int) -> list[list[Message]]:
+        """Split commands into runs per aggregate, each in read order.
+
+        A command's stream (``<category>:command-<identity>``) names its
+        aggregate. Runs hold at most ``max_batch`` commands and are ordered by
+        the position of their first command.
+        """
+        runs: list[list[Message]] = []
+        open_runs: dict[str | None, list[Message]] = {}
+        for message in messages:
+            headers = message.metadata.headers if message.metadata else None
+            key = headers.stream if headers else None
+            run = open_runs.get(key)
+            if run is None or len(run) >= max_batch or key is None:
+                run = open_runs[key] = []
+                runs.append(run)
+            run.append(message)
+        return runs
+
     def _setup_signal_handlers(self) -> None:
         """
         Set up signal handlers using the appropriate method based on the platform.
@@ -1101,8 +1362,18 @@ class Engine:
             )
             if self._dlq_maintenance is not None:
                 subscription_shutdown_coros.append(self._dlq_maintenance.shutdown())
+            if self._pending_reclaim is not None:
+                subscription_shutdown_coros.append(self._pending_reclaim.shutdown())
+            subscription_shutdown_coros.extend(
+                multiplexer.shutdown()
+                for multiplexer in self._read_multiplexers.values()
+            )
 
             await asyncio.gather(*subscription_shutdown_coros, return_exceptions=True)
+            await asyncio.gather(
+                *(listener.stop() for listener in self._push_listeners),
+                return_exceptions=True,
+            )
             logger.info("engine.subscriptions_stopped")
 
             # Step 2: Wait for in-flight tasks to finish with a bounded timeout.
@@ -1132,7 +1403,15 @@ class Engine:
                         task.cancel()
                     await asyncio.gather(*pending, return_exceptions=True)
 
-            # Step 3: Close domain infrastructure connections
+            # Step 3: Close domain infrastructure connections. Resources bound
+            # to this loop (an async event store pool) close first, while the
+            # loop still runs.
+            try:
+                store = self.domain.event_store.store
+                if store is not None:
+                    await store.aclose()
+            except Exception:
+                logger.exception("engine.cleanup_failed")
             try:
                 self.domain.close()
             except Exception:
@@ -1143,6 +1422,28 @@ class Engine:
         finally:
             self.loop.stop()
 
+    def _start_push_listeners(self) -> None:
+        """Start the push listeners of the event store and the outbox providers.
+
+        A listener delivers other processes' writes to the wakeups its source's
+        subscriptions wait on. Sources without one are only polled.
+        """
+        outbox_providers = {
+            processor.database_provider_name
+            for processor in self._outbox_processors.values()
+        }
+        sources: list[Any] = [
+            self.domain.providers[name] for name in sorted(outbox_providers)
+        ]
+        if self._subscriptions and self.domain.event_store.store is not None:
+            sources.append(self.domain.event_store.store)
+
+        for source in sources:
+            listener = source.push_listener()
+            if listener is not None:
+                listener.start(self.loop)
+                self._push_listeners.append(listener)
+
     def _reconcile_outbox_on_startup(self) -> int:
         """Recover the ADR-0015 crash window on startup: create outbox rows for
         events that are durable in the event store but whose relational outbox
@@ -1243,6 +1544,8 @@ class Engine:
             health_task.set_name("health-server")
             health_task.add_done_callback(self._on_health_server_done)
 
+        self._start_push_listeners()
+
         # Create all tasks with names for better debugging
         subscription_tasks = []
         for name, subscription in self._subscriptions.items():
@@ -1268,13 +1571,20 @@ class Engine:
             logger.info("engine.outbox_processor_started", extra={"processor": name})
 
         # Start DLQ maintenance task if a DLQ-capable broker is present
-        dlq_maintenance_tasks = []
+        maintenance_tasks = []
         if self._dlq_maintenance is not None:
             task = self.loop.create_task(self._dlq_maintenance.start())
             task.set_name("dlq-maintenance")
-            dlq_maintenance_tasks.append(task)
+            maintenance_tasks.append(task)
             logger.info("engine.dlq_maintenance_started")
 
+        # Start the pending reclaimer if a reclaim-capable broker is present
+        if self._pending_reclaim is not None:
+            task = self.loop.create_task(self._pending_reclaim.start())
+            task.set_name("pending-reclaim")
+            maintenance_tasks.append(task)
+            logger.info("engine.pending_reclaim_started")
+
         try:
             if self.test_mode:
                 # In test mode, run the loop multiple times to ensure all messages are processed
@@ -1285,7 +1595,7 @@ class Engine:
                         subscription_tasks
                         + broker_subscription_tasks
                         + outbox_processor_tasks
-                        + dlq_maintenance_tasks
+                        + maintenance_tasks
                     )
 
                     # Run enough cycles to allow message propagation across
@@ -25,6 +25,7 @@ Infrastructure gauges (OTEL instrument name / Prometheus text name):
 - protean.subscription.consumer_lag — Messages behind stream head per subscription
 - protean.subscription.lag_seconds — Seconds since a subscription's last processed position
 - protean.subscription.pending_messages — Unacknowledged messages per subscription
+- protean.subscription.idle_pending — Pending messages held by idle consumers, awaiting reclaim
 - protean_subscription_dlq_depth — Dead letter queue depth per subscription
 - protean_subscription_status — Subscription health (1=ok, 0=not ok)
 - protean.projection.staleness_seconds — Seconds a projection is behind its source events
@@ -42,6 +43,7 @@ Plus OTel counters and histograms when telemetry is active:
 
 - protean.command.processed, protean.handler.invocations, protean.uow.commits
 - protean.outbox.published, protean.outbox.failed
+- protean.subscription.pending_reclaimed
 - protean.command.duration, protean.handler.duration
 - protean.uow.events_per_commit, protean.outbox.latency
 """
@@ -423,6 +425,12 @@ def _register_infrastructure_gauges(domains: list[Domain]) -> None:
             "Unacknowledged messages",
             None,
         ),
+        (
+            "protean.subscription.idle_pending",
+            "idle_pending",
+            "Pending messages held by idle consumers, awaiting reclaim",
+            None,
+        ),
         (
             "protean_subscription_dlq_depth",
             "dlq_depth",
@@ -642,6 +650,12 @@ def _hand_rolled_metrics(domains: list[Domain]) -> str:
             )
             lines.append("# TYPE protean_subscription_pending_messages gauge")
             lines.append("")
+            lines.append(
+                "# HELP protean_subscription_idle_pending Pending messages held "
+                "by idle consumers, awaiting reclaim"
+            )
+            lines.append("# TYPE protean_subscription_idle_pending gauge")
+            lines.append("")
             lines.append(
                 "# HELP protean_subscription_dlq_depth Dead letter queue depth"
             )
@@ -676,6 +690,9 @@ def _hand_rolled_metrics(domains: list[Domain]) -> str:
                 lines.append(
                     f"protean_subscription_pending_messages{{{labels}}} {s.pending}"
                 )
+                lines.append(
+                    f"protean_subscription_idle_pending{{{labels}}} {s.idle_pending}"
+                )
                 lines.append(
                     f"protean_subscription_dlq_depth{{{labels}}} {s.dlq_depth}"
                 )
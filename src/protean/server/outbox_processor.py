@@ -17,6 +17,7 @@ from .subscription import BaseSubscription
 
 if TYPE_CHECKING:
     from protean.server.engine import Engine
+    from protean.utils.wakeup import Wakeup
 
 logger = logging.getLogger(__name__)
 
@@ -130,6 +131,13 @@ class OutboxProcessor(BaseSubscription):
 
         self.tick_count = 0
 
+        # While the provider's wakeups are live, an idle processor waits this
+        # long for one before polling again. Kept short: a failed message
+        # coming due for retry wakes nothing.
+        self.push_poll_interval = float(
+            engine.domain.config.get("outbox", {}).get("push_poll_interval_seconds", 5)
+        )
+
         # ``subscriber_name`` is refined to the Outbox aggregate name in
         # ``initialize()``; until then the base subscription lifecycle (which
         # logs it before ``initialize()`` runs) reads this stable identifier,
@@ -188,6 +196,17 @@ class OutboxProcessor(BaseSubscription):
             },
         )
 
+    def subscribe_wakeup(self) -> "Wakeup":
+        """Wake when outbox rows for this processor's broker commit.
+
+        Without external brokers, rows are not filtered by target broker, so
+        any commit wakes the processor.
+        """
+        wakeups = self.engine.domain.providers[self.database_provider_name].wakeups
+        if self._filter_by_broker:
+            return wakeups.subscribe([self.broker_provider_name])
+        return wakeups.subscribe()
+
     async def get_next_batch_of_messages(self) -> list[Outbox]:
         """
         Atomically claim the next batch of outbox messages for processing.
@@ -294,6 +313,7 @@ class OutboxProcessor(BaseSubscription):
         resetting to the base interval whenever a non-empty batch is fetched.
         """
         messages = await self.get_next_batch_of_messages()
+        self._idle = not messages
         if messages:
             self.tick_interval = self._base_tick_interval
             await self.process_batch(messages)
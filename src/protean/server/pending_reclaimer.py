@@ -0,0 +1,187 @@
+"""Pending-message reclaimer for stream subscriptions.
+
+Runs as an async task inside the Engine, following the same lifecycle
+pattern as ``DLQMaintenanceTask``.  A stream subscription only re-reads its
+*own* pending messages, so messages held by a crashed or scaled-down
+consumer would otherwise sit in the consumer group's pending entries list
+(PEL) indefinitely.  Every cycle, for each stream subscription on a broker
+advertising ``PENDING_RECLAIM``, the task:
+
+1. Claims one bounded page of pending messages idle for at least
+   ``min_idle_ms`` into the subscription's consumer, using
+   ``BaseBroker.reclaim_pending()`` (``XAUTOCLAIM`` on Redis).
+2. Remembers the scan cursor, so the next cycle continues with the next
+   page instead of rescanning from the start.
+
+The subscription then redelivers the claimed messages along with its own
+pending messages.  Their broker-side delivery count feeds the retry/DLQ
+decision, so a poison message does not get a fresh set of retries every
+time it changes hands.
+
+Configuration lives in ``[server.pending_reclaim]`` within domain.toml.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING
+
+from protean.port.broker import BrokerCapabilities
+from protean.server.subscription.partitioned_stream_subscription import (
+    PartitionedStreamSubscription,
+)
+from protean.server.subscription.stream_subscription import StreamSubscription
+from protean.utils.telemetry import get_domain_metrics
+
+if TYPE_CHECKING:
+    from protean.domain import Domain
+    from protean.port.broker import BaseBroker
+    from protean.server.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+# Cursor that starts (and, when returned, restarts) a pending-entries scan
+_SCAN_START = "0-0"
+
+
+class PendingReclaimTask:
+    """Periodic takeover of idle pending messages by live consumers.
+
+    Attributes:
+        engine: The Protean Engine instance.
+        min_idle_ms: Minimum idle time before a pending message is claimed.
+        batch_size: Maximum messages claimed per stream in one cycle.
+        check_interval: Seconds between reclaim cycles.
+    """
+
+    def __init__(self, engine: Engine) -> None:
+        self.engine = engine
+        self.domain: Domain = engine.domain
+        self.keep_going = True
+
+        reclaim_config = self.domain.config.get("server", {}).get("pending_reclaim", {})
+        self.min_idle_ms: int = int(reclaim_config.get("min_idle_ms", 120_000))
+        self.batch_size: int = int(reclaim_config.get("batch_size", 100))
+        self.check_interval: float = float(
+            reclaim_config.get("check_interval_seconds", 30)
+        )
+
+        # Scan cursor per (stream, consumer group), carried across cycles
+        self._cursors: dict[tuple[str, str], str] = {}
+
+    @property
+    def subscriber_name(self) -> str:
+        return "pending-reclaimer"
+
+    async def start(self) -> None:
+        """Start the reclaim loop."""
+        logger.info("pending_reclaim.started")
+        loop_task = self.engine.loop.create_task(self._run())
+        loop_task.set_name("pending-reclaim-loop")
+
+    async def _run(self) -> None:
+        """Main loop: sleep, then run one reclaim cycle."""
+        while self.keep_going and not self.engine.shutting_down:
+            try:
+                await asyncio.sleep(self.check_interval)
+                if not self.keep_going or self.engine.shutting_down:
+                    break
+                with self.domain.domain_context():
+                    await self._reclaim_cycle()
+            except asyncio.CancelledError:
+                break
+            except Exception:
+                logger.exception("pending_reclaim.cycle_failed")
+
+    async def _reclaim_cycle(self) -> int:
+        """Claim one page of idle pending messages per subscribed stream.
+
+        Returns the total number of messages reclaimed in this cycle.
+        """
+        metrics = get_domain_metrics(self.domain)
+        total = 0
+
+        for subscription in self._subscriptions():
+            broker = subscription.broker
+            assert broker is not None, "Broker not initialized"
+            for stream in self._streams(subscription):
+                try:
+                    claimed = await asyncio.to_thread(
+                        self._reclaim_page, broker, subscription, stream
+                    )
+                except Exception:
+                    logger.exception(
+                        "pending_reclaim.stream_reclaim_failed",
+                        extra={
+                            "stream": stream,
+                            "consumer_group": subscription.consumer_group,
+                        },
+                    )
+                    continue
+
+                if claimed:
+                    total += len(claimed)
+                    metrics.subscription_pending_reclaimed.add(
+                        len(claimed),
+                        {
+                            "subscription": subscription.subscriber_class_name,
+                            "handler": subscription.subscriber_class_name,
+                            "stream": stream,
+                        },
+                    )
+                    logger.info(
+                        "pending_reclaim.reclaimed",
+                        extra={
+                            "stream": stream,
+                            "consumer_group": subscription.consumer_group,
+                            "consumer": subscription.consumer_name,
+                            "count": len(claimed),
+                        },
+                    )
+
+        return total
+
+    def _reclaim_page(
+        self, broker: BaseBroker, subscription: StreamSubscription, stream: str
+    ) -> list[str]:
+        """Claim the next page for *stream* and advance its cursor."""
+        key = (stream, subscription.consumer_group)
+        cursor, claimed = broker.reclaim_pending(
+            stream,
+            subscription.consumer_group,
+            subscription.consumer_name,
+            self.min_idle_ms,
+            start_id=self._cursors.get(key, _SCAN_START),
+            count=self.batch_size,
+        )
+        self._cursors[key] = cursor
+        return claimed
+
+    def _subscriptions(self) -> list[StreamSubscription]:
+        """Return the engine's stream subscriptions on reclaim-capable brokers.
+
+        Partitioned subscriptions are left out: a new partition owner already
+        reclaims its predecessor's pending messages under the partition lease.
+        """
+        return [
+            subscription
+            for subscription in self.engine._subscriptions.values()
+            if isinstance(subscription, StreamSubscription)
+            and not isinstance(subscription, PartitionedStreamSubscription)
+            and subscription.broker is not None
+            and subscription.broker.has_capability(BrokerCapabilities.PENDING_RECLAIM)
+        ]
+
+    @staticmethod
+    def _streams(subscription: StreamSubscription) -> list[str]:
+        """Return the streams a subscription consumes (primary, then backfill)."""
+        streams = [subscription.stream_category]
+        if subscription._lanes_enabled:
+            streams.append(subscription.backfill_stream)
+        return streams
+
+    async def shutdown(self) -> None:
+        """Signal the task to stop."""
+        self.keep_going = False
+        logger.info("pending_reclaim.shutdown")
@@ -9,6 +9,7 @@ from protean.server.subscription.profiles import SubscriptionType
 if TYPE_CHECKING:
     from protean.domain import Domain
     from protean.server.engine import Engine
+    from protean.utils.wakeup import Wakeup
 
 logger = logging.getLogger(__name__)
 
@@ -49,6 +50,13 @@ class BaseSubscription(ABC):
 
         self.keep_going = True  # Initially set to keep going
 
+        # Push wakeups (see ``subscribe_wakeup``). While the wakeup's hub is
+        # live, an idle subscription waits up to ``push_poll_interval`` seconds
+        # for one before polling again; ``None`` keeps ``tick_interval``.
+        self.wakeup: Wakeup | None = None
+        self.push_poll_interval: float | None = None
+        self._idle = False
+
     async def start(self) -> None:
         """
         Start the subscription.
@@ -65,6 +73,7 @@ class BaseSubscription(ABC):
 
         # Perform backend-specific initialization
         await self.initialize()
+        self.wakeup = self.subscribe_wakeup()
 
         # Start the polling loop
         self.loop.create_task(self.poll())
@@ -90,13 +99,7 @@ class BaseSubscription(ABC):
                     # Reset error counter on successful tick
                     consecutive_errors = 0
 
-                    # Use minimal sleep for cooperative multitasking
-                    # This ensures interleaving without blocking
-                    if self.tick_interval > 0:
-                        await asyncio.sleep(self.tick_interval)
-                    else:
-                        # Always yield control to allow other tasks to run
-                        await asyncio.sleep(0)
+                    await self.wait_for_next_tick()
 
             except asyncio.CancelledError:
                 logger.info(
@@ -127,9 +130,38 @@ class BaseSubscription(ABC):
             None
         """
         messages = await self.get_next_batch_of_messages()
+        self._idle = not messages
         if messages:
             await self.process_batch(messages)
 
+    def subscribe_wakeup(self) -> "Wakeup | None":
+        """Subscribe to the push wakeups of the subscription's source.
+
+        Called once, on the engine's loop, after ``initialize``. ``None``, the
+        default, means the source has none, and the subscription only polls.
+        """
+        return None
+
+    async def wait_for_next_tick(self) -> None:
+        """Wait between ticks.
+
+        Waits ``tick_interval`` seconds, returning early on a wakeup. While the
+        wakeup's hub is live and the last tick found nothing, waits up to
+        ``push_poll_interval`` instead: every write then wakes the
+        subscription, and the poll only guards against a missed one. A
+        ``tick_interval`` of 0 just yields to the loop.
+        """
+        timeout = self.tick_interval
+        wakeup = self.wakeup
+        if wakeup is None:
+            # Yield control even at 0 to allow other tasks to run
+            await asyncio.sleep(max(timeout, 0))
+            return
+
+        if self._idle and wakeup.live and self.push_poll_interval is not None:
+            timeout = max(timeout, self.push_poll_interval)
+        await wakeup.wait(timeout)
+
     async def shutdown(self) -> None:
         """
         Shutdown the subscription.
@@ -140,6 +172,8 @@ class BaseSubscription(ABC):
             None
         """
         self.keep_going = False  # Signal to stop polling
+        if self.wakeup is not None:
+            self.wakeup.close()  # Release a poll loop waiting for work
         await self.cleanup()
         logger.info(
             "subscription.shutdown",
@@ -199,6 +233,19 @@ class BaseSubscription(ABC):
         """
 
 
+def handles_batches(handler: Any) -> bool:
+    """Whether a subscription should hand *handler* whole batches.
+
+    A ``micro_batch`` projector, and a command dispatcher combining each
+    aggregate's commands, gets each batch through ``Engine.handle_batch``
+    instead of one ``handle_message`` per message.
+    """
+    if getattr(getattr(handler, "meta_", None), "micro_batch", False) is True:
+        return True
+    combine = getattr(handler, "combine_max_batch", 0)
+    return isinstance(combine, int) and combine > 0
+
+
 def event_store_subscription_handlers(domain: "Domain") -> list[str]:
     """Return the names of handlers whose subscriptions resolve to EVENT_STORE.
 
@@ -293,4 +340,5 @@ __all__ = [
     "BaseSubscription",
     "event_store_multi_worker_error",
     "event_store_subscription_handlers",
+    "handles_batches",
 ]
@@ -13,12 +13,14 @@ from protean.core.event_handler import BaseEventHandler
 from protean.exceptions import ConfigurationError
 from protean.port.event_store import BaseEventStore
 from protean.utils import checkpoint_trace, fqn, recovery_trace
+from protean.utils.consume_idempotency import batch_markers
 from protean.utils.eventing import Message, MessageType
 
-from . import BaseSubscription
+from . import BaseSubscription, handles_batches
 
 if TYPE_CHECKING:
     from protean.server.engine import Engine
+    from protean.utils.wakeup import Wakeup
 
     from .profiles import SubscriptionConfig
 
@@ -97,6 +99,9 @@ class EventStoreSubscription(BaseSubscription):
     - ``gap_timeout_seconds`` (default 5) — for a ``$all`` (cross-category)
       subscription, how long to hold at a missing lower ``global_position``
       before abandoning it as a rolled-back gap (see ``_gap_safe_batch``).
+    - ``push_poll_interval_seconds`` (default 30) — while the event store's
+      wakeups are live (see ``subscribe_wakeup``), how long an idle
+      subscription waits for a wakeup before polling anyway.
 
     Per-handler overrides can be passed via the constructor or
     ``from_config()`` factory.
@@ -116,6 +121,7 @@ class EventStoreSubscription(BaseSubscription):
         enable_recovery: bool | None = None,
         recovery_interval_seconds: float | None = None,
         gap_timeout_seconds: float | None = None,
+        push_poll_interval_seconds: float | None = None,
     ) -> None:
         """
         Initialize the EventStoreSubscription object.
@@ -135,12 +141,16 @@ class EventStoreSubscription(BaseSubscription):
             gap_timeout_seconds: For a ``$all`` (cross-category) subscription, how
                 long to wait for a missing lower ``global_position`` to commit
                 before abandoning it as a rolled-back gap.
+            push_poll_interval_seconds: While the event store pushes wakeups for
+                every write, how long an idle subscription waits for one before
+                polling anyway.
         """
         # Initialize parent class
         super().__init__(engine, messages_per_tick, tick_interval)
 
         self.handler = handler
         self.subscriber_name = fqn(self.handler)
+        self.micro_batch = handles_batches(handler)
         self.subscriber_class_name = self.handler.__name__
 
         # Generate unique subscription ID
@@ -203,6 +213,11 @@ class EventStoreSubscription(BaseSubscription):
             if gap_timeout_seconds is not None
             else float(es_config.get("gap_timeout_seconds", 5))
         )
+        self.push_poll_interval = (
+            push_poll_interval_seconds
+            if push_poll_interval_seconds is not None
+            else float(es_config.get("push_poll_interval_seconds", 30))
+        )
 
         # $all (cross-category) gap tracking: the monotonic time each missing
         # global_position at the contiguity frontier was first observed, used to
@@ -279,6 +294,16 @@ class EventStoreSubscription(BaseSubscription):
             tick_interval=config.tick_interval,
         )
 
+    def subscribe_wakeup(self) -> "Wakeup":
+        """Wake on new messages in the subscribed category, or in any for ``$all``.
+
+        The store notifies its ``wakeups`` on every write it makes, and on
+        other processes' writes too while its push listener is connected.
+        """
+        if self.stream_category == "$all":
+            return self.store.wakeups.subscribe()
+        return self.store.wakeups.subscribe([self.store.category(self.stream_category)])
+
     async def initialize(self) -> None:
         """
         Perform event store specific initialization.
@@ -321,14 +346,8 @@ class EventStoreSubscription(BaseSubscription):
         Returns:
             int: The last read position from the store.
         """
-        message = await asyncio.to_thread(
-            self.store._read_last_message, self.subscriber_stream_name
-        )
-        if message:
-            position: int = message["data"]["position"]
-            return position
-
-        return -1
+        checkpoint = await self.store.aread_checkpoint(self.subscriber_stream_name)
+        return checkpoint.position if checkpoint else -1
 
     async def update_current_position_to_store(self) -> int:
         """Update the current position to the store, only if out of sync.
@@ -369,8 +388,9 @@ class EventStoreSubscription(BaseSubscription):
         """
         Write the position to the store.
 
-        This method writes the current read position to the event store. It updates the read position
-        of the subscriber and resets the counter for messages since the last position write.
+        This method writes the current read position to the event store's checkpoint store,
+        overwriting the subscriber's checkpoint, and resets the counter for messages since the
+        last position write.
 
         Args:
             position (int): The read position to be written.
@@ -382,27 +402,12 @@ class EventStoreSubscription(BaseSubscription):
 
         self.messages_since_last_position_write = 0  # Reset counter
 
-        result = await asyncio.to_thread(
-            self.store._write,
-            self.subscriber_stream_name,
-            "Read",
-            {"position": position},
-            metadata={
-                "headers": {
-                    "id": str(uuid4()),
-                    "type": "Read",
-                    "time": self.engine.domain.clock.now().isoformat(),
-                    "stream": self.subscriber_stream_name,
-                },
-                "domain": {
-                    "kind": MessageType.READ_POSITION.value,
-                    "origin_stream": self.stream_category,
-                },
-            },
+        await self.store.awrite_checkpoint(
+            self.subscriber_stream_name, position, self.engine.domain.clock.now()
         )
         # The durable cursor checkpoint advanced to this position (the spec's Flush).
         recovery_trace.record(action="flush", position=position)
-        return result
+        return position
 
     def filter_on_origin(self, messages: list[Message]) -> list[Message]:
         """
@@ -445,6 +450,9 @@ class EventStoreSubscription(BaseSubscription):
         no-op for single-category subscriptions (``_gap_watermark`` stays -1).
         """
         messages = await self.get_next_batch_of_messages()
+        # A batch held at a ``$all`` gap is not idle: the gap times out on a
+        # later poll, with no write to wake the subscription
+        self._idle = not messages and not self._gap_first_seen
         if messages:
             await self.process_batch(messages)
 
@@ -461,8 +469,7 @@ class EventStoreSubscription(BaseSubscription):
         Returns:
             List[Message]: The next batch of messages to process.
         """
-        messages = await asyncio.to_thread(
-            self.store.read,
+        messages = await self.store.aread(
             self.stream_category,
             position=self.current_position + 1,
             no_of_messages=self.messages_per_tick,
@@ -615,125 +622,183 @@ class EventStoreSubscription(BaseSubscription):
         # Get the idempotency store (may be inactive if Redis is not configured)
         idempotency_store = self.engine.domain.idempotency_store
 
-        for message in messages:
-            # Messages read from the event store are always deserialized with
-            # metadata (headers + store positions). Guard defensively so a
-            # malformed record is skipped rather than crashing the batch.
-            if (
-                message.metadata is None
-                or message.metadata.event_store is None
-                or message.metadata.event_store.global_position is None
-            ):  # pragma: no cover — corruption guard; real store messages always carry these
-                logger.warning(
-                    f"[{self.subscriber_class_name}] "
-                    f"Skipping message with missing metadata/position"
-                )
-                continue
-
-            message_type = message.metadata.headers.type or "unknown"
-            message_id = message.metadata.headers.id or "unknown"
-            short_id = message_id[:8]
-            position = message.metadata.event_store.global_position
+        # Idempotent handlers read the processed markers of the whole batch at
+        # once instead of one message at a time.
+        with batch_markers(
+            message.metadata.headers.id
+            if message.metadata and message.metadata.headers
+            else None
+            for message in messages
+        ):
+            # A micro-batch projector handles the messages up front, together; the
+            # loop then records their results in order, so no position is written
+            # before the batch's rows are.
+            batch_results = await self._handle_micro_batch(messages)
+
+            for message in messages:
+                # Messages read from the event store are always deserialized with
+                # metadata (headers + store positions). Guard defensively so a
+                # malformed record is skipped rather than crashing the batch.
+                if (
+                    message.metadata is None
+                    or message.metadata.event_store is None
+                    or message.metadata.event_store.global_position is None
+                ):  # pragma: no cover — corruption guard; real store messages always carry these
+                    logger.warning(
+                        f"[{self.subscriber_class_name}] "
+                        f"Skipping message with missing metadata/position"
+                    )
+                    continue
 
-            # Log the message being picked up, with payload
-            logger.info(
-                f"[{self.subscriber_class_name}] "
-                f"Received {message_type} (ID: {short_id}..., pos: {position})\n"
-                f"  Payload: {message.to_dict()}"
-            )
+                message_type = message.metadata.headers.type or "unknown"
+                message_id = message.metadata.headers.id or "unknown"
+                short_id = message_id[:8]
+                position = message.metadata.event_store.global_position
 
-            # Skip synchronous messages — they were already handled inline
-            if not (message.metadata.domain and message.metadata.domain.asynchronous):
+                # Log the message being picked up, with payload
                 logger.info(
                     f"[{self.subscriber_class_name}] "
-                    f"{message_type} (pos: {position}) — already processed inline"
+                    f"Received {message_type} (ID: {short_id}..., pos: {position})\n"
+                    f"  Payload: {message.to_dict()}"
                 )
-                # A skipped sync message is a non-failed advance past the cursor,
-                # the same transition the spec models as HandleOk. Emit before the
-                # cursor write so a durable flush lands after it in the log.
-                recovery_trace.record(action="handle_ok", position=position)
-                await self.update_read_position(position)
-                continue
 
-            # Check idempotency store for already-processed commands
-            idempotency_key = (
-                message.metadata.headers.idempotency_key
-                if message.metadata.headers
-                else None
-            )
-            if idempotency_key and idempotency_store.is_active:
-                existing = idempotency_store.check(idempotency_key)
-                if existing and existing.get("status") == "success":
+                # Skip synchronous messages — they were already handled inline
+                if not (
+                    message.metadata.domain and message.metadata.domain.asynchronous
+                ):
                     logger.info(
                         f"[{self.subscriber_class_name}] "
-                        f"{message_type} (ID: {short_id}...) — already processed (idempotent)"
+                        f"{message_type} (pos: {position}) — already processed inline"
                     )
-                    # An idempotent skip is a non-failed advance (already handled),
-                    # the same HandleOk transition the spec models. Emit before the
+                    # A skipped sync message is a non-failed advance past the cursor,
+                    # the same transition the spec models as HandleOk. Emit before the
                     # cursor write so a durable flush lands after it in the log.
                     recovery_trace.record(action="handle_ok", position=position)
                     await self.update_read_position(position)
-                    successful_count += 1
                     continue
 
-            # Process the message and get a success/failure result
-            is_successful = await self.engine.handle_message(
-                self.handler, message, worker_id=self.subscription_id
-            )
-
-            if not is_successful:
-                logger.warning(
-                    f"[{self.subscriber_class_name}] "
-                    f"Failed {message_type} (ID: {short_id}..., pos: {position})"
+                # Check idempotency store for already-processed commands
+                idempotency_key = (
+                    message.metadata.headers.idempotency_key
+                    if message.metadata.headers
+                    else None
                 )
-                recovery_trace.record(action="fail", position=position)
-                # Record the failure durably BEFORE advancing the cursor past it
-                # (see the method docstring): the recovery record has to be durable
-                # first, or a crash in the gap would drop the message.
-                if self.enable_recovery:
-                    stream_name = (
-                        message.metadata.headers.stream
-                        if message.metadata.headers
-                        else None
+                if idempotency_key and idempotency_store.is_active:
+                    existing = idempotency_store.check(idempotency_key)
+                    if existing and existing.get("status") == "success":
+                        logger.info(
+                            f"[{self.subscriber_class_name}] "
+                            f"{message_type} (ID: {short_id}...) — already processed (idempotent)"
+                        )
+                        # An idempotent skip is a non-failed advance (already handled),
+                        # the same HandleOk transition the spec models. Emit before the
+                        # cursor write so a durable flush lands after it in the log.
+                        recovery_trace.record(action="handle_ok", position=position)
+                        await self.update_read_position(position)
+                        successful_count += 1
+                        continue
+
+                # Process the message and get a success/failure result
+                if id(message) in batch_results:
+                    is_successful = batch_results[id(message)]
+                else:
+                    is_successful = await self.engine.handle_message(
+                        self.handler, message, worker_id=self.subscription_id
                     )
-                    stream_position = (
-                        message.metadata.event_store.position
-                        if message.metadata.event_store
-                        else None
+
+                if not is_successful:
+                    logger.warning(
+                        f"[{self.subscriber_class_name}] "
+                        f"Failed {message_type} (ID: {short_id}..., pos: {position})"
                     )
-                    await self._record_failed_position(
-                        position,
-                        message_type,
-                        message_id,
-                        stream_name=stream_name,
-                        stream_position=stream_position,
+                    recovery_trace.record(action="fail", position=position)
+                    # Record the failure durably BEFORE advancing the cursor past it
+                    # (see the method docstring): the recovery record has to be durable
+                    # first, or a crash in the gap would drop the message.
+                    if self.enable_recovery:
+                        stream_name = (
+                            message.metadata.headers.stream
+                            if message.metadata.headers
+                            else None
+                        )
+                        stream_position = (
+                            message.metadata.event_store.position
+                            if message.metadata.event_store
+                            else None
+                        )
+                        await self._record_failed_position(
+                            position,
+                            message_type,
+                            message_id,
+                            stream_name=stream_name,
+                            stream_position=stream_position,
+                        )
+
+                # The in-memory cursor advances past this message: HandleOk for a handled
+                # message, Advance for a failed one (after its record, if recovery is
+                # enabled). Emit before the cursor write below so a durable flush
+                # (write_position emits it) lands after the advance in the log —
+                # Recovery!Flush requires cursorDur < cursorMem.
+                recovery_trace.record(
+                    action="handle_ok" if is_successful else "advance",
+                    position=position,
+                )
+
+                # Advance the cursor after any failure record (non-blocking, to avoid a
+                # poison pill). With recovery enabled the record above is already
+                # durable; with it disabled a failed message is intentionally dropped.
+                await self.update_read_position(position)
+
+                if is_successful:
+                    successful_count += 1
+                    logger.info(
+                        f"[{self.subscriber_class_name}] "
+                        f"Completed {message_type} (ID: {short_id}..., pos: {position})"
                     )
+                    # Record success in the idempotency store for future dedup
+                    if idempotency_key and idempotency_store.is_active:
+                        idempotency_store.record_success(idempotency_key, True)
 
-            # The in-memory cursor advances past this message: HandleOk for a handled
-            # message, Advance for a failed one (after its record, if recovery is
-            # enabled). Emit before the cursor write below so a durable flush
-            # (write_position emits it) lands after the advance in the log —
-            # Recovery!Flush requires cursorDur < cursorMem.
-            recovery_trace.record(
-                action="handle_ok" if is_successful else "advance", position=position
-            )
+        return successful_count
 
-            # Advance the cursor after any failure record (non-blocking, to avoid a
-            # poison pill). With recovery enabled the record above is already
-            # durable; with it disabled a failed message is intentionally dropped.
-            await self.update_read_position(position)
+    async def _handle_micro_batch(self, messages: list[Message]) -> dict[int, bool]:
+        """Handle a micro-batch projector's messages with ``Engine.handle_batch``.
 
-            if is_successful:
-                successful_count += 1
-                logger.info(
-                    f"[{self.subscriber_class_name}] "
-                    f"Completed {message_type} (ID: {short_id}..., pos: {position})"
-                )
-                # Record success in the idempotency store for future dedup
-                if idempotency_key and idempotency_store.is_active:
-                    idempotency_store.record_success(idempotency_key, True)
+        Picks the messages ``process_batch`` would hand to the handler (those
+        with a position, raised asynchronously and not already processed) and
+        returns each one's result, keyed by ``id(message)``. Empty unless the
+        handler is a ``micro_batch`` projector.
+        """
+        if not self.micro_batch:
+            return {}
 
-        return successful_count
+        idempotency_store = self.engine.domain.idempotency_store
+        to_handle: list[Message] = []
+        for message in messages:
+            metadata = message.metadata
+            if (
+                metadata is None
+                or metadata.event_store is None
+                or metadata.event_store.global_position is None
+                or not (metadata.domain and metadata.domain.asynchronous)
+            ):
+                continue
+            idempotency_key = (
+                metadata.headers.idempotency_key if metadata.headers else None
+            )
+            if idempotency_key and idempotency_store.is_active:
+                existing = idempotency_store.check(idempotency_key)
+                if existing and existing.get("status") == "success":
+                    continue
+            to_handle.append(message)
+
+        results = await self.engine.handle_batch(
+            self.handler, to_handle, worker_id=self.subscription_id
+        )
+        return {
+            id(message): result
+            for message, result in zip(to_handle, results, strict=True)
+        }
 
     # ──────────────────────────────────────────────────────────────────────
     # Failed Position Tracking
@@ -768,8 +833,7 @@ class EventStoreSubscription(BaseSubscription):
             f"(retry {retry_count}/{self.max_retries})"
         )
 
-        await asyncio.to_thread(
-            self.store._write,
+        await self.store._awrite(
             self.failed_positions_stream,
             FailedPositionStatus.FAILED.value,
             {
@@ -824,8 +888,7 @@ class EventStoreSubscription(BaseSubscription):
             message_type: The type string of the message.
             message_id: The ID of the message.
         """
-        await asyncio.to_thread(
-            self.store._write,
+        await self.store._awrite(
             self.failed_positions_stream,
             status.value,
             {
@@ -867,8 +930,8 @@ class EventStoreSubscription(BaseSubscription):
         """
         # Restore from checkpoint if available
         watermark = 0
-        checkpoint = await asyncio.to_thread(
-            self.store._read_last_message, self.recovery_checkpoint_stream
+        checkpoint = await self.store._aread_last_message(
+            self.recovery_checkpoint_stream
         )
         if checkpoint:
             watermark = checkpoint["data"].get("watermark", 0)
@@ -881,8 +944,7 @@ class EventStoreSubscription(BaseSubscription):
             )
 
         # Read only new records since the checkpoint
-        messages = await asyncio.to_thread(
-            self.store.read,
+        messages = await self.store.aread(
             self.failed_positions_stream,
             position=watermark,
             no_of_messages=10000,
@@ -948,8 +1010,7 @@ class EventStoreSubscription(BaseSubscription):
         # Serialize _failed_positions with string keys for JSON compatibility
         snapshot = {str(pos): info for pos, info in self._failed_positions.items()}
 
-        await asyncio.to_thread(
-            self.store._write,
+        await self.store._awrite(
             self.recovery_checkpoint_stream,
             "Checkpoint",
             {
@@ -1044,15 +1105,13 @@ class EventStoreSubscription(BaseSubscription):
             # Use the specific stream name and per-stream position if available,
             # otherwise fall back to reading from the category stream.
             if stream_name and stream_position is not None:
-                messages = await asyncio.to_thread(
-                    self.store.read,
+                messages = await self.store.aread(
                     stream_name,
                     position=stream_position,
                     no_of_messages=1,
                 )
             else:
-                messages = await asyncio.to_thread(
-                    self.store.read,
+                messages = await self.store.aread(
                     self.stream_category,
                     position=position,
                     no_of_messages=1,
@@ -1165,11 +1224,7 @@ class EventStoreSubscription(BaseSubscription):
                     # Reset error counter on successful tick
                     consecutive_errors = 0
 
-                    # Use minimal sleep for cooperative multitasking
-                    if self.tick_interval > 0:
-                        await asyncio.sleep(self.tick_interval)
-                    else:
-                        await asyncio.sleep(0)
+                    await self.wait_for_next_tick()
 
             except asyncio.CancelledError:
                 logger.info(f"Subscription cancelled: {self.subscriber_name}")
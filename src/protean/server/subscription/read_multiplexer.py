@@ -0,0 +1,156 @@
+"""Shared multi-stream reads for the stream subscriptions of one consumer group.
+
+A handler subscribed to several stream categories (a projector or a process
+manager) gets one ``StreamSubscription`` per category, all in the handler's
+consumer group. Read independently, each keeps a thread blocked in the broker
+and pays its own read round-trips on every tick. A ``StreamReadMultiplexer``
+serves them all with one ``BaseBroker.read_blocking_multi()`` call (a single
+``XREADGROUP ... STREAMS s1 s2 ...`` on Redis) and hands each subscription the
+messages read from its own stream.
+
+Reads are demand-driven: a subscription asks for its next batch and waits, and
+the multiplexer reads the streams of every waiting subscription together.
+While some members are still processing a batch, a read blocks for at most
+``busy_timeout_ms`` so that they rejoin the next read quickly; once every
+member is waiting, the read blocks for the full timeout.
+
+Configuration lives in ``[server.read_multiplexer]`` within domain.toml.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from protean.server.engine import Engine
+    from protean.server.subscription.stream_subscription import StreamSubscription
+
+logger = logging.getLogger(__name__)
+
+_Batch = list[tuple[str, dict[str, Any]]]
+
+
+class StreamReadMultiplexer:
+    """One reader for all stream subscriptions sharing a consumer group.
+
+    Members share one consumer name, because a multi-stream read names a
+    single consumer for all its streams.
+
+    Attributes:
+        engine: The Protean Engine instance.
+        consumer_group: The consumer group shared by all members.
+        consumer_name: The consumer name used by all members.
+        busy_timeout_ms: Longest read while some member is processing a batch.
+    """
+
+    def __init__(
+        self, engine: Engine, consumer_group: str, busy_timeout_ms: int = 50
+    ) -> None:
+        self.engine = engine
+        self.consumer_group = consumer_group
+        self.consumer_name: str | None = None
+        self.busy_timeout_ms = busy_timeout_ms
+        self.keep_going = True
+
+        # Member subscriptions, keyed by the stream each one consumes
+        self._members: dict[str, StreamSubscription] = {}
+
+        # Stream -> (batch size, future) of members waiting for messages
+        self._demand: dict[str, tuple[int, asyncio.Future[_Batch]]] = {}
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def subscriber_name(self) -> str:
+        return f"read-multiplexer-{self.consumer_group}"
+
+    @property
+    def streams(self) -> list[str]:
+        return list(self._members)
+
+    def attach(self, subscription: StreamSubscription) -> None:
+        """Serve *subscription*'s reads from this multiplexer.
+
+        The first member's consumer name becomes everyone's consumer name.
+        """
+        if self.consumer_name is None:
+            self.consumer_name = subscription.consumer_name
+        subscription.consumer_name = self.consumer_name
+        subscription.read_multiplexer = self
+        self._members[subscription.stream_category] = subscription
+
+    async def read(self, subscription: StreamSubscription, count: int) -> _Batch:
+        """Wait for the next batch of at most *count* messages for *subscription*."""
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[_Batch] = loop.create_future()
+        self._demand[subscription.stream_category] = (count, future)
+        self._wakeup.set()
+
+        if self._task is None or self._task.done():
+            self._task = loop.create_task(self._run())
+            self._task.set_name(self.subscriber_name)
+
+        return await future
+
+    async def _run(self) -> None:
+        """Main loop: wait for demand, then serve it with one read."""
+        try:
+            while self.keep_going and not self.engine.shutting_down:
+                if not self._demand:
+                    self._wakeup.clear()
+                    await self._wakeup.wait()
+                    continue
+
+                demand, self._demand = self._demand, {}
+                await self._read_round(demand)
+        finally:
+            # Release members still waiting once the loop stops
+            for _, future in self._demand.values():
+                if not future.done():
+                    future.set_result([])
+            self._demand = {}
+
+    async def _read_round(
+        self, demand: dict[str, tuple[int, asyncio.Future[_Batch]]]
+    ) -> None:
+        """Read the demanded streams together and resolve each member's future."""
+        leader = self._members[next(iter(demand))]
+        broker = leader.broker
+        assert broker is not None, "Broker not initialized"
+        assert self.consumer_name is not None, "No member attached"
+
+        timeout_ms = leader.blocking_timeout_ms
+        if len(demand) < len(self._members):
+            timeout_ms = min(timeout_ms, self.busy_timeout_ms)
+
+        try:
+            results = await asyncio.to_thread(
+                broker.read_blocking_multi,
+                list(demand),
+                self.consumer_group,
+                self.consumer_name,
+                timeout_ms,
+                max(count for count, _ in demand.values()),
+            )
+        except Exception as exc:
+            for _, future in demand.values():
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        for stream, (count, future) in demand.items():
+            if not future.done():
+                # A smaller batch leaves the surplus pending on this consumer;
+                # the next read picks it up again.
+                future.set_result(results.get(stream, [])[:count])
+
+    async def shutdown(self) -> None:
+        """Signal the loop to stop."""
+        self.keep_going = False
+        self._wakeup.set()
+        logger.debug(
+            "read_multiplexer.shutdown",
+            extra={"consumer_group": self.consumer_group},
+        )
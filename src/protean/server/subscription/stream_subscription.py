@@ -1,26 +1,30 @@
 import asyncio
 import logging
 import os
+import random
 import secrets
 import socket
 import time
+from collections.abc import AsyncIterator
 from typing import TYPE_CHECKING, Any
 
 from protean.core.command_handler import BaseCommandHandler
 from protean.core.event_handler import BaseEventHandler
 from protean.exceptions import ConfigurationError
-from protean.port.broker import BaseBroker
+from protean.port.broker import BaseBroker, BrokerCapabilities
 from protean.utils import fqn
+from protean.utils.consume_idempotency import batch_markers
 from protean.utils.eventing import Message
 from protean.utils.telemetry import get_domain_metrics
 
-from . import BaseSubscription
+from . import BaseSubscription, handles_batches
 from .profiles import CircuitBreakerState
 
 if TYPE_CHECKING:
     from protean.server.engine import Engine
 
     from .profiles import SubscriptionConfig
+    from .read_multiplexer import StreamReadMultiplexer
 
 logger = logging.getLogger(__name__)
 
@@ -54,6 +58,7 @@ class StreamSubscription(BaseSubscription):
         blocking_timeout_ms: int | None = None,
         max_retries: int | None = None,
         retry_delay_seconds: float | None = None,
+        retry_max_delay_seconds: float | None = None,
         enable_dlq: bool | None = None,
         circuit_breaker_threshold: int | None = None,
         circuit_breaker_reset_seconds: float | None = None,
@@ -72,8 +77,10 @@ class StreamSubscription(BaseSubscription):
                 Defaults to config value or 5000.
             max_retries (int, optional): Maximum number of retries before moving to DLQ.
                 Defaults to config value or 3.
-            retry_delay_seconds (float, optional): Delay between retries in seconds.
-                Defaults to config value or 1.
+            retry_delay_seconds (float, optional): Base delay before the first
+                retry, doubled on each later attempt. Defaults to config value or 1.
+            retry_max_delay_seconds (float, optional): Upper bound on the
+                backoff between retries. Defaults to config value or 60.
             enable_dlq (bool, optional): Whether to use a dead letter queue.
                 Defaults to config value or True.
             circuit_breaker_threshold (int, optional): Consecutive handler
@@ -111,6 +118,11 @@ class StreamSubscription(BaseSubscription):
             if retry_delay_seconds is not None
             else float(stream_config.get("retry_delay_seconds", 1))
         )
+        resolved_retry_max_delay_seconds: float = (
+            retry_max_delay_seconds
+            if retry_max_delay_seconds is not None
+            else float(stream_config.get("retry_max_delay_seconds", 60))
+        )
         resolved_enable_dlq: bool = (
             enable_dlq
             if enable_dlq is not None
@@ -133,6 +145,7 @@ class StreamSubscription(BaseSubscription):
 
         self.handler = handler
         self.subscriber_name = fqn(self.handler)
+        self.micro_batch = handles_batches(handler)
         self.subscriber_class_name = self.handler.__name__
 
         # Generate unique subscription ID
@@ -143,6 +156,7 @@ class StreamSubscription(BaseSubscription):
         self.blocking_timeout_ms: int = resolved_blocking_timeout_ms
         self.max_retries: int = resolved_max_retries
         self.retry_delay_seconds: float = resolved_retry_delay_seconds
+        self.retry_max_delay_seconds: float = resolved_retry_max_delay_seconds
         self.enable_dlq: bool = resolved_enable_dlq
 
         # Circuit breaker: gates reads when the handler keeps failing. The
@@ -163,9 +177,14 @@ class StreamSubscription(BaseSubscription):
         # concern resolved upstream by the ConfigResolver.
         self.retention_maxlen: int | None = retention_maxlen
 
-        # Consumer name for Redis Streams (unique per consumer instance)
+        # Consumer name for Redis Streams (unique per consumer instance, or
+        # shared by the members of a read multiplexer)
         self.consumer_name = self.subscription_id
 
+        # Set by the engine when this subscription's reads are served by a
+        # multiplexer shared with the other subscriptions of its consumer group
+        self.read_multiplexer: StreamReadMultiplexer | None = None
+
         # Consumer group name (shared across consumers of same handler)
         self.consumer_group = self.subscriber_name
 
@@ -285,7 +304,7 @@ class StreamSubscription(BaseSubscription):
         # Clean up stale consumers from previous engine runs
         try:
             removed = self.broker._cleanup_stale_consumers(
-                self.stream_category, self.consumer_group, self.subscription_id
+                self.stream_category, self.consumer_group, self.consumer_name
             )
             if removed > 0:
                 logger.info(
@@ -309,7 +328,7 @@ class StreamSubscription(BaseSubscription):
             # Clean up stale consumers on backfill stream too
             try:
                 removed = self.broker._cleanup_stale_consumers(
-                    self.backfill_stream, self.consumer_group, self.subscription_id
+                    self.backfill_stream, self.consumer_group, self.consumer_name
                 )
                 if removed > 0:
                     logger.info(
@@ -629,7 +648,8 @@ class StreamSubscription(BaseSubscription):
         Get the next batch of messages using blocking read.
 
         This method uses Redis Streams' XREADGROUP with BLOCK parameter to efficiently
-        wait for new messages without polling.
+        wait for new messages without polling. With a read multiplexer, the read
+        is shared with the other subscriptions of the consumer group.
 
         Returns:
             List[tuple[str, dict]]: The next batch of messages to process as (id, payload) tuples.
@@ -639,6 +659,11 @@ class StreamSubscription(BaseSubscription):
             return []
 
         try:
+            if self.read_multiplexer is not None:
+                return await self.read_multiplexer.read(
+                    self, self._current_batch_size()
+                )
+
             # Run the blocking Redis call in a thread pool to avoid blocking the event loop
             # This allows other async tasks to run concurrently
             messages = await asyncio.to_thread(
@@ -666,6 +691,10 @@ class StreamSubscription(BaseSubscription):
         This method takes a batch of messages and processes each message by calling the `handle_message` method
         of the engine. It handles retries and dead letter queue for failed messages.
 
+        On brokers advertising ``BATCH_ACK``, successful messages are
+        acknowledged together in one call at the end of the batch instead of
+        one round-trip each.
+
         Args:
             messages (List[tuple[str, dict]]): The batch of messages to process as (id, payload) tuples.
             stream: The stream these messages came from. Used by ACK/NACK/DLQ
@@ -674,7 +703,10 @@ class StreamSubscription(BaseSubscription):
         Returns:
             int: The number of messages processed successfully.
         """
+        assert self.broker is not None, "Broker not initialized"
         stream = stream or self._default_stream
+        batch_ack = self.broker.has_capability(BrokerCapabilities.BATCH_ACK)
+        to_ack: list[tuple[str, Message]] = []
 
         logger.debug(
             f"[{self.subscriber_class_name}] Received {len(messages)} message(s)"
@@ -687,53 +719,127 @@ class StreamSubscription(BaseSubscription):
             "stream": stream,
         }
 
+        # Deserialized up front so that idempotent handlers can read the
+        # processed markers of the whole batch at once
+        staged = await self._deserialize_messages(messages, stream)
+
+        # Flush deferred ACKs even if the batch is cut short (cancellation at
+        # shutdown, or an error while handling a failure): those messages were
+        # already handled and would otherwise be redelivered and run twice.
+        try:
+            with batch_markers(
+                message.metadata.headers.id
+                if message.metadata and message.metadata.headers
+                else None
+                for _, _, message in staged
+            ):
+                async for (
+                    identifier,
+                    payload,
+                    message,
+                    is_successful,
+                    elapsed,
+                ) in self._handle_messages(staged):
+                    assert message.metadata is not None, (
+                        "Message metadata cannot be None"
+                    )
+                    message_type = message.metadata.headers.type or "unknown"
+                    short_id = (message.metadata.headers.id or identifier)[:8]
+
+                    metrics.subscription_processing_duration.record(elapsed, attrs)
+
+                    # Record handler outcome independent of broker ACK
+                    metrics.subscription_messages_processed.add(
+                        1, {**attrs, "status": "ok" if is_successful else "error"}
+                    )
+
+                    # Advance the circuit breaker on the handler outcome. This is
+                    # separate from the ACK/NACK/DLQ paths below, which are untouched.
+                    self._record_handler_outcome(is_successful)
+
+                    if is_successful:
+                        if batch_ack:
+                            to_ack.append((identifier, message))
+                        elif await self._acknowledge_message(
+                            identifier, message, stream
+                        ):
+                            successful_count += 1
+                            logger.info(
+                                f"[{self.subscriber_class_name}] Completed "
+                                f"{message_type} (ID: {short_id}...) — acked"
+                            )
+                    else:
+                        logger.warning(
+                            f"[{self.subscriber_class_name}] Failed {message_type} "
+                            f"(ID: {short_id}...) — retrying"
+                        )
+                        await self.handle_failed_message(identifier, payload, stream)
+        finally:
+            if to_ack:
+                successful_count += await self._acknowledge_messages(to_ack, stream)
+
+        return successful_count
+
+    async def _deserialize_messages(
+        self, messages: list[tuple[str, dict[str, Any]]], stream: str
+    ) -> list[tuple[str, dict[str, Any], Message]]:
+        """Deserialize ``messages`` as ``(identifier, payload, message)``.
+
+        Messages that fail to deserialize go to the DLQ and are left out.
+        """
+        staged: list[tuple[str, dict[str, Any], Message]] = []
         for identifier, payload in messages:
             message = await self._deserialize_message(identifier, payload, stream)
-            if not message:
-                continue  # Message was moved to DLQ during deserialization
-
+            if message:
+                staged.append((identifier, payload, message))
+        return staged
+
+    async def _handle_messages(
+        self, staged: list[tuple[str, dict[str, Any], Message]]
+    ) -> AsyncIterator[tuple[str, dict[str, Any], Message, bool, float]]:
+        """Handle deserialized messages, yielding each outcome in order.
+
+        Yields ``(identifier, payload, message, is_successful, elapsed)``.
+        A ``micro_batch`` projector gets all of them through one
+        ``Engine.handle_batch`` call, so nothing is acknowledged before the
+        batch's rows are written, and each message is timed at its share of it.
+        """
+        for identifier, payload, message in staged:
             assert message.metadata is not None, "Message metadata cannot be None"
-            message_type = message.metadata.headers.type or "unknown"
-            short_id = (message.metadata.headers.id or identifier)[:8]
-
             logger.info(
-                f"[{self.subscriber_class_name}] Processing {message_type} "
-                f"(ID: {short_id}...)"
+                f"[{self.subscriber_class_name}] Processing "
+                f"{message.metadata.headers.type or 'unknown'} "
+                f"(ID: {(message.metadata.headers.id or identifier)[:8]}...)"
             )
+            if self.micro_batch:
+                continue
 
-            # Process the message
             msg_start = time.monotonic()
             is_successful = await self.engine.handle_message(
                 self.handler, message, worker_id=self.subscription_id
             )
-            elapsed = time.monotonic() - msg_start
-
-            metrics.subscription_processing_duration.record(elapsed, attrs)
-
-            # Record handler outcome independent of broker ACK
-            metrics.subscription_messages_processed.add(
-                1, {**attrs, "status": "ok" if is_successful else "error"}
+            yield (
+                identifier,
+                payload,
+                message,
+                is_successful,
+                time.monotonic() - msg_start,
             )
 
-            # Advance the circuit breaker on the handler outcome. This is
-            # separate from the ACK/NACK/DLQ paths below, which are untouched.
-            self._record_handler_outcome(is_successful)
-
-            if is_successful:
-                if await self._acknowledge_message(identifier, message, stream):
-                    successful_count += 1
-                    logger.info(
-                        f"[{self.subscriber_class_name}] Completed {message_type} "
-                        f"(ID: {short_id}...) — acked"
-                    )
-            else:
-                logger.warning(
-                    f"[{self.subscriber_class_name}] Failed {message_type} "
-                    f"(ID: {short_id}...) — retrying"
-                )
-                await self.handle_failed_message(identifier, payload, stream)
+        if not self.micro_batch or not staged:
+            return
 
-        return successful_count
+        batch_start = time.monotonic()
+        results = await self.engine.handle_batch(
+            self.handler,
+            [message for _, _, message in staged],
+            worker_id=self.subscription_id,
+        )
+        elapsed = (time.monotonic() - batch_start) / len(staged)
+        for (identifier, payload, message), is_successful in zip(
+            staged, results, strict=True
+        ):
+            yield identifier, payload, message, is_successful, elapsed
 
     async def _deserialize_message(
         self, identifier: str, payload: dict[str, Any], stream: str | None = None
@@ -763,35 +869,86 @@ class StreamSubscription(BaseSubscription):
         stream = stream or self._default_stream
         ack_result = self.broker.ack(stream, identifier, self.consumer_group)
         if ack_result:
-            # Clear retry count if exists
-            self.retry_counts.pop(identifier, None)
-
-            # Emit message.acked trace
-            if message and message.metadata:
-                self.engine.emitter.emit(
-                    event="message.acked",
-                    stream=stream,
-                    message_id=message.metadata.headers.id or identifier,
-                    message_type=message.metadata.headers.type or "unknown",
-                    handler=self.subscriber_class_name,
-                    worker_id=self.subscription_id,
-                    correlation_id=(
-                        message.metadata.domain.correlation_id
-                        if message.metadata.domain
-                        else None
-                    ),
-                    causation_id=(
-                        message.metadata.domain.causation_id
-                        if message.metadata.domain
-                        else None
-                    ),
-                )
-
+            self._record_ack(identifier, message, stream)
             return True
         else:
             logger.warning(f"Failed to acknowledge message {identifier}")
             return False
 
+    async def _acknowledge_messages(
+        self, messages: list[tuple[str, Message]], stream: str
+    ) -> int:
+        """Acknowledge a batch of processed messages in one broker call.
+
+        Args:
+            messages: ``(identifier, message)`` pairs that were handled successfully.
+            stream: The stream to ACK on.
+
+        Returns:
+            The number of messages the broker acknowledged.
+        """
+        assert self.broker is not None, "Broker not initialized"
+        results = self.broker.ack_many(
+            stream, [identifier for identifier, _ in messages], self.consumer_group
+        )
+
+        if len(results) != len(messages):
+            # A broker that cannot say which ids it acknowledged: fall back to
+            # one ACK per message rather than guess.
+            logger.warning(
+                f"Broker returned {len(results)} ACK results for "
+                f"{len(messages)} messages; acknowledging one by one"
+            )
+            acked_count = 0
+            for identifier, message in messages:
+                if await self._acknowledge_message(identifier, message, stream):
+                    acked_count += 1
+            return acked_count
+
+        acked_count = 0
+        for (identifier, message), acked in zip(messages, results, strict=True):
+            if not acked:
+                logger.warning(f"Failed to acknowledge message {identifier}")
+                continue
+
+            acked_count += 1
+            self._record_ack(identifier, message, stream)
+            assert message.metadata is not None, "Message metadata cannot be None"
+            logger.info(
+                f"[{self.subscriber_class_name}] Completed "
+                f"{message.metadata.headers.type or 'unknown'} "
+                f"(ID: {(message.metadata.headers.id or identifier)[:8]}...) — acked"
+            )
+        return acked_count
+
+    def _record_ack(
+        self, identifier: str, message: Message | None, stream: str
+    ) -> None:
+        """Clear retry state and emit the ``message.acked`` trace after an ACK."""
+        # Clear retry count if exists
+        self.retry_counts.pop(identifier, None)
+
+        # Emit message.acked trace
+        if message and message.metadata:
+            self.engine.emitter.emit(
+                event="message.acked",
+                stream=stream,
+                message_id=message.metadata.headers.id or identifier,
+                message_type=message.metadata.headers.type or "unknown",
+                handler=self.subscriber_class_name,
+                worker_id=self.subscription_id,
+                correlation_id=(
+                    message.metadata.domain.correlation_id
+                    if message.metadata.domain
+                    else None
+                ),
+                causation_id=(
+                    message.metadata.domain.causation_id
+                    if message.metadata.domain
+                    else None
+                ),
+            )
+
     async def handle_failed_message(
         self, identifier: str, payload: dict[str, Any], stream: str | None = None
     ) -> None:
@@ -806,6 +963,8 @@ class StreamSubscription(BaseSubscription):
             stream: The stream the message came from. Defaults to the primary stream.
         """
         stream = stream or self._default_stream
+        if identifier not in self.retry_counts:
+            self._seed_retry_count(identifier, stream)
         retry_count = self._increment_retry_count(identifier)
 
         if retry_count < self.max_retries:
@@ -818,10 +977,65 @@ class StreamSubscription(BaseSubscription):
         self.retry_counts[identifier] = self.retry_counts.get(identifier, 0) + 1
         return self.retry_counts[identifier]
 
+    def _seed_retry_count(self, identifier: str, stream: str) -> None:
+        """Carry over attempts made on a message before this consumer saw it fail.
+
+        Retry counts are in-memory, so a message re-read from the pending list
+        after a restart, or reclaimed from a crashed consumer, would otherwise
+        start from zero and a poison message could cycle forever across
+        restarts. Brokers advertising ``PENDING_RECLAIM`` keep a per-message
+        delivery count; every delivery before the current one counts as an
+        attempt. Any message this subscription is not yet tracking is seeded,
+        wherever it was read from.
+        """
+        assert self.broker is not None, "Broker not initialized"
+        if not self.broker.has_capability(BrokerCapabilities.PENDING_RECLAIM):
+            return
+        try:
+            delivered = self.broker.delivery_count(
+                stream, identifier, self.consumer_group
+            )
+        except Exception as e:
+            logger.debug(f"Could not read delivery count of {identifier}: {e}")
+            return
+        if delivered is not None and delivered > 1:
+            self.retry_counts[identifier] = delivered - 1
+
+    def _retry_backoff(self, retry_count: int) -> float:
+        """Return the delay before redelivering a message on attempt *retry_count*.
+
+        Exponential backoff from ``retry_delay_seconds``, capped at
+        ``retry_max_delay_seconds``, with equal jitter (a uniform pick from the
+        upper half) so messages that failed together do not retry in lockstep.
+        """
+        if self.retry_delay_seconds <= 0:
+            return 0.0
+        exponent = max(retry_count - 1, 0)
+        delay = min(
+            self.retry_delay_seconds * 2**exponent, self.retry_max_delay_seconds
+        )
+        return random.uniform(delay / 2, delay)
+
+    async def _nack_after(self, stream: str, identifier: str, delay: float) -> bool:
+        """NACK *identifier* so it is redelivered no sooner than *delay* seconds.
+
+        Brokers advertising ``DELAYED_REDELIVERY`` hold the message back
+        themselves, so the batch moves on immediately. Others get the legacy
+        behaviour: sleep here, then NACK.
+        """
+        assert self.broker is not None, "Broker not initialized"
+        if delay > 0:
+            if self.broker.has_capability(BrokerCapabilities.DELAYED_REDELIVERY):
+                return self.broker.nack_delayed(
+                    stream, identifier, self.consumer_group, delay
+                )
+            await asyncio.sleep(delay)
+        return self.broker.nack(stream, identifier, self.consumer_group)
+
     async def _retry_message(
         self, identifier: str, retry_count: int, stream: str | None = None
     ) -> None:
-        """Retry a failed message after delay.
+        """Retry a failed message after an exponential backoff.
 
         Args:
             identifier: The message identifier to NACK.
@@ -841,9 +1055,10 @@ class StreamSubscription(BaseSubscription):
             },
         )
 
+        delay = self._retry_backoff(retry_count)
         logger.debug(
             f"Retrying message {identifier} (attempt {retry_count}/{self.max_retries}) "
-            f"after {self.retry_delay_seconds}s delay"
+            f"after {delay:.3f}s delay"
         )
 
         # Emit message.nacked trace
@@ -858,10 +1073,8 @@ class StreamSubscription(BaseSubscription):
             worker_id=self.subscription_id,
         )
 
-        await asyncio.sleep(self.retry_delay_seconds)
-
         # NACK the message to make it available for reprocessing
-        self.broker.nack(stream, identifier, self.consumer_group)
+        await self._nack_after(stream, identifier, delay)
 
     async def _exhaust_retries(
         self, identifier: str, payload: dict[str, Any], stream: str | None = None
@@ -886,13 +1099,16 @@ class StreamSubscription(BaseSubscription):
         )
         if not await self.move_to_dlq(identifier, payload, stream):
             # DLQ publish failed: hold the message for redelivery instead of
-            # ACKing it away. Back off first (as the retry path does) so a downed
-            # DLQ is retried at the retry cadence, not hammered at poll speed (the
+            # ACKing it away. Back off (as the retry path does) so a downed DLQ
+            # is retried at the retry cadence, not hammered at poll speed (the
             # stream poll loop re-reads pending messages with no inter-poll delay).
             # Keep the retry count so the redelivery stays on the exhaust path and
             # re-attempts the DLQ move.
-            await asyncio.sleep(self.retry_delay_seconds)
-            nack_result = self.broker.nack(stream, identifier, self.consumer_group)
+            nack_result = await self._nack_after(
+                stream,
+                identifier,
+                self._retry_backoff(self.retry_counts.get(identifier, 1)),
+            )
             if not nack_result:
                 logger.warning(
                     f"Failed to NACK message {identifier} after a failed DLQ publish"
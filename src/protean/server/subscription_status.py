@@ -17,7 +17,6 @@ Usage::
 from __future__ import annotations
 
 import contextlib
-import json
 import logging
 from collections import defaultdict
 from dataclasses import asdict, dataclass
@@ -113,6 +112,10 @@ class SubscriptionStatus:
     """Seconds behind head: ``0.0`` when caught up, time-since-last-update when
     lagging, ``None`` when unknown (event-store subscriptions only)."""
 
+    idle_pending: int = 0
+    """Pending messages held by consumers idle past the reclaim threshold
+    (``server.pending_reclaim.min_idle_ms``); stream subscriptions only."""
+
     def to_dict(self) -> dict[str, Any]:
         return asdict(self)
 
@@ -181,10 +184,14 @@ def _collect_event_store_status(
                     name, handler_cls.__name__, "event_store", stream_category
                 )
 
-            # Current position (and when it was last written) from the stream
-            last_msg = store._read_last_message(position_stream)
-            current_position = last_msg["data"]["position"] if last_msg else -1
-            last_updated = _extract_position_time(last_msg)
+            # Current position (and when it was last written): a point read
+            checkpoint = store.read_checkpoint(position_stream)
+            current_position = checkpoint.position if checkpoint else -1
+            last_updated = (
+                checkpoint.updated_at.isoformat()
+                if checkpoint and checkpoint.updated_at
+                else None
+            )
 
             # Head of the category stream
             head_position = store.stream_head_position(stream_category)
@@ -448,6 +455,14 @@ def _collect_stream_status(
             except Exception:
                 pass
 
+            # Messages stuck with idle (likely dead) consumers, awaiting reclaim
+            idle_pending = 0
+            if pending:
+                with contextlib.suppress(Exception):
+                    idle_pending = _idle_pending(
+                        domain, broker, stream_category, consumer_group
+                    )
+
             # Fallback: count messages after last-delivered-id via xrange
             if lag is None and last_delivered_id is not None:
                 try:
@@ -481,6 +496,7 @@ def _collect_stream_status(
                 status=status,
                 consumer_count=consumer_count,
                 dlq_depth=dlq_depth,
+                idle_pending=idle_pending,
             )
     except Exception as exc:
         logger.debug(
@@ -489,6 +505,25 @@ def _collect_stream_status(
         return _unknown_status(name, handler_cls.__name__, "stream", stream_category)
 
 
+def _idle_pending(
+    domain: Domain, broker: _RedisStyleBroker, stream: str, consumer_group: str
+) -> int:
+    """Sum the pending messages of consumers idle past the reclaim threshold."""
+    min_idle_ms = int(
+        domain.config.get("server", {})
+        .get("pending_reclaim", {})
+        .get("min_idle_ms", 120000)
+    )
+    total = 0
+    for c in broker.redis_instance.xinfo_consumers(stream, consumer_group):
+        if not isinstance(c, dict):
+            continue
+        idle = broker._get_field_value(c, "idle", convert_to_int=True) or 0
+        if idle >= min_idle_ms:
+            total += broker._get_field_value(c, "pending", convert_to_int=True) or 0
+    return total
+
+
 # ---------------------------------------------------------------------------
 # Broker subscription status
 # ---------------------------------------------------------------------------
@@ -879,36 +914,6 @@ def collect_subscription_statuses(domain: Domain) -> list[SubscriptionStatus]:
 # ---------------------------------------------------------------------------
 
 
-def _as_dict(value: object) -> dict[str, Any] | None:
-    """Return *value* as a dict, JSON-decoding a string first, else ``None``."""
-    if isinstance(value, str):
-        try:
-            value = json.loads(value)
-        except (ValueError, TypeError):
-            return None
-    return value if isinstance(value, dict) else None
-
-
-def _extract_position_time(last_msg: dict[str, Any] | None) -> str | None:
-    """Pull the ISO timestamp of a position write from its stored message.
-
-    ``write_position`` stamps ``metadata.headers.time``; some stores also expose a
-    top-level ``time``. Some adapters return that value as a ``datetime`` rather
-    than a string, so normalize to ISO format. Returns ``None`` when no message or
-    timestamp is present.
-    """
-    if not last_msg:
-        return None
-    raw = last_msg.get("time")
-    if not raw:
-        metadata = _as_dict(last_msg.get("metadata"))
-        headers = _as_dict(metadata.get("headers")) if metadata else None
-        raw = headers.get("time") if headers else None
-    if isinstance(raw, datetime):
-        return raw.isoformat()
-    return raw if isinstance(raw, str) else None
-
-
 def _parse_time(iso_value: str | None) -> datetime | None:
     """Parse an ISO timestamp into an aware UTC datetime, or ``None``."""
     if not iso_value:
@@ -935,14 +935,17 @@ class ProcessManagerResult:
             self._transition_count = 0
             return
 
+        # Every transition carries the PM's full state, so the stream's tail is
+        # enough; its (zero-based, gapless) position gives the transition count.
         stream_name = f"{self._pm_cls.meta_.stream_category}-{correlation_value}"
-        messages = _event_store_of(current_domain).read(stream_name)
+        message = _event_store_of(current_domain).read_last_message(stream_name)
 
-        if messages:
-            self._pm_instance = self._pm_cls._from_transitions(
-                messages, correlation_value
+        if message is not None:
+            self._pm_instance = self._pm_cls._from_last_transition(
+                message, correlation_value
             )
-            self._transition_count = len(messages)
+            # The PM is versioned at the tail's stream position
+            self._transition_count = self._pm_instance._version + 1
         else:
             self._pm_instance = None
             self._transition_count = 0
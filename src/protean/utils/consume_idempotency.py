@@ -25,14 +25,27 @@ The strength of the guarantee depends on the projection's provider:
 - For a **cache-backed** projection there is no marker at all (the option
   no-ops); such projectors must be written as idempotent upserts.
 
+A subscription dispatching a batch declares its message ids with
+:func:`batch_markers`, and the markers for the whole batch are then read in one
+query per handler rather than one per message. With
+``[consume_idempotency] recent_window`` set, each marker repository also
+remembers that many recently committed markers, so a redelivery of one of them
+is skipped without a read.
+
 See ADR-0017.
 """
 
 from __future__ import annotations
 
 import logging
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
-from typing import Annotated, Any
+from typing import TYPE_CHECKING, Annotated, Any
 
 from pydantic import Field
 
@@ -44,6 +57,10 @@ from protean.utils import fqn
 from protean.utils.globals import current_domain
 from protean.utils.query import Q
 
+if TYPE_CHECKING:
+    from protean.domain import Domain
+    from protean.port.provider import BaseProvider
+
 logger = logging.getLogger(__name__)
 
 
@@ -76,22 +93,104 @@ PROCESSED_MESSAGE_INDEXES = [
 ]
 
 
+class _RecentMarkers:
+    """The last ``size`` markers known to be committed, least recent evicted first.
+
+    Only ever answers "processed": a pair it does not hold may still have been
+    processed by another worker, so a miss falls through to the marker table.
+    """
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self._pairs: OrderedDict[tuple[str, str], None] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __contains__(self, pair: tuple[str, str]) -> bool:
+        if not self.size:
+            return False
+        with self._lock:
+            if pair not in self._pairs:
+                return False
+            self._pairs.move_to_end(pair)
+            return True
+
+    def add(self, pair: tuple[str, str]) -> None:
+        if not self.size:
+            return
+        with self._lock:
+            self._pairs[pair] = None
+            self._pairs.move_to_end(pair)
+            if len(self._pairs) > self.size:
+                self._pairs.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._pairs.clear()
+
+
 class ProcessedMessageRepository(BaseRepository):
     """Repository for the consume-side idempotency marker."""
 
+    def __init__(self, domain: Domain, provider: BaseProvider) -> None:
+        super().__init__(domain, provider)
+        config = domain.config.get("consume_idempotency", {})
+        self._recent = _RecentMarkers(config.get("recent_window", 0))
+
     def is_processed(self, message_id: str, handler: str) -> bool:
         """Whether ``handler`` has already processed ``message_id``."""
+        if (message_id, handler) in self._recent:
+            return True
         rows = (
             self._dao.query.filter(message_id=message_id, handler=handler)
             .limit(1)  # existence check — the pair is unique, one row suffices
             .all(with_total=False)
             .items
         )
+        if rows:
+            self._recent.add((message_id, handler))
         return len(rows) > 0
 
+    def processed_among(self, message_ids: Iterable[str], handler: str) -> set[str]:
+        """Return which of ``message_ids`` ``handler`` has already processed.
+
+        One ``IN`` query for every id not already known to be processed.
+        """
+        message_ids = set(message_ids)
+        processed = {
+            message_id
+            for message_id in message_ids
+            if (message_id, handler) in self._recent
+        }
+        pending = sorted(message_ids - processed)
+        if pending:
+            rows = (
+                self._dao.query.filter(message_id__in=pending, handler=handler)
+                .limit(len(pending))  # at most one marker per id for this handler
+                .all(with_total=False)
+                .items
+            )
+            for row in rows:
+                processed.add(row.message_id)
+                self._recent.add((row.message_id, handler))
+        return processed
+
     def mark(self, message_id: str, handler: str) -> None:
-        """Record that ``handler`` has processed ``message_id`` (in the active UoW)."""
-        self._dao.save(ProcessedMessage(message_id=message_id, handler=handler))
+        """Record that ``handler`` has processed ``message_id`` (in the active UoW).
+
+        Inserted directly rather than through ``save``: the marker's identity is
+        freshly generated, so the uniqueness read ``save`` would make first can
+        only come back empty, and the (message_id, handler) index is what
+        rejects a duplicate pair.
+        """
+        marker = ProcessedMessage(message_id=message_id, handler=handler)
+        self._dao._create(self._dao.database_model_cls.from_entity(marker))
+
+    def remember(self, message_id: str, handler: str) -> None:
+        """Note a marker whose transaction has committed.
+
+        A no-op unless ``[consume_idempotency] recent_window`` is set.
+        """
+        self._recent.add((message_id, handler))
 
     def cleanup_old_markers(self, retention_hours: int, batch_size: int) -> int:
         """Delete markers older than ``retention_hours``, in bounded batches.
@@ -108,7 +207,68 @@ class ProcessedMessageRepository(BaseRepository):
             raise ValueError("retention_hours cannot be negative")
 
         threshold = self._dao.domain.clock.now() - timedelta(hours=retention_hours)
-        return self._delete_in_batches(Q(processed_at__lt=threshold), batch_size)
+        deleted = self._delete_in_batches(Q(processed_at__lt=threshold), batch_size)
+        # A pruned marker must not linger here, or its message would still be
+        # skipped after the table forgot it
+        if deleted:
+            self._recent.clear()
+        return deleted
+
+
+@dataclass
+class _BatchMarkers:
+    """Marker lookups shared by the handler invocations of one batch."""
+
+    message_ids: frozenset[str]
+    # Handler id -> the batch's message ids it had processed when first asked
+    processed: dict[str, set[str]] = field(default_factory=dict)
+    # (message_id, handler) pairs already checked against ``processed``
+    checked: set[tuple[str, str]] = field(default_factory=set)
+
+
+_batch_markers: ContextVar[_BatchMarkers | None] = ContextVar(
+    "consume_idempotency_batch_markers", default=None
+)
+
+
+@contextmanager
+def batch_markers(message_ids: Iterable[str | None]) -> Iterator[None]:
+    """Read the processed markers of a batch of messages together.
+
+    A subscription wraps the dispatch of a batch in this. The first idempotent
+    handler method to check one of ``message_ids`` reads its markers for all
+    of them in a single query, and its remaining checks in the batch are
+    answered from that result. Ids that are ``None`` are ignored.
+    """
+    token = _batch_markers.set(_BatchMarkers(frozenset(filter(None, message_ids))))
+    try:
+        yield
+    finally:
+        _batch_markers.reset(token)
+
+
+def already_processed(
+    repo: ProcessedMessageRepository, message_id: str, handler_id: str
+) -> bool:
+    """Whether ``handler_id`` has processed ``message_id``, as of this check.
+
+    Inside :func:`batch_markers` the answer for a message of the batch comes
+    from one read of the whole batch's markers. A pair checked a second time
+    in the batch (a retry, or the same message twice) is read afresh: the
+    first attempt may have written its marker since.
+    """
+    batch = _batch_markers.get()
+    pair = (message_id, handler_id)
+    if batch is None or message_id not in batch.message_ids or pair in batch.checked:
+        return repo.is_processed(message_id, handler_id)
+
+    batch.checked.add(pair)
+    processed = batch.processed.get(handler_id)
+    if processed is None:
+        processed = batch.processed[handler_id] = repo.processed_among(
+            batch.message_ids, handler_id
+        )
+    return message_id in processed
 
 
 def resolve_dispatch_context(
@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 import ast
 import logging
 import os
@@ -5,10 +7,13 @@ import re
 import sys
 import traceback
 from types import ModuleType
+from typing import TYPE_CHECKING
 
-from protean import Domain
 from protean.exceptions import NoDomainException
 
+if TYPE_CHECKING:
+    from protean.domain import Domain
+
 logger = logging.getLogger(__name__)
 
 
@@ -24,6 +29,8 @@ def find_domain_in_module(module: ModuleType) -> Domain:
     - If multiple instances of `Domain` are present, raise an exception
     - If no instances of `Domain` are present, raise an exception
     """
+    from protean.domain import Domain  # noqa: PLC0415
+
     # Search for the most common names first.
     for attr_name in ("domain", "subdomain"):
         domain = getattr(module, attr_name, None)
@@ -99,6 +106,8 @@ def find_domain_by_string(module: ModuleType, domain_name: str) -> Domain:
             f"Failed to parse {domain_name!r} as an attribute name."
         )
 
+    from protean.domain import Domain  # noqa: PLC0415
+
     if not isinstance(domain, Domain):
         raise NoDomainException(
             f"A valid Protean domain was not obtained from '{module.__name__}:{domain_name}'."
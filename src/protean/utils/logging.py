@@ -46,14 +46,13 @@ from typing import Any, TypeVar, cast
 
 import structlog
 
-from protean.domain.context import has_domain_context
 from protean.integrations.logging import (
     LOG_RECORD_RESERVED_ATTRS as _RESERVED_LOG_RECORD_ATTRS,
 )
 from protean.integrations.logging import (
     make_redaction_processor,
 )
-from protean.utils.globals import current_domain, g
+from protean.utils.globals import _domain_context_stack, current_domain, g
 
 _T = TypeVar("_T")
 
@@ -320,8 +319,8 @@ def bind_event_context(**kwargs: Any) -> None:
     When called inside a FastAPI endpoint running under
     ``DomainContextMiddleware``, the kwargs are *also* mirrored onto
     ``g._http_wide_event_extras`` (initialised by the middleware before
-    ``call_next`` is awaited). Starlette runs the endpoint in a child task
-    whose ``contextvars`` copy is not observable from the parent, so the
+    the endpoint runs). FastAPI runs a sync endpoint in a worker thread
+    whose ``contextvars`` copy is not observable from the middleware, so the
     plain structlog binding alone would be lost at the HTTP boundary.
     """
     structlog.contextvars.bind_contextvars(**kwargs)
@@ -440,13 +439,13 @@ def get_logging_config_value(key: str, default: _T) -> _T:
     """Read a single value from the domain's ``[logging]`` config section.
 
     Returns ``default`` when no domain is bound to the current context or when
-    the key is absent. Uses ``has_domain_context()`` to avoid triggering the
-    outside-domain-context warning that ``current_domain`` would emit outside a
-    domain context. Any unexpected failure also yields ``default`` so callers on
+    the key is absent. Checks the domain context stack directly to avoid
+    triggering the outside-domain-context warning that ``current_domain`` would
+    emit outside a domain context. Any unexpected failure also yields ``default`` so callers on
     a hot path (e.g. per-query instrumentation) can safely swallow it.
     """
     try:
-        if has_domain_context():
+        if _domain_context_stack.top is not None:
             return cast(_T, current_domain.config.get("logging", {}).get(key, default))
     except Exception:
         pass
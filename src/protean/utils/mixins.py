@@ -4,7 +4,9 @@ import importlib
 import logging
 import time
 from collections import defaultdict
-from collections.abc import Callable, Collection
+from collections.abc import Callable, Collection, Iterator
+from contextvars import ContextVar
+from dataclasses import dataclass
 from datetime import timedelta
 from typing import Any, ClassVar
 
@@ -15,10 +17,14 @@ from protean.core.unit_of_work import UnitOfWork
 from protean.exceptions import (
     ConfigurationError,
     ExpectedVersionError,
+    IncorrectUsageError,
     SendError,
 )
 from protean.utils import DomainObjects
-from protean.utils.consume_idempotency import resolve_dispatch_context
+from protean.utils.consume_idempotency import (
+    already_processed,
+    resolve_dispatch_context,
+)
 from protean.utils.eventing import Message
 from protean.utils.globals import _domain_now, current_domain, g
 from protean.utils.logging import access_log_handler
@@ -62,15 +68,16 @@ _TRANSIENT_RETRY_DEFAULTS = {
 _VALID_BACKOFF_STRATEGIES = ("exponential", "linear", "fixed")
 
 
-def _get_version_retry_config() -> dict[str, Any]:
-    """Read version retry configuration from the active domain.
+def _get_version_retry_config(domain: Any = None) -> dict[str, Any]:
+    """Read version retry configuration from ``domain``, or the active domain.
 
     Falls back to defaults if no domain is active (e.g. during tests
     that call handlers directly without a domain context).
     """
     try:
-        if current_domain:
-            server_config = current_domain.config.get("server", {})
+        domain = domain if domain is not None else current_domain
+        if domain:
+            server_config = domain.config.get("server", {})
             cfg = server_config.get("version_retry", {})
             return {
                 "enabled": cfg.get("enabled", _VERSION_RETRY_DEFAULTS["enabled"]),
@@ -170,14 +177,17 @@ def _resolve_exception_types(specs: Any) -> tuple[type[BaseException], ...]:
     return tuple(resolved)
 
 
-def _get_transient_retry_config(instance: Any = None) -> dict[str, Any]:
+def _get_transient_retry_config(
+    instance: Any = None, domain: Any = None
+) -> dict[str, Any]:
     """Resolve the effective transient-retry policy for a handler.
 
     Precedence (highest first): per-handler ``retries`` / ``backoff`` /
     ``retry_exceptions`` options, then the domain-level
-    ``server.transient_retry`` config, then :data:`_TRANSIENT_RETRY_DEFAULTS`.
-    The returned ``max_retries`` is ``0`` whenever the policy is inactive, so
-    callers can gate purely on that value.
+    ``server.transient_retry`` config of ``domain`` (the active domain when
+    omitted), then :data:`_TRANSIENT_RETRY_DEFAULTS`. The returned
+    ``max_retries`` is ``0`` whenever the policy is inactive, so callers can
+    gate purely on that value.
     """
     cfg: dict[str, Any] = dict(_TRANSIENT_RETRY_DEFAULTS)
     # Exception specs are kept unresolved (dotted-path strings or classes) and
@@ -187,8 +197,9 @@ def _get_transient_retry_config(instance: Any = None) -> dict[str, Any]:
 
     # --- Domain-level configuration ---
     try:
-        if current_domain:
-            raw = current_domain.config.get("server", {}).get("transient_retry", {})
+        domain = domain if domain is not None else current_domain
+        if domain:
+            raw = domain.config.get("server", {}).get("transient_retry", {})
             if raw:
                 cfg["enabled"] = _coerce_bool(raw.get("enabled", cfg["enabled"]))
                 cfg["max_retries"] = int(raw.get("max_retries", cfg["max_retries"]))
@@ -252,6 +263,61 @@ def _transient_backoff_delay(
     return min(delay, max_delay)
 
 
+@dataclass(frozen=True, slots=True)
+class _RetryPolicy:
+    """A handler's resolved version and transient retry policies.
+
+    Resolved for every handler when the domain wires it (``Domain.init()``),
+    so invoking a handler does not re-read and re-validate retry config. A
+    config change made after ``init()`` takes effect on the next ``init()``.
+    """
+
+    version_max: int
+    version_base_delay: float
+    version_max_delay: float
+    transient_max: int
+    # `except ()` matches nothing, so an empty tuple cleanly disables the
+    # transient branch when no policy is active.
+    transient_exceptions: tuple[type[BaseException], ...]
+    transient_backoff: str
+    transient_base_delay: float
+    transient_max_delay: float
+
+    @classmethod
+    def resolve(cls, handler: Any, domain: Any = None) -> "_RetryPolicy":
+        version_cfg = _get_version_retry_config(domain)
+        transient_cfg = _get_transient_retry_config(handler, domain)
+        transient_max = transient_cfg["max_retries"]
+        return cls(
+            version_max=(
+                version_cfg["max_retries"]
+                if version_cfg["enabled"] and version_cfg["max_retries"] > 0
+                else 0
+            ),
+            version_base_delay=version_cfg["base_delay_seconds"],
+            version_max_delay=version_cfg["max_delay_seconds"],
+            transient_max=transient_max,
+            transient_exceptions=(
+                transient_cfg["exceptions"] if transient_max > 0 else ()
+            ),
+            transient_backoff=transient_cfg["backoff"],
+            transient_base_delay=transient_cfg["base_delay_seconds"],
+            transient_max_delay=transient_cfg["max_delay_seconds"],
+        )
+
+
+def _retry_policy_for(instance: Any) -> _RetryPolicy:
+    """Return the retry policy the active domain resolved for ``instance``'s
+    handler class, resolving it on the spot for a handler the domain has not
+    wired (e.g. one invoked directly, without ``init()``).
+    """
+    try:
+        policy = current_domain._retry_policies.get(type(instance))
+    except Exception:
+        policy = None
+    return policy if policy is not None else _RetryPolicy.resolve(instance)
+
+
 def _record_handler_retry(instance: Any, exc: BaseException) -> None:
     """Increment the ``protean.handler.retried`` counter for a transient retry."""
     try:
@@ -296,6 +362,159 @@ def _deadline_exceeded_after(delay: float) -> bool:
     return bool(headers.is_expired(next_attempt_at))
 
 
+class _BackoffDeferred(BaseException):
+    """Raised by a handler wrapper instead of sleeping through a retry backoff.
+
+    Only raised inside :func:`deferred_backoff`, whose owner awaits ``delay``
+    and dispatches the message again. A ``BaseException``, like an interrupt,
+    so that handler code catching ``Exception`` cannot swallow it.
+    """
+
+    def __init__(self, delay: float) -> None:
+        super().__init__(delay)
+        self.delay = delay
+
+
+class _DeferredBackoff:
+    """Retry progress for one message whose backoffs are awaited elsewhere.
+
+    Dispatching the message again re-enters every handler method. Attempt
+    counts carry over, so retries stay bounded, and a method that has already
+    finished is not run again: its result, or its final exception, is replayed.
+    """
+
+    __slots__ = ("attempts", "outcomes")
+
+    def __init__(self) -> None:
+        self.attempts: dict[Callable[..., Any], list[int]] = {}
+        self.outcomes: dict[Callable[..., Any], tuple[bool, Any]] = {}
+
+    def run(self, key: Callable[..., Any], loop: Callable[[list[int]], Any]) -> Any:
+        if key in self.outcomes:
+            succeeded, outcome = self.outcomes[key]
+            if succeeded:
+                return outcome
+            raise outcome
+
+        # Handlers this one invokes synchronously, such as a command processed
+        # with `asynchronous=False`, retry in place: deferring their backoff
+        # would unwind this handler's attempt too.
+        token = _deferred_backoff.set(None)
+        try:
+            result = loop(self.attempts.setdefault(key, [0, 0]))
+        except Exception as exc:
+            self.outcomes[key] = (False, exc)
+            raise
+        finally:
+            _deferred_backoff.reset(token)
+        self.outcomes[key] = (True, result)
+        return result
+
+    @staticmethod
+    def sleep(delay: float) -> None:
+        raise _BackoffDeferred(delay)
+
+
+_deferred_backoff: ContextVar[_DeferredBackoff | None] = ContextVar(
+    "deferred_backoff", default=None
+)
+
+
+@contextlib.contextmanager
+def deferred_backoff() -> Iterator[None]:
+    """Defer handler retry backoffs to the caller for one message.
+
+    Within the block, a handler that would sleep before retrying raises
+    :class:`_BackoffDeferred` instead. The caller waits out ``delay`` however
+    suits it (the engine awaits ``asyncio.sleep``, so other subscriptions keep
+    running) and dispatches the message again to resume the retries.
+    """
+    token = _deferred_backoff.set(_DeferredBackoff())
+    try:
+        yield
+    finally:
+        _deferred_backoff.reset(token)
+
+
+def _call_with_retries(
+    fn: Callable[..., Any],
+    instance: Any,
+    invoke: Callable[[], Any],
+    policy: _RetryPolicy,
+    attempts: list[int],
+    sleep: Callable[[float], None],
+) -> Any:
+    """Run ``invoke`` under the version and transient retry policies.
+
+    Two independent, composable auto-retry policies wrap every handler
+    invocation. Version (OCC) retry resolves `ExpectedVersionError` from
+    concurrent writes; transient retry (opt-in) re-runs handlers that fail with
+    transient infrastructure exceptions. Each keeps its own attempt counter in
+    ``attempts`` (version, transient) and its own backoff, and ``sleep`` waits
+    out the backoff between attempts.
+    """
+    while True:
+        try:
+            return invoke()
+        except ExpectedVersionError:
+            if attempts[0] >= policy.version_max:
+                raise
+            # Version (OCC) retry is always exponential.
+            delay = _transient_backoff_delay(
+                "exponential",
+                attempts[0],
+                policy.version_base_delay,
+                policy.version_max_delay,
+            )
+            # Never sleep into an attempt that would start past the
+            # command deadline — surface the conflict instead.
+            if _deadline_exceeded_after(delay):
+                logger.debug(
+                    "Command deadline would elapse before retrying %s; "
+                    "stopping version retry",
+                    fn.__qualname__,
+                )
+                raise
+            logger.debug(
+                "Version conflict in %s, retrying (%d/%d) after %.3fs",
+                fn.__qualname__,
+                attempts[0] + 1,
+                policy.version_max,
+                delay,
+            )
+            attempts[0] += 1
+            sleep(delay)
+        except policy.transient_exceptions as exc:
+            if attempts[1] >= policy.transient_max:
+                raise
+            delay = _transient_backoff_delay(
+                policy.transient_backoff,
+                attempts[1],
+                policy.transient_base_delay,
+                policy.transient_max_delay,
+            )
+            # Never sleep into an attempt that would start past the
+            # command deadline — surface the transient failure instead.
+            if _deadline_exceeded_after(delay):
+                logger.debug(
+                    "Command deadline would elapse before retrying %s; "
+                    "stopping transient retry",
+                    fn.__qualname__,
+                )
+                raise
+            logger.debug(
+                "Transient error %s in %s, retrying (%d/%d) after %.3fs",
+                type(exc).__name__,
+                fn.__qualname__,
+                attempts[1] + 1,
+                policy.transient_max,
+                delay,
+            )
+            _record_handler_retry(instance, exc)
+            attempts[1] += 1
+            sleep(delay)
+
+
 def _carry_discarded_failures(
     handler_cls: type,
     item: Any,
@@ -390,32 +609,19 @@ class handle:
 
         @functools.wraps(fn)
         def wrapper(instance: Any, target_obj: Any) -> Any:
-            # Two independent, composable auto-retry policies wrap every handler
-            # invocation. Version (OCC) retry resolves `ExpectedVersionError`
-            # from concurrent writes; transient retry (opt-in) re-runs handlers
-            # that fail with transient infrastructure exceptions. Each keeps its
-            # own attempt counter and backoff, and each attempt runs in a fresh
-            # UnitOfWork so a failed attempt rolls back cleanly before the retry.
-            version_cfg = _get_version_retry_config()
-            transient_cfg = _get_transient_retry_config(instance)
-
-            version_max = (
-                version_cfg["max_retries"]
-                if version_cfg["enabled"] and version_cfg["max_retries"] > 0
-                else 0
-            )
-            transient_max = transient_cfg["max_retries"]
-            # `except ()` matches nothing, so an empty tuple cleanly disables the
-            # transient branch when no policy is active.
-            transient_excs: tuple[type[BaseException], ...] = (
-                transient_cfg["exceptions"] if transient_max > 0 else ()
-            )
+            # Version and transient retries (see `_call_with_retries`) follow
+            # the policy the domain resolved for this handler. Each attempt
+            # runs in a fresh UnitOfWork so a failed attempt rolls back cleanly
+            # before the retry.
+            policy = _retry_policy_for(instance)
 
             # Consume-side idempotency (opt-in). When active, each attempt checks
             # a (message_id, handler) marker before running and writes it after,
             # inside the SAME UnitOfWork as the handler's read-model write — so a
             # redelivered event is applied exactly once on a transactional
-            # provider. Resolved once; the marker read/write happen per attempt.
+            # provider. Resolved once; the marker read/write happen per attempt,
+            # the read shared with the rest of the batch under a subscription
+            # (see `batch_markers`).
             #
             # Note for ADR-0031's "no repository access, no transaction": when
             # this resolves (a DB-backed marker store), the marker read is itself
@@ -424,82 +630,39 @@ class handle:
             idempotency = resolve_dispatch_context(instance, fn, target_obj)
 
             def _invoke() -> Any:
-                with UnitOfWork():
-                    if idempotency is not None:
-                        repo, message_id, handler_id = idempotency
-                        if repo.is_processed(message_id, handler_id):
-                            return None  # redelivery — already applied, skip
-                        result = fn(instance, target_obj)
-                        repo.mark(message_id, handler_id)
-                        return result
-                    return fn(instance, target_obj)
+                if idempotency is None:
+                    with UnitOfWork():
+                        return fn(instance, target_obj)
+
+                repo, message_id, handler_id = idempotency
+                with UnitOfWork() as uow:
+                    if already_processed(repo, message_id, handler_id):
+                        return None  # redelivery — already applied, skip
+                    result = fn(instance, target_obj)
+                    repo.mark(message_id, handler_id)
+                # Joined to an enclosing UnitOfWork, the marker is not committed
+                # yet and may still roll back with it
+                if not uow._nested:
+                    repo.remember(message_id, handler_id)
+                return result
 
             # Fast path: neither policy active — run once without a retry loop.
-            if version_max == 0 and transient_max == 0:
+            if policy.version_max == 0 and policy.transient_max == 0:
                 return _invoke()
 
-            version_attempt = 0
-            transient_attempt = 0
-            while True:
-                try:
-                    return _invoke()
-                except ExpectedVersionError:
-                    if version_attempt >= version_max:
-                        raise
-                    # Version (OCC) retry is always exponential.
-                    delay = _transient_backoff_delay(
-                        "exponential",
-                        version_attempt,
-                        version_cfg["base_delay_seconds"],
-                        version_cfg["max_delay_seconds"],
-                    )
-                    # Never sleep into an attempt that would start past the
-                    # command deadline — surface the conflict instead.
-                    if _deadline_exceeded_after(delay):
-                        logger.debug(
-                            "Command deadline would elapse before retrying %s; "
-                            "stopping version retry",
-                            fn.__qualname__,
-                        )
-                        raise
-                    logger.debug(
-                        "Version conflict in %s, retrying (%d/%d) after %.3fs",
-                        fn.__qualname__,
-                        version_attempt + 1,
-                        version_max,
-                        delay,
-                    )
-                    version_attempt += 1
-                    time.sleep(delay)
-                except transient_excs as exc:
-                    if transient_attempt >= transient_max:
-                        raise
-                    delay = _transient_backoff_delay(
-                        transient_cfg["backoff"],
-                        transient_attempt,
-                        transient_cfg["base_delay_seconds"],
-                        transient_cfg["max_delay_seconds"],
-                    )
-                    # Never sleep into an attempt that would start past the
-                    # command deadline — surface the transient failure instead.
-                    if _deadline_exceeded_after(delay):
-                        logger.debug(
-                            "Command deadline would elapse before retrying %s; "
-                            "stopping transient retry",
-                            fn.__qualname__,
-                        )
-                        raise
-                    logger.debug(
-                        "Transient error %s in %s, retrying (%d/%d) after %.3fs",
-                        type(exc).__name__,
-                        fn.__qualname__,
-                        transient_attempt + 1,
-                        transient_max,
-                        delay,
-                    )
-                    _record_handler_retry(instance, exc)
-                    transient_attempt += 1
-                    time.sleep(delay)
+            # Under the engine, backoffs are handed back to the event loop
+            # rather than slept through on it (see `deferred_backoff`).
+            deferred = _deferred_backoff.get()
+            if deferred is None:
+                return _call_with_retries(
+                    fn, instance, _invoke, policy, [0, 0], time.sleep
+                )
+            return deferred.run(
+                wrapper,
+                lambda attempts: _call_with_retries(
+                    fn, instance, _invoke, policy, attempts, deferred.sleep
+                ),
+            )
 
         setattr(wrapper, "_target_cls", self._target_cls)
         setattr(wrapper, "_start", self._start)
@@ -514,15 +677,46 @@ class read:
     Like ``@handle`` but does **not** wrap in ``UnitOfWork`` — reads are
     stateless and must not trigger side-effects.
 
-    Only ``target_cls`` is accepted (no ``start``, ``correlate``, or
-    ``end`` — those are ProcessManager-specific)::
+    ``start``, ``correlate``, and ``end`` are not accepted (those are
+    ProcessManager-specific)::
 
         @read(GetOrdersByCustomer)
         def get_by_customer(self, query): ...
+
+    ``cache_ttl`` caches the method's results in the domain's ``default``
+    cache for up to that many seconds, keyed by the query's payload. A write
+    to any of ``projections`` (the handler's own projection when omitted)
+    invalidates them as soon as it commits::
+
+        @read(GetOrdersByCustomer, cache_ttl=60)
+        def get_by_customer(self, query): ...
     """
 
-    def __init__(self, target_cls: type) -> None:
+    def __init__(
+        self,
+        target_cls: type,
+        cache_ttl: int | float | None = None,
+        projections: Collection[type] | None = None,
+    ) -> None:
+        if cache_ttl is not None and (
+            isinstance(cache_ttl, bool)
+            or not isinstance(cache_ttl, (int, float))
+            or not 0 < cache_ttl < float("inf")
+        ):
+            raise IncorrectUsageError(
+                f"`@read({getattr(target_cls, '__name__', target_cls)})` has "
+                f"cache_ttl={cache_ttl!r}; it must be a positive number of seconds"
+            )
+        if projections is not None and cache_ttl is None:
+            raise IncorrectUsageError(
+                f"`@read({getattr(target_cls, '__name__', target_cls)})` names "
+                f"`projections` without a `cache_ttl`; they only say which "
+                f"writes invalidate cached results"
+            )
+
         self._target_cls = target_cls
+        self._cache_ttl = cache_ttl
+        self._cache_projections = tuple(projections) if projections else None
 
     def __call__(self, fn: Callable[..., Any]) -> Callable[..., Any]:
         """Marks the method with ``_target_cls`` metadata for handler map construction.
@@ -540,6 +734,8 @@ class read:
             return fn(instance, target_obj)
 
         setattr(wrapper, "_target_cls", self._target_cls)
+        setattr(wrapper, "_cache_ttl", self._cache_ttl)
+        setattr(wrapper, "_cache_projections", self._cache_projections)
         return wrapper
 
 
@@ -663,6 +859,8 @@ class HandlerMixin:
         ``Exception``, such as ``KeyboardInterrupt``, propagates for the obvious
         reason. On either path, failures gathered before it are attached to it
         as a note and logged, since nothing downstream would otherwise see them.
+        A retry backoff deferred to the engine (see ``deferred_backoff``) ends
+        dispatch too, but the engine dispatches the message again afterwards.
         """
         # Map element_type to access log kind
         _KIND_MAP = {
@@ -695,6 +893,11 @@ class HandlerMixin:
                 # would never fire.
                 _carry_discarded_failures(cls, item, failures, exc)
                 raise
+            except _BackoffDeferred:
+                # Not collected either, and nothing is discarded: the message
+                # is dispatched again after the backoff, and every sibling that
+                # already finished replays its outcome instead of running again.
+                raise
             # `Exception` and not `BaseException`, so an interrupt or a
             # cancellation still stops dispatch where it is raised.
             except Exception as exc:
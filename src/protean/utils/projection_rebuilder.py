@@ -166,7 +166,9 @@ def _truncate_projection(
         cache.remove_by_key_pattern(key_pattern)
     else:
         repo = domain.repository_for(projection_cls)
-        repo._dao._delete_all()
+        # `delete_all` rather than `_delete_all`: it also invalidates cached
+        # query results read from the projection
+        repo._dao.delete_all()
 
 
 def _replay_projector(
@@ -621,6 +621,28 @@ class DomainMetrics:
             description="Subscription circuit breaker state transitions",
             unit="{transition}",
         )
+        self.subscription_pending_reclaimed = meter.create_counter(
+            "protean.subscription.pending_reclaimed",
+            description="Idle pending messages taken over from other consumers",
+            unit="{message}",
+        )
+
+        # --- Cache counters ---------------------------------------------------
+        self.cache_hits = meter.create_counter(
+            "protean.cache.hits",
+            description="Cache reads that found an entry",
+            unit="{read}",
+        )
+        self.cache_misses = meter.create_counter(
+            "protean.cache.misses",
+            description="Cache reads that found no entry",
+            unit="{read}",
+        )
+        self.cache_evictions = meter.create_counter(
+            "protean.cache.evictions",
+            description="Cache entries dropped on expiry or to stay within bounds",
+            unit="{entry}",
+        )
 
         # --- DLQ maintenance counters -----------------------------------------
         self.dlq_trimmed = meter.create_counter(
@@ -634,6 +656,13 @@ class DomainMetrics:
             unit="{alert}",
         )
 
+        # --- Off-loop execution counters ---------------------------------------
+        self.offload_rejected = meter.create_counter(
+            "protean.offload.rejected",
+            description="Off-loop calls rejected because the pool was full",
+            unit="{call}",
+        )
+
         # --- Histograms -------------------------------------------------------
         self.command_duration = meter.create_histogram(
             "protean.command.duration",
@@ -656,6 +685,12 @@ class DomainMetrics:
             unit="s",
         )
 
+        self.offload_queue_wait = meter.create_histogram(
+            "protean.offload.queue_wait",
+            description="Time an off-loop call waited for a free worker",
+            unit="s",
+        )
+
         # --- Subscription histograms ------------------------------------------
         self.subscription_processing_duration = meter.create_histogram(
             "protean.subscription.processing_duration",
@@ -0,0 +1,250 @@
+"""Push wakeups for polling consumers.
+
+Event-store subscriptions and outbox processors poll: they read, find nothing,
+sleep and read again, so pickup latency and idle query load trade off against
+each other through the poll interval. A ``Wakeups`` hub lets the writer say
+"new work landed on this topic" and wakes the consumers waiting on it at once.
+
+Topics are plain strings: the stream category for an event store, the target
+broker for an outbox. A writer calls ``notify``; a consumer holds a ``Wakeup``
+from ``subscribe`` and awaits ``wait(timeout)`` instead of sleeping, so it
+still polls every ``timeout`` seconds when no wakeup arrives.
+
+Writes in this process reach the hub directly. Writes from other processes
+reach it through a push channel: ``PgNotifyListener`` turns Postgres
+``NOTIFY`` messages into ``notify`` calls. ``Wakeups.live`` says whether every
+write reaches the hub, which lets consumers poll less often while it holds and
+fall back to their normal polling when the channel drops.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import re
+import threading
+from collections.abc import Callable, Iterable
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class Wakeup:
+    """One consumer's subscription to a ``Wakeups`` hub.
+
+    Bound to the event loop it was created on. A wakeup that arrives while the
+    consumer is busy is kept, so the next ``wait`` returns at once.
+    """
+
+    def __init__(
+        self,
+        hub: Wakeups,
+        topics: frozenset[str] | None,
+        loop: asyncio.AbstractEventLoop,
+    ) -> None:
+        self._hub = hub
+        self._topics = topics
+        self._loop = loop
+        self._event = asyncio.Event()
+        self.closed = False
+
+    @property
+    def live(self) -> bool:
+        """Whether every write reaches this wakeup's hub."""
+        return self._hub.live
+
+    def matches(self, topic: str | None) -> bool:
+        return topic is None or self._topics is None or topic in self._topics
+
+    def _set(self) -> None:
+        """Set the flag from any thread."""
+        if self._loop.is_closed():
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self._loop:
+            self._event.set()
+            return
+        with contextlib.suppress(RuntimeError):  # The loop closed in between
+            self._loop.call_soon_threadsafe(self._event.set)
+
+    async def wait(self, timeout: float) -> bool:
+        """Wait up to ``timeout`` seconds for a wakeup.
+
+        Returns whether one arrived. A ``timeout`` of zero or less only yields
+        to the loop, keeping the caller's polling cadence.
+        """
+        if timeout <= 0:
+            woken = self._event.is_set()
+            self._event.clear()
+            await asyncio.sleep(0)
+            return woken
+
+        try:
+            await asyncio.wait_for(self._event.wait(), timeout)
+        except TimeoutError:
+            return False
+        self._event.clear()
+        return True
+
+    def close(self) -> None:
+        """Leave the hub, releasing a consumer blocked in ``wait``."""
+        if self.closed:
+            return
+        self.closed = True
+        self._hub._discard(self)
+        self._set()
+
+
+class Wakeups:
+    """A thread-safe hub waking the consumers of a topic when it gets work.
+
+    ``live`` is ``True`` while every write is known to reach the hub: always,
+    for in-process stores, and while a push channel is connected for stores
+    that other processes write to.
+    """
+
+    def __init__(self, live: bool = False) -> None:
+        self.live = live
+        self._lock = threading.Lock()
+        self._waiters: set[Wakeup] = set()
+
+    def subscribe(self, topics: Iterable[str] | None = None) -> Wakeup:
+        """Subscribe the running event loop to ``topics``, or to every topic."""
+        waiter = Wakeup(
+            self,
+            frozenset(topics) if topics is not None else None,
+            asyncio.get_running_loop(),
+        )
+        with self._lock:
+            self._waiters.add(waiter)
+        return waiter
+
+    def notify(self, topic: str) -> None:
+        """Wake every consumer of ``topic``. Safe to call from any thread."""
+        self._wake(topic)
+
+    def notify_all(self) -> None:
+        """Wake every consumer, as after a push channel reconnects."""
+        self._wake(None)
+
+    def _wake(self, topic: str | None) -> None:
+        with self._lock:
+            waiters = [waiter for waiter in self._waiters if waiter.matches(topic)]
+        for waiter in waiters:
+            waiter._set()
+
+    def _discard(self, waiter: Wakeup) -> None:
+        with self._lock:
+            self._waiters.discard(waiter)
+
+
+_CHANNEL_NAME = re.compile(r"^[a-z_][a-z0-9_]*$")
+
+# libpq keepalives for a listening connection. It only ever reads, so without
+# them a connection dropped without a FIN would go unnoticed, leaving the hub
+# ``live`` with nothing arriving.
+PG_KEEPALIVES = {
+    "keepalives": 1,
+    "keepalives_idle": 30,
+    "keepalives_interval": 10,
+    "keepalives_count": 3,
+}
+
+
+class PgNotifyListener:
+    """Deliver Postgres ``NOTIFY`` messages on ``channel`` to a ``Wakeups`` hub.
+
+    Each payload is a topic. The listener holds one psycopg2 connection in
+    autocommit mode, runs ``LISTEN`` on it and reads notifications when the
+    event loop sees the socket become readable, so it costs no thread and no
+    query while idle.
+
+    The hub is ``live`` while the connection is up. When it drops, consumers
+    fall back to polling, and the listener reconnects with exponential backoff
+    (1s, 2s, 4s, ... capped at 30s), waking every consumer once it is back so
+    nothing written meanwhile waits for the next poll.
+
+    Args:
+        connect: Opens a psycopg2 connection. Called from a worker thread.
+        channel: The channel to ``LISTEN`` on, a lowercase SQL identifier.
+        wakeups: The hub to notify.
+    """
+
+    MAX_BACKOFF_SECONDS = 30
+
+    def __init__(
+        self, connect: Callable[[], Any], channel: str, wakeups: Wakeups
+    ) -> None:
+        if not _CHANNEL_NAME.match(channel):
+            raise ValueError(f"Invalid notification channel name: {channel!r}")
+        self._connect = connect
+        self.channel = channel
+        self.wakeups = wakeups
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Start listening on ``loop``."""
+        if self._task is None or self._task.done():
+            self._task = loop.create_task(self._run())
+            self._task.set_name(f"notify-listener-{self.channel}")
+
+    async def stop(self) -> None:
+        """Stop listening and close the connection."""
+        task, self._task = self._task, None
+        if task is not None and not task.done():
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        failures = 0
+        while True:
+            try:
+                conn = await asyncio.to_thread(self._open)
+            except Exception:
+                failures += 1
+                logger.warning(
+                    "wakeups.listen_failed",
+                    extra={"channel": self.channel, "attempt": failures},
+                    exc_info=True,
+                )
+                await asyncio.sleep(min(2 ** (failures - 1), self.MAX_BACKOFF_SECONDS))
+                continue
+
+            failures = 0
+            fd = conn.fileno()
+            lost: asyncio.Future[None] = loop.create_future()
+            loop.add_reader(fd, self._drain, conn, lost)
+            self.wakeups.live = True
+            self.wakeups.notify_all()
+            logger.info("wakeups.listening", extra={"channel": self.channel})
+            try:
+                await lost
+            finally:
+                self.wakeups.live = False
+                loop.remove_reader(fd)
+                with contextlib.suppress(Exception):  # Already broken
+                    conn.close()
+            logger.warning("wakeups.listener_lost", extra={"channel": self.channel})
+
+    def _open(self) -> Any:
+        conn = self._connect()
+        conn.autocommit = True
+        with conn.cursor() as cursor:
+            cursor.execute(f'LISTEN "{self.channel}"')
+        return conn
+
+    def _drain(self, conn: Any, lost: asyncio.Future[None]) -> None:
+        try:
+            conn.poll()
+        except Exception:
+            if not lost.done():
+                lost.set_result(None)
+            return
+        while conn.notifies:
+            notification = conn.notifies.pop(0)
+            self.wakeups.notify(notification.payload)
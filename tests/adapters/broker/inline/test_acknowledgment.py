@@ -126,6 +126,27 @@ def test_ack_nacked_message_not_in_failed_queue(broker):
     assert ack_result is False
 
 
+def test_ack_many_acknowledges_each_message(broker):
+    """Without BATCH_ACK, ``ack_many`` falls back to one ``_ack`` per id."""
+    stream = "test_stream"
+    consumer_group = "test_consumer_group"
+
+    first = broker.publish(stream, {"n": 1})
+    second = broker.publish(stream, {"n": 2})
+    broker.get_next(stream, consumer_group)
+    broker.get_next(stream, consumer_group)
+
+    results = broker.ack_many(stream, [first, "unknown", second], consumer_group)
+
+    assert results == [True, False, True]
+    assert not broker._is_in_flight_message(stream, consumer_group, first)
+    assert not broker._is_in_flight_message(stream, consumer_group, second)
+
+
+def test_ack_many_with_no_identifiers(broker):
+    assert broker.ack_many("test_stream", [], "test_consumer_group") == []
+
+
 # ============= NACK Tests =============
 
 
@@ -243,7 +243,9 @@ def test_broker_capabilities(broker):
 
     capabilities = broker.capabilities
     assert capabilities == (
-        BrokerCapabilities.RELIABLE_MESSAGING | BrokerCapabilities.DEAD_LETTER_QUEUE
+        BrokerCapabilities.RELIABLE_MESSAGING
+        | BrokerCapabilities.DEAD_LETTER_QUEUE
+        | BrokerCapabilities.DELAYED_REDELIVERY
     )
 
 
@@ -2,7 +2,11 @@
 
 import time
 
-from protean.adapters.broker.inline import CONSUMER_GROUP_SEPARATOR
+import pytest
+
+from protean.adapters.broker.inline import CONSUMER_GROUP_SEPARATOR, InlineBroker
+from protean.exceptions import NotSupportedError
+from protean.port.broker import BrokerCapabilities
 
 # `nack` stores `time.time() + delay`. A wall-clock timestamp is around 1.8e9,
 # where a float carries only about 2e-7 seconds of absolute precision, so that
@@ -89,6 +93,48 @@ def test_exponential_backoff(broker):
         assert broker.get_next(stream, consumer_group) is not None
 
 
+def test_nack_delayed_overrides_backoff(broker):
+    """`nack_delayed` schedules the retry at the caller's delay, not the broker's."""
+    stream = "test_stream"
+    consumer_group = "test_consumer_group"
+
+    broker._retry_delay = 0.05
+
+    identifier = broker.publish(stream, {"foo": "bar"})
+    assert broker.get_next(stream, consumer_group) is not None
+
+    delay = 30.0
+    before = time.time()
+    assert broker.nack_delayed(stream, identifier, consumer_group, delay) is True
+    after = time.time()
+
+    assert broker.get_next(stream, consumer_group) is None
+    scheduled = _scheduled_retry_time(broker, stream, consumer_group, identifier)
+    assert scheduled - after - _CLOCK_EPSILON <= delay
+    assert delay <= scheduled - before + _CLOCK_EPSILON
+
+    _make_retry_due(broker, stream, consumer_group, identifier)
+    assert broker.get_next(stream, consumer_group)[0] == identifier
+
+
+def test_nack_delayed_requires_delayed_redelivery(broker, monkeypatch):
+    monkeypatch.setattr(
+        InlineBroker,
+        "capabilities",
+        property(lambda self: BrokerCapabilities.RELIABLE_MESSAGING),
+    )
+
+    with pytest.raises(NotSupportedError):
+        broker.nack_delayed("test_stream", "id", "test_consumer_group", 1.0)
+
+
+def test_pending_reclaim_is_not_supported(broker):
+    with pytest.raises(NotSupportedError):
+        broker.reclaim_pending("test_stream", "test_consumer_group", "c", 0)
+    with pytest.raises(NotSupportedError):
+        broker.delivery_count("test_stream", "id", "test_consumer_group")
+
+
 def _group_key(stream: str, consumer_group: str) -> str:
     return f"{stream}{CONSUMER_GROUP_SEPARATOR}{consumer_group}"
 
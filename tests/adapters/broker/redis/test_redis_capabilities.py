@@ -10,13 +10,17 @@ class TestRedisBrokerCapabilities:
     """Test capability methods specifically with Redis broker."""
 
     def test_capabilities(self, broker):
-        """RedisBroker has ordered messaging, blocking reads, DLQ, and
-        partition-per-key streams (STREAM_PARTITIONING, added in ADR-0028)."""
+        """RedisBroker has ordered messaging, blocking reads, DLQ,
+        partition-per-key streams (STREAM_PARTITIONING, added in ADR-0028),
+        delayed redelivery, batched acknowledgement and pending reclaim."""
         expected_caps = (
             BrokerCapabilities.ORDERED_MESSAGING
             | BrokerCapabilities.BLOCKING_READ
             | BrokerCapabilities.DEAD_LETTER_QUEUE
             | BrokerCapabilities.STREAM_PARTITIONING
+            | BrokerCapabilities.DELAYED_REDELIVERY
+            | BrokerCapabilities.BATCH_ACK
+            | BrokerCapabilities.PENDING_RECLAIM
         )
 
         # Test has_all_capabilities
@@ -29,6 +33,9 @@ class TestRedisBrokerCapabilities:
         assert broker.has_all_capabilities(BrokerCapabilities.BLOCKING_READ)
         assert broker.has_all_capabilities(BrokerCapabilities.DEAD_LETTER_QUEUE)
         assert broker.has_all_capabilities(BrokerCapabilities.STREAM_PARTITIONING)
+        assert broker.has_all_capabilities(BrokerCapabilities.DELAYED_REDELIVERY)
+        assert broker.has_all_capabilities(BrokerCapabilities.BATCH_ACK)
+        assert broker.has_all_capabilities(BrokerCapabilities.PENDING_RECLAIM)
         assert broker.has_all_capabilities(expected_caps)
 
         # Should not have some advanced capabilities it does not implement.
@@ -0,0 +1,230 @@
+"""Tests for multi-stream XREADGROUP reads on the Redis broker.
+
+``read_blocking_multi`` reads the pending and then the new messages of several
+streams of one consumer group with one XREADGROUP each. The benchmark at the
+end compares a worker with many handlers reading separately against one
+multiplexed reader: XREADGROUP calls and CPU while idle, and p99 pickup latency.
+"""
+
+import statistics
+import threading
+import time
+from uuid import uuid4
+
+import pytest
+
+from protean.adapters.broker.redis import RedisBroker
+
+
+@pytest.fixture
+def redis_broker(test_domain):
+    """Get the default Redis broker from test domain."""
+    broker = test_domain.brokers["default"]
+    assert isinstance(broker, RedisBroker)
+    return broker
+
+
+def _names(count: int = 2) -> tuple[list[str], str]:
+    suffix = uuid4().hex[:8]
+    streams = [f"test_stream_{n}_{suffix}" for n in range(count)]
+    return streams, f"test_group_{suffix}"
+
+
+@pytest.mark.redis
+class TestRedisMultiStreamRead:
+    def test_new_messages_are_keyed_by_stream(self, redis_broker):
+        (orders, customers), group = _names()
+        redis_broker._ensure_group(group, orders)
+        redis_broker._ensure_group(group, customers)
+        order_id = redis_broker.publish(orders, {"n": 1})
+        customer_id = redis_broker.publish(customers, {"n": 2})
+
+        results = redis_broker.read_blocking_multi(
+            [orders, customers], group, "consumer-1", timeout_ms=100, count=10
+        )
+
+        assert [msg_id for msg_id, _ in results[orders]] == [order_id]
+        assert [msg_id for msg_id, _ in results[customers]] == [customer_id]
+
+    def test_streams_without_messages_are_left_out(self, redis_broker):
+        (orders, customers), group = _names()
+        redis_broker._ensure_group(group, orders)
+        redis_broker._ensure_group(group, customers)
+        redis_broker.publish(orders, {"n": 1})
+
+        results = redis_broker.read_blocking_multi(
+            [orders, customers], group, "consumer-1", timeout_ms=100, count=10
+        )
+
+        assert list(results) == [orders]
+
+    def test_times_out_empty(self, redis_broker):
+        streams, group = _names()
+
+        start = time.monotonic()
+        results = redis_broker.read_blocking_multi(
+            streams, group, "consumer-1", timeout_ms=100, count=10
+        )
+
+        assert results == {}
+        assert time.monotonic() - start < 1.0
+
+    def test_zero_timeout_does_not_block(self, redis_broker):
+        streams, group = _names()
+
+        start = time.monotonic()
+        assert (
+            redis_broker.read_blocking_multi(
+                streams, group, "consumer-1", timeout_ms=0, count=10
+            )
+            == {}
+        )
+        assert time.monotonic() - start < 0.5
+
+    def test_pending_messages_come_first(self, redis_broker):
+        (orders, customers), group = _names()
+        redis_broker._ensure_group(group, orders)
+        redis_broker._ensure_group(group, customers)
+        pending_id = redis_broker.publish(orders, {"n": 1})
+        redis_broker.read_blocking_multi(
+            [orders, customers], group, "consumer-1", timeout_ms=100, count=10
+        )
+        redis_broker.publish(customers, {"n": 2})
+
+        # Not acknowledged: redelivered before the new message is read
+        results = redis_broker.read_blocking_multi(
+            [orders, customers], group, "consumer-1", timeout_ms=100, count=10
+        )
+
+        assert {stream: [m for m, _ in msgs] for stream, msgs in results.items()} == {
+            orders: [pending_id]
+        }
+
+    def test_held_back_messages_are_skipped(self, redis_broker):
+        (orders, customers), group = _names()
+        redis_broker._ensure_group(group, orders)
+        redis_broker._ensure_group(group, customers)
+        held_id = redis_broker.publish(orders, {"n": 1})
+        redis_broker.read_blocking_multi(
+            [orders, customers], group, "consumer-1", timeout_ms=100, count=10
+        )
+        assert redis_broker.nack_delayed(orders, held_id, group, 60)
+        new_id = redis_broker.publish(customers, {"n": 2})
+
+        results = redis_broker.read_blocking_multi(
+            [orders, customers], group, "consumer-1", timeout_ms=100, count=10
+        )
+
+        assert {stream: [m for m, _ in msgs] for stream, msgs in results.items()} == {
+            customers: [new_id]
+        }
+
+    def test_recreates_vanished_groups(self, redis_broker):
+        (orders, customers), group = _names()
+        redis_broker._ensure_group(group, orders)
+        redis_broker._ensure_group(group, customers)
+        redis_broker._client.delete(orders)
+
+        assert (
+            redis_broker.read_blocking_multi(
+                [orders, customers], group, "consumer-1", timeout_ms=100, count=10
+            )
+            == {}
+        )
+
+        identifier = redis_broker.publish(orders, {"n": 1})
+        results = redis_broker.read_blocking_multi(
+            [orders, customers], group, "consumer-1", timeout_ms=100, count=10
+        )
+        assert [msg_id for msg_id, _ in results[orders]] == [identifier]
+
+
+@pytest.mark.redis
+@pytest.mark.slow
+class TestMultiStreamReadBenchmark:
+    """Idle cost and pickup latency of a worker with many handlers.
+
+    Compares one reader thread per stream (``read_blocking``) with a single
+    reader over all the streams (``read_blocking_multi``).
+    """
+
+    HANDLERS = 40
+    IDLE_SECONDS = 2.0
+    MESSAGES = 200
+
+    def _xreadgroup_calls(self, broker) -> int:
+        stats = broker._client.info("commandstats")
+        return int(stats.get("cmdstat_xreadgroup", {}).get("calls", 0))
+
+    def _run(self, broker, multiplexed: bool) -> dict[str, float]:
+        streams, group = _names(self.HANDLERS)
+        for stream in streams:
+            broker._ensure_group(group, stream)
+
+        stop = threading.Event()
+        latencies: list[float] = []
+
+        def record(stream, messages):
+            now = time.perf_counter()
+            for identifier, message in messages:
+                latencies.append(now - message["sent_at"])
+                broker.ack(stream, identifier, group)
+
+        def read_one(stream):
+            while not stop.is_set():
+                record(stream, broker.read_blocking(stream, group, "c", 1000, 10))
+
+        def read_all():
+            while not stop.is_set():
+                results = broker.read_blocking_multi(streams, group, "c", 1000, 10)
+                for stream, messages in results.items():
+                    record(stream, messages)
+
+        readers = (
+            [threading.Thread(target=read_all)]
+            if multiplexed
+            else [threading.Thread(target=read_one, args=(s,)) for s in streams]
+        )
+        for reader in readers:
+            reader.start()
+        time.sleep(0.5)  # Let every reader reach its first blocking read
+
+        calls_before = self._xreadgroup_calls(broker)
+        cpu_before = time.process_time()
+        time.sleep(self.IDLE_SECONDS)
+        idle_cpu = time.process_time() - cpu_before
+        idle_calls = self._xreadgroup_calls(broker) - calls_before
+
+        for n in range(self.MESSAGES):
+            broker.publish(
+                streams[n % len(streams)], {"n": n, "sent_at": time.perf_counter()}
+            )
+            time.sleep(0.005)
+
+        deadline = time.monotonic() + 5
+        while len(latencies) < self.MESSAGES and time.monotonic() < deadline:
+            time.sleep(0.05)
+        stop.set()
+        for reader in readers:
+            reader.join(timeout=5)
+
+        assert len(latencies) == self.MESSAGES
+        return {
+            "idle_cpu_seconds": idle_cpu,
+            "idle_xreadgroup_calls": idle_calls,
+            "p99_pickup_ms": statistics.quantiles(latencies, n=100)[98] * 1000,
+        }
+
+    def test_multiplexed_reads_idle_cheaper_without_slower_pickup(self, redis_broker):
+        separate = self._run(redis_broker, multiplexed=False)
+        multiplexed = self._run(redis_broker, multiplexed=True)
+        print(f"\nseparate:    {separate}\nmultiplexed: {multiplexed}")
+
+        # 40 blocked readers against 1: an order of magnitude fewer idle reads
+        assert (
+            multiplexed["idle_xreadgroup_calls"]
+            < separate["idle_xreadgroup_calls"] / 10
+        )
+        assert multiplexed["idle_cpu_seconds"] <= separate["idle_cpu_seconds"] + 0.05
+        # A blocked XREADGROUP returns as soon as any of its streams has data
+        assert multiplexed["p99_pickup_ms"] < 250
@@ -6,6 +6,9 @@ from uuid import uuid4
 import pytest
 
 from protean.adapters.broker.redis import RedisBroker
+from protean.core.event_handler import BaseEventHandler
+from protean.server.engine import Engine
+from protean.server.subscription.stream_subscription import StreamSubscription
 
 
 @pytest.fixture
@@ -365,3 +368,331 @@ class TestRedisPendingMessages:
             stream, consumer_group, consumer_name, timeout_ms=100, count=1
         )
         assert messages == []
+
+
+@pytest.mark.redis
+class TestRedisAckMany:
+    """``ack_many`` acknowledges a batch with one pipelined round-trip."""
+
+    def test_ack_many_reports_per_message_results(self, redis_broker):
+        stream = f"test_stream_{uuid4().hex[:8]}"
+        consumer_group = f"test_group_{uuid4().hex[:8]}"
+
+        id1 = redis_broker.publish(stream, {"n": 1})
+        id2 = redis_broker.publish(stream, {"n": 2})
+        assert len(redis_broker.read(stream, consumer_group, 2)) == 2
+
+        results = redis_broker.ack_many(stream, [id1, "0-1", id2], consumer_group)
+
+        assert results == [True, False, True]
+        assert not redis_broker._is_message_pending(stream, consumer_group, id1)
+        assert not redis_broker._is_message_pending(stream, consumer_group, id2)
+
+    def test_ack_many_clears_redelivery_schedule(self, redis_broker):
+        stream = f"test_stream_{uuid4().hex[:8]}"
+        consumer_group = f"test_group_{uuid4().hex[:8]}"
+
+        identifier = redis_broker.publish(stream, {"n": 1})
+        redis_broker.get_next(stream, consumer_group)
+        assert redis_broker.nack_delayed(stream, identifier, consumer_group, 60)
+
+        assert redis_broker.ack_many(stream, [identifier], consumer_group) == [True]
+
+        schedule_key = redis_broker._redelivery_schedule_key(stream, consumer_group)
+        assert redis_broker._client.zscore(schedule_key, identifier) is None
+
+
+@pytest.mark.redis
+class TestRedisDelayedRedelivery:
+    """``nack_delayed`` holds a pending message back until its delay elapses."""
+
+    def _deliver(self, redis_broker, stream, consumer_group):
+        identifier = redis_broker.publish(stream, {"n": 1})
+        messages = redis_broker.read_blocking(
+            stream, consumer_group, redis_broker._consumer_name, timeout_ms=100
+        )
+        assert [msg_id for msg_id, _ in messages] == [identifier]
+        return identifier
+
+    def test_held_back_message_is_not_redelivered(self, redis_broker):
+        stream = f"test_stream_{uuid4().hex[:8]}"
+        consumer_group = f"test_group_{uuid4().hex[:8]}"
+        identifier = self._deliver(redis_broker, stream, consumer_group)
+
+        assert redis_broker.nack_delayed(stream, identifier, consumer_group, 60)
+
+        assert (
+            redis_broker.read_blocking(
+                stream, consumer_group, redis_broker._consumer_name, timeout_ms=100
+            )
+            == []
+        )
+        assert redis_broker.read(stream, consumer_group, 5) == []
+        # Still pending, only held back
+        assert redis_broker._is_message_pending(stream, consumer_group, identifier)
+
+    def test_held_back_message_is_redelivered_once_due(self, redis_broker):
+        stream = f"test_stream_{uuid4().hex[:8]}"
+        consumer_group = f"test_group_{uuid4().hex[:8]}"
+        identifier = self._deliver(redis_broker, stream, consumer_group)
+
+        assert redis_broker.nack_delayed(stream, identifier, consumer_group, 0.2)
+        time.sleep(0.3)
+
+        messages = redis_broker.read_blocking(
+            stream, consumer_group, redis_broker._consumer_name, timeout_ms=100
+        )
+        assert [msg_id for msg_id, _ in messages] == [identifier]
+
+        schedule_key = redis_broker._redelivery_schedule_key(stream, consumer_group)
+        assert redis_broker._client.zscore(schedule_key, identifier) is None
+        assert schedule_key not in redis_broker._held_back
+
+    def test_non_blocking_read_redelivers_once_due(self, redis_broker):
+        stream = f"test_stream_{uuid4().hex[:8]}"
+        consumer_group = f"test_group_{uuid4().hex[:8]}"
+        identifier = self._deliver(redis_broker, stream, consumer_group)
+
+        assert redis_broker.nack_delayed(stream, identifier, consumer_group, 0.2)
+        assert redis_broker.read(stream, consumer_group, 5) == []
+        time.sleep(0.3)
+
+        messages = redis_broker.read(stream, consumer_group, 5)
+        assert [msg_id for msg_id, _ in messages] == [identifier]
+
+    def test_schedule_expires_after_latest_due_time(self, redis_broker):
+        stream = f"test_stream_{uuid4().hex[:8]}"
+        consumer_group = f"test_group_{uuid4().hex[:8]}"
+        identifier = self._deliver(redis_broker, stream, consumer_group)
+
+        assert redis_broker.nack_delayed(stream, identifier, consumer_group, 60)
+
+        schedule_key = redis_broker._redelivery_schedule_key(stream, consumer_group)
+        assert 0 < redis_broker._client.ttl(schedule_key) <= 62
+
+    def test_ack_clears_redelivery_schedule(self, redis_broker):
+        stream = f"test_stream_{uuid4().hex[:8]}"
+        consumer_group = f"test_group_{uuid4().hex[:8]}"
+        identifier = self._deliver(redis_broker, stream, consumer_group)
+
+        assert redis_broker.nack_delayed(stream, identifier, consumer_group, 60)
+        assert redis_broker.ack(stream, identifier, consumer_group)
+
+        schedule_key = redis_broker._redelivery_schedule_key(stream, consumer_group)
+        assert redis_broker._client.zscore(schedule_key, identifier) is None
+        assert schedule_key not in redis_broker._held_back
+        assert not redis_broker._is_message_pending(stream, consumer_group, identifier)
+
+    def test_reads_skip_schedule_when_nothing_is_held_back(self, redis_broker):
+        stream = f"test_stream_{uuid4().hex[:8]}"
+        consumer_group = f"test_group_{uuid4().hex[:8]}"
+        identifier = self._deliver(redis_broker, stream, consumer_group)
+
+        schedule_key = redis_broker._redelivery_schedule_key(stream, consumer_group)
+        assert schedule_key not in redis_broker._held_back
+
+        messages = redis_broker.read(stream, consumer_group, 5)
+        assert [msg_id for msg_id, _ in messages] == [identifier]
+        assert not redis_broker._client.exists(schedule_key)
+
+    def test_a_later_shorter_delay_does_not_shorten_the_expiry(self, redis_broker):
+        stream = f"test_stream_{uuid4().hex[:8]}"
+        consumer_group = f"test_group_{uuid4().hex[:8]}"
+        redis_broker.publish(stream, {"n": 1})
+        redis_broker.publish(stream, {"n": 2})
+        first, second = (
+            msg_id
+            for msg_id, _ in redis_broker.read_blocking(
+                stream,
+                consumer_group,
+                redis_broker._consumer_name,
+                timeout_ms=100,
+                count=2,
+            )
+        )
+
+        assert redis_broker.nack_delayed(stream, first, consumer_group, 60)
+        assert redis_broker.nack_delayed(stream, second, consumer_group, 1)
+
+        schedule_key = redis_broker._redelivery_schedule_key(stream, consumer_group)
+        assert 55 < redis_broker._client.ttl(schedule_key) <= 62
+
+    def test_held_back_message_stays_held_back_after_a_restart(self, redis_broker):
+        stream = f"test_stream_{uuid4().hex[:8]}"
+        consumer_group = f"test_group_{uuid4().hex[:8]}"
+        identifier = self._deliver(redis_broker, stream, consumer_group)
+        assert redis_broker.nack_delayed(stream, identifier, consumer_group, 60)
+
+        # What a restarted worker starts from: no local state
+        redis_broker._held_back.clear()
+        redis_broker._created_groups_set.clear()
+
+        assert (
+            redis_broker.read_blocking(
+                stream, consumer_group, redis_broker._consumer_name, timeout_ms=100
+            )
+            == []
+        )
+        schedule_key = redis_broker._redelivery_schedule_key(stream, consumer_group)
+        assert redis_broker._held_back[schedule_key] == {identifier}
+
+    def test_claimed_message_keeps_its_delay(self, redis_broker):
+        stream = f"test_stream_{uuid4().hex[:8]}"
+        consumer_group = f"test_group_{uuid4().hex[:8]}"
+        identifier = self._deliver(redis_broker, stream, consumer_group)
+        assert redis_broker.nack_delayed(stream, identifier, consumer_group, 60)
+        # Held back by another worker, as far as this broker knows
+        redis_broker._held_back.clear()
+
+        _, claimed = redis_broker._reclaim_pending(
+            stream, consumer_group, "other-consumer", 0, "0-0", 10
+        )
+
+        assert claimed == [identifier]
+        assert (
+            redis_broker.read_blocking(
+                stream, consumer_group, "other-consumer", timeout_ms=100
+            )
+            == []
+        )
+
+
+@pytest.mark.redis
+class TestRedisPendingReclaim:
+    """``reclaim_pending`` moves idle pending messages to a live consumer."""
+
+    def test_reclaimed_message_is_redelivered_to_new_consumer(self, redis_broker):
+        stream = f"test_stream_{uuid4().hex[:8]}"
+        consumer_group = f"test_group_{uuid4().hex[:8]}"
+
+        identifier = redis_broker.publish(stream, {"n": 1})
+        assert redis_broker.read_blocking(
+            stream, consumer_group, "crashed-consumer", timeout_ms=100
+        )
+
+        cursor, claimed = redis_broker.reclaim_pending(
+            stream, consumer_group, "live-consumer", min_idle_ms=0
+        )
+        assert claimed == [identifier]
+        assert cursor == "0-0"
+
+        messages = redis_broker.read_blocking(
+            stream, consumer_group, "live-consumer", timeout_ms=100
+        )
+        assert [msg_id for msg_id, _ in messages] == [identifier]
+        assert redis_broker.delivery_count(stream, identifier, consumer_group) == 2
+
+    def test_busy_messages_are_not_reclaimed(self, redis_broker):
+        stream = f"test_stream_{uuid4().hex[:8]}"
+        consumer_group = f"test_group_{uuid4().hex[:8]}"
+
+        redis_broker.publish(stream, {"n": 1})
+        assert redis_broker.read_blocking(
+            stream, consumer_group, "busy-consumer", timeout_ms=100
+        )
+
+        _, claimed = redis_broker.reclaim_pending(
+            stream, consumer_group, "live-consumer", min_idle_ms=60_000
+        )
+        assert claimed == []
+
+    def test_reclaim_is_paged(self, redis_broker):
+        stream = f"test_stream_{uuid4().hex[:8]}"
+        consumer_group = f"test_group_{uuid4().hex[:8]}"
+
+        for n in range(3):
+            redis_broker.publish(stream, {"n": n})
+        assert (
+            len(
+                redis_broker.read_blocking(
+                    stream, consumer_group, "crashed-consumer", timeout_ms=100, count=3
+                )
+            )
+            == 3
+        )
+
+        cursor, first = redis_broker.reclaim_pending(
+            stream, consumer_group, "live-consumer", min_idle_ms=0, count=2
+        )
+        _, second = redis_broker.reclaim_pending(
+            stream, consumer_group, "live-consumer", 0, start_id=cursor, count=2
+        )
+        assert len(first) == 2
+        assert len(second) == 1
+
+    def test_missing_group_reclaims_nothing(self, redis_broker):
+        stream = f"test_stream_{uuid4().hex[:8]}"
+        redis_broker.publish(stream, {"n": 1})
+
+        assert redis_broker.reclaim_pending(stream, "no-such-group", "c", 0) == (
+            "0-0",
+            [],
+        )
+
+    def test_delivery_count_of_unknown_message_is_none(self, redis_broker):
+        stream = f"test_stream_{uuid4().hex[:8]}"
+        consumer_group = f"test_group_{uuid4().hex[:8]}"
+        redis_broker.publish(stream, {"n": 1})
+        redis_broker._ensure_group(consumer_group, stream)
+
+        assert redis_broker.delivery_count(stream, "0-1", consumer_group) is None
+
+
+class RetriedHandler(BaseEventHandler):
+    pass
+
+
+@pytest.mark.redis
+class TestRedisRetryCountsAcrossRestart:
+    """Attempt counts come from Redis, so a restart does not reset them."""
+
+    def _poll(self, redis_broker, subscription):
+        return redis_broker.read_blocking(
+            subscription.stream_category,
+            subscription.consumer_group,
+            subscription.consumer_name,
+            timeout_ms=10,
+        )
+
+    async def _fail_next_delivery(self, redis_broker, subscription):
+        # Poll while the message is held back, then wait for it to come due
+        assert self._poll(redis_broker, subscription) == []
+        assert self._poll(redis_broker, subscription) == []
+        time.sleep(0.45)
+        [(identifier, payload)] = self._poll(redis_broker, subscription)
+        await subscription.handle_failed_message(identifier, payload)
+        return identifier
+
+    async def test_restarted_worker_dead_letters_at_max_retries(
+        self, redis_broker, test_domain
+    ):
+        subscription = StreamSubscription(
+            engine=Engine(test_domain, test_mode=True),
+            stream_category=f"test_stream_{uuid4().hex[:8]}",
+            handler=RetriedHandler,
+            max_retries=3,
+            retry_delay_seconds=0.4,
+            retry_max_delay_seconds=0.4,
+        )
+        subscription.broker = redis_broker
+        stream = subscription.stream_category
+        consumer_group = subscription.consumer_group
+
+        identifier = redis_broker.publish(stream, {"n": 1})
+        [(_, payload)] = self._poll(redis_broker, subscription)
+        await subscription.handle_failed_message(identifier, payload)
+        assert subscription.retry_counts == {identifier: 1}
+
+        # Restart mid-retry: the worker keeps its pending entry but loses
+        # every in-memory count and index
+        subscription.retry_counts.clear()
+        redis_broker._held_back.clear()
+        redis_broker._created_groups_set.clear()
+
+        await self._fail_next_delivery(redis_broker, subscription)
+        assert subscription.retry_counts == {identifier: 2}
+        assert redis_broker.dlq_depth(subscription.dlq_stream) == 0
+
+        await self._fail_next_delivery(redis_broker, subscription)
+        assert redis_broker.dlq_depth(subscription.dlq_stream) == 1
+        assert not redis_broker._is_message_pending(stream, consumer_group, identifier)
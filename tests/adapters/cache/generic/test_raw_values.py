@@ -0,0 +1,38 @@
+"""Cross-adapter `_get_raw`/`_set_raw`, the opaque values behind query caching.
+
+Raw values live outside the `name:::identifier` projection keyspace, so they
+must round-trip as bytes, read back in one call, and stay out of a
+projection's `count`.
+"""
+
+from __future__ import annotations
+
+from .conftest import CacheEntry
+
+
+class TestRawValues:
+    def test_set_then_get_round_trips_bytes(self, cache):
+        cache._set_raw("protean:query:a", b"\x00one")
+        cache._set_raw("protean:query:b", b"two")
+
+        assert cache._get_raw(["protean:query:a", "missing", "protean:query:b"]) == [
+            b"\x00one",
+            None,
+            b"two",
+        ]
+
+    def test_set_replaces_the_value_and_takes_a_ttl(self, cache):
+        cache._set_raw("protean:query:a", b"one")
+        cache._set_raw("protean:query:a", b"two", ttl=30)
+
+        assert cache._get_raw(["protean:query:a"]) == [b"two"]
+        assert 0 < cache.get_ttl("protean:query:a") <= 30
+
+    def test_raw_values_are_not_projection_entries(self, cache):
+        cache.add(CacheEntry(key="alpha", value="one"))
+        cache._set_raw("protean:query:a", b"one")
+
+        assert cache.count("cache_entry:::*") == 1
+
+    def test_get_of_no_keys_is_empty(self, cache):
+        assert cache._get_raw([]) == []
@@ -233,6 +233,43 @@ class TestCachePersistenceFlows:
         assert total == 0
 
 
+@pytest.mark.redis
+class TestProjectionIndex:
+    @pytest.fixture(autouse=True)
+    def clean_db(self, test_domain):
+        # FLUSHDB, not `flush_all`: FLUSHALL would wipe other suites' DBs too.
+        test_domain.cache_for(Token).get_connection().flushdb()
+
+    def test_count_and_get_all_follow_adds_and_removes(self, test_domain):
+        cache = test_domain.cache_for(Token)
+        for key in ("a", "b", "c"):
+            cache.add(Token(key=key, user_id="foo", email="bar@baz.com"))
+        cache.remove_by_key("token:::b")
+
+        assert cache.count("token:::*") == 2
+        assert [token.key for token in cache._get_all("token:::*")] == ["a", "c"]
+
+    def test_keys_written_without_the_index_are_backfilled(self, test_domain):
+        cache = test_domain.cache_for(Token)
+        conn = cache.get_connection()
+        conn.set(
+            "token:::legacy",
+            json.dumps({"key": "legacy", "user_id": "u", "email": "e@x.com"}),
+        )
+        cache.add(Token(key="fresh", user_id="foo", email="bar@baz.com"))
+
+        assert cache.count("token:::*") == 2
+        assert conn.exists("protean:cache:index-ready:token")
+
+    def test_expired_keys_are_not_counted(self, test_domain):
+        cache = test_domain.cache_for(Token)
+        cache.add(Token(key="short", user_id="foo", email="bar@baz.com"), ttl=0.1)
+        cache.add(Token(key="long", user_id="foo", email="bar@baz.com"))
+        time.sleep(0.2)
+
+        assert cache.count("token:::*") == 1
+
+
 @pytest.mark.redis
 class TestCacheSerialization:
     def test_serializing_projection_object_data(self, test_domain):
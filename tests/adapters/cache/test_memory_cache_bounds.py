@@ -0,0 +1,250 @@
+"""Size bounds, heap-driven expiry and the prefix index of the memory cache.
+
+Before these, `TTLDict` had no capacity limit, dropped expired entries only
+when they were read, and answered `len` and pattern reads by scanning every
+key, so a long-running memory-cached projection grew without limit and slowed
+down as it grew.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+
+from protean.adapters.cache.memory import MemoryCache, TTLDict
+from protean.exceptions import ConfigurationError
+
+# ── TTLDict ──────────────────────────────────────────────────────────────
+
+
+class TestEntryBound:
+    def test_lru_evicts_the_least_recently_used_entry(self):
+        store = TTLDict(300, max_entries=2)
+        store["a"] = 1
+        store["b"] = 2
+        assert store["a"] == 1  # "b" is now the least recently used
+
+        store["c"] = 3
+
+        assert sorted(store) == ["a", "c"]
+
+    def test_rewriting_a_key_counts_as_a_use(self):
+        store = TTLDict(300, max_entries=2)
+        store["a"] = 1
+        store["b"] = 2
+        store["a"] = 10
+
+        store["c"] = 3
+
+        assert sorted(store) == ["a", "c"]
+
+    def test_membership_checks_do_not_count_as_a_use(self):
+        store = TTLDict(300, max_entries=2)
+        store["a"] = 1
+        store["b"] = 2
+        assert "a" in store
+
+        store["c"] = 3
+
+        assert sorted(store) == ["b", "c"]
+
+    def test_lfu_evicts_the_least_frequently_used_entry(self):
+        store = TTLDict(300, max_entries=2, eviction="lfu")
+        store["a"] = 1
+        store["b"] = 2
+        for _ in range(3):
+            assert store["a"] == 1
+        assert store["b"] == 2
+
+        store["c"] = 3
+
+        assert sorted(store) == ["a", "c"]
+
+    def test_lfu_breaks_ties_by_age(self):
+        store = TTLDict(300, max_entries=2, eviction="lfu")
+        store["a"] = 1
+        store["b"] = 2
+
+        store["c"] = 3
+
+        assert sorted(store) == ["b", "c"]
+
+    def test_unknown_policy_is_rejected(self):
+        with pytest.raises(ValueError, match="eviction policy"):
+            TTLDict(300, eviction="fifo")
+
+
+class TestByteBound:
+    def test_evicts_until_the_size_fits(self):
+        store = TTLDict(300, max_bytes=30)
+        store["a"] = "x" * 10  # 12 bytes of JSON
+        store["b"] = "x" * 10
+
+        store["c"] = "x" * 10
+
+        assert sorted(store) == ["b", "c"]
+        assert store.total_bytes == 24
+
+    def test_rewrites_replace_the_old_size(self):
+        store = TTLDict(300, max_bytes=100)
+        store["a"] = "x" * 10
+        store["a"] = "x" * 20
+
+        assert store.total_bytes == 22
+
+    def test_an_oversized_entry_is_kept_alone(self):
+        store = TTLDict(300, max_bytes=10)
+        store["a"] = "x"
+
+        store["big"] = "x" * 50
+
+        assert list(store) == ["big"]
+
+    def test_deleting_releases_the_size(self):
+        store = TTLDict(300, max_bytes=100)
+        store["a"] = "x" * 10
+        del store["a"]
+
+        assert store.total_bytes == 0
+
+
+class TestHeapExpiry:
+    def test_expired_entries_are_dropped_without_a_read(self):
+        store = TTLDict(300)
+        store["a"] = 1
+        store["b"] = 2
+        store.expire_at("a", 0.0)
+
+        assert len(store) == 1
+        assert "a" not in store._values
+
+    def test_a_retimed_entry_is_not_dropped_by_its_old_expiry(self):
+        store = TTLDict(300)
+        store["a"] = 1
+        store.set_ttl("a", 0.01, now=0.0)  # due long ago
+        store.set_ttl("a", 300)  # ...then pushed back out
+
+        assert len(store) == 1
+
+    def test_stale_heap_entries_are_compacted(self):
+        store = TTLDict(300)
+        store["a"] = 1
+        for _ in range(200):
+            store.set_ttl("a", 300)
+
+        assert len(store._expiry_heap) <= 2 * len(store) + 64
+
+    def test_eviction_callback_reports_reasons(self):
+        evictions = []
+        store = TTLDict(
+            300,
+            max_entries=1,
+            on_evict=lambda count, reason: evictions.append((count, reason)),
+        )
+        store["a"] = 1
+        store["b"] = 2
+        store.expire_at("b", 0.0)
+        len(store)
+
+        assert evictions == [(1, "capacity"), (1, "expired")]
+
+
+class TestPrefixIndex:
+    def test_keys_are_read_by_prefix(self):
+        store = TTLDict(300)
+        store["token:::1"] = 1
+        store["token:::2"] = 2
+        store["person:::1"] = 3
+        store["plain"] = 4
+
+        assert sorted(store.keys_with_prefix("token")) == ["token:::1", "token:::2"]
+        assert store.keys_with_prefix("missing") == []
+
+    def test_removed_and_expired_keys_leave_the_index(self):
+        store = TTLDict(300)
+        store["token:::1"] = 1
+        store["token:::2"] = 2
+        del store["token:::1"]
+        store.expire_at("token:::2", 0.0)
+
+        assert store.keys_with_prefix("token") == []
+        assert store._by_prefix == {}
+
+    def test_clear_empties_every_index(self):
+        store = TTLDict(300, max_bytes=100, max_entries=5, eviction="lfu")
+        store["token:::1"] = 1
+        store.clear()
+
+        assert store.keys_with_prefix("token") == []
+        assert store.total_bytes == 0
+        assert len(store) == 0
+
+
+# ── MemoryCache ──────────────────────────────────────────────────────────
+
+
+class TestMemoryCacheBoundsConfig:
+    def test_bounds_are_read_from_conn_info(self, test_domain):
+        cache = MemoryCache(
+            "bounded",
+            test_domain,
+            {"max_entries": "100", "max_bytes": 2048, "eviction": "LFU"},
+        )
+
+        assert cache._db._max_entries == 100
+        assert cache._db._max_bytes == 2048
+        assert cache._db._eviction == "lfu"
+
+    def test_unbounded_by_default(self, test_domain):
+        cache = MemoryCache("default", test_domain, {})
+
+        assert cache._db.bounded is False
+        assert cache._db._eviction == "lru"
+
+    @pytest.mark.parametrize("bad", [0, -1, "ten", True, 1.5])
+    def test_a_bad_bound_names_the_cache(self, test_domain, bad):
+        with pytest.raises(ConfigurationError, match="sessions.*max_entries"):
+            MemoryCache("sessions", test_domain, {"max_entries": bad})
+
+    def test_a_bad_policy_names_the_cache(self, test_domain):
+        with pytest.raises(ConfigurationError, match="sessions.*eviction"):
+            MemoryCache("sessions", test_domain, {"eviction": "random"})
+
+
+class TestMemoryCacheMetrics:
+    def test_hits_misses_and_evictions_are_counted(self, test_domain):
+        cache = MemoryCache("bounded", test_domain, {"max_entries": 1})
+        cache._db["token:::1"] = {"key": "1"}
+        cache._projections["token"] = dict
+
+        with patch("protean.adapters.cache.memory.get_domain_metrics") as metrics:
+            cache.get("token:::1")
+            cache.get("token:::2")
+            cache._db["token:::3"] = {"key": "3"}
+
+        counters = metrics.return_value
+        counters.cache_hits.add.assert_called_once_with(1, {"cache": "bounded"})
+        counters.cache_misses.add.assert_called_once_with(1, {"cache": "bounded"})
+        counters.cache_evictions.add.assert_called_once_with(
+            1, {"cache": "bounded", "reason": "capacity"}
+        )
+
+
+class TestMemoryCachePatternReads:
+    def test_projection_patterns_do_not_scan_every_key(self, test_domain):
+        cache = MemoryCache("default", test_domain, {})
+        cache._db["token:::1"] = {"key": "1"}
+        cache._db["token:::2"] = {"key": "2"}
+        cache._db["person:::1"] = {"key": "3"}
+
+        with patch.object(TTLDict, "keys", side_effect=AssertionError("scanned")):
+            assert cache.count("token:::*") == 2
+            assert cache.count("token:::1") == 1
+
+    def test_wildcard_prefixes_fall_back_to_a_scan(self, test_domain):
+        cache = MemoryCache("default", test_domain, {})
+        cache._db["token:::1"] = {"key": "1"}
+        cache._db["person:::1"] = {"key": "3"}
+
+        assert cache.count("*:::1") == 2
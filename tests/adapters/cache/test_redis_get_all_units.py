@@ -1,7 +1,8 @@
 """`_get_all` reads Redis keys in sorted key order, deduped.
 
-Redis has no native ordering, so `_get_all` collects every matching key with
-`scan_iter`, dedupes, sorts them ascending, and materialises them. That sort and
+Redis has no native ordering, so `_get_all` collects every matching key, from
+the projection's index or with `scan_iter`, dedupes, sorts them ascending, and
+materialises them. That sort and
 dedupe is the whole behaviour, so it is worth covering on its own.
 
 Driven through a stub client rather than a live Redis, so the logic runs in the
@@ -28,31 +29,149 @@ class CacheEntry(BaseProjection):
 
 
 class _StubClient:
-    """The parts of the Redis client `_get_all`/`add`/`count` touch, backed by a dict.
+    """The parts of the Redis client the cache touches, backed by dicts.
 
     Keys and values come back as `bytes`, the way redis-py answers without
     `decode_responses`, so the test exercises the same bytes sort the live
     adapter does. `scan_iter` yields keys in insertion order, deliberately not
     sorted, so a `_get_all` that forgot to sort would return them in the wrong
     order and the order assertion would catch it.
+
+    Values expire at `now_ms`, which tests move by hand. Sorted sets are
+    `member -> score` dicts, enough for the projection indexes.
     """
 
     def __init__(self) -> None:
         self._store: dict[bytes, bytes] = {}
+        self._expiry: dict[bytes, float] = {}
+        self._zsets: dict[bytes, dict[bytes, float]] = {}
+        self.now_ms = 0.0
+        self.calls: list[str] = []
+
+    @staticmethod
+    def _b(key: str | bytes) -> bytes:
+        return key if isinstance(key, bytes) else key.encode()
+
+    def _live(self, key: bytes) -> bool:
+        if key in self._expiry and self._expiry[key] <= self.now_ms:
+            del self._store[key], self._expiry[key]
+        return key in self._store
+
+    @staticmethod
+    def _bound(value) -> tuple[float, bool]:
+        if isinstance(value, str) and value.startswith("("):
+            return float(value[1:]), True
+        return float(value), False
+
+    def _in_range(self, score, low, high) -> bool:
+        (lo, lo_open), (hi, hi_open) = self._bound(low), self._bound(high)
+        above = score > lo if lo_open else score >= lo
+        below = score < hi if hi_open else score <= hi
+        return above and below
 
     def ping(self) -> bool:
         return True
 
-    def psetex(self, key: str, ttl_ms: int, value: str) -> None:
-        self._store[key.encode()] = value.encode()
+    def pipeline(self, transaction: bool = True) -> "_StubPipeline":
+        return _StubPipeline(self)
 
-    def scan_iter(self, match: str | None = None):
-        for key in self._store:  # insertion order, not sorted
+    def psetex(self, key: str, ttl_ms: int, value: str) -> None:
+        self.calls.append("psetex")
+        self._store[self._b(key)] = value.encode()
+        self._expiry[self._b(key)] = self.now_ms + ttl_ms
+
+    def set(self, key: str, value) -> None:
+        self._store[self._b(key)] = str(value).encode()
+        self._expiry.pop(self._b(key), None)
+
+    def flushall(self) -> None:
+        self._store.clear()
+        self._expiry.clear()
+        self._zsets.clear()
+
+    def exists(self, key: str) -> int:
+        return int(self._live(self._b(key)))
+
+    def scan_iter(self, match: str | None = None, count: int | None = None):
+        self.calls.append("scan")
+        for key in list(self._store):  # insertion order, not sorted
+            if not self._live(key):
+                continue
             if match is None or fnmatch.fnmatchcase(key.decode(), match):
                 yield key
 
     def get(self, key: bytes) -> bytes | None:
-        return self._store.get(key)
+        self.calls.append("get")
+        return self._store.get(self._b(key)) if self._live(self._b(key)) else None
+
+    def mget(self, keys) -> list[bytes | None]:
+        self.calls.append("mget")
+        return [self._store.get(k) if self._live(self._b(k)) else None for k in keys]
+
+    def delete(self, *keys) -> int:
+        removed = 0
+        for key in map(self._b, keys):
+            removed += int(self._live(key))
+            self._store.pop(key, None)
+            self._expiry.pop(key, None)
+        return removed
+
+    def pttl(self, key) -> int:
+        key = self._b(key)
+        if not self._live(key):
+            return -2
+        if key not in self._expiry:
+            return -1
+        return int(self._expiry[key] - self.now_ms)
+
+    def pexpire(self, key, ttl_ms: int) -> bool:
+        if not self._live(self._b(key)):
+            return False
+        self._expiry[self._b(key)] = self.now_ms + ttl_ms
+        return True
+
+    def zadd(self, name, mapping, xx: bool = False) -> int:
+        zset = self._zsets.setdefault(self._b(name), {})
+        for member, score in mapping.items():
+            if not xx or self._b(member) in zset:
+                zset[self._b(member)] = float(score)
+        return len(mapping)
+
+    def zrem(self, name, *members) -> int:
+        zset = self._zsets.get(self._b(name), {})
+        return sum(zset.pop(self._b(m), None) is not None for m in members)
+
+    def zremrangebyscore(self, name, low, high) -> int:
+        zset = self._zsets.get(self._b(name), {})
+        doomed = [m for m, s in zset.items() if self._in_range(s, low, high)]
+        for member in doomed:
+            del zset[member]
+        return len(doomed)
+
+    def zrangebyscore(self, name, low, high) -> list[bytes]:
+        zset = self._zsets.get(self._b(name), {})
+        return [m for m, s in zset.items() if self._in_range(s, low, high)]
+
+    def zcount(self, name, low, high) -> int:
+        return len(self.zrangebyscore(name, low, high))
+
+
+class _StubPipeline:
+    """Queues calls against a `_StubClient` and runs them on `execute`."""
+
+    def __init__(self, client: _StubClient) -> None:
+        self._client = client
+        self._queued: list = []
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self._queued.append((getattr(self._client, name), args, kwargs))
+            return self
+
+        return queue
+
+    def execute(self) -> list:
+        return [command(*args, **kwargs) for command, args, kwargs in self._queued]
 
 
 def _install(monkeypatch, stub):
@@ -107,7 +226,7 @@ class _DuplicatingStub(_StubClient):
     on the core leg, not only against a live server.
     """
 
-    def scan_iter(self, match=None):
+    def scan_iter(self, match=None, count=None):
         keys = list(super().scan_iter(match=match))
         if keys:
             yield keys[0]
@@ -0,0 +1,169 @@
+"""Projection indexes of the Redis cache.
+
+Each projection's keys sit in a sorted set scored by expiry, kept in step by
+`add`, `remove`, `remove_by_key(_pattern)` and `set_ttl`. `count` and
+`_get_all` on a whole projection read it instead of scanning the keyspace, and
+keys written before the index existed are backfilled on the first such read.
+
+Driven through the dict-backed stub client of `test_redis_get_all_units.py`,
+so it runs in the core suite.
+"""
+
+import pytest
+
+from protean.adapters.cache.redis import RedisCache
+from tests.adapters.cache.test_redis_get_all_units import (
+    CacheEntry,
+    _install,
+    _StubClient,
+)
+
+pytestmark = pytest.mark.no_test_domain
+
+PATTERN = "cache_entry:::*"
+INDEX = b"protean:cache:index:cache_entry"
+
+
+@pytest.fixture
+def stub():
+    return _StubClient()
+
+
+@pytest.fixture
+def cache(monkeypatch, stub):
+    domain = _install(monkeypatch, stub)
+    with domain.domain_context():
+        yield domain.cache_for(CacheEntry)
+
+
+@pytest.fixture(autouse=True)
+def frozen_clock(monkeypatch, stub):
+    """The cache scores entries with the stub's clock, so tests can move it."""
+    monkeypatch.setattr(RedisCache, "_now_ms", staticmethod(lambda: stub.now_ms))
+
+
+def _load(cache, count=3, ttl=None):
+    for i in range(count):
+        cache.add(CacheEntry(key=f"k{i}", value=str(i)), ttl=ttl)
+
+
+class TestIndexMaintenance:
+    def test_add_indexes_the_key_at_its_expiry(self, cache, stub):
+        cache.add(CacheEntry(key="k0", value="0"), ttl=10)
+
+        assert stub._zsets[INDEX] == {b"cache_entry:::k0": 10_000.0}
+
+    def test_remove_drops_the_index_entry(self, cache, stub):
+        _load(cache)
+        cache.remove(CacheEntry(key="k0", value="0"))
+        cache.remove_by_key("cache_entry:::k1")
+
+        assert list(stub._zsets[INDEX]) == [b"cache_entry:::k2"]
+
+    def test_remove_by_pattern_drops_the_index_entries(self, cache, stub):
+        _load(cache)
+        cache.remove_by_key_pattern("cache_entry:::k[01]")
+
+        assert list(stub._zsets[INDEX]) == [b"cache_entry:::k2"]
+
+    def test_set_ttl_moves_the_index_entry(self, cache, stub):
+        _load(cache, count=1)
+        cache.set_ttl("cache_entry:::k0", 900)
+
+        assert stub._zsets[INDEX] == {b"cache_entry:::k0": 900_000.0}
+
+    def test_set_ttl_on_a_missing_key_does_not_index_it(self, cache, stub):
+        cache.set_ttl("cache_entry:::absent", 900)
+
+        assert stub._zsets.get(INDEX, {}) == {}
+
+    def test_add_prunes_expired_entries(self, cache, stub):
+        cache.add(CacheEntry(key="old", value="0"), ttl=1)
+        stub.now_ms = 5_000
+        cache.add(CacheEntry(key="new", value="1"), ttl=1)
+
+        assert list(stub._zsets[INDEX]) == [b"cache_entry:::new"]
+
+
+class TestIndexedReads:
+    def test_count_and_get_all_do_not_scan_once_indexed(self, cache, stub):
+        _load(cache)
+        assert cache.count(PATTERN) == 3  # backfills once
+        stub.calls.clear()
+
+        assert cache.count(PATTERN) == 3
+        assert [entry.key for entry in cache._get_all(PATTERN)] == ["k0", "k1", "k2"]
+        assert "scan" not in stub.calls
+        assert "get" not in stub.calls
+
+    def test_expired_entries_are_not_counted(self, cache, stub):
+        cache.add(CacheEntry(key="short", value="0"), ttl=1)
+        cache.add(CacheEntry(key="long", value="1"), ttl=100)
+        stub.now_ms = 5_000
+
+        assert cache.count(PATTERN) == 1
+        assert [entry.key for entry in cache._get_all(PATTERN)] == ["long"]
+
+    def test_values_are_read_in_mget_batches(self, cache, stub, monkeypatch):
+        monkeypatch.setattr(RedisCache, "_MGET_BATCH_SIZE", 2)
+        _load(cache, count=5)
+        cache.count(PATTERN)
+        stub.calls.clear()
+
+        assert len(cache._get_all(PATTERN)) == 5
+        assert stub.calls.count("mget") == 3
+
+    def test_a_vanished_value_leaves_the_index(self, cache, stub):
+        _load(cache)
+        cache.count(PATTERN)
+        stub.delete(b"cache_entry:::k1")  # evicted behind the cache's back
+
+        assert [entry.key for entry in cache._get_all(PATTERN)] == ["k0", "k2"]
+        assert cache.count(PATTERN) == 2
+
+    def test_other_patterns_scan(self, cache, stub):
+        _load(cache)
+        stub.calls.clear()
+
+        assert cache.count("cache_entry:::k1") == 1
+        assert [entry.key for entry in cache._get_all("cache_entry:::k?")] == [
+            "k0",
+            "k1",
+            "k2",
+        ]
+        assert "scan" in stub.calls
+
+
+class TestBackfill:
+    def test_keys_written_before_the_index_are_backfilled(self, cache, stub):
+        stub.psetex("cache_entry:::legacy", 60_000, '{"key": "legacy", "value": "x"}')
+        stub.set("cache_entry:::forever", '{"key": "forever", "value": "y"}')
+        _load(cache, count=1)
+
+        assert cache.count(PATTERN) == 3
+        assert stub._zsets[INDEX][b"cache_entry:::legacy"] == 60_000.0
+        assert stub._zsets[INDEX][b"cache_entry:::forever"] == float("inf")
+
+    def test_backfill_runs_once(self, cache, stub):
+        _load(cache)
+        cache.count(PATTERN)
+        stub.calls.clear()
+
+        cache.count(PATTERN)
+        cache._get_all(PATTERN)
+
+        assert "scan" not in stub.calls
+
+    def test_backfill_walks_the_keys_in_batches(self, cache, stub, monkeypatch):
+        monkeypatch.setattr(RedisCache, "_BACKFILL_BATCH_SIZE", 2)
+        for i in range(5):
+            stub.psetex(f"cache_entry:::k{i}", 60_000, "{}")
+
+        assert cache.count(PATTERN) == 5
+
+    def test_flush_all_resets_the_index(self, cache, stub):
+        _load(cache)
+        cache.count(PATTERN)
+        cache.flush_all()
+
+        assert cache.count(PATTERN) == 0
@@ -0,0 +1,116 @@
+"""The async read/write methods of the event store port, on the memory store.
+
+The engine awaits ``aread``, ``_awrite`` and ``_aread_last_message``. An adapter
+without an async driver inherits defaults that run its sync methods in a worker
+thread, and must answer exactly what the sync methods answer.
+"""
+
+import asyncio
+
+import pytest
+
+from protean.adapters.event_store.memory import MemoryEventStore
+
+
+def _metadata(stream_name, message_type, message_id):
+    return {
+        "domain": {"kind": "EVENT"},
+        "headers": {"id": message_id, "type": message_type, "stream": stream_name},
+    }
+
+
+async def _write_n(store, stream_name, count):
+    for i in range(count):
+        await store._awrite(
+            stream_name,
+            "Ticked",
+            {"n": i},
+            _metadata(stream_name, "Ticked", f"{stream_name}-{i}"),
+        )
+
+
+@pytest.mark.asyncio
+async def test_async_writes_and_reads_match_the_sync_methods(test_domain):
+    store = test_domain.event_store.store
+    await _write_n(store, "counter-1", 3)
+
+    messages = await store.aread("counter-1")
+
+    assert [m.data["n"] for m in messages] == [0, 1, 2]
+    assert [m.metadata.headers.id for m in messages] == [
+        m.metadata.headers.id for m in store.read("counter-1")
+    ]
+
+
+@pytest.mark.asyncio
+async def test_aread_pages_from_a_position(test_domain):
+    store = test_domain.event_store.store
+    await _write_n(store, "counter-1", 5)
+
+    messages = await store.aread("counter", position=2, no_of_messages=2)
+
+    assert len(messages) == 2
+    assert [m.data for m in messages] == [
+        m.data for m in store.read("counter", position=2, no_of_messages=2)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_aread_skips_snapshot_rows(test_domain):
+    store = test_domain.event_store.store
+    await _write_n(store, "counter-1", 1)
+    await store._awrite("counter:snapshot-1", "SNAPSHOT", {"n": 0})
+
+    messages = await store.aread("$all")
+
+    assert [m.data["n"] for m in messages] == [0]
+
+
+@pytest.mark.asyncio
+async def test_aread_last_message_returns_the_raw_tail(test_domain):
+    store = test_domain.event_store.store
+    await _write_n(store, "counter-1", 3)
+
+    assert (await store._aread_last_message("counter-1"))["data"] == {"n": 2}
+    assert await store._aread_last_message("counter-2") is None
+
+
+@pytest.mark.asyncio
+async def test_async_write_honours_the_expected_version(test_domain):
+    store = test_domain.event_store.store
+    await _write_n(store, "counter-1", 1)
+
+    with pytest.raises(Exception, match="Wrong expected version"):
+        await store._awrite("counter-1", "Ticked", {"n": 1}, expected_version=5)
+
+
+@pytest.mark.asyncio
+async def test_defaults_run_off_the_event_loop(test_domain, monkeypatch):
+    store = test_domain.event_store.store
+    loop_thread = []
+
+    real_read = MemoryEventStore._read
+
+    def recording_read(self, *args, **kwargs):
+        try:
+            asyncio.get_running_loop()
+            loop_thread.append(True)
+        except RuntimeError:
+            loop_thread.append(False)
+        return real_read(self, *args, **kwargs)
+
+    monkeypatch.setattr(MemoryEventStore, "_read", recording_read)
+
+    await store.aread("counter-1")
+
+    assert loop_thread == [False]
+
+
+@pytest.mark.asyncio
+async def test_aclose_is_a_no_op_by_default(test_domain):
+    store = test_domain.event_store.store
+    await _write_n(store, "counter-1", 1)
+
+    await store.aclose()
+
+    assert len(store.read("counter-1")) == 1
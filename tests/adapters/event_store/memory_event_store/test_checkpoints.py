@@ -0,0 +1,156 @@
+"""Tests for subscription checkpoints and position-stream compaction on the
+memory event store adapter."""
+
+from datetime import UTC, datetime
+
+import pytest
+
+from protean.adapters.event_store.memory import MemoryEventStore
+from protean.exceptions import NotSupportedError
+from protean.port.checkpoint_store import Checkpoint, PositionStreamCheckpointStore
+
+EARLIER = datetime(2026, 1, 1, tzinfo=UTC)
+LATER = datetime(2026, 1, 2, tzinfo=UTC)
+
+
+def _write_legacy_position(store, name: str, position: int) -> None:
+    """Append a ``Read`` message the way subscriptions used to."""
+    store._write(
+        name,
+        "Read",
+        {"position": position},
+        {
+            "domain": {"kind": "READ_POSITION"},
+            "headers": {"type": "Read", "stream": name, "time": EARLIER.isoformat()},
+        },
+    )
+
+
+class TestCheckpoints:
+    def test_missing_checkpoint(self, test_domain):
+        assert test_domain.event_store.store.read_checkpoint("position-a-x") is None
+
+    def test_write_and_read_checkpoint(self, test_domain):
+        store = test_domain.event_store.store
+        store.write_checkpoint("position-a-x", 5, EARLIER)
+
+        assert store.read_checkpoint("position-a-x") == Checkpoint(
+            "position-a-x", 5, EARLIER
+        )
+
+    def test_checkpoint_is_overwritten_in_place(self, test_domain):
+        store = test_domain.event_store.store
+        for position in range(10):
+            store.write_checkpoint("position-a-x", position, LATER)
+
+        assert store.read_checkpoint("position-a-x").position == 9
+        assert store._read("$all") == []
+
+    @pytest.mark.asyncio
+    async def test_async_write_and_read_checkpoint(self, test_domain):
+        store = test_domain.event_store.store
+        await store.awrite_checkpoint("position-a-x", 3, EARLIER)
+
+        assert (await store.aread_checkpoint("position-a-x")).position == 3
+
+    def test_legacy_position_stream_is_read_through(self, test_domain):
+        store = test_domain.event_store.store
+        _write_legacy_position(store, "position-a-x", 1)
+        _write_legacy_position(store, "position-a-x", 7)
+
+        checkpoint = store.read_checkpoint("position-a-x")
+
+        assert checkpoint.position == 7
+        assert checkpoint.updated_at is not None
+
+    @pytest.mark.asyncio
+    async def test_legacy_position_stream_is_read_through_asynchronously(
+        self, test_domain
+    ):
+        store = test_domain.event_store.store
+        _write_legacy_position(store, "position-a-x", 4)
+
+        assert (await store.aread_checkpoint("position-a-x")).position == 4
+
+    def test_checkpoint_wins_over_legacy_position_stream(self, test_domain):
+        store = test_domain.event_store.store
+        _write_legacy_position(store, "position-a-x", 4)
+        store.write_checkpoint("position-a-x", 9, LATER)
+
+        assert store.read_checkpoint("position-a-x").position == 9
+
+    def test_data_reset_clears_checkpoints(self, test_domain):
+        store = test_domain.event_store.store
+        store.write_checkpoint("position-a-x", 5, EARLIER)
+
+        store._data_reset()
+
+        assert store.read_checkpoint("position-a-x") is None
+
+
+class TestCompactPositionStreams:
+    def test_legacy_positions_are_migrated_and_streams_deleted(self, test_domain):
+        store = test_domain.event_store.store
+        for position in range(3):
+            _write_legacy_position(store, "position-a-x", position)
+        _write_legacy_position(store, "position-b-y", 8)
+        store._write("test::user-1", "Registered", {"id": "1"})
+
+        report = store.compact_position_streams()
+
+        assert report.streams == ("position-a-x", "position-b-y")
+        assert report.migrated_count == 2
+        assert report.message_count == 4
+        assert report.dry_run is False
+        assert store.checkpoints.read("position-a-x").position == 2
+        assert store.checkpoints.read("position-b-y").position == 8
+        assert [m["stream_name"] for m in store._read("$all")] == ["test::user-1"]
+
+    def test_existing_checkpoint_is_kept(self, test_domain):
+        store = test_domain.event_store.store
+        _write_legacy_position(store, "position-a-x", 4)
+        store.write_checkpoint("position-a-x", 9, LATER)
+
+        report = store.compact_position_streams()
+
+        assert report.streams == ("position-a-x",)
+        assert report.migrated_count == 0
+        assert store.read_checkpoint("position-a-x") == Checkpoint(
+            "position-a-x", 9, LATER
+        )
+        assert store._read("position-a-x") == []
+
+    def test_dry_run_changes_nothing(self, test_domain):
+        store = test_domain.event_store.store
+        _write_legacy_position(store, "position-a-x", 0)
+        _write_legacy_position(store, "position-a-x", 1)
+
+        report = store.compact_position_streams(dry_run=True)
+
+        assert report.streams == ("position-a-x",)
+        assert report.migrated_count == 1
+        assert report.message_count == 2
+        assert report.dry_run is True
+        assert store.checkpoints.read("position-a-x") is None
+        assert len(store._read("position-a-x")) == 2
+
+    def test_nothing_to_compact(self, test_domain):
+        report = test_domain.event_store.store.compact_position_streams()
+
+        assert report.as_dict() == {
+            "streams": [],
+            "stream_count": 0,
+            "migrated_count": 0,
+            "message_count": 0,
+            "dry_run": False,
+        }
+
+    def test_store_without_checkpoint_store_cannot_compact(self, test_domain):
+        class PositionStreamStore(MemoryEventStore):
+            def _make_checkpoint_store(self):
+                return PositionStreamCheckpointStore(self)
+
+        store = PositionStreamStore(test_domain, {})
+
+        with pytest.raises(NotSupportedError, match="no checkpoint store"):
+            store.compact_position_streams()
@@ -0,0 +1,252 @@
+"""The ``message_db_async`` event store and its async pool.
+
+``AsyncMessageDBStore`` answers ``_aread``, ``_awrite`` and
+``_aread_last_message`` from a psycopg 3 async pool, and must return exactly
+what the psycopg2 path returns for the same store. The benchmark at the end
+compares it with the threaded driver at 1, 10 and 100 concurrent readers:
+messages/s and the most connections each held open.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+# The async driver ships in the optional ``message-db-async`` extra
+pytest.importorskip("psycopg")
+pytest.importorskip("psycopg_pool")
+
+from protean.adapters.event_store import message_db_async
+from protean.adapters.event_store.message_db import MessageDBStore
+from protean.adapters.event_store.message_db_async import AsyncMessageDBStore
+from protean.domain import Domain
+from protean.exceptions import ConfigurationError
+from tests.shared import MESSAGE_DB_URI
+
+
+def _store(test_domain, **conn_info) -> AsyncMessageDBStore:
+    return AsyncMessageDBStore(
+        test_domain,
+        {"provider": "message_db_async", "database_uri": MESSAGE_DB_URI, **conn_info},
+    )
+
+
+@pytest.fixture
+def store(test_domain):
+    store = _store(test_domain)
+    yield store
+    store.close()
+
+
+@pytest.fixture
+def offline_domain():
+    """A domain that is never initialised, so nothing connects to MessageDB."""
+    return Domain(name="Offline")
+
+
+class FakePool:
+    """Stands in for ``AsyncConnectionPool``, counting the pools opened."""
+
+    opened = 0
+
+    def __init__(self, *args, **kwargs) -> None:
+        pass
+
+    async def open(self, wait: bool = True, timeout: float = 0) -> None:
+        # Yield, as a real connection attempt would, so racing callers overlap
+        await asyncio.sleep(0.01)
+        FakePool.opened += 1
+
+    async def close(self) -> None:
+        pass
+
+
+@pytest.mark.no_test_domain
+class TestAsyncPoolConfig:
+    @pytest.mark.parametrize("bad", [0, -1, "ten", True, 1.5])
+    def test_bad_pool_sizes_are_rejected(self, offline_domain, bad):
+        with pytest.raises(ConfigurationError, match="async_max_connections"):
+            _store(offline_domain, async_max_connections=bad)
+
+    def test_min_cannot_exceed_max(self, offline_domain):
+        with pytest.raises(ConfigurationError, match="cannot exceed"):
+            _store(offline_domain, async_min_connections=5, async_max_connections=2)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_first_callers_share_one_pool(
+        self, offline_domain, monkeypatch
+    ):
+        monkeypatch.setattr(message_db_async, "AsyncConnectionPool", FakePool)
+        monkeypatch.setattr(FakePool, "opened", 0)
+        store = _store(offline_domain)
+
+        pools = await asyncio.gather(*(store._async_pool() for _ in range(5)))
+
+        assert FakePool.opened == 1
+        assert all(pool is pools[0] for pool in pools)
+
+
+@pytest.mark.message_db
+class TestAsyncMessageDBStore:
+    @pytest.mark.asyncio
+    async def test_write_then_read_a_stream(self, store):
+        for i in range(3):
+            position = await store._awrite("testStream-1", "Event1", {"n": i})
+
+        messages = await store._aread("testStream-1")
+
+        assert position == 2
+        assert [m["data"] for m in messages] == [{"n": 0}, {"n": 1}, {"n": 2}]
+        assert messages == store._read("testStream-1")
+
+    @pytest.mark.asyncio
+    async def test_category_and_all_reads_match_the_sync_path(self, store):
+        await store._awrite("testStream-1", "Event1", {"n": 1}, {"domain": {}})
+        await store._awrite("otherStream-2", "Event2", {"n": 2})
+
+        assert await store._aread("testStream") == store._read("testStream")
+        assert await store._aread("$all") == store._read("$all")
+
+    @pytest.mark.asyncio
+    async def test_read_last_message_of_a_stream_category_and_all(self, store):
+        await store._awrite("testStream-1", "Event1", {"n": 1})
+        await store._awrite("testStream-2", "Event1", {"n": 2})
+        await store._awrite("otherStream-3", "Event2", {"n": 3})
+
+        assert (await store._aread_last_message("testStream-1"))["data"] == {"n": 1}
+        assert (await store._aread_last_message("testStream"))["data"] == {"n": 2}
+        assert (await store._aread_last_message("$all"))["data"] == {"n": 3}
+        assert await store._aread_last_message("neverWritten") is None
+
+    @pytest.mark.asyncio
+    async def test_version_conflict_reads_like_the_sync_client(self, store):
+        await store._awrite("testStream-1", "Event1", {"n": 1})
+
+        with pytest.raises(ValueError, match="^P0001-ERROR:  Wrong expected version"):
+            await store._awrite("testStream-1", "Event1", {"n": 2}, expected_version=5)
+
+    @pytest.mark.asyncio
+    async def test_aclose_closes_the_pool(self, store):
+        await store._aread("testStream-1")
+        pool = store._apool
+
+        await store.aclose()
+
+        assert store._apool is None
+        assert pool.closed
+
+    def test_each_loop_gets_its_own_pool(self, store):
+        asyncio.run(store._aread("testStream-1"))
+        first = store._apool
+
+        asyncio.run(store._aread("testStream-1"))
+
+        assert store._apool is not first
+
+    def test_unreachable_database_raises_configuration_error(self, test_domain):
+        store = _store(
+            test_domain,
+            database_uri=MESSAGE_DB_URI.replace("/message_store?", "/dummy?"),
+            async_pool_timeout=2,
+        )
+
+        with pytest.raises(ConfigurationError, match="Unable to connect"):
+            asyncio.run(store._aread("testStream-1"))
+
+
+@pytest.mark.message_db
+@pytest.mark.slow
+class TestAsyncDriverBenchmark:
+    """Throughput and connection use of the async and threaded drivers.
+
+    Each reader pages the whole category, 100 messages a page, the way an
+    event-store subscription reads on every tick.
+    """
+
+    MESSAGES = 2_000
+    PAGE = 100
+
+    @pytest.fixture
+    def seeded(self, test_domain):
+        sync = MessageDBStore(test_domain, {"database_uri": MESSAGE_DB_URI})
+        for i in range(self.MESSAGES):
+            sync._write(f"bench-{i % 50}", "Ticked", {"n": i})
+        yield sync
+        sync.close()
+
+    async def _drain(self, read) -> int:
+        position, total = 0, 0
+        while True:
+            page = await read(position)
+            total += len(page)
+            if len(page) < self.PAGE:
+                return total
+            position = page[-1]["global_position"] + 1
+
+    async def _measure(self, read, open_connections, readers: int) -> dict:
+        peak = 0
+        done = asyncio.Event()
+
+        async def sample():
+            nonlocal peak
+            while not done.is_set():
+                peak = max(peak, open_connections())
+                await asyncio.sleep(0.005)
+
+        sampler = asyncio.create_task(sample())
+        start = time.perf_counter()
+        totals = await asyncio.gather(*(self._drain(read) for _ in range(readers)))
+        elapsed = time.perf_counter() - start
+        done.set()
+        await sampler
+
+        return {
+            "messages_per_second": sum(totals) / elapsed,
+            "peak_connections": peak,
+        }
+
+    def _threaded(self, sync: MessageDBStore, readers: int) -> dict:
+        async def read(position):
+            return await asyncio.to_thread(
+                sync._read, "bench", position=position, no_of_messages=self.PAGE
+            )
+
+        def open_connections():
+            pool = sync.client.connection_pool._connection_pool
+            return len(pool._used) + len(pool._pool)
+
+        return asyncio.run(self._measure(read, open_connections, readers))
+
+    def _async(self, test_domain, readers: int) -> dict:
+        store = _store(test_domain)
+
+        async def read(position):
+            return await store._aread(
+                "bench", position=position, no_of_messages=self.PAGE
+            )
+
+        def open_connections():
+            return store._apool.get_stats()["pool_size"] if store._apool else 0
+
+        async def run():
+            try:
+                return await self._measure(read, open_connections, readers)
+            finally:
+                await store.aclose()
+
+        return asyncio.run(run())
+
+    @pytest.mark.parametrize("readers", [1, 10, 100])
+    def test_async_driver_serves_more_readers_on_fewer_connections(
+        self, test_domain, seeded, readers
+    ):
+        threaded = self._threaded(seeded, readers)
+        native = self._async(test_domain, readers)
+        print(f"\n{readers} readers\n  threaded: {threaded}\n  async:    {native}")
+
+        # The async pool never grows past `async_max_connections` (10)
+        assert native["peak_connections"] <= 10
+        if readers >= 10:
+            assert native["peak_connections"] <= threaded["peak_connections"]
+        # ...and serving every reader from it costs no throughput
+        assert native["messages_per_second"] >= threaded["messages_per_second"] * 0.8
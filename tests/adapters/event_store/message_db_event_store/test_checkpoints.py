@@ -0,0 +1,75 @@
+"""MessageDB integration tests for subscription checkpoints.
+
+Checkpoints live in the ``message_store.protean_checkpoints`` side table,
+upserted in place, and legacy position streams compact into it.
+"""
+
+from datetime import UTC, datetime
+
+import pytest
+
+EARLIER = datetime(2026, 1, 1, tzinfo=UTC)
+LATER = datetime(2026, 1, 2, tzinfo=UTC)
+
+
+def _write_legacy_position(store, name: str, position: int) -> None:
+    store._write(
+        name,
+        "Read",
+        {"position": position},
+        {
+            "domain": {"kind": "READ_POSITION"},
+            "headers": {"type": "Read", "stream": name, "time": EARLIER.isoformat()},
+        },
+    )
+
+
+@pytest.mark.message_db
+class TestMessageDBCheckpoints:
+    @pytest.fixture(autouse=True)
+    def initialize_domain(self, test_domain):
+        test_domain.init(traverse=False)
+
+    def test_checkpoint_is_upserted_in_place(self, test_domain):
+        store = test_domain.event_store.store
+        store.write_checkpoint("position-a-x", 1, EARLIER)
+        store.write_checkpoint("position-a-x", 2, LATER)
+
+        checkpoint = store.read_checkpoint("position-a-x")
+
+        assert checkpoint.position == 2
+        assert checkpoint.updated_at == LATER
+        assert store._read("$all") == []
+
+    def test_legacy_position_stream_is_read_through(self, test_domain):
+        store = test_domain.event_store.store
+        _write_legacy_position(store, "position-a-x", 7)
+
+        assert store.read_checkpoint("position-a-x").position == 7
+
+    def test_compaction_migrates_and_deletes_position_streams(self, test_domain):
+        store = test_domain.event_store.store
+        _write_legacy_position(store, "position-a-x", 3)
+        _write_legacy_position(store, "position-a-x", 4)
+        store._write(
+            "test::user-1",
+            "Registered",
+            {"id": "1"},
+            {"domain": {"kind": "EVENT"}, "headers": {"type": "Registered"}},
+        )
+
+        report = store.compact_position_streams()
+
+        assert report.streams == ("position-a-x",)
+        assert report.migrated_count == 1
+        assert report.message_count == 2
+        assert store.checkpoints.read("position-a-x").position == 4
+        assert [m["stream_name"] for m in store._read("$all")] == ["test::user-1"]
+
+    def test_data_reset_truncates_checkpoints(self, test_domain):
+        store = test_domain.event_store.store
+        store.write_checkpoint("position-a-x", 1, EARLIER)
+
+        store._data_reset()
+
+        assert store.checkpoints.read("position-a-x") is None
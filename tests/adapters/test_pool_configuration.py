@@ -10,6 +10,7 @@ These tests verify that:
 from unittest.mock import patch
 
 import pytest
+import redis
 
 from protean import Domain
 from protean.adapters.broker.redis import RedisBroker
@@ -94,6 +95,47 @@ class TestRedisBrokerPoolConfig:
             reconnect_call = mock_from_url.call_args_list[1]
             assert reconnect_call.kwargs == {"max_connections": 25}
 
+    def test_pool_timeout_uses_a_blocking_pool(self, test_domain):
+        """With max_connections, pool_timeout makes callers wait for a connection."""
+        conn_info = {
+            "URI": "redis://localhost:6379/0",
+            "max_connections": 5,
+            "pool_timeout": 2,
+        }
+        with patch("redis.Redis.from_url") as mock_from_url:
+            broker = RedisBroker("test", test_domain, conn_info)
+
+        mock_from_url.assert_not_called()
+        pool = broker.redis_instance.connection_pool
+        assert isinstance(pool, redis.BlockingConnectionPool)
+        assert pool.max_connections == 5
+        assert pool.timeout == 2.0
+        assert "pool_timeout" not in broker._pool_kwargs
+
+    def test_close_disconnects_the_blocking_pool(self, test_domain):
+        """The client does not own a pool it was given, so ``close()`` closes it."""
+        conn_info = {
+            "URI": "redis://localhost:6379/0",
+            "max_connections": 5,
+            "pool_timeout": 2,
+        }
+        broker = RedisBroker("test", test_domain, conn_info)
+        pool = broker.redis_instance.connection_pool
+
+        with patch.object(pool, "disconnect") as disconnect:
+            broker.close()
+
+        disconnect.assert_called_once_with()
+        assert broker._blocking_pool is None
+
+    def test_pool_timeout_without_max_connections_is_ignored(self, test_domain):
+        """An unbounded pool never runs out, so pool_timeout has no effect."""
+        conn_info = {"URI": "redis://localhost:6379/0", "pool_timeout": 2}
+        with patch("redis.Redis.from_url") as mock_from_url:
+            RedisBroker("test", test_domain, conn_info)
+
+        mock_from_url.assert_called_once_with("redis://localhost:6379/0")
+
     @pytest.mark.redis
     @pytest.mark.no_test_domain
     def test_redis_broker_with_max_connections(self, test_domain):
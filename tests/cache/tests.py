@@ -4,6 +4,7 @@ import pytest
 
 from protean.adapters.cache.memory import MemoryCache
 from protean.core.projection import BaseProjection
+from protean.exceptions import NotSupportedError
 from protean.fields import Identifier, String
 from protean.port.cache import BaseCache
 
@@ -19,6 +20,16 @@ class TestCacheInitialization:
         with pytest.raises(TypeError):
             BaseCache()
 
+    def test_that_raw_values_are_optional_for_an_adapter(self, test_domain):
+        """Third-party adapters written before query caching still load."""
+        assert {"_get_raw", "_set_raw"}.isdisjoint(BaseCache.__abstractmethods__)
+
+        cache = MemoryCache("dummy_name", test_domain, {})
+        with pytest.raises(NotSupportedError, match="does not support raw values"):
+            BaseCache._get_raw(cache, ["key"])
+        with pytest.raises(NotSupportedError, match="does not support raw values"):
+            BaseCache._set_raw(cache, "key", b"value")
+
     def test_that_a_concrete_cache_can_be_initialized_successfully(self, test_domain):
         cache = MemoryCache("dummy_name", test_domain, {})
         assert cache is not None
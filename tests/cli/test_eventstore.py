@@ -10,8 +10,13 @@ import pytest
 from typer.testing import CliRunner
 
 from protean.cli import app
-from protean.exceptions import NoDomainException
-from protean.port.event_store import BaseEventStore, IntegrityReport, IntegrityViolation
+from protean.exceptions import NoDomainException, NotSupportedError
+from protean.port.event_store import (
+    BaseEventStore,
+    CompactionReport,
+    IntegrityReport,
+    IntegrityViolation,
+)
 from tests.shared import change_working_directory_to
 
 # A wide terminal so Rich never wraps a violation token mid-string, keeping the
@@ -218,6 +223,94 @@ class TestEventStoreVerify:
         assert payload["status"] == "error"
 
 
+class TestEventStoreCompactPositions:
+    @pytest.fixture(autouse=True)
+    def reset_path(self):
+        original_path = sys.path[:]
+        cwd = Path.cwd()
+        yield
+        sys.path[:] = original_path
+        os.chdir(cwd)
+
+    def _invoke(self, mock_domain: MagicMock, *extra_args: str):
+        change_working_directory_to("test7")
+        mock_domain.domain_context.return_value.__enter__.return_value = None
+        mock_domain.domain_context.return_value.__exit__.return_value = False
+        with patch("protean.cli._helpers.derive_domain", return_value=mock_domain):
+            return runner.invoke(
+                app,
+                [
+                    "eventstore",
+                    "compact-positions",
+                    "--domain",
+                    "publishing7.py",
+                    *extra_args,
+                ],
+            )
+
+    def _domain_with_report(self, report: CompactionReport) -> MagicMock:
+        mock_domain = MagicMock()
+        mock_domain.event_store.store.compact_position_streams.return_value = report
+        return mock_domain
+
+    def test_compaction_summary(self):
+        report = CompactionReport(
+            streams=("position-a-x", "position-b-y"),
+            migrated_count=1,
+            message_count=120,
+        )
+        mock_domain = self._domain_with_report(report)
+        result = self._invoke(mock_domain)
+
+        assert result.exit_code == 0
+        assert "Compacted 2 position stream(s)" in result.output
+        assert "1 migrated to checkpoints" in result.output
+        assert "120 message(s) removed" in result.output
+        store = mock_domain.event_store.store
+        store.compact_position_streams.assert_called_once_with(dry_run=False)
+
+    def test_dry_run(self):
+        report = CompactionReport(
+            streams=("position-a-x",), migrated_count=1, message_count=3, dry_run=True
+        )
+        mock_domain = self._domain_with_report(report)
+        result = self._invoke(mock_domain, "--dry-run")
+
+        assert result.exit_code == 0
+        assert "Would compact 1 position stream(s)" in result.output
+        store = mock_domain.event_store.store
+        store.compact_position_streams.assert_called_once_with(dry_run=True)
+
+    def test_json_emits_pass_envelope(self):
+        report = CompactionReport(
+            streams=("position-a-x",), migrated_count=1, message_count=3
+        )
+        result = self._invoke(self._domain_with_report(report), "--json")
+
+        assert result.exit_code == 0
+        payload = json.loads(result.stdout)
+        assert payload["status"] == "pass"
+        assert payload["data"] == {
+            "streams": ["position-a-x"],
+            "stream_count": 1,
+            "migrated_count": 1,
+            "message_count": 3,
+            "dry_run": False,
+        }
+
+    def test_store_without_checkpoint_store_is_a_usage_error(self):
+        mock_domain = MagicMock()
+        mock_domain.event_store.store.compact_position_streams.side_effect = (
+            NotSupportedError("no checkpoint store to compact them into")
+        )
+        result = self._invoke(mock_domain, "--json")
+
+        assert result.exit_code == 2
+        payload = json.loads(result.stdout)
+        assert payload["status"] == "error"
+        assert "no checkpoint store" in payload["data"]["error"]
+
+
 @pytest.mark.no_test_domain
 class TestEventStoreVerifyEndToEnd:
     """Run the command against a real domain, exercising verify -> envelope -> exit.
@@ -269,6 +362,17 @@ class TestEventStoreVerifyEndToEnd:
         assert payload["status"] == "pass"
         assert payload["data"]["ok"] is True
 
+    def test_real_store_compact_positions(self, tmp_path):
+        domain_file = self._write_domain(tmp_path)
+        os.chdir(tmp_path)
+
+        result = runner.invoke(
+            app, ["eventstore", "compact-positions", "--domain", str(domain_file)]
+        )
+
+        assert result.exit_code == 0
+        assert "Compacted 0 position stream(s)" in result.output
+
 
 @pytest.mark.no_test_domain
 def test_documented_violation_kinds_match_the_constants():
@@ -122,7 +122,7 @@ class TestCliExceptionHandler:
         """typer.Exit passes through the handler without logging."""
         change_working_directory_to("test7")
 
-        with patch("protean.cli.Engine") as MockEngine:
+        with patch("protean.server.engine.Engine") as MockEngine:
             mock_engine = MockEngine.return_value
             mock_engine.exit_code = 42
 
@@ -106,6 +106,16 @@ class TestBuildStalenessParser:
         args = parser.parse_args(["-f"])
         assert args.fix is True
 
+    def test_cache_flag_default_false(self):
+        parser = _build_staleness_parser()
+        args = parser.parse_args([])
+        assert args.cache is False
+
+    def test_cache_flag(self):
+        parser = _build_staleness_parser()
+        args = parser.parse_args(["--cache"])
+        assert args.cache is True
+
     def test_fix_help_advertises_canonical_output(self):
         """The --fix help makes the canonical-baseline guarantee discoverable so
         projects committing canonical baselines know it is safe to enable.
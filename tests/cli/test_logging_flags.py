@@ -40,7 +40,7 @@ class TestLogLevelFlag:
         """--log-level DEBUG sets the root logger level to DEBUG."""
         change_working_directory_to("test7")
 
-        with patch("protean.cli.Engine") as MockEngine:
+        with patch("protean.server.engine.Engine") as MockEngine:
             mock_engine = MockEngine.return_value
             mock_engine.exit_code = 0
 
@@ -56,7 +56,7 @@ class TestLogLevelFlag:
         """--log-level WARNING sets the root logger level to WARNING."""
         change_working_directory_to("test7")
 
-        with patch("protean.cli.Engine") as MockEngine:
+        with patch("protean.server.engine.Engine") as MockEngine:
             mock_engine = MockEngine.return_value
             mock_engine.exit_code = 0
 
@@ -79,7 +79,7 @@ class TestLogLevelFlag:
         """--log-level accepts lowercase values."""
         change_working_directory_to("test7")
 
-        with patch("protean.cli.Engine") as MockEngine:
+        with patch("protean.server.engine.Engine") as MockEngine:
             mock_engine = MockEngine.return_value
             mock_engine.exit_code = 0
 
@@ -99,7 +99,7 @@ class TestLogFormatFlag:
 
         change_working_directory_to("test7")
 
-        with patch("protean.cli.Engine") as MockEngine:
+        with patch("protean.server.engine.Engine") as MockEngine:
             mock_engine = MockEngine.return_value
             mock_engine.exit_code = 0
 
@@ -152,7 +152,7 @@ class TestLogConfigFlag:
         config_file = tmp_path / "log_config.json"
         config_file.write_text(json.dumps(custom_config))
 
-        with patch("protean.cli.Engine") as MockEngine:
+        with patch("protean.server.engine.Engine") as MockEngine:
             mock_engine = MockEngine.return_value
             mock_engine.exit_code = 0
 
@@ -218,7 +218,7 @@ class TestRemovedDebugFlag:
         """--debug was removed; --log-level DEBUG is the supported replacement."""
         change_working_directory_to("test7")
 
-        with patch("protean.cli.Engine") as MockEngine:
+        with patch("protean.server.engine.Engine") as MockEngine:
             mock_engine = MockEngine.return_value
             mock_engine.exit_code = 0
 
@@ -243,7 +243,7 @@ class TestRemovedDebugFlag:
         change_working_directory_to("test7")
 
         with (
-            patch("protean.cli.Engine") as MockEngine,
+            patch("protean.server.engine.Engine") as MockEngine,
             patch.dict(os.environ, {"PROTEAN_LOG_LEVEL": "DEBUG"}),
         ):
             mock_engine = MockEngine.return_value
@@ -259,7 +259,7 @@ class TestRemovedDebugFlag:
         change_working_directory_to("test7")
         monkeypatch.delenv("PROTEAN_LOG_LEVEL", raising=False)
 
-        with patch("protean.cli.Engine") as MockEngine:
+        with patch("protean.server.engine.Engine") as MockEngine:
             mock_engine = MockEngine.return_value
             mock_engine.exit_code = 0
 
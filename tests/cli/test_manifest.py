@@ -0,0 +1,67 @@
+"""Tests for CLI manifest commands (protean manifest ...)."""
+
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from typer.testing import CliRunner
+
+from protean.cli import app
+from protean.domain.manifest import ManifestStatus
+from protean.exceptions import NoDomainException
+
+runner = CliRunner()
+
+
+class TestManifestBuild:
+    def test_build_writes_manifest_without_initializing_the_domain(self):
+        domain = MagicMock()
+        with (
+            patch("protean.cli.manifest.derive_domain", return_value=domain),
+            patch(
+                "protean.domain.manifest.build_manifest",
+                return_value=Path("app/.protean/manifest.json"),
+            ) as build,
+        ):
+            result = runner.invoke(app, ["manifest", "build", "--domain", "x.py"])
+
+        assert result.exit_code == 0, result.output
+        assert "manifest.json" in result.output
+        build.assert_called_once_with(domain)
+        domain.init.assert_not_called()
+
+    def test_build_aborts_when_domain_is_not_found(self):
+        with patch(
+            "protean.cli.manifest.derive_domain",
+            side_effect=NoDomainException("nope"),
+        ):
+            result = runner.invoke(app, ["manifest", "build", "--domain", "x.py"])
+
+        assert result.exit_code != 0
+        assert "Error loading Protean domain" in result.output
+
+
+class TestManifestCheck:
+    def _check(self, status):
+        with (
+            patch("protean.cli.manifest.derive_domain", return_value=MagicMock()),
+            patch("protean.domain.manifest.manifest_status", return_value=status),
+        ):
+            return runner.invoke(app, ["manifest", "check", "--domain", "x.py"])
+
+    def test_fresh_manifest_exits_zero(self):
+        result = self._check(ManifestStatus.FRESH)
+
+        assert result.exit_code == 0, result.output
+        assert "fresh" in result.output
+
+    def test_stale_manifest_exits_one(self):
+        result = self._check(ManifestStatus.STALE)
+
+        assert result.exit_code == 1
+        assert "stale" in result.output
+
+    def test_missing_manifest_exits_one(self):
+        result = self._check(ManifestStatus.NO_MANIFEST)
+
+        assert result.exit_code == 1
+        assert "No element manifest" in result.output
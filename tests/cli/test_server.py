@@ -99,7 +99,7 @@ class TestServerCommand:
         change_working_directory_to("test7")
 
         # Mock the Engine class entirely
-        with patch("protean.cli.Engine") as MockEngine:
+        with patch("protean.server.engine.Engine") as MockEngine:
             mock_engine_instance = MockEngine.return_value
             mock_engine_instance.exit_code = 0  # Set the exit code
 
@@ -131,7 +131,7 @@ class TestServerCommand:
         """Test that the server command raises a TyperExit with the correct exit code on error in run"""
         change_working_directory_to("test7")
 
-        with patch("protean.cli.Engine.run", side_effect=SystemExit(1)):
+        with patch("protean.server.engine.Engine.run", side_effect=SystemExit(1)):
             args = ["server", "--domain", "publishing7.py"]
             result = runner.invoke(app, args)
 
@@ -150,7 +150,7 @@ class TestServerCommand:
         mock_engine.exit_code = expected_exit_code
 
         # Patch the Engine class to return our mock instance
-        with patch("protean.cli.Engine", return_value=mock_engine):
+        with patch("protean.server.engine.Engine", return_value=mock_engine):
             args = ["server", "--domain", "publishing7.py"]
             result = runner.invoke(app, args)
 
@@ -0,0 +1,374 @@
+"""Per-aggregate command mailboxes.
+
+With ``command_mailbox`` enabled, commands for the same aggregate run one at a
+time, in arrival order, instead of racing to commit and retrying on version
+conflicts. With ``combine`` on, commands waiting for the same aggregate run in
+one UnitOfWork.
+"""
+
+import threading
+import time
+from uuid import uuid4
+
+import pytest
+
+from protean import current_domain
+from protean.adapters.repository.memory import MemorySession
+from protean.core.aggregate import BaseAggregate
+from protean.core.command import BaseCommand
+from protean.core.command_handler import BaseCommandHandler
+from protean.core.unit_of_work import UnitOfWork
+from protean.domain.mailbox import AggregateMailbox
+from protean.exceptions import ExpectedVersionError
+from protean.fields import Identifier, Integer
+from protean.server import Engine
+from protean.utils import Processing
+from protean.utils.globals import current_uow
+from protean.utils.mixins import handle
+
+
+class Inventory(BaseAggregate):
+    sku: Identifier(identifier=True)
+    available: Integer(default=0)
+
+
+class Reserve(BaseCommand):
+    sku: Identifier(identifier=True)
+    quantity: Integer()
+
+
+class InventoryCommandHandler(BaseCommandHandler):
+    @handle(Reserve)
+    def reserve(self, command: Reserve) -> int:
+        if command.quantity < 0:
+            raise ValueError("Cannot reserve a negative quantity")
+
+        repo = current_domain.repository_for(Inventory)
+        inventory = repo.get(command.sku)
+        inventory.available -= command.quantity
+        repo.add(inventory)
+        return inventory.available
+
+
+@pytest.fixture(autouse=True)
+def register(test_domain):
+    test_domain.register(Inventory)
+    test_domain.register(Reserve, part_of=Inventory)
+    test_domain.register(InventoryCommandHandler, part_of=Inventory)
+    test_domain.init(traverse=False)
+
+
+@pytest.fixture
+def sku(test_domain):
+    sku = str(uuid4())
+    test_domain.repository_for(Inventory).add(Inventory(sku=sku, available=1_000))
+    return sku
+
+
+def _configure(test_domain, enabled=True, combine=False, retry=True):
+    test_domain.config["command_mailbox"] = {
+        "enabled": enabled,
+        "combine": combine,
+        "max_batch": 50,
+    }
+    test_domain.config["server"]["version_retry"]["enabled"] = retry
+    # Re-resolved without a full `init()`, which would reset the stored
+    # inventory
+    test_domain._handler_configurator.resolve_retry_policies()
+
+
+def _reserve_concurrently(test_domain, sku, callers, per_caller=1):
+    """Process ``callers * per_caller`` reservations of 1 from ``callers`` threads."""
+    barrier = threading.Barrier(callers)
+    errors: list[BaseException] = []
+
+    def caller():
+        with test_domain.domain_context():
+            barrier.wait()
+            for _ in range(per_caller):
+                try:
+                    test_domain.process(
+                        Reserve(sku=sku, quantity=1), asynchronous=False
+                    )
+                except Exception as exc:
+                    errors.append(exc)
+
+    threads = [threading.Thread(target=caller) for _ in range(callers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return errors
+
+
+def _available(test_domain, sku):
+    return test_domain.repository_for(Inventory).get(sku).available
+
+
+class TestProcess:
+    def test_the_mailbox_is_off_by_default(self, test_domain):
+        assert test_domain.config["command_mailbox"]["enabled"] is False
+
+    def test_commands_for_one_aggregate_never_conflict(self, test_domain, sku):
+        _configure(test_domain, retry=False)
+
+        errors = _reserve_concurrently(test_domain, sku, callers=8, per_caller=5)
+
+        assert errors == []
+        assert _available(test_domain, sku) == 1_000 - 40
+
+    def test_combined_commands_never_conflict(self, test_domain, sku):
+        _configure(test_domain, combine=True, retry=False)
+
+        errors = _reserve_concurrently(test_domain, sku, callers=8, per_caller=5)
+
+        assert errors == []
+        assert _available(test_domain, sku) == 1_000 - 40
+
+    def test_each_caller_gets_its_own_result(self, test_domain, sku):
+        _configure(test_domain, combine=True)
+
+        result = test_domain.process(Reserve(sku=sku, quantity=10), asynchronous=False)
+
+        assert result == 990
+
+    def test_commands_inside_a_unit_of_work_join_it(self, test_domain, sku, mocker):
+        _configure(test_domain)
+        submit = mocker.spy(AggregateMailbox, "submit")
+
+        with UnitOfWork():
+            test_domain.process(Reserve(sku=sku, quantity=1), asynchronous=False)
+
+        submit.assert_not_called()
+        assert _available(test_domain, sku) == 999
+
+
+class TestMailbox:
+    def _queue_behind(self, test_domain, mailbox, key, jobs, max_batch=50):
+        """Submit ``jobs`` for ``key`` while a first one holds it.
+
+        Returns each job's outcome (or raised exception) in submission order,
+        once all of them have run.
+        """
+        release = threading.Event()
+        outcomes: dict[int, object] = {}
+
+        def submit(index, fn):
+            with test_domain.domain_context():
+                try:
+                    outcomes[index] = mailbox.submit(key, fn, max_batch=max_batch)
+                except Exception as exc:
+                    outcomes[index] = exc
+
+        first = threading.Thread(target=submit, args=(-1, release.wait))
+        first.start()
+        while key not in mailbox._queues:
+            time.sleep(0.001)
+
+        threads = []
+        for index, fn in enumerate(jobs):
+            thread = threading.Thread(target=submit, args=(index, fn))
+            thread.start()
+            threads.append(thread)
+            while len(mailbox._queues[key]) <= index:
+                time.sleep(0.001)
+
+        release.set()
+        for thread in [first, *threads]:
+            thread.join()
+        return [outcomes[index] for index in range(len(jobs))]
+
+    def test_waiting_commands_run_in_arrival_order(self, test_domain):
+        mailbox = AggregateMailbox()
+        ran: list[int] = []
+
+        self._queue_behind(
+            test_domain,
+            mailbox,
+            "a",
+            [lambda n=n: ran.append(n) for n in range(5)],
+            max_batch=1,
+        )
+
+        assert ran == [0, 1, 2, 3, 4]
+        assert mailbox._queues == {}
+
+    def test_waiting_commands_combine_into_one_unit_of_work(self, test_domain):
+        mailbox = AggregateMailbox()
+
+        def uow_id():
+            with UnitOfWork():
+                return id(current_uow._get_current_object())
+
+        outcomes = self._queue_behind(test_domain, mailbox, "a", [uow_id] * 3)
+
+        assert len(set(outcomes)) == 1
+
+    def test_a_failed_command_fails_alone(self, test_domain):
+        mailbox = AggregateMailbox()
+
+        def fail():
+            with UnitOfWork():
+                raise ValueError("boom")
+
+        outcomes = self._queue_behind(
+            test_domain, mailbox, "a", [lambda: 1, fail, lambda: 3]
+        )
+
+        assert outcomes[0] == 1
+        assert isinstance(outcomes[1], ValueError)
+        assert outcomes[2] == 3
+
+    def test_a_command_submitted_while_running_its_key_runs_at_once(self):
+        mailbox = AggregateMailbox()
+
+        result = mailbox.submit("a", lambda: mailbox.submit("a", lambda: "inner"))
+
+        assert result == "inner"
+
+    def test_different_keys_do_not_wait_for_each_other(self, test_domain):
+        mailbox = AggregateMailbox()
+        release = threading.Event()
+        holder = threading.Thread(target=mailbox.submit, args=("a", release.wait))
+        holder.start()
+        while "a" not in mailbox._queues:
+            time.sleep(0.001)
+
+        assert mailbox.submit("b", lambda: "b") == "b"
+
+        release.set()
+        holder.join()
+
+
+class TestEngine:
+    @pytest.fixture
+    def commands(self, test_domain, sku):
+        test_domain.config["command_processing"] = Processing.ASYNC.value
+        other = str(uuid4())
+        test_domain.repository_for(Inventory).add(Inventory(sku=other, available=10))
+        for target in (sku, other, sku, sku):
+            test_domain.process(Reserve(sku=target, quantity=1), asynchronous=True)
+        return test_domain.event_store.store.read("test::inventory:command")
+
+    @pytest.fixture
+    def commits(self, monkeypatch):
+        counted: list[UnitOfWork] = []
+        commit = UnitOfWork.commit
+
+        def counting_commit(uow):
+            if not uow._nested:
+                counted.append(uow)
+            return commit(uow)
+
+        monkeypatch.setattr(UnitOfWork, "commit", counting_commit)
+        return counted
+
+    def _subscription(self, test_domain):
+        engine = Engine(domain=test_domain, test_mode=True)
+        (subscription,) = [
+            subscription
+            for key, subscription in engine._subscriptions.items()
+            if key.startswith("commands:")
+        ]
+        return engine, subscription
+
+    def test_runs_are_split_per_aggregate_in_read_order(self, commands):
+        runs = Engine._aggregate_runs(commands, max_batch=2)
+
+        streams = [[m.metadata.headers.stream for m in run] for run in runs]
+        assert [len(run) for run in runs] == [2, 1, 1]
+        assert all(len(set(run)) == 1 for run in streams)
+        assert runs[0] == [commands[0], commands[2]]
+
+    @pytest.mark.asyncio
+    async def test_a_batch_commits_once_per_aggregate(
+        self, test_domain, sku, commands, commits
+    ):
+        _configure(test_domain, combine=True)
+        engine, subscription = self._subscription(test_domain)
+        assert subscription.micro_batch
+
+        results = await engine.handle_batch(subscription.handler, commands)
+
+        assert results == [True] * 4
+        assert len(commits) == 2
+        assert _available(test_domain, sku) == 997
+
+    @pytest.mark.asyncio
+    async def test_commands_are_not_combined_unless_configured(
+        self, test_domain, commands
+    ):
+        _configure(test_domain)
+        _, subscription = self._subscription(test_domain)
+
+        assert subscription.handler.combine_max_batch == 0
+        assert not subscription.micro_batch
+
+
+@pytest.mark.slow
+class TestContendedAggregateBenchmark:
+    """Commits/s on a single contended aggregate at rising concurrency: racing
+    with version retries, through the mailbox, and through the mailbox with
+    commands combined.
+
+    Every commit waits a couple of milliseconds, standing in for a database
+    round trip: the in-memory store commits in microseconds, so without it
+    concurrent callers would barely overlap. Commands go straight to their
+    handler, as ``domain.process()`` hands them over after storing them.
+    """
+
+    COMMANDS = 64
+    COMMIT_LATENCY = 0.002
+
+    @pytest.fixture(autouse=True)
+    def slow_commits(self, monkeypatch):
+        commit = MemorySession.commit
+
+        def slow_commit(session):
+            time.sleep(self.COMMIT_LATENCY)
+            return commit(session)
+
+        monkeypatch.setattr(MemorySession, "commit", slow_commit)
+
+    def _rate(self, test_domain, callers, **config):
+        sku = str(uuid4())
+        test_domain.repository_for(Inventory).add(Inventory(sku=sku, available=10_000))
+        _configure(test_domain, **config)
+        processor = test_domain._command_processor
+        barrier = threading.Barrier(callers)
+        errors: list[BaseException] = []
+
+        def caller():
+            with test_domain.domain_context():
+                barrier.wait()
+                for _ in range(self.COMMANDS // callers):
+                    command = processor.enrich(Reserve(sku=sku, quantity=1), False)
+                    try:
+                        processor._execute(InventoryCommandHandler, command)
+                    except ExpectedVersionError as exc:
+                        errors.append(exc)
+
+        threads = [threading.Thread(target=caller) for _ in range(callers)]
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - start
+
+        committed = 10_000 - _available(test_domain, sku)
+        assert committed == self.COMMANDS - len(errors)
+        return committed / elapsed
+
+    def test_the_mailbox_keeps_throughput_as_concurrency_rises(self, test_domain):
+        for callers in (1, 4, 16):
+            racing = self._rate(test_domain, callers, enabled=False)
+            serialized = self._rate(test_domain, callers)
+            combined = self._rate(test_domain, callers, combine=True)
+            print(
+                f"\n{callers} callers: {racing:,.0f}/s racing, "
+                f"{serialized:,.0f}/s mailbox, {combined:,.0f}/s combined"
+            )
+
+        assert serialized > racing
+        assert combined > racing
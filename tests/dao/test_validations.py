@@ -1,6 +1,10 @@
+from unittest.mock import patch
+
 import pytest
 
+from protean.core.aggregate import BaseAggregate
 from protean.exceptions import ValidationError
+from protean.fields import String
 
 from .elements import Person, PersonRepository, User
 
@@ -76,3 +80,55 @@ class TestValidations:
                 "Input should be a valid integer, unable to parse string as an integer"
             ]
         }
+
+
+class Member(BaseAggregate):
+    email: String(max_length=255, unique=True)
+    username: String(max_length=50, unique=True)
+    name: String(max_length=50)
+
+
+class TestUniqueValidationQueries:
+    @pytest.fixture(autouse=True)
+    def register_elements(self, test_domain):
+        test_domain.register(Member)
+        test_domain.init(traverse=False)
+
+    @pytest.fixture
+    def dao(self, test_domain):
+        dao = test_domain.repository_for(Member)._dao
+        dao.create(email="john@example.com", username="john", name="John")
+        return dao
+
+    def test_all_unique_fields_are_checked_in_one_query(self, dao):
+        with (
+            patch.object(dao, "_filter", wraps=dao._filter) as filter_spy,
+            patch.object(dao, "exists", wraps=dao.exists) as exists_spy,
+        ):
+            dao.create(email="jane@example.com", username="jane", name="Jane")
+
+        assert filter_spy.call_count == 1
+        exists_spy.assert_not_called()
+
+    def test_collision_on_a_later_unique_field_is_reported(self, dao):
+        with pytest.raises(ValidationError) as err:
+            dao.create(email="jane@example.com", username="john", name="Jane")
+
+        assert err.value.messages == {
+            "username": ["Member with username 'john' is already present."]
+        }
+
+    def test_first_colliding_field_is_reported_when_several_collide(self, dao):
+        dao.create(email="jane@example.com", username="jane", name="Jane")
+
+        with pytest.raises(ValidationError) as err:
+            dao.create(email="john@example.com", username="jane", name="Other")
+
+        assert list(err.value.messages) == ["email"]
+
+    def test_update_excludes_the_record_itself(self, dao):
+        member = dao.query.filter(username="john").all().first
+
+        updated = dao.update(member, name="Johnny")
+
+        assert updated.name == "Johnny"
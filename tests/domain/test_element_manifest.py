@@ -0,0 +1,177 @@
+"""Tests for the precompiled element manifest (``protean.domain.manifest``)."""
+
+import importlib
+import json
+import os
+import sys
+import uuid
+
+import pytest
+
+from protean.domain import manifest as manifest_module
+from protean.domain.manifest import (
+    ManifestStatus,
+    build_manifest,
+    manifest_path,
+    manifest_status,
+)
+
+pytestmark = pytest.mark.no_test_domain
+
+
+DOMAIN_SOURCE = """\
+from protean import Domain
+
+domain = Domain(name="Shop")
+"""
+
+ELEMENTS_SOURCE = """\
+from protean.core.aggregate import BaseAggregate
+from protean.fields import String
+
+from {package}.domain import domain
+
+
+@domain.aggregate
+class Order(BaseAggregate):
+    name = String()
+"""
+
+HELPERS_SOURCE = """\
+VALUE = 42
+"""
+
+
+@pytest.fixture
+def shop(tmp_path):
+    """A throwaway domain package with one element module and one helper."""
+    package = f"shop_{uuid.uuid4().hex[:8]}"
+    package_dir = tmp_path / package
+    package_dir.mkdir()
+    (package_dir / "__init__.py").write_text("")
+    (package_dir / "domain.py").write_text(DOMAIN_SOURCE)
+    (package_dir / "elements.py").write_text(ELEMENTS_SOURCE.format(package=package))
+    (package_dir / "helpers.py").write_text(HELPERS_SOURCE)
+
+    sys.path.insert(0, str(tmp_path))
+    yield package, package_dir
+
+    sys.path.remove(str(tmp_path))
+    _purge(package)
+
+
+def _purge(package):
+    for name in [m for m in sys.modules if m == package or m.startswith(package)]:
+        del sys.modules[name]
+
+
+def _fresh_domain(package):
+    """Import the domain module anew, as a freshly spawned worker would."""
+    _purge(package)
+    return importlib.import_module(f"{package}.domain").domain
+
+
+def _touch(path):
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+class TestBuildManifest:
+    def test_records_only_modules_that_register_elements(self, shop):
+        package, package_dir = shop
+
+        path = build_manifest(_fresh_domain(package))
+
+        assert path == manifest_path(package_dir)
+        data = json.loads(path.read_text())
+        modules = [module_name for module_name, _ in data["modules"]]
+        assert f"{package}.elements" in modules
+        assert f"{package}.helpers" not in modules
+        assert set(data["files"]) == {
+            "__init__.py",
+            "domain.py",
+            "elements.py",
+            "helpers.py",
+        }
+
+    def test_fresh_after_build(self, shop):
+        package, _ = shop
+
+        build_manifest(_fresh_domain(package))
+
+        assert manifest_status(_fresh_domain(package)) == ManifestStatus.FRESH
+
+
+class TestInitWithManifest:
+    def test_without_manifest_every_module_is_loaded(self, shop):
+        package, _ = shop
+        domain = _fresh_domain(package)
+
+        assert manifest_status(domain) == ManifestStatus.NO_MANIFEST
+        domain.init()
+
+        assert f"{package}.helpers" in sys.modules
+        assert "Order" in [
+            cls.__name__ for cls in domain.registry.elements["aggregates"]
+        ]
+
+    def test_fresh_manifest_skips_element_free_modules(self, shop):
+        package, _ = shop
+        build_manifest(_fresh_domain(package))
+
+        domain = _fresh_domain(package)
+        domain.init()
+
+        assert f"{package}.helpers" not in sys.modules
+        assert "Order" in [
+            cls.__name__ for cls in domain.registry.elements["aggregates"]
+        ]
+
+    def test_edited_file_makes_manifest_stale(self, shop):
+        package, package_dir = shop
+        build_manifest(_fresh_domain(package))
+        _touch(package_dir / "helpers.py")
+
+        domain = _fresh_domain(package)
+        assert manifest_status(domain) == ManifestStatus.STALE
+        domain.init()
+
+        assert f"{package}.helpers" in sys.modules
+
+    def test_new_file_makes_manifest_stale(self, shop):
+        package, package_dir = shop
+        build_manifest(_fresh_domain(package))
+        (package_dir / "extra.py").write_text(HELPERS_SOURCE)
+
+        assert manifest_status(_fresh_domain(package)) == ManifestStatus.STALE
+
+    def test_protean_upgrade_makes_manifest_stale(self, shop, monkeypatch):
+        package, _ = shop
+        build_manifest(_fresh_domain(package))
+        monkeypatch.setattr(manifest_module, "__version__", "0.0.0")
+
+        assert manifest_status(_fresh_domain(package)) == ManifestStatus.STALE
+
+    def test_unreadable_manifest_falls_back_to_full_traversal(self, shop):
+        package, package_dir = shop
+        path = manifest_path(package_dir)
+        path.parent.mkdir()
+        path.write_text("{not json")
+
+        domain = _fresh_domain(package)
+        assert manifest_status(domain) == ManifestStatus.NO_MANIFEST
+        domain.init()
+
+        assert f"{package}.helpers" in sys.modules
+
+    def test_non_object_manifest_falls_back_to_full_traversal(self, shop):
+        package, package_dir = shop
+        path = manifest_path(package_dir)
+        path.parent.mkdir()
+        path.write_text("[]")
+
+        domain = _fresh_domain(package)
+        assert manifest_status(domain) == ManifestStatus.NO_MANIFEST
+        domain.init()
+
+        assert f"{package}.helpers" in sys.modules
@@ -0,0 +1,352 @@
+"""Off-loop execution with ``domain.aprocess()`` and ``domain.adispatch()``.
+
+Both run the synchronous call on the domain's bounded thread pool, in a copy of
+the caller's context, and turn calls away with ``ServiceUnavailableError`` once
+every worker is busy and the queue is full.
+"""
+
+import asyncio
+import threading
+import time
+from uuid import uuid4
+
+import pytest
+from opentelemetry import trace as otel_trace
+from opentelemetry.sdk.metrics import MeterProvider as SDKMeterProvider
+from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+from opentelemetry.sdk.trace import TracerProvider as SDKTracerProvider
+
+from protean.core.aggregate import BaseAggregate
+from protean.core.command import BaseCommand
+from protean.core.command_handler import BaseCommandHandler
+from protean.core.projection import BaseProjection
+from protean.core.query import BaseQuery
+from protean.core.query_handler import BaseQueryHandler
+from protean.domain.context import _domain_ctx_stack
+from protean.domain.offload import OffloadExecutor
+from protean.exceptions import ConfigurationError, ServiceUnavailableError
+from protean.fields import Identifier, String
+from protean.utils.globals import current_domain, g
+from protean.utils.mixins import handle, read
+from protean.utils.telemetry import _DOMAIN_METRICS_KEY
+
+
+class Account(BaseAggregate):
+    account_id: Identifier(identifier=True)
+    name: String()
+
+
+class OpenAccount(BaseCommand):
+    account_id: Identifier(identifier=True)
+    name: String()
+
+
+class AccountCommandHandler(BaseCommandHandler):
+    @handle(OpenAccount)
+    def open(self, command: OpenAccount) -> dict:
+        if not command.name:
+            raise ValueError("An account needs a name")
+
+        current_domain.repository_for(Account).add(
+            Account(account_id=command.account_id, name=command.name)
+        )
+        return {
+            "thread": threading.current_thread().name,
+            "request_id": getattr(g, "request_id", None),
+        }
+
+
+class Audit(BaseCommand):
+    account_id: Identifier(identifier=True)
+
+
+class AuditCommandHandler(BaseCommandHandler):
+    @handle(Audit)
+    def audit(self, command: Audit) -> None:
+        # Stands in for a slow, blocking commit
+        time.sleep(0.02)
+
+
+class AccountView(BaseProjection):
+    account_id: Identifier(identifier=True)
+    name: String()
+
+
+class GetAccount(BaseQuery):
+    account_id: Identifier(required=True)
+
+
+class AccountViewQueryHandler(BaseQueryHandler):
+    @read(GetAccount)
+    def get(self, query: GetAccount) -> dict:
+        return {
+            "account_id": query.account_id,
+            "thread": threading.current_thread().name,
+        }
+
+
+@pytest.fixture(autouse=True)
+def register(test_domain):
+    test_domain.register(Account)
+    test_domain.register(OpenAccount, part_of=Account)
+    test_domain.register(AccountCommandHandler, part_of=Account)
+    test_domain.register(Audit, part_of=Account)
+    test_domain.register(AuditCommandHandler, part_of=Account)
+    test_domain.register(AccountView)
+    test_domain.register(GetAccount, part_of=AccountView)
+    test_domain.register(AccountViewQueryHandler, part_of=AccountView)
+    test_domain.init(traverse=False)
+    yield
+    if test_domain._offload_executor is not None:
+        test_domain._offload_executor.shutdown()
+
+
+class TestAprocess:
+    async def test_runs_command_on_a_pool_thread(self, test_domain):
+        account_id = str(uuid4())
+
+        result = await test_domain.aprocess(
+            OpenAccount(account_id=account_id, name="Jane"), asynchronous=False
+        )
+
+        assert result["thread"].startswith("protean-offload")
+        assert test_domain.repository_for(Account).get(account_id).name == "Jane"
+
+    async def test_carries_g_values_to_the_handler(self, test_domain):
+        g.request_id = "req-42"
+
+        result = await test_domain.aprocess(
+            OpenAccount(account_id=str(uuid4()), name="Jane"), asynchronous=False
+        )
+
+        assert result["request_id"] == "req-42"
+
+    async def test_uses_the_callers_correlation_id(self, test_domain):
+        await test_domain.aprocess(
+            OpenAccount(account_id=str(uuid4()), name="Jane"),
+            asynchronous=False,
+            correlation_id="corr-7",
+        )
+
+        # ``g`` is the caller's own, so what ``process()`` set is visible here
+        assert g.used_correlation_id == "corr-7"
+
+    async def test_handler_errors_are_raised_to_the_caller(self, test_domain):
+        with pytest.raises(ValueError, match="needs a name"):
+            await test_domain.aprocess(
+                OpenAccount(account_id=str(uuid4())), asynchronous=False
+            )
+
+
+class TestAdispatch:
+    async def test_dispatches_query_on_a_pool_thread(self, test_domain):
+        result = await test_domain.adispatch(GetAccount(account_id="a-1"))
+
+        assert result["account_id"] == "a-1"
+        assert result["thread"].startswith("protean-offload")
+
+
+class TestContextPropagation:
+    async def test_current_span_is_carried_over(self, test_domain):
+        tracer = SDKTracerProvider().get_tracer(__name__)
+
+        with tracer.start_as_current_span("endpoint") as span:
+            seen = await test_domain._offload().run("test", otel_trace.get_current_span)
+
+        assert seen is span
+
+    async def test_changes_in_the_worker_do_not_leak_into_the_caller(self, test_domain):
+        def leave_a_context():
+            test_domain.domain_context().push()
+
+        with test_domain.domain_context() as ctx:
+            await test_domain._offload().run("test", leave_a_context)
+
+            assert _domain_ctx_stack.top is ctx
+
+
+class TestBackpressure:
+    async def test_rejects_calls_once_workers_and_queue_are_full(self, test_domain):
+        executor = OffloadExecutor(test_domain, max_workers=1, max_queue=1)
+        release = threading.Event()
+        started = threading.Event()
+
+        def block():
+            started.set()
+            release.wait(5)
+            return "done"
+
+        running = asyncio.ensure_future(executor.run("test", block))
+        await asyncio.to_thread(started.wait, 5)
+        queued = asyncio.ensure_future(executor.run("test", block))
+        await asyncio.sleep(0)
+
+        assert executor.queue_depth == 1
+        with pytest.raises(ServiceUnavailableError, match="1 workers are busy"):
+            await executor.run("test", block)
+
+        release.set()
+        assert await running == "done"
+        assert await queued == "done"
+        assert executor.queue_depth == 0
+        executor.shutdown()
+
+    async def test_capacity_is_freed_when_calls_fail(self, test_domain):
+        executor = OffloadExecutor(test_domain, max_workers=1, max_queue=0)
+
+        def fail():
+            raise ValueError("boom")
+
+        for _ in range(3):
+            with pytest.raises(ValueError, match="boom"):
+                await executor.run("test", fail)
+
+        assert await executor.run("test", lambda: "ok") == "ok"
+        executor.shutdown()
+
+    async def test_capacity_is_freed_when_queued_calls_are_cancelled(self, test_domain):
+        executor = OffloadExecutor(test_domain, max_workers=1, max_queue=2)
+        release = threading.Event()
+        started = threading.Event()
+
+        def block():
+            started.set()
+            release.wait(5)
+            return "done"
+
+        running = asyncio.ensure_future(executor.run("test", block))
+        await asyncio.to_thread(started.wait, 5)
+        queued = [asyncio.ensure_future(executor.run("test", block)) for _ in range(2)]
+        await asyncio.sleep(0)
+        assert executor.queue_depth == 2
+
+        for task in queued:
+            task.cancel()
+        await asyncio.gather(*queued, return_exceptions=True)
+
+        assert executor.queue_depth == 0
+        # The running call plus a full queue fit again
+        refill = [asyncio.ensure_future(executor.run("test", block)) for _ in range(2)]
+        await asyncio.sleep(0)
+        assert executor.queue_depth == 2
+
+        release.set()
+        assert await asyncio.gather(running, *refill) == ["done"] * 3
+        assert executor._in_flight == 0
+        executor.shutdown()
+
+    async def test_unbounded_queue(self, test_domain):
+        executor = OffloadExecutor(test_domain, max_workers=1, max_queue=None)
+
+        results = await asyncio.gather(
+            *(executor.run("test", lambda i=i: i) for i in range(20))
+        )
+
+        assert results == list(range(20))
+        executor.shutdown()
+
+
+class TestQueueWaitMetrics:
+    async def test_queue_wait_and_rejections_are_recorded(self, test_domain):
+        reader = InMemoryMetricReader()
+        test_domain._otel_meter_provider = SDKMeterProvider(metric_readers=[reader])
+        test_domain._otel_init_attempted = True
+        setattr(test_domain, _DOMAIN_METRICS_KEY, None)
+        executor = OffloadExecutor(test_domain, max_workers=1, max_queue=0)
+        release = threading.Event()
+
+        running = asyncio.ensure_future(executor.run("process", release.wait, 5))
+        await asyncio.sleep(0)
+        with pytest.raises(ServiceUnavailableError):
+            await executor.run("process", lambda: None)
+        release.set()
+        await running
+        executor.shutdown()
+
+        metrics = {
+            metric.name: list(metric.data.data_points)
+            for resource_metric in reader.get_metrics_data().resource_metrics
+            for scope_metric in resource_metric.scope_metrics
+            for metric in scope_metric.metrics
+        }
+        (wait,) = metrics["protean.offload.queue_wait"]
+        assert wait.count == 1
+        assert wait.attributes == {"operation": "process"}
+        (rejected,) = metrics["protean.offload.rejected"]
+        assert rejected.value == 1
+
+
+class TestConfiguration:
+    def test_pool_is_sized_from_config(self, test_domain):
+        test_domain.config["offload"] = {"max_workers": 3, "max_queue": 7}
+
+        executor = test_domain._offload()
+
+        assert (executor.max_workers, executor.max_queue) == (3, 7)
+
+    def test_default_max_workers(self, test_domain):
+        assert OffloadExecutor(test_domain).max_workers >= 5
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [{"max_workers": 0}, {"max_workers": "4"}, {"max_queue": -1}],
+    )
+    def test_invalid_sizes_are_rejected(self, test_domain, kwargs):
+        with pytest.raises(ConfigurationError, match="offload"):
+            OffloadExecutor(test_domain, **kwargs)
+
+    async def test_close_stops_the_pool(self, test_domain):
+        await test_domain.adispatch(GetAccount(account_id="a-1"))
+        executor = test_domain._offload()
+        assert executor._executor is not None
+
+        test_domain.close()
+
+        assert executor._executor is None
+
+
+@pytest.mark.slow
+class TestOffloadBenchmark:
+    """How long the event loop stalls while concurrent requests process a
+    command with a blocking handler, calling ``process()`` on the loop against
+    ``aprocess()``."""
+
+    CALLS = 20
+
+    async def _longest_stall(self, call) -> tuple[float, float]:
+        stalls = []
+        done = asyncio.Event()
+
+        async def heartbeat():
+            while not done.is_set():
+                before = time.perf_counter()
+                await asyncio.sleep(0.001)
+                stalls.append(time.perf_counter() - before)
+
+        ticker = asyncio.ensure_future(heartbeat())
+        start = time.perf_counter()
+        await asyncio.gather(*(call() for _ in range(self.CALLS)))
+        elapsed = time.perf_counter() - start
+        done.set()
+        await ticker
+        return max(stalls), elapsed
+
+    async def test_aprocess_keeps_the_loop_responsive(self, test_domain):
+        async def on_loop():
+            test_domain.process(Audit(account_id=str(uuid4())), asynchronous=False)
+
+        async def off_loop():
+            await test_domain.aprocess(
+                Audit(account_id=str(uuid4())), asynchronous=False
+            )
+
+        on_loop_stall, on_loop_elapsed = await self._longest_stall(on_loop)
+        off_loop_stall, off_loop_elapsed = await self._longest_stall(off_loop)
+        print(
+            f"\nlongest loop stall: {on_loop_stall * 1000:,.1f} ms with process(), "
+            f"{off_loop_stall * 1000:,.1f} ms with aprocess(); "
+            f"{self.CALLS} calls took {on_loop_elapsed * 1000:,.0f} ms and "
+            f"{off_loop_elapsed * 1000:,.0f} ms"
+        )
+
+        assert off_loop_stall < on_loop_stall
@@ -0,0 +1,152 @@
+"""Tests for deferred invariant evaluation (``defer_invariants=True``).
+
+A deferring aggregate skips the per-assignment pre/post walk. Changes are
+tracked on the root, pre-invariants run once per entity on its first change,
+and post-invariants run at explicit boundaries on the root and the entities
+that changed.
+"""
+
+import pytest
+
+from protean.core.aggregate import BaseAggregate, atomic_change
+from protean.core.entity import BaseEntity, invariant
+from protean.exceptions import ValidationError
+from protean.fields import Float, HasMany, Identifier, Integer, String
+
+
+class Cart(BaseAggregate):
+    customer_id: Identifier()
+    total: Float(default=0.0)
+    status: String(default="OPEN")
+    lines = HasMany("CartLine")
+
+    @invariant.pre
+    def cart_must_be_open_to_change(self):
+        if self.status == "CLOSED":
+            raise ValidationError({"_entity": ["Closed carts cannot change"]})
+
+    @invariant.post
+    def total_must_equal_sum_of_lines(self):
+        if self.total != sum(line.subtotal for line in self.lines):
+            raise ValidationError({"_entity": ["Total must equal sum of lines"]})
+
+
+class CartLine(BaseEntity):
+    quantity: Integer(default=1)
+    price: Float(default=0.0)
+    subtotal: Float(default=0.0)
+
+    @invariant.post
+    def subtotal_must_match(self):
+        if self.subtotal != self.quantity * self.price:
+            raise ValidationError({"_entity": ["Subtotal must be quantity x price"]})
+
+
+@pytest.fixture(autouse=True)
+def register_elements(test_domain):
+    test_domain.register(Cart, defer_invariants=True)
+    test_domain.register(CartLine, part_of=Cart)
+    test_domain.init(traverse=False)
+
+
+@pytest.fixture
+def cart():
+    return Cart(
+        customer_id="c1",
+        total=10.0,
+        lines=[CartLine(quantity=1, price=10.0, subtotal=10.0)],
+    )
+
+
+class TestDeferredInvariants:
+    def test_option_defaults_to_eager_checks(self):
+        class EagerCart(BaseAggregate):
+            name: String()
+
+        assert EagerCart.meta_.defer_invariants is False
+
+    def test_intermediate_invalid_states_are_allowed(self, cart):
+        line = cart.lines[0]
+        line.quantity = 2  # subtotal and total are now stale
+        line.subtotal = 20.0
+        cart.total = 20.0
+
+        cart._flush_invariants()
+        assert cart._invariants_dirty == {}
+
+    def test_violation_is_reported_at_the_boundary(self, cart):
+        cart.total = 99.0
+
+        with pytest.raises(ValidationError) as exc:
+            cart._flush_invariants()
+
+        assert exc.value.messages == {"_entity": ["Total must equal sum of lines"]}
+
+    def test_failed_flush_keeps_changes_pending(self, cart):
+        cart.total = 99.0
+        with pytest.raises(ValidationError):
+            cart._flush_invariants()
+
+        with pytest.raises(ValidationError):
+            cart._flush_invariants()
+
+    def test_only_changed_entities_are_tracked(self, cart):
+        cart.add_lines(CartLine(quantity=1, price=5.0, subtotal=5.0))
+        cart.total = 15.0
+        cart._flush_invariants()
+
+        changed = cart.lines[1]
+        changed.price = 6.0
+        changed.subtotal = 6.0
+
+        assert set(cart._invariants_dirty) == {id(cart), id(changed)}
+
+    def test_changed_child_is_checked_at_the_boundary(self, cart):
+        cart.lines[0].subtotal = 10.5
+        cart.total = 10.5
+
+        with pytest.raises(ValidationError) as exc:
+            cart._flush_invariants()
+
+        assert exc.value.messages == {"_entity": ["Subtotal must be quantity x price"]}
+
+    def test_pre_invariants_run_on_first_change(self, cart):
+        cart.status = "CLOSED"
+        cart._flush_invariants()
+
+        with pytest.raises(ValidationError) as exc:
+            cart.total = 20.0
+
+        assert exc.value.messages == {"_entity": ["Closed carts cannot change"]}
+
+    def test_atomic_change_flushes_on_exit(self, cart):
+        with pytest.raises(ValidationError):
+            with atomic_change(cart):
+                cart.total = 50.0
+
+    def test_atomic_change_tracks_changes_made_inside_the_block(self, cart):
+        with atomic_change(cart):
+            cart.lines[0].quantity = 3
+            cart.lines[0].subtotal = 30.0
+            cart.total = 30.0
+
+        assert cart._invariants_dirty == {}
+        assert cart._atomic_depth == 0
+
+    def test_repository_add_is_a_boundary(self, test_domain, cart):
+        cart.total = 99.0
+
+        with pytest.raises(ValidationError):
+            test_domain.repository_for(Cart).add(cart)
+
+    def test_unit_of_work_commit_is_a_boundary(self, test_domain, cart):
+        from protean.core.unit_of_work import UnitOfWork
+
+        repo = test_domain.repository_for(Cart)
+        repo.add(cart)
+
+        with pytest.raises(ValidationError):
+            with UnitOfWork():
+                loaded = repo.get(cart.id)
+                repo.add(loaded)
+                loaded.total = 99.0
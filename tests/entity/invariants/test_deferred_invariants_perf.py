@@ -0,0 +1,144 @@
+"""Regression guards for the cost of deferred invariant evaluation.
+
+Counts invariant evaluations rather than wall-clock time, which is
+deterministic. Eager aggregates walk the whole tree before and after every
+assignment, so setting ``F`` fields on an aggregate with ``N`` children
+evaluates ``O(F x N)`` invariants. A deferring aggregate evaluates the root
+once plus each changed entity once per boundary, however wide or deep the
+aggregate is.
+"""
+
+import pytest
+
+from protean.core.aggregate import BaseAggregate, atomic_change
+from protean.core.entity import BaseEntity, invariant
+from protean.fields import HasMany, HasOne, Integer, String
+
+CALLS: list[str] = []
+
+
+class Ledger(BaseAggregate):
+    name: String()
+    a: Integer(default=0)
+    b: Integer(default=0)
+    c: Integer(default=0)
+    entries = HasMany("Entry")
+
+    @invariant.post
+    def root_check(self):
+        CALLS.append("root")
+
+
+class Entry(BaseEntity):
+    amount: Integer(default=0)
+
+    @invariant.post
+    def entry_check(self):
+        CALLS.append("entry")
+
+
+class Branch(BaseAggregate):
+    name: String()
+    a: Integer(default=0)
+    sections = HasMany("Section")
+
+    @invariant.post
+    def root_check(self):
+        CALLS.append("root")
+
+
+class Section(BaseEntity):
+    title: String()
+    paragraphs = HasMany("Paragraph")
+
+    @invariant.post
+    def section_check(self):
+        CALLS.append("section")
+
+
+class Paragraph(BaseEntity):
+    text: String()
+    note = HasOne("Note")
+
+    @invariant.post
+    def paragraph_check(self):
+        CALLS.append("paragraph")
+
+
+class Note(BaseEntity):
+    body: String()
+
+    @invariant.post
+    def note_check(self):
+        CALLS.append("note")
+
+
+WIDTH = 200
+FANOUT = 10
+
+
+@pytest.fixture(params=[False, True], ids=["eager", "deferred"])
+def deferred(request, test_domain):
+    test_domain.register(Ledger, defer_invariants=request.param)
+    test_domain.register(Entry, part_of=Ledger)
+    test_domain.register(Branch, defer_invariants=request.param)
+    test_domain.register(Section, part_of=Branch)
+    test_domain.register(Paragraph, part_of=Section)
+    test_domain.register(Note, part_of=Paragraph)
+    test_domain.init(traverse=False)
+    return request.param
+
+
+def _evaluations(mutate) -> int:
+    CALLS.clear()
+    mutate()
+    return len(CALLS)
+
+
+def test_wide_aggregate(deferred):
+    ledger = Ledger(name="l", entries=[Entry(amount=i) for i in range(WIDTH)])
+
+    def mutate():
+        with atomic_change(ledger):
+            pass
+        ledger.a = 1
+        ledger.b = 2
+        ledger.c = 3
+        ledger.entries[0].amount = 99
+        ledger._flush_invariants()
+
+    count = _evaluations(mutate)
+    if deferred:
+        # root + one changed entry, once
+        assert count == 2
+    else:
+        assert count > 4 * WIDTH
+
+
+def test_deep_aggregate(deferred):
+    branch = Branch(
+        name="b",
+        sections=[
+            Section(
+                title=f"s{i}",
+                paragraphs=[
+                    Paragraph(text=f"p{j}", note=Note(body="n")) for j in range(FANOUT)
+                ],
+            )
+            for i in range(FANOUT)
+        ],
+    )
+    note = branch.sections[-1].paragraphs[-1].note
+
+    def mutate():
+        branch.a = 1
+        note.body = "changed"
+        branch._flush_invariants()
+
+    count = _evaluations(mutate)
+    if deferred:
+        # root + the changed leaf, once
+        assert count == 2
+    else:
+        # every level of the tree, before and after each assignment
+        assert count > 4 * FANOUT * FANOUT
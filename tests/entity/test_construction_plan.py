@@ -0,0 +1,174 @@
+"""Per-class construction plans for entities, aggregates and value objects.
+
+The work of construction that depends only on the class (the invariant scan,
+shadow-field and descriptor lookups, the association pseudo-methods) happens
+once per class, not once per instance.
+"""
+
+import time
+
+import pytest
+
+from protean.core.aggregate import BaseAggregate
+from protean.core.entity import BaseEntity, _AssociationMethod, invariant
+from protean.core.value_object import BaseValueObject
+from protean.exceptions import ValidationError
+from protean.fields import HasMany, Identifier, Integer, Reference, String, ValueObject
+
+
+class Address(BaseValueObject):
+    street: String(max_length=100)
+    city: String(max_length=50)
+
+    @invariant.post
+    def city_is_not_blank(self):
+        if self.city == "":
+            raise ValidationError({"city": ["cannot be blank"]})
+
+
+class Order(BaseAggregate):
+    name: String(required=True, max_length=50)
+    shipping_address = ValueObject(Address)
+    items = HasMany("OrderItem")
+
+
+class OrderItem(BaseEntity):
+    product_name: String(required=True, max_length=100)
+    quantity: Integer(min_value=1)
+
+
+class Post(BaseAggregate):
+    title: String(required=True, max_length=100)
+    author = Reference("Author")
+
+
+class Author(BaseEntity):
+    code: Identifier(identifier=True)
+    name: String(max_length=50)
+
+
+@pytest.fixture
+def register_orders(test_domain):
+    test_domain.register(Order)
+    test_domain.register(OrderItem, part_of=Order)
+    test_domain.register(Address)
+    test_domain.init(traverse=False)
+
+
+@pytest.mark.usefixtures("register_orders")
+class TestEntityConstructionPlan:
+    def test_the_plan_is_built_once_per_class(self):
+        Order(name="first")
+        plan = Order._construction_plan()
+
+        Order(name="second")
+
+        assert Order._construction_plan() is plan
+
+    def test_the_plan_captures_the_class_structure(self):
+        plan = Order._construction_plan()
+
+        assert plan.associations == ("items",)
+        assert {"shipping_address_street", "shipping_address_city"} <= (
+            plan.shadow_field_names
+        )
+        assert {"shipping_address", "items"} <= plan.descriptor_names
+
+    def test_association_methods_live_on_the_class(self):
+        order = Order(name="Test")
+
+        assert isinstance(vars(Order)["add_items"], _AssociationMethod)
+        assert "add_items" not in order.__dict__
+
+    def test_association_methods_bind_to_the_instance(self):
+        order = Order(name="Test")
+        item = OrderItem(product_name="Pen", quantity=1)
+
+        order.add_items(item)
+        assert order.get_one_from_items(product_name="Pen") is item
+        assert order.filter_items(quantity=1) == [item]
+
+        order.remove_items(item)
+        assert order.items == []
+
+    def test_shadow_fields_still_rebuild_value_objects(self):
+        order = Order(
+            name="Test",
+            shipping_address_street="1 Main St",
+            shipping_address_city="Boston",
+        )
+
+        assert order.shipping_address == Address(street="1 Main St", city="Boston")
+
+    def test_value_object_invariants_still_run(self):
+        with pytest.raises(ValidationError) as exc:
+            Order(name="Test", shipping_address=Address(street="1 Main St", city=""))
+
+        assert exc.value.messages == {"city": ["cannot be blank"]}
+
+
+def test_resolving_a_reference_rebuilds_the_plan(test_domain):
+    test_domain.register(Post)
+    test_domain.register(Author, part_of=Post)
+    # Built while `Author` is still a string: the shadow field is `author_id`
+    assert "author_id" in Post._construction_plan().shadow_field_names
+
+    test_domain.init(traverse=False)
+
+    assert "author_code" in Post._construction_plan().shadow_field_names
+    assert Post(title="Hello", author_code="a-1").author_code == "a-1"
+
+
+class TestValueObjectInvariantDiscovery:
+    def test_invariants_are_discovered_once_per_class(self, mocker):
+        Address(street="1 Main St", city="Boston")
+        spy = mocker.spy(Address, "_discover_invariants")
+
+        Address(street="2 Main St", city="Boston")
+
+        spy.assert_not_called()
+        assert "city_is_not_blank" in Address._invariants["post"]
+
+
+@pytest.mark.slow
+@pytest.mark.usefixtures("register_orders")
+class TestConstructionBenchmark:
+    """Construction rates with the plan reused, against rebuilding it for
+    every instance as construction used to."""
+
+    INSTANCES = 5_000
+
+    def _rate(self, build, reset) -> float:
+        start = time.perf_counter()
+        for _ in range(self.INSTANCES):
+            reset()
+            build()
+        return self.INSTANCES / (time.perf_counter() - start)
+
+    def test_entities_construct_faster_with_a_plan(self):
+        def build():
+            return Order(
+                name="Test",
+                shipping_address_street="1 Main St",
+                shipping_address_city="Boston",
+            )
+
+        rebuilt = self._rate(build, Order._reset_construction_plan)
+        planned = self._rate(build, lambda: None)
+        print(f"\nentity: {rebuilt:,.0f}/s rebuilt, {planned:,.0f}/s planned")
+
+        assert planned > rebuilt
+
+    def test_value_objects_construct_faster_without_rescanning(self):
+        def build():
+            return Address(street="1 Main St", city="Boston")
+
+        def reset():
+            if "__invariants_discovered__" in vars(Address):
+                delattr(Address, "__invariants_discovered__")
+
+        rescanned = self._rate(build, reset)
+        planned = self._rate(build, lambda: None)
+        print(f"\nvalue object: {rescanned:,.0f}/s rescanned, {planned:,.0f}/s once")
+
+        assert planned > rescanned
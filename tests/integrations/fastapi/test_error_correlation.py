@@ -104,6 +104,14 @@ def _make_app(domain) -> FastAPI:
             asynchronous=False,
         )
 
+    @app.post("/api/widgets/async")
+    async def create_widget_off_loop():
+        """Async endpoint that processes the command off the event loop."""
+        await current_domain.aprocess(
+            CreateWidget(widget_id=str(uuid4()), name="Sprocket"),
+            asynchronous=False,
+        )
+
     # Route outside any domain context
     @app.get("/health")
     def health():
@@ -305,3 +313,13 @@ class TestCommandProcessingErrorCorrelation:
         assert "correlation_id" in body
         assert len(body["correlation_id"]) == 32
         assert body["correlation_id"] == response.headers["X-Correlation-ID"]
+
+    def test_off_loop_command_handler_error_has_correlation_id(self, client):
+        response = client.post(
+            "/api/widgets/async",
+            headers={"X-Correlation-ID": "cmd-err-async"},
+        )
+        assert response.status_code == 404
+        body = response.json()
+        assert body["correlation_id"] == "cmd-err-async"
+        assert "Widget supplier not found" in body["error"]
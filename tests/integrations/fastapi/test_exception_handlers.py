@@ -9,6 +9,7 @@ from protean.exceptions import (
     InvalidOperationError,
     InvalidStateError,
     ObjectNotFoundError,
+    ServiceUnavailableError,
     ValidationError,
 )
 from protean.integrations.fastapi import register_exception_handlers
@@ -44,6 +45,10 @@ def app():
     def raise_invalid_operation():
         raise InvalidOperationError("Cannot cancel a completed order")
 
+    @app.get("/service-unavailable")
+    def raise_service_unavailable():
+        raise ServiceUnavailableError("All workers are busy")
+
     @app.get("/generic-error")
     def raise_generic():
         raise RuntimeError("unexpected")
@@ -81,6 +86,11 @@ class TestExceptionHandlerMappings:
         response = client.get("/invalid-operation")
         assert response.status_code == 422
 
+    def test_service_unavailable_returns_503(self, client):
+        response = client.get("/service-unavailable")
+        assert response.status_code == 503
+        assert response.json()["error"] == "All workers are busy"
+
     def test_error_response_body_format(self, client):
         """All error responses have a JSON body with an 'error' key."""
         response = client.get("/not-found")
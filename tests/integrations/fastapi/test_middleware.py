@@ -1,8 +1,12 @@
 """Tests for DomainContextMiddleware."""
 
+import time
+
+import httpx
 import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
+from starlette.middleware.base import BaseHTTPMiddleware
 
 from protean.domain import Domain
 from protean.integrations.fastapi import DomainContextMiddleware
@@ -183,3 +187,106 @@ class TestValidation:
             app.add_middleware(DomainContextMiddleware)
             # Force middleware instantiation by making a request
             TestClient(app).get("/")
+
+
+class TestNonHttpScopes:
+    async def test_lifespan_scope_passes_through(self, domain_a):
+        seen: list[str] = []
+
+        async def app(scope, receive, send):
+            seen.append(scope["type"])
+
+        middleware = DomainContextMiddleware(app, route_domain_map={"/": domain_a})
+        await middleware({"type": "lifespan"}, None, None)
+
+        assert seen == ["lifespan"]
+
+
+class TestPrefixTable:
+    def test_prefixes_are_matched_literally(self, domain_a, domain_b):
+        middleware = DomainContextMiddleware(
+            None, route_domain_map={"/v1.0": domain_a, "/v1": domain_b}
+        )
+
+        assert middleware._resolve_domain("/v1.0/items") is domain_a
+        assert middleware._resolve_domain("/v1x0/items") is domain_b
+        assert middleware._resolve_domain("/other") is None
+
+    def test_http_logging_config_is_read_once_per_domain(self, domain_a):
+        middleware = DomainContextMiddleware(None, resolver=lambda path: domain_a)
+
+        config = middleware._http_logging_config(domain_a)
+        domain_a.config["logging"]["http"]["enabled"] = False
+
+        assert middleware._http_logging_config(domain_a) is config
+        assert config.enabled is True
+
+
+class TestErrorAfterResponseStarted:
+    def test_error_is_raised_once_the_response_has_started(self, domain_a):
+        async def app(scope, receive, send):
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+            raise RuntimeError("broken stream")
+
+        client = TestClient(
+            DomainContextMiddleware(app, route_domain_map={"/": domain_a})
+        )
+
+        with pytest.raises(RuntimeError, match="broken stream"):
+            client.get("/stream")
+
+
+@pytest.mark.slow
+class TestMiddlewareBenchmark:
+    """Requests per second through the middleware, against an empty FastAPI
+    app and one behind a pass-through ``BaseHTTPMiddleware``, the base class
+    this middleware used to be built on."""
+
+    REQUESTS = 2_000
+
+    @staticmethod
+    def _app() -> FastAPI:
+        app = FastAPI()
+
+        @app.get("/alpha/ping")
+        async def ping():
+            return {}
+
+        return app
+
+    async def _rate(self, app: FastAPI) -> float:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://test"
+        ) as client:
+            for _ in range(100):  # warm up
+                await client.get("/alpha/ping")
+            start = time.perf_counter()
+            for _ in range(self.REQUESTS):
+                await client.get("/alpha/ping")
+        return self.REQUESTS / (time.perf_counter() - start)
+
+    async def test_overhead_is_below_a_base_http_middleware(self, domain_a):
+        async def passthrough(request, call_next):
+            return await call_next(request)
+
+        empty = self._app()
+        base_http = self._app()
+        base_http.add_middleware(BaseHTTPMiddleware, dispatch=passthrough)
+        domain_context = self._app()
+        domain_context.add_middleware(
+            DomainContextMiddleware,
+            route_domain_map={"/alpha": domain_a},
+            emit_http_wide_event=False,
+        )
+
+        empty_rate = await self._rate(empty)
+        base_http_rate = await self._rate(base_http)
+        domain_context_rate = await self._rate(domain_context)
+        print(
+            f"\nrequests/s: {empty_rate:,.0f} empty, "
+            f"{base_http_rate:,.0f} BaseHTTPMiddleware, "
+            f"{domain_context_rate:,.0f} DomainContextMiddleware"
+        )
+
+        assert domain_context_rate > base_http_rate
@@ -255,6 +255,30 @@ class TestGoldenSnapshot:
             "removed": sorted(set(self.EXPECTED_RESOLUTIONS) - set(actual)),
         }
 
+    # Every code whose findings depend on more than the element they name. A
+    # code missing here is matched against that element alone by
+    # ``protean check --changed-since``, so moving a code in or out of this map
+    # decides which changes bring its findings back, and is a reviewed change.
+    EXPECTED_SCOPES = {
+        "AGGREGATE_TOO_LARGE": "cluster",
+        "AGGREGATE_WITHOUT_COMMAND_HANDLER": "cluster",
+        "CIRCULAR_CLUSTER_DEPENDENCY": "domain",
+        "DEPRECATED_CONFIG": "domain",
+        "DEPRECATED_IMPORT": "module",
+        "ES_AGGREGATE_NO_EVENTS": "cluster",
+        "PUBLISHED_NO_EXTERNAL_BROKER": "domain",
+        "UNBOUNDED_INDEXED_STRING": "cluster",
+        "UNINDEXED_FILTER_PATH": "domain",
+    }
+
+    def test_scope_map_is_frozen(self):
+        actual = {
+            code.value: meta.scope
+            for code, meta in REGISTRY.items()
+            if meta.scope != "element"
+        }
+        assert actual == self.EXPECTED_SCOPES
+
 
 def _meta_digest(meta: CodeMeta) -> str:
     """A stable short hash over a code's full metadata text."""
@@ -6,7 +6,7 @@ import subprocess
 
 import pytest
 
-from protean.ir.git import GitError, load_ir_from_commit
+from protean.ir.git import GitError, changed_files, load_ir_from_commit
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -184,6 +184,59 @@ class TestLoadIrFromCommit:
         assert result["checksum"] == "sha256:custom"
 
 
+@pytest.mark.no_test_domain
+class TestChangedFiles:
+    """Unit tests for changed_files()."""
+
+    @pytest.fixture(autouse=True)
+    def _repo(self, tmp_path, monkeypatch):
+        """A repository with one commit, run from a subdirectory."""
+        env = _init_repo(tmp_path)
+        (tmp_path / "app").mkdir()
+        (tmp_path / "app" / "orders.py").write_text("")
+        (tmp_path / "app" / "catalog.py").write_text("")
+        (tmp_path / ".gitignore").write_text("*.log\n")
+        subprocess.run(
+            ["git", "add", "."], cwd=tmp_path, capture_output=True, check=True
+        )
+        subprocess.run(
+            ["git", "commit", "-m", "init"],
+            cwd=tmp_path,
+            capture_output=True,
+            check=True,
+            env=env,
+        )
+        monkeypatch.chdir(tmp_path / "app")
+        self.root = tmp_path.resolve()
+
+    def test_nothing_changed(self):
+        assert changed_files("HEAD") == ()
+
+    def test_lists_modified_deleted_and_untracked_files(self):
+        (self.root / "app" / "orders.py").write_text("x = 1\n")
+        (self.root / "app" / "catalog.py").unlink()
+        (self.root / "app" / "billing.py").write_text("")
+        (self.root / "app" / "debug.log").write_text("")
+
+        assert changed_files("HEAD") == tuple(
+            str(self.root / "app" / name)
+            for name in ("billing.py", "catalog.py", "orders.py")
+        )
+
+    def test_raises_git_error_for_unknown_ref(self):
+        with pytest.raises(GitError, match="no-such-ref"):
+            changed_files("no-such-ref")
+
+    def test_raises_git_error_when_not_a_repo(self, tmp_path, monkeypatch):
+        outside = tmp_path / "outside"
+        outside.mkdir()
+        monkeypatch.chdir(outside)
+        monkeypatch.setenv("GIT_CEILING_DIRECTORIES", str(tmp_path))
+
+        with pytest.raises(GitError):
+            changed_files("HEAD")
+
+
 @pytest.mark.no_test_domain
 class TestGitErrorException:
     """Tests for the GitError exception class."""
@@ -0,0 +1,298 @@
+"""Tests for ChangeScope — src/protean/ir/impact.py — and the
+``--changed-since`` option of ``protean check``."""
+
+import json
+import os
+import subprocess
+import sys
+import types
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from protean.cli import app
+from protean.domain import Domain
+from protean.ir.impact import ChangeScope
+
+runner = CliRunner()
+
+_EXAMPLE = Path(__file__).parents[2] / "src/protean/ir/examples/ordering-ir.json"
+
+
+@pytest.fixture(scope="module")
+def ir() -> dict:
+    return json.loads(_EXAMPLE.read_text())
+
+
+def _diagnostic(code: str, element: str) -> dict:
+    return {"code": code, "element": element, "level": "warning", "message": ""}
+
+
+class TestFromModules:
+    def test_elements_of_changed_modules_are_affected(self, ir):
+        scope = ChangeScope.from_modules(ir, ["ecommerce.payments"])
+
+        assert {
+            "ecommerce.payments.Payment",
+            "ecommerce.payments.ConfirmPayment",
+            "ecommerce.payments.PaymentConfirmed",
+        } <= scope.affected_elements
+        assert "ecommerce.ordering.Order" not in scope.affected_elements
+
+    def test_handlers_of_changed_events_are_affected(self, ir):
+        # The process manager handles ``Payments.PaymentConfirmed.v1``, which
+        # it names by type
+        scope = ChangeScope.from_modules(ir, ["ecommerce.payments"])
+
+        assert "ecommerce.fulfillment.OrderFulfillmentPM" in scope.affected_elements
+
+    def test_what_a_changed_element_refers_to_is_affected(self, ir):
+        scope = ChangeScope.from_modules(ir, ["ecommerce.fulfillment"])
+
+        assert "ecommerce.ordering.OrderPlaced" in scope.affected_elements
+        assert "ecommerce.ordering.PlaceOrder" not in scope.affected_elements
+
+    def test_clusters_of_affected_elements(self, ir):
+        scope = ChangeScope.from_modules(ir, ["ecommerce.payments"])
+
+        assert scope.affected_clusters == {"ecommerce.payments.Payment"}
+
+    def test_unrelated_modules_affect_nothing(self, ir):
+        scope = ChangeScope.from_modules(ir, ["ecommerce.helpers"])
+
+        assert not scope.affected_elements
+        assert not scope.affected_clusters
+
+
+class TestIncludes:
+    @pytest.fixture
+    def scope(self, ir) -> ChangeScope:
+        return ChangeScope.from_modules(ir, ["ecommerce.payments"])
+
+    def test_element_findings_follow_affected_elements(self, scope):
+        assert scope.includes(
+            _diagnostic("UNHANDLED_EVENT", "ecommerce.payments.PaymentFailed")
+        )
+        assert not scope.includes(
+            _diagnostic("UNHANDLED_EVENT", "ecommerce.ordering.OrderCancelled")
+        )
+
+    def test_cluster_findings_follow_affected_clusters(self, scope):
+        assert scope.includes(
+            _diagnostic("AGGREGATE_TOO_LARGE", "ecommerce.payments.Payment")
+        )
+        assert not scope.includes(
+            _diagnostic("AGGREGATE_TOO_LARGE", "ecommerce.ordering.Order")
+        )
+
+    def test_module_findings_follow_changed_modules(self, scope):
+        assert scope.includes(_diagnostic("DEPRECATED_IMPORT", "ecommerce.payments"))
+        assert not scope.includes(
+            _diagnostic("DEPRECATED_IMPORT", "ecommerce.ordering")
+        )
+
+    def test_domain_findings_are_always_kept(self, scope):
+        assert scope.includes(_diagnostic("PUBLISHED_NO_EXTERNAL_BROKER", "Shop"))
+
+    def test_findings_of_unknown_codes_are_kept(self, scope):
+        assert scope.includes(_diagnostic("TEAM_NAMING_RULE", "ecommerce.Anything"))
+
+    def test_everything_keeps_every_finding(self, ir):
+        scope = ChangeScope.from_modules(ir, [], everything=True)
+
+        assert scope.includes(
+            _diagnostic("UNHANDLED_EVENT", "ecommerce.ordering.OrderCancelled")
+        )
+
+
+@pytest.mark.no_test_domain
+class TestFromFiles:
+    @pytest.fixture
+    def package(self, tmp_path, monkeypatch) -> Path:
+        root = tmp_path / "ecommerce"
+        root.mkdir()
+        (root / "domain.py").write_text(
+            'from protean import Domain\n\ndomain = Domain(name="Shop")\n'
+        )
+        (root / "payments.py").write_text("class Payment: ...\n")
+        (root / "helpers.py").write_text("")
+        # An imported module defined outside the package
+        shared = tmp_path / "shared" / "money.py"
+        shared.parent.mkdir()
+        shared.write_text("")
+        module = types.ModuleType("shared.money")
+        module.__file__ = str(shared)
+        monkeypatch.setitem(sys.modules, module.__name__, module)
+        return root
+
+    @pytest.fixture
+    def domain(self, package) -> Domain:
+        return Domain(name="Shop", root_path=str(package / "domain.py"))
+
+    def test_changed_files_are_mapped_to_modules(self, package, domain, ir):
+        scope = ChangeScope.from_files(
+            domain,
+            ir,
+            [package / "payments.py", package.parent / "shared" / "money.py"],
+        )
+
+        assert scope.changed_modules == {"ecommerce.payments", "shared.money"}
+        assert "ecommerce.payments.Payment" in scope.affected_elements
+        assert not scope.everything
+
+    def test_files_outside_the_domain_are_ignored(self, tmp_path, domain, ir):
+        scope = ChangeScope.from_files(domain, ir, [tmp_path / "README.md"])
+
+        assert not scope.changed_modules
+        assert not scope.everything
+
+    @pytest.mark.parametrize(
+        "changed",
+        ["ecommerce/domain.toml", "ecommerce/.domain.toml", "pyproject.toml"],
+    )
+    def test_configuration_changes_reach_everything(
+        self, tmp_path, domain, ir, changed
+    ):
+        scope = ChangeScope.from_files(domain, ir, [tmp_path / changed])
+
+        assert scope.everything
+
+    def test_changed_domain_module_reaches_everything(
+        self, package, domain, ir, monkeypatch
+    ):
+        module = types.ModuleType("ecommerce.domain")
+        module.__file__ = str(package / "domain.py")
+        module.domain = domain
+        monkeypatch.setitem(sys.modules, module.__name__, module)
+
+        scope = ChangeScope.from_files(domain, ir, [package / "domain.py"])
+
+        assert scope.everything
+
+    def test_changed_lint_rule_reaches_everything(self, package, domain, ir):
+        domain.config["lint"] = {"rules": ["ecommerce.helpers.check_names"]}
+
+        scope = ChangeScope.from_files(domain, ir, [package / "helpers.py"])
+
+        assert scope.everything
+
+
+_GIT_ENV = {
+    "GIT_AUTHOR_NAME": "test",
+    "GIT_AUTHOR_EMAIL": "test@test.com",
+    "GIT_COMMITTER_NAME": "test",
+    "GIT_COMMITTER_EMAIL": "test@test.com",
+}
+
+_AGGREGATE_MODULE = """\
+from protean.fields import String
+
+from impactshop.domain import domain
+
+
+@domain.aggregate
+class {name}:
+    title = String(max_length=100)
+"""
+
+
+class TestChangedSinceOption:
+    @pytest.fixture(autouse=True)
+    def reset_path(self):
+        original_path = sys.path[:]
+        cwd = Path.cwd()
+        yield
+        sys.path[:] = original_path
+        os.chdir(cwd)
+
+    @pytest.fixture
+    def repo(self, tmp_path, monkeypatch) -> Path:
+        """A domain of two aggregates in two modules, committed to a fresh
+        repository."""
+        # Import this copy, not the one an earlier test loaded
+        for name in [m for m in sys.modules if m.startswith("impactshop")]:
+            monkeypatch.delitem(sys.modules, name)
+        package = tmp_path / "impactshop"
+        package.mkdir()
+        (package / "__init__.py").write_text("")
+        (package / "domain.py").write_text(
+            'from protean import Domain\n\ndomain = Domain(name="Shop")\n'
+        )
+        (package / "orders.py").write_text(_AGGREGATE_MODULE.format(name="Order"))
+        (package / "catalog.py").write_text(_AGGREGATE_MODULE.format(name="Product"))
+        env = {**os.environ, **_GIT_ENV, "HOME": str(tmp_path)}
+        for command in (
+            ["git", "init"],
+            ["git", "add", "impactshop"],
+            ["git", "commit", "-m", "domain"],
+        ):
+            subprocess.run(
+                command, cwd=tmp_path, env=env, check=True, capture_output=True
+            )
+        os.chdir(tmp_path)
+        return package
+
+    def _check(self, *args: str) -> dict:
+        result = runner.invoke(
+            app, ["check", "-d", "impactshop.domain", "-f", "json", *args]
+        )
+        return json.loads(result.stdout)
+
+    def _elements(self, report: dict) -> set[str]:
+        return {d["element"] for d in report["diagnostics"]}
+
+    def test_no_changes_report_no_findings(self, repo):
+        full = self._check()
+        changed = self._check("--changed-since", "HEAD")
+
+        assert self._elements(full) == {
+            "impactshop.orders.Order",
+            "impactshop.catalog.Product",
+        }
+        assert changed["diagnostics"] == []
+        assert changed["data"]["status"] == "pass"
+
+    def test_changed_module_reports_its_findings(self, repo):
+        with (repo / "orders.py").open("a") as source:
+            source.write("\n# edited\n")
+
+        changed = self._check("--changed-since", "HEAD")
+
+        assert self._elements(changed) == {"impactshop.orders.Order"}
+
+    def test_untracked_module_reports_its_findings(self, repo):
+        (repo / "billing.py").write_text(_AGGREGATE_MODULE.format(name="Invoice"))
+
+        changed = self._check("--changed-since", "HEAD")
+
+        assert self._elements(changed) == {"impactshop.billing.Invoice"}
+
+    def test_changed_domain_module_reports_everything(self, repo):
+        full = self._check()
+        with (repo / "domain.py").open("a") as source:
+            source.write("\n# edited\n")
+
+        changed = self._check("--changed-since", "HEAD")
+
+        assert changed["diagnostics"] == full["diagnostics"]
+
+    def test_narrowed_report_is_cached_apart(self, repo):
+        full = self._check("--cache")
+        with (repo / "orders.py").open("a") as source:
+            source.write("\n# edited\n")
+
+        changed = self._check("--changed-since", "HEAD", "--cache")
+        rerun = self._check("--cache")
+
+        assert self._elements(changed) == {"impactshop.orders.Order"}
+        assert rerun["diagnostics"] == full["diagnostics"]
+
+    def test_unknown_ref_is_a_usage_error(self, repo):
+        result = runner.invoke(
+            app,
+            ["check", "-d", "impactshop.domain", "--changed-since", "no-such-ref"],
+        )
+
+        assert result.exit_code == 2
+        assert "no-such-ref" in result.stderr
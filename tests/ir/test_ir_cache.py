@@ -0,0 +1,371 @@
+"""Tests for the source-keyed IR cache — src/protean/ir/cache.py and the
+``--cache`` option of the IR commands and ``protean check``."""
+
+import json
+import os
+import subprocess
+import sys
+import time
+import types
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from protean.cli import app
+from protean.cli._ir_utils import load_domain_ir
+from protean.domain import Domain
+from protean.ir.cache import CacheReport, IRCache
+from tests.shared import change_working_directory_to
+
+runner = CliRunner()
+
+
+@pytest.fixture
+def package(tmp_path) -> Path:
+    """A domain package on disk. Nothing in it is imported."""
+    root = tmp_path / "shop"
+    root.mkdir()
+    (root / "__init__.py").write_text("")
+    (root / "domain.py").write_text("domain = None\n")
+    (root / "orders.py").write_text("class Order: ...\n")
+    (root / "catalog").mkdir()
+    (root / "catalog" / "__init__.py").write_text("")
+    (root / "catalog" / "products.py").write_text("class Product: ...\n")
+    return root
+
+
+@pytest.fixture
+def domain(package) -> Domain:
+    return Domain(name="Shop", root_path=str(package / "domain.py"))
+
+
+class Builds:
+    """A ``build`` callable that counts its calls."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def __call__(self) -> dict:
+        self.calls += 1
+        return {"build": self.calls}
+
+
+@pytest.mark.no_test_domain
+class TestGetOrBuild:
+    def test_first_lookup_builds(self, tmp_path, domain):
+        build = Builds()
+
+        result, report = IRCache(tmp_path / ".protean").get_or_build(
+            domain, "ir", build
+        )
+
+        assert result == {"build": 1}
+        assert report.hit is False
+        assert report.modules_total == 5
+        assert report.modules_unchanged == 0
+        assert (report.hits, report.misses) == (0, 1)
+
+    def test_unchanged_sources_reuse_the_result(self, tmp_path, domain):
+        cache = IRCache(tmp_path / ".protean")
+        build = Builds()
+        cache.get_or_build(domain, "ir", build)
+
+        result, report = cache.get_or_build(domain, "ir", build)
+
+        assert result == {"build": 1}
+        assert build.calls == 1
+        assert report.hit is True
+        assert report.modules_unchanged == 5
+        assert report.hit_rate == 0.5
+
+    def test_edited_module_is_rebuilt_and_reported(self, tmp_path, package, domain):
+        cache = IRCache(tmp_path / ".protean")
+        build = Builds()
+        cache.get_or_build(domain, "ir", build)
+
+        (package / "orders.py").write_text("class Order:\n    total = 0\n")
+        result, report = cache.get_or_build(domain, "ir", build)
+
+        assert result == {"build": 2}
+        assert report.hit is False
+        assert report.changed_modules == ("shop.orders",)
+        assert report.modules_unchanged == 4
+
+    def test_added_and_removed_modules_are_changes(self, tmp_path, package, domain):
+        cache = IRCache(tmp_path / ".protean")
+        cache.get_or_build(domain, "ir", Builds())
+
+        (package / "catalog" / "products.py").unlink()
+        (package / "payments.py").write_text("class Payment: ...\n")
+        _, report = cache.get_or_build(domain, "ir", Builds())
+
+        assert report.changed_modules == ("shop.catalog.products", "shop.payments")
+
+    def test_config_change_is_a_miss(self, tmp_path, domain):
+        cache = IRCache(tmp_path / ".protean")
+        cache.get_or_build(domain, "ir", Builds())
+
+        domain.config["event_processing"] = "sync"
+        _, report = cache.get_or_build(domain, "ir", Builds())
+
+        assert report.hit is False
+
+    def test_modules_the_build_imported_are_tracked(
+        self, tmp_path, package, domain, monkeypatch
+    ):
+        # Two levels down, out of reach of the package walk
+        helper = package / "catalog" / "pricing" / "rules.py"
+        helper.parent.mkdir()
+        helper.write_text("DISCOUNT = 0\n")
+        module = types.ModuleType("shop.catalog.pricing.rules")
+        module.__file__ = str(helper)
+
+        def build() -> dict:
+            monkeypatch.setitem(sys.modules, module.__name__, module)
+            return {}
+
+        cache = IRCache(tmp_path / ".protean")
+        cache.get_or_build(domain, "ir", build)
+        helper.write_text("DISCOUNT = 10\n")
+
+        _, report = cache.get_or_build(domain, "ir", build)
+
+        assert report.changed_modules == ("shop.catalog.pricing.rules",)
+
+    def test_kinds_are_cached_separately(self, tmp_path, domain):
+        cache = IRCache(tmp_path / ".protean")
+        cache.get_or_build(domain, "ir", lambda: {"kind": "ir"})
+
+        result, report = cache.get_or_build(domain, "check", lambda: {"kind": "check"})
+        ir, _ = cache.get_or_build(domain, "ir", Builds())
+
+        assert result == {"kind": "check"}
+        assert report.hit is False
+        assert report.modules_unchanged == 5
+        assert ir == {"kind": "ir"}
+
+    def test_a_miss_drops_results_of_other_kinds(self, tmp_path, package, domain):
+        cache = IRCache(tmp_path / ".protean")
+        cache.get_or_build(domain, "ir", Builds())
+        cache.get_or_build(domain, "check", Builds())
+
+        (package / "orders.py").write_text("class Order:\n    total = 0\n")
+        cache.get_or_build(domain, "check", Builds())
+        _, report = cache.get_or_build(domain, "ir", Builds())
+
+        assert report.hit is False
+
+    def test_corrupt_entry_is_a_miss(self, tmp_path, domain):
+        cache = IRCache(tmp_path / ".protean")
+        cache.get_or_build(domain, "ir", Builds())
+        (entry,) = cache.directory.glob("shop-*[0-9a-f].json")
+        entry.write_text("{ not json")
+
+        result, report = cache.get_or_build(domain, "ir", Builds())
+
+        assert result == {"build": 1}
+        assert report.hit is False
+
+    def test_cache_directory_is_ignored_by_git(self, tmp_path, domain):
+        cache = IRCache(tmp_path / ".protean")
+        cache.get_or_build(domain, "ir", Builds())
+
+        assert (cache.directory / ".gitignore").read_text().splitlines()[-1] == "*"
+
+    def test_unwritable_cache_still_builds(self, tmp_path, domain):
+        # A file where the cache directory should be
+        (tmp_path / ".protean").write_text("")
+
+        result, report = IRCache(tmp_path / ".protean").get_or_build(
+            domain, "ir", Builds()
+        )
+
+        assert result == {"build": 1}
+        assert report.hit is False
+
+
+class TestCacheReport:
+    def test_summary_of_a_hit(self):
+        report = CacheReport("ir", True, 100, (), hits=3, misses=1)
+
+        assert report.summary() == (
+            "IR cache hit: 100/100 modules unchanged, hit rate 75% (3 of 4 runs)"
+        )
+
+    def test_summary_of_a_miss_names_changed_modules(self):
+        changed = tuple(f"shop.m{i}" for i in range(7))
+        report = CacheReport("ir", False, 100, changed, hits=0, misses=1)
+
+        assert report.summary() == (
+            "IR cache miss: 93/100 modules unchanged, hit rate 0% (0 of 1 runs); "
+            "changed: shop.m0, shop.m1, shop.m2, shop.m3, shop.m4 and 2 more"
+        )
+
+
+class TestCacheOption:
+    @pytest.fixture(autouse=True)
+    def reset_path(self):
+        original_path = sys.path[:]
+        cwd = Path.cwd()
+        yield
+        sys.path[:] = original_path
+        os.chdir(cwd)
+
+    def test_ir_show_reuses_the_cached_ir(self, tmp_path):
+        change_working_directory_to("test7")
+        # Initialising the domain fills adapter defaults into its config, so
+        # the cached runs start from an initialised domain, as the later runs
+        # of one process would
+        runner.invoke(app, ["ir", "show", "-d", "publishing7.py"])
+        args = ["ir", "show", "-d", "publishing7.py", "--cache", "--dir", str(tmp_path)]
+
+        first = runner.invoke(app, args)
+        second = runner.invoke(app, args)
+
+        assert first.exit_code == second.exit_code == 0
+        assert "IR cache miss" in first.stderr
+        assert "IR cache hit" in second.stderr
+        live = load_domain_ir("publishing7.py")
+        assert json.loads(second.stdout)["checksum"] == live["checksum"]
+
+    def test_ir_check_reports_the_cache(self, tmp_path):
+        change_working_directory_to("test7")
+        show = runner.invoke(app, ["ir", "show", "-d", "publishing7.py"])
+        (tmp_path / "ir.json").write_text(show.stdout)
+        args = [
+            "ir",
+            "check",
+            "-d",
+            "publishing7.py",
+            "--cache",
+            "--dir",
+            str(tmp_path),
+        ]
+
+        runner.invoke(app, args)
+        result = runner.invoke(app, args)
+
+        assert result.exit_code == 0
+        assert "IR cache hit" in result.stderr
+
+    def test_check_reuses_the_cached_report(self, tmp_path):
+        change_working_directory_to("test7")
+        domain_file = str(Path.cwd() / "publishing7.py")
+        os.chdir(tmp_path)
+        args = ["check", "-d", domain_file, "--cache", "-f", "json"]
+
+        first = runner.invoke(app, args)
+        second = runner.invoke(app, args)
+
+        assert "IR cache hit" in second.stderr
+        assert json.loads(second.stdout)["data"] == json.loads(first.stdout)["data"]
+        assert (tmp_path / ".protean" / "cache").is_dir()
+
+
+_AGGREGATE_MODULE = """\
+from protean.fields import Identifier, Integer, String
+from protean.utils.mixins import handle
+
+from {package}.domain import domain
+
+
+@domain.aggregate
+class Thing{i}:
+    name = String(max_length=100)
+    count = Integer(default=0)
+
+
+@domain.command(part_of=Thing{i})
+class CreateThing{i}:
+    thing_id = Identifier(identifier=True)
+    name = String()
+
+
+@domain.event(part_of=Thing{i})
+class Created{i}:
+    thing_id = Identifier(identifier=True)
+    name = String()
+
+
+@domain.command_handler(part_of=Thing{i})
+class Thing{i}Handler:
+    @handle(CreateThing{i})
+    def create(self, command):
+        thing = Thing{i}(id=command.thing_id, name=command.name)
+        thing.raise_(Created{i}(thing_id=thing.id, name=thing.name))
+        domain.repository_for(Thing{i}).add(thing)
+
+
+@domain.event_handler(part_of=Thing{i})
+class Thing{i}Events:
+    @handle(Created{i})
+    def on_created(self, event):
+        pass
+"""
+
+
+@pytest.mark.slow
+@pytest.mark.no_test_domain
+class TestIRCacheBenchmark:
+    """How long ``protean ir show`` takes on a generated domain of 100
+    aggregates and 500 elements: without a cache entry, with one, and after
+    one module changed."""
+
+    MODULES = 100
+
+    def _generate(self, root: Path) -> None:
+        package = root / "benchapp"
+        package.mkdir()
+        (package / "__init__.py").write_text("")
+        (package / "domain.py").write_text(
+            'from protean import Domain\n\ndomain = Domain(name="Bench")\n'
+        )
+        for i in range(self.MODULES):
+            (package / f"ctx{i}.py").write_text(
+                _AGGREGATE_MODULE.format(package="benchapp", i=i)
+            )
+
+    def _show(self, root: Path) -> tuple[float, str]:
+        start = time.perf_counter()
+        completed = subprocess.run(
+            [
+                sys.executable,
+                "-m",
+                "protean",
+                "--log-level",
+                "WARNING",
+                "ir",
+                "show",
+                "--domain",
+                "benchapp.domain",
+                "--cache",
+            ],
+            cwd=root,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        elapsed = time.perf_counter() - start
+        (summary,) = [
+            line for line in completed.stderr.splitlines() if "IR cache" in line
+        ]
+        return elapsed, summary
+
+    def test_cached_ir_is_reused(self, tmp_path):
+        self._generate(tmp_path)
+
+        cold, _ = self._show(tmp_path)
+        warm, warm_summary = self._show(tmp_path)
+        with (tmp_path / "benchapp" / "ctx7.py").open("a") as source:
+            source.write("\n# edited\n")
+        changed, changed_summary = self._show(tmp_path)
+        print(
+            f"\nir show on {self.MODULES} modules: {cold:.2f}s cold, "
+            f"{warm:.2f}s warm, {changed:.2f}s with one module changed"
+            f"\n{warm_summary}\n{changed_summary}"
+        )
+
+        assert "IR cache hit" in warm_summary
+        assert "changed: benchapp.ctx7" in changed_summary
+        assert warm < cold
@@ -22,6 +22,7 @@ from protean.core.command import BaseCommand
 from protean.core.command_handler import BaseCommandHandler
 from protean.fields import Identifier, String
 from protean.integrations.fastapi import DomainContextMiddleware
+from protean.integrations.fastapi.middleware import _HttpLoggingConfig
 from protean.utils.globals import current_domain
 from protean.utils.logging import bind_event_context, unbind_event_context
 from protean.utils.mixins import handle
@@ -512,7 +513,7 @@ class TestClientMetadata:
         caplog.set_level(logging.DEBUG, logger="protean.access.http")
         DomainContextMiddleware._emit_http_wide_event(
             request=bare_request,
-            response=None,
+            response_headers=None,
             status_code=200,
             duration_ms=1.0,
             request_id="rid",
@@ -520,10 +521,7 @@ class TestClientMetadata:
             commands_dispatched=[],
             error_info=None,
             app_context={},
-            config={
-                "log_request_headers": False,
-                "log_response_headers": False,
-            },
+            config=_HttpLoggingConfig(),
         )
 
         records = _http_records(caplog)
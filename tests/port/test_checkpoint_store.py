@@ -0,0 +1,71 @@
+"""Port-level tests for subscription checkpoints.
+
+Covers reading a checkpoint from a legacy position stream message, which both
+the ``PositionStreamCheckpointStore`` fallback and the compaction of position
+streams rely on.
+"""
+
+from datetime import UTC, datetime
+
+from protean.port.checkpoint_store import (
+    Checkpoint,
+    PositionStreamCheckpointStore,
+    _message_time,
+)
+
+
+def _read(position: int, **fields) -> dict:
+    return {"type": "Read", "data": {"position": position}, **fields}
+
+
+class TestCheckpointFromMessage:
+    def test_none_message(self):
+        assert PositionStreamCheckpointStore.from_message("position-x", None) is None
+
+    def test_message_that_is_not_a_read_position(self):
+        message = {"type": "Registered", "data": {"position": 3}}
+        assert PositionStreamCheckpointStore.from_message("position-x", message) is None
+
+    def test_read_position(self):
+        dt = datetime(2026, 1, 1, tzinfo=UTC)
+
+        checkpoint = PositionStreamCheckpointStore.from_message(
+            "position-x", _read(7, time=dt)
+        )
+
+        assert checkpoint == Checkpoint("position-x", 7, dt)
+
+
+class TestMessageTime:
+    def test_top_level_time(self):
+        assert _message_time({"time": "2026-01-01T00:00:00Z"}) == datetime(
+            2026, 1, 1, tzinfo=UTC
+        )
+
+    def test_metadata_headers_time_dict(self):
+        msg = {"metadata": {"headers": {"time": "2026-02-02T00:00:00Z"}}}
+        assert _message_time(msg) == datetime(2026, 2, 2, tzinfo=UTC)
+
+    def test_metadata_headers_time_json_string(self):
+        msg = {"metadata": '{"headers": {"time": "2026-03-03T00:00:00Z"}}'}
+        assert _message_time(msg) == datetime(2026, 3, 3, tzinfo=UTC)
+
+    def test_missing_time_returns_none(self):
+        assert _message_time({"data": {"position": 1}}) is None
+
+    def test_malformed_metadata_json_returns_none(self):
+        assert _message_time({"metadata": "{not json"}) is None
+
+    def test_headers_as_json_string(self):
+        msg = {"metadata": {"headers": '{"time": "2026-04-04T00:00:00Z"}'}}
+        assert _message_time(msg) == datetime(2026, 4, 4, tzinfo=UTC)
+
+    def test_malformed_headers_json_returns_none(self):
+        assert _message_time({"metadata": {"headers": "{bad"}}) is None
+
+    def test_unparseable_time_returns_none(self):
+        assert _message_time({"time": "yesterday"}) is None
+
+    def test_datetime_value_kept(self):
+        dt = datetime(2026, 5, 5, 12, 0, 0, tzinfo=UTC)
+        assert _message_time({"metadata": {"headers": {"time": dt}}}) == dt
@@ -0,0 +1,151 @@
+"""Tests for the opt-in in-process cache of live process manager instances."""
+
+from uuid import uuid4
+
+import pytest
+
+from protean.core.process_manager import BaseProcessManager
+from protean.fields import Identifier, Integer, List, String
+from protean.utils.mixins import handle
+
+from .elements import (
+    Order,
+    OrderPlaced,
+    Payment,
+    PaymentConfirmed,
+    PaymentFailed,
+)
+
+
+class CachedPM(BaseProcessManager):
+    order_id: Identifier()
+    status: String(default="new")
+    confirmations: Integer(default=0)
+    payment_ids: List(content_type=String, default=list)
+
+    @handle(OrderPlaced, start=True, correlate="order_id")
+    def on_order_placed(self, event: OrderPlaced) -> None:
+        self.order_id = event.order_id
+        self.status = "awaiting_payment"
+
+    @handle(PaymentConfirmed, correlate="order_id")
+    def on_payment_confirmed(self, event: PaymentConfirmed) -> None:
+        self.confirmations += 1
+        self.payment_ids = [*self.payment_ids, event.payment_id]
+        if event.amount < 0:
+            raise ValueError("negative amount")
+
+    @handle(PaymentFailed, correlate="order_id", end=True)
+    def on_payment_failed(self, event: PaymentFailed) -> None:
+        self.status = "cancelled"
+
+
+@pytest.fixture(autouse=True)
+def register_elements(test_domain):
+    test_domain.register(Order)
+    test_domain.register(OrderPlaced, part_of=Order)
+    test_domain.register(Payment)
+    test_domain.register(PaymentConfirmed, part_of=Payment)
+    test_domain.register(PaymentFailed, part_of=Payment)
+    test_domain.register(
+        CachedPM,
+        stream_categories=["test::order", "test::payment"],
+        instance_cache_size=2,
+    )
+    test_domain.init(traverse=False)
+
+
+def _start(order_id: str) -> None:
+    CachedPM._handle(OrderPlaced(order_id=order_id, customer_id="C", total=1.0))
+
+
+def _confirm(order_id: str, amount: float = 1.0) -> None:
+    CachedPM._handle(
+        PaymentConfirmed(payment_id=str(uuid4()), order_id=order_id, amount=amount)
+    )
+
+
+class TestInstanceCache:
+    def test_cache_is_disabled_by_default(self, test_domain):
+        from .elements import OrderFulfillmentPM
+
+        assert OrderFulfillmentPM.meta_.instance_cache_size == 0
+
+    def test_persisted_transition_is_cached(self):
+        order_id = str(uuid4())
+        _start(order_id)
+
+        version, state, is_complete = CachedPM._instance_cache[order_id]
+        assert version == 0
+        assert state["status"] == "awaiting_payment"
+        assert is_complete is False
+
+    def test_cached_instance_skips_the_event_store(self, mocker):
+        order_id = str(uuid4())
+        _start(order_id)
+
+        load_spy = mocker.spy(CachedPM, "_from_last_transition")
+        _confirm(order_id)
+        _confirm(order_id)
+
+        assert load_spy.call_count == 0
+        pm = CachedPM._load_or_create(order_id, is_start=False)
+        assert pm.confirmations == 2
+        assert pm._version == 2
+
+    def test_cache_is_bounded_and_evicts_least_recently_used(self):
+        first, second, third = (str(uuid4()) for _ in range(3))
+        _start(first)
+        _start(second)
+        _confirm(first)  # `first` becomes most recently used
+        _start(third)
+
+        assert list(CachedPM._instance_cache) == [first, third]
+
+    def test_completed_instance_is_not_cached(self):
+        order_id = str(uuid4())
+        _start(order_id)
+        CachedPM._handle(
+            PaymentFailed(payment_id=str(uuid4()), order_id=order_id, reason="x")
+        )
+
+        assert order_id not in CachedPM._instance_cache
+
+    def test_failed_handler_does_not_corrupt_cached_state(self):
+        order_id = str(uuid4())
+        _start(order_id)
+        _confirm(order_id)
+
+        with pytest.raises(ValueError):
+            _confirm(order_id, amount=-1.0)
+
+        _, state, _ = CachedPM._instance_cache[order_id]
+        assert state["confirmations"] == 1
+        assert len(state["payment_ids"]) == 1
+
+    def test_stale_entry_fails_the_write_and_is_evicted(self, test_domain):
+        order_id = str(uuid4())
+        _start(order_id)
+
+        # Another worker appends a transition behind this process's back
+        stale_entry = CachedPM._instance_cache[order_id]
+        pm = CachedPM._load_or_create(order_id, is_start=False)
+        CachedPM._persist_transition(pm, "on_payment_confirmed")
+        CachedPM._instance_cache[order_id] = stale_entry
+
+        with pytest.raises(ValueError, match="Wrong expected version"):
+            _confirm(order_id)
+
+        assert order_id not in CachedPM._instance_cache
+
+        # The retry reloads from the store and succeeds
+        _confirm(order_id)
+        assert CachedPM._instance_cache[order_id][0] == 2
+
+    def test_init_resets_the_cache(self, test_domain):
+        _start(str(uuid4()))
+        assert CachedPM._instance_cache
+
+        test_domain.init(traverse=False)
+
+        assert not CachedPM._instance_cache
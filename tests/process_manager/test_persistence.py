@@ -153,3 +153,42 @@ class TestReconstitution:
         assert pm._correlation_value == "new-id"
         assert pm._version == -1
         assert pm._is_complete is False
+
+
+class TestTailLoad:
+    def test_load_reads_only_the_last_transition(self, test_domain, mocker):
+        order_id = str(uuid4())
+        OrderFulfillmentPM._handle(
+            OrderPlaced(order_id=order_id, customer_id="CUST-1", total=100.0)
+        )
+        OrderFulfillmentPM._handle(
+            PaymentConfirmed(payment_id=str(uuid4()), order_id=order_id, amount=100.0)
+        )
+
+        store = test_domain.event_store.store
+        read_spy = mocker.spy(store, "read")
+        tail_spy = mocker.spy(store, "_read_last_message")
+
+        pm = OrderFulfillmentPM._load_or_create(order_id, is_start=False)
+
+        assert pm.status == "awaiting_shipment"
+        assert tail_spy.call_count >= 1
+        assert read_spy.call_count == 0
+
+    def test_version_comes_from_the_stream_position(self, test_domain, mocker):
+        """The version is the tail's stream position, not a count of messages
+        read, so a PM past the store's 1000-message read cap loads correctly."""
+        order_id = str(uuid4())
+        OrderFulfillmentPM._handle(
+            OrderPlaced(order_id=order_id, customer_id="CUST-1", total=100.0)
+        )
+
+        store = test_domain.event_store.store
+        stream_name = f"{OrderFulfillmentPM.meta_.stream_category}-{order_id}"
+        tail = {**store._read_last_message(stream_name), "position": 1_500}
+        mocker.patch.object(store, "_read_last_message", return_value=tail)
+
+        pm = OrderFulfillmentPM._load_or_create(order_id, is_start=False)
+
+        assert pm._version == 1_500
+        assert pm.status == "awaiting_payment"
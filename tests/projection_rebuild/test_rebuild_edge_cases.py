@@ -128,7 +128,8 @@ class TestCacheBackedProjectionTruncation:
         mock_cache.remove_by_key_pattern.assert_called_once_with("cached_view:::*")
 
     def test_truncate_uses_dao_when_database_backed(self):
-        """_truncate_projection uses dao._delete_all for database-backed projections."""
+        """_truncate_projection uses dao.delete_all for database-backed projections,
+        which also invalidates cached query results read from them."""
         mock_dao = MagicMock()
         mock_repo = MagicMock()
         mock_repo._dao = mock_dao
@@ -143,7 +144,7 @@ class TestCacheBackedProjectionTruncation:
         _truncate_projection(mock_domain, mock_projection_cls)
 
         mock_domain.repository_for.assert_called_once_with(mock_projection_cls)
-        mock_dao._delete_all.assert_called_once()
+        mock_dao.delete_all.assert_called_once()
 
 
 class TestHandlerExceptionSkipsEvent:
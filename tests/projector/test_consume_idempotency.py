@@ -20,6 +20,7 @@ from protean.fields import Identifier, Integer, String
 from protean.utils import fqn
 from protean.utils.consume_idempotency import (
     ProcessedMessage,
+    batch_markers,
     cleanup_processed_messages,
 )
 from protean.utils.eventing import (
@@ -217,6 +218,131 @@ class TestConsumeIdempotency:
             test_domain._infrastructure.initialize_processed_messages()
 
 
+def _spy(monkeypatch, obj, name) -> list[tuple]:
+    """Record the arguments of every call to ``obj.name``."""
+    calls: list[tuple] = []
+    original = getattr(obj, name)
+
+    def _record(*args, **kwargs):
+        calls.append(args)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(obj, name, _record)
+    return calls
+
+
+class TestBatchedMarkerChecks:
+    """A subscription dispatching a batch reads its markers in one query."""
+
+    @pytest.fixture(autouse=True)
+    def register(self, test_domain):
+        _register(test_domain, idempotent=True)
+
+    @pytest.fixture
+    def repo(self):
+        return current_domain._get_processed_message_repo("default")
+
+    def _handle_batch(self, messages: list[Message]) -> None:
+        with batch_markers(message.metadata.headers.id for message in messages):
+            for message in messages:
+                RatingProjector._handle(message)
+
+    def test_markers_of_a_batch_are_read_in_one_query(self, repo, monkeypatch):
+        product_id = str(uuid4())
+        messages = [_review_message(product_id, seq=seq) for seq in range(5)]
+        among = _spy(monkeypatch, repo, "processed_among")
+        single = _spy(monkeypatch, repo, "is_processed")
+
+        self._handle_batch(messages)
+
+        assert len(among) == 1
+        assert single == []
+        stats = current_domain.repository_for(ProductStats).get(product_id)
+        assert stats.total_reviews == 5
+
+    def test_processed_messages_in_a_batch_are_skipped(self):
+        product_id = str(uuid4())
+        RatingProjector._handle(_review_message(product_id, seq=0))
+
+        self._handle_batch([_review_message(product_id, seq=seq) for seq in range(3)])
+
+        stats = current_domain.repository_for(ProductStats).get(product_id)
+        assert stats.total_reviews == 3
+
+    def test_message_repeated_within_a_batch_is_applied_once(self):
+        product_id = str(uuid4())
+        message = _review_message(product_id)
+
+        self._handle_batch([message, message])
+
+        stats = current_domain.repository_for(ProductStats).get(product_id)
+        assert stats.total_reviews == 1
+
+    def test_message_outside_the_batch_is_checked_on_its_own(self, repo, monkeypatch):
+        product_id = str(uuid4())
+        single = _spy(monkeypatch, repo, "is_processed")
+
+        with batch_markers(["some-other-message"]):
+            RatingProjector._handle(_review_message(product_id))
+
+        assert len(single) == 1
+
+    def test_marker_is_written_without_a_uniqueness_read(self, repo, monkeypatch):
+        validations = _spy(monkeypatch, repo._dao, "_validate_unique")
+
+        RatingProjector._handle(_review_message(str(uuid4())))
+
+        assert validations == []
+
+
+class TestRecentMarkerWindow:
+    def test_recent_window_is_off_by_default(self, test_domain):
+        _register(test_domain, idempotent=True)
+        repo = current_domain._get_processed_message_repo("default")
+        message_id = f"test::product-{uuid4()}-0"
+
+        repo.remember(message_id, "h")
+
+        assert not repo.is_processed(message_id, "h")
+
+    def test_redelivery_of_a_recent_marker_skips_the_read(
+        self, test_domain, monkeypatch
+    ):
+        test_domain.config["consume_idempotency"]["recent_window"] = 10
+        _register(test_domain, idempotent=True)
+        repo = current_domain._get_processed_message_repo("default")
+        product_id = str(uuid4())
+        message = _review_message(product_id)
+        RatingProjector._handle(message)
+
+        reads = _spy(monkeypatch, repo._dao, "_filter")
+        RatingProjector._handle(message)
+
+        assert reads == []
+        stats = current_domain.repository_for(ProductStats).get(product_id)
+        assert stats.total_reviews == 1
+
+    def test_window_keeps_the_most_recent_markers(self, test_domain):
+        test_domain.config["consume_idempotency"]["recent_window"] = 2
+        _register(test_domain, idempotent=True)
+        repo = current_domain._get_processed_message_repo("default")
+        for message_id in ("m1", "m2", "m3"):
+            repo.remember(message_id, "h")
+
+        assert ("m1", "h") not in repo._recent
+        assert ("m3", "h") in repo._recent
+
+    def test_cleanup_forgets_recent_markers(self, test_domain):
+        test_domain.config["consume_idempotency"]["recent_window"] = 10
+        _register(test_domain, idempotent=True)
+        repo = current_domain._get_processed_message_repo("default")
+        _old_marker(repo, "old", hours_ago=200)
+        repo.remember("old", "h")
+
+        assert repo.cleanup_old_markers(retention_hours=168, batch_size=5000) == 1
+        assert not repo.is_processed("old", "h")
+
+
 class FlakyProjector(BaseProjector):
     """Writes the read model, then crashes before commit on its first delivery."""
 
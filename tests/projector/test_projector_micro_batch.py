@@ -0,0 +1,288 @@
+"""Micro-batch projectors apply a subscription batch in one transaction.
+
+A ``micro_batch`` projector's events are handled together in one UnitOfWork
+that holds the projection rows they load and add, so a row touched by many
+events in the batch is read once and written once, when the batch commits.
+"""
+
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+
+from protean import current_domain
+from protean.core.aggregate import BaseAggregate
+from protean.core.event import BaseEvent
+from protean.core.projection import BaseProjection
+from protean.core.projector import BaseProjector, on
+from protean.core.unit_of_work import UnitOfWork
+from protean.exceptions import IncorrectUsageError
+from protean.fields import Float, Identifier
+from protean.port.broker import BrokerCapabilities
+from protean.port.dao import BaseDAO
+from protean.server import Engine
+from protean.server.subscription.event_store_subscription import (
+    EventStoreSubscription,
+)
+from protean.server.subscription.stream_subscription import StreamSubscription
+from protean.utils import Processing
+from protean.utils.eventing import Message
+
+
+class Account(BaseAggregate):
+    pass
+
+
+class Deposited(BaseEvent):
+    account_id: Identifier()
+    amount: Float()
+
+
+class Balance(BaseProjection):
+    account_id: Identifier(identifier=True)
+    total: Float(default=0.0)
+
+
+class CachedBalance(BaseProjection):
+    account_id: Identifier(identifier=True)
+    total: Float(default=0.0)
+
+
+class BalanceProjector(BaseProjector):
+    @on(Deposited)
+    def on_deposited(self, event: Deposited) -> None:
+        if event.amount < 0:
+            raise ValueError("Negative deposit")
+
+        repo = current_domain.repository_for(Balance)
+        balance = repo.get_or_none(event.account_id) or Balance(
+            account_id=event.account_id
+        )
+        balance.total += event.amount
+        repo.add(balance)
+
+
+@pytest.fixture(autouse=True)
+def register(test_domain):
+    test_domain.config["event_processing"] = Processing.ASYNC.value
+    test_domain.register(Account)
+    test_domain.register(Deposited, part_of=Account)
+    test_domain.register(Balance)
+    test_domain.register(
+        BalanceProjector,
+        projector_for=Balance,
+        aggregates=[Account],
+        micro_batch=True,
+    )
+    test_domain.init(traverse=False)
+
+
+@pytest.fixture
+def saves(monkeypatch):
+    """Count the projection rows written, by identifier."""
+    written: list[str] = []
+    save = BaseDAO.save
+
+    def counting_save(self, entity_obj, **kwargs):
+        if isinstance(entity_obj, Balance):
+            written.append(entity_obj.account_id)
+        return save(self, entity_obj, **kwargs)
+
+    monkeypatch.setattr(BaseDAO, "save", counting_save)
+    return written
+
+
+@pytest.fixture
+def engine(test_domain):
+    return Engine(domain=test_domain, test_mode=True)
+
+
+def _deposits(test_domain, account_id, *amounts) -> list[Message]:
+    store = test_domain.event_store.store
+    account = Account(id=account_id)
+    for amount in amounts:
+        account.raise_(Deposited(account_id=account_id, amount=amount))
+    for event in account._events:
+        store.append(event)
+    return store.read("test::account")
+
+
+def _total(account_id) -> float:
+    return current_domain.repository_for(Balance).get(account_id).total
+
+
+class TestOption:
+    def test_micro_batch_is_off_by_default(self, test_domain):
+        @test_domain.projector(projector_for=Balance, aggregates=[Account])
+        class PlainProjector:
+            pass
+
+        assert PlainProjector.meta_.micro_batch is False
+        assert BalanceProjector.meta_.micro_batch is True
+
+    def test_cache_backed_projection_cannot_micro_batch(self, test_domain):
+        test_domain.register(CachedBalance, cache="default")
+
+        with pytest.raises(IncorrectUsageError, match="cache-backed"):
+            test_domain.register(
+                BalanceProjector,
+                projector_for=CachedBalance,
+                aggregates=[Account],
+                micro_batch=True,
+            )
+
+
+class TestCoalescingUnitOfWork:
+    def test_get_returns_the_held_row_and_add_writes_it_once(self, test_domain, saves):
+        account_id = str(uuid4())
+        repo = test_domain.repository_for(Balance)
+
+        with UnitOfWork() as uow:
+            uow.coalesce_projections()
+            repo.add(Balance(account_id=account_id, total=1))
+            for _ in range(3):
+                balance = repo.get(account_id)
+                balance.total += 1
+                repo.add(balance)
+            assert repo.get(account_id) is balance
+            assert saves == []
+
+        assert saves == [account_id]
+        assert _total(account_id) == 4
+
+    def test_a_query_sees_held_rows(self, test_domain):
+        account_id = str(uuid4())
+        repo = test_domain.repository_for(Balance)
+
+        with UnitOfWork() as uow:
+            uow.coalesce_projections()
+            repo.add(Balance(account_id=account_id, total=7))
+
+            assert repo.find_by(account_id=account_id).total == 7
+
+    def test_a_deleted_row_is_gone_and_not_written_back(self, test_domain):
+        account_id = str(uuid4())
+        repo = test_domain.repository_for(Balance)
+
+        with UnitOfWork() as uow:
+            uow.coalesce_projections()
+            balance = Balance(account_id=account_id, total=7)
+            repo.add(balance)
+            repo._dao.delete(balance)
+
+            assert repo.get_or_none(account_id) is None
+
+        assert repo.get_or_none(account_id) is None
+
+    def test_nothing_is_written_on_rollback(self, test_domain, saves):
+        account_id = str(uuid4())
+        repo = test_domain.repository_for(Balance)
+
+        uow = UnitOfWork()
+        uow.start()
+        uow.coalesce_projections()
+        repo.add(Balance(account_id=account_id, total=7))
+        uow.rollback()
+
+        assert saves == []
+        assert repo.get_or_none(account_id) is None
+
+
+class TestHandleBatch:
+    @pytest.mark.asyncio
+    async def test_each_row_is_written_once_per_batch(self, test_domain, engine, saves):
+        account_id = str(uuid4())
+        messages = _deposits(test_domain, account_id, 10, 20, 30, 40)
+
+        results = await engine.handle_batch(BalanceProjector, messages)
+
+        assert results == [True] * 4
+        assert saves == [account_id]
+        assert _total(account_id) == 100
+
+    @pytest.mark.asyncio
+    async def test_a_failed_message_leaves_the_rest_of_the_batch_applied(
+        self, test_domain, engine
+    ):
+        account_id = str(uuid4())
+        messages = _deposits(test_domain, account_id, 10, -1, 20, 30)
+
+        results = await engine.handle_batch(BalanceProjector, messages)
+
+        assert results == [True, False, True, True]
+        assert _total(account_id) == 60
+
+    @pytest.mark.asyncio
+    async def test_a_failed_commit_applies_the_messages_one_by_one(
+        self, test_domain, engine, monkeypatch
+    ):
+        account_id = str(uuid4())
+        messages = _deposits(test_domain, account_id, 10, 20)
+        flush = UnitOfWork._flush_projection_rows
+        calls = []
+
+        def failing_once(uow):
+            calls.append(1)
+            if len(calls) == 1:
+                raise RuntimeError("Database went away")
+            flush(uow)
+
+        monkeypatch.setattr(UnitOfWork, "_flush_projection_rows", failing_once)
+
+        results = await engine.handle_batch(BalanceProjector, messages)
+
+        assert results == [True, True]
+        assert _total(account_id) == 30
+
+
+class TestSubscriptions:
+    @pytest.mark.asyncio
+    async def test_event_store_subscription_moves_past_the_batch_after_writing(
+        self, test_domain, engine, saves
+    ):
+        account_id = str(uuid4())
+        messages = _deposits(test_domain, account_id, 10, 20, 30)
+        subscription = EventStoreSubscription(engine, "test::account", BalanceProjector)
+        assert subscription.micro_batch is True
+
+        assert await subscription.process_batch(messages) == 3
+
+        assert saves == [account_id]
+        assert _total(account_id) == 60
+        assert subscription.current_position == (
+            messages[-1].metadata.event_store.global_position
+        )
+
+    @pytest.mark.asyncio
+    async def test_stream_subscription_acks_the_batch_after_writing(
+        self, test_domain, engine, saves
+    ):
+        account_id = str(uuid4())
+        messages = _deposits(test_domain, account_id, 10, 20, 30)
+        subscription = StreamSubscription(
+            engine=engine,
+            stream_category="test::account",
+            handler=BalanceProjector,
+            max_retries=50,
+            retry_delay_seconds=0,
+        )
+        broker = MagicMock()
+        broker.has_capability = MagicMock(
+            side_effect=lambda cap: cap == BrokerCapabilities.BATCH_ACK
+        )
+        broker.ack_many = MagicMock(
+            side_effect=lambda stream, ids, group: [True] * len(ids)
+        )
+        broker.nack = MagicMock(return_value=True)
+        subscription.broker = broker
+
+        batch = [(str(uuid4()), message.to_dict()) for message in messages]
+        assert await subscription.process_batch(batch) == 3
+
+        assert saves == [account_id]
+        assert _total(account_id) == 60
+        broker.ack_many.assert_called_once_with(
+            "test::account",
+            [identifier for identifier, _ in batch],
+            subscription.consumer_group,
+        )
@@ -0,0 +1,370 @@
+"""Cached query results, invalidated by writes to the projections they read.
+
+``@read(Query, cache_ttl=...)`` keeps a handler's results in the ``default``
+cache, keyed by the query payload. Every committed write to a projection the
+query reads replaces that projection's stamp, so the next dispatch runs the
+handler again instead of serving what the write replaced.
+"""
+
+import json
+
+import pytest
+
+from protean import current_domain
+from protean.core.projection import BaseProjection
+from protean.core.query import BaseQuery
+from protean.core.query_handler import BaseQueryHandler
+from protean.core.unit_of_work import UnitOfWork
+from protean.domain.query_processor import _RESULT_KEY, _payload_digest
+from protean.exceptions import IncorrectUsageError, ObjectNotFoundError
+from protean.fields import Float, Identifier, String
+from protean.port.cache import BaseCache
+from protean.utils.mixins import read
+
+
+class Balance(BaseProjection):
+    account_id: Identifier(identifier=True)
+    total: Float(default=0.0)
+
+
+class Rate(BaseProjection):
+    currency: String(identifier=True)
+    value: Float()
+
+
+class CachedRate(BaseProjection):
+    currency: String(identifier=True)
+    value: Float()
+
+
+class GetBalance(BaseQuery):
+    account_id: Identifier(required=True)
+
+
+class GetBalanceIn(BaseQuery):
+    account_id: Identifier(required=True)
+    currency: String(required=True)
+
+
+class GetCachedRate(BaseQuery):
+    currency: String(required=True)
+
+
+class GetLiveBalance(BaseQuery):
+    account_id: Identifier(required=True)
+
+
+class GetBalanceCallable(BaseQuery):
+    account_id: Identifier(required=True)
+
+
+class ListBalances(BaseQuery):
+    pass
+
+
+class GetTotals(BaseQuery):
+    pass
+
+
+calls: list[str] = []
+
+
+class BalanceQueryHandler(BaseQueryHandler):
+    @read(GetBalance, cache_ttl=60)
+    def get_balance(self, query):
+        calls.append("balance")
+        return self._view().get(query.account_id)
+
+    @read(GetBalanceIn, cache_ttl=60, projections=[Balance, Rate])
+    def get_balance_in(self, query):
+        calls.append("balance_in")
+        rate = current_domain.view_for(Rate).get(query.currency)
+        return self._view().get(query.account_id).total * rate.value
+
+    @read(GetLiveBalance)
+    def get_live_balance(self, query):
+        calls.append("live")
+        return self._view().get(query.account_id)
+
+    @read(GetBalanceCallable, cache_ttl=60)
+    def get_balance_callable(self, query):
+        calls.append("callable")
+        return lambda: query.account_id
+
+    @read(ListBalances, cache_ttl=60)
+    def list_balances(self, query):
+        calls.append("list")
+        return self._view().query.all()
+
+    @read(GetTotals, cache_ttl=60)
+    def get_totals(self, query):
+        calls.append("totals")
+        balances = self._view().query.only("account_id", "total").all().items
+        return {"balances": balances, "count": len(balances), "rate": (2.0, None)}
+
+    @staticmethod
+    def _view():
+        return current_domain.view_for(Balance)
+
+
+class CachedRateQueryHandler(BaseQueryHandler):
+    @read(GetCachedRate, cache_ttl=60)
+    def get_rate(self, query):
+        calls.append("cached_rate")
+        return current_domain.view_for(CachedRate).get(query.currency).value
+
+
+@pytest.fixture(autouse=True)
+def register_elements(test_domain):
+    calls.clear()
+    test_domain.register(Balance)
+    test_domain.register(Rate)
+    test_domain.register(CachedRate, cache="default")
+    for query in (
+        GetBalance,
+        GetBalanceIn,
+        GetLiveBalance,
+        GetBalanceCallable,
+        ListBalances,
+        GetTotals,
+    ):
+        test_domain.register(query, part_of=Balance)
+    test_domain.register(GetCachedRate, part_of=CachedRate)
+    test_domain.register(BalanceQueryHandler, part_of=Balance)
+    test_domain.register(CachedRateQueryHandler, part_of=CachedRate)
+    test_domain.init(traverse=False)
+
+    test_domain.repository_for(Balance).add(Balance(account_id="acc-1", total=10))
+    test_domain.repository_for(Rate).add(Rate(currency="EUR", value=2.0))
+    calls.clear()
+
+
+def _result_key(query):
+    return _RESULT_KEY.format(query.__class__.__type__, _payload_digest(query))
+
+
+def _deposit(test_domain, amount):
+    repo = test_domain.repository_for(Balance)
+    balance = repo.get("acc-1")
+    balance.total += amount
+    repo.add(balance)
+
+
+class TestCaching:
+    def test_a_repeated_query_is_answered_from_the_cache(self, test_domain):
+        first = test_domain.dispatch(GetBalance(account_id="acc-1"))
+        second = test_domain.dispatch(GetBalance(account_id="acc-1"))
+
+        assert calls == ["balance"]
+        assert second.total == first.total == 10
+        assert second is not first  # Each hit is its own copy
+
+    def test_each_payload_is_cached_separately(self, test_domain):
+        test_domain.repository_for(Balance).add(Balance(account_id="acc-2", total=5))
+
+        assert test_domain.dispatch(GetBalance(account_id="acc-1")).total == 10
+        assert test_domain.dispatch(GetBalance(account_id="acc-2")).total == 5
+        assert calls == ["balance", "balance"]
+
+    def test_handlers_without_a_ttl_are_not_cached(self, test_domain):
+        test_domain.dispatch(GetLiveBalance(account_id="acc-1"))
+        test_domain.dispatch(GetLiveBalance(account_id="acc-1"))
+
+        assert calls == ["live", "live"]
+
+    def test_an_unserializable_result_is_returned_uncached(self, test_domain):
+        result = test_domain.dispatch(GetBalanceCallable(account_id="acc-1"))
+        test_domain.dispatch(GetBalanceCallable(account_id="acc-1"))
+
+        assert result() == "acc-1"
+        assert calls == ["callable", "callable"]
+
+    def test_queries_inside_a_unit_of_work_bypass_the_cache(self, test_domain):
+        test_domain.dispatch(GetBalance(account_id="acc-1"))
+
+        with UnitOfWork():
+            _deposit(test_domain, 5)
+            # Sees the transaction's own write, and caches nothing from it
+            assert test_domain.dispatch(GetBalance(account_id="acc-1")).total == 15
+
+        assert calls == ["balance", "balance"]
+
+    def test_a_result_set_round_trips(self, test_domain):
+        test_domain.dispatch(ListBalances())
+        cached = test_domain.dispatch(ListBalances())
+
+        assert calls == ["list"]
+        assert cached.total == 1
+        assert isinstance(cached.items[0], Balance)
+        assert cached.items[0].total == 10
+
+    def test_records_and_plain_values_round_trip(self, test_domain):
+        test_domain.dispatch(GetTotals())
+        cached = test_domain.dispatch(GetTotals())
+
+        assert calls == ["totals"]
+        assert cached["count"] == 1
+        assert cached["balances"][0].total == 10
+        assert cached["rate"] == [2.0, None]  # Tuples come back as lists
+
+    def test_results_are_stored_as_json(self, test_domain):
+        query = GetBalance(account_id="acc-1")
+        test_domain.dispatch(query)
+
+        [entry] = test_domain.caches["default"]._get_raw([_result_key(query)])
+
+        assert json.loads(entry)["result"]["data"]["total"] == 10
+
+    @pytest.mark.parametrize(
+        "entry",
+        [
+            b"\x80\x04not json",
+            b'{"stamps": [], "result": null}',
+            b'{"stamps": STAMPS, "result": {"__protean__": "projection", '
+            b'"class": "os.system", "data": {}}}',
+        ],
+    )
+    def test_an_entry_that_does_not_decode_is_a_miss(self, test_domain, entry):
+        query = GetBalance(account_id="acc-1")
+        test_domain.dispatch(query)
+        cache, key = test_domain.caches["default"], _result_key(query)
+        stamps = json.loads(cache._get_raw([key])[0])["stamps"]
+        cache._set_raw(key, entry.replace(b"STAMPS", json.dumps(stamps).encode()))
+
+        assert test_domain.dispatch(query).total == 10
+        assert calls == ["balance", "balance"]
+
+    def test_a_lost_stamp_forces_a_fresh_read(self, test_domain):
+        test_domain.dispatch(GetBalance(account_id="acc-1"))
+
+        test_domain.caches["default"].flush_all()
+        test_domain.dispatch(GetBalance(account_id="acc-1"))
+
+        assert calls == ["balance", "balance"]
+
+
+class TestCacheWithoutRawValues:
+    """A `default` cache whose adapter leaves `_get_raw`/`_set_raw` to the port."""
+
+    @pytest.fixture(autouse=True)
+    def cache_without_raw_values(self, test_domain, monkeypatch):
+        cache = test_domain.caches["default"]
+        for name in ("_get_raw", "_set_raw"):
+            monkeypatch.setattr(cache, name, getattr(BaseCache, name).__get__(cache))
+
+    def test_queries_run_uncached(self, test_domain):
+        test_domain.dispatch(GetBalance(account_id="acc-1"))
+        test_domain.dispatch(GetBalance(account_id="acc-1"))
+
+        assert calls == ["balance", "balance"]
+
+    def test_writes_still_commit(self, test_domain):
+        _deposit(test_domain, 5)
+
+        assert test_domain.dispatch(GetBalance(account_id="acc-1")).total == 15
+
+
+class TestInvalidation:
+    def test_a_committed_write_invalidates_the_result(self, test_domain):
+        test_domain.dispatch(GetBalance(account_id="acc-1"))
+
+        _deposit(test_domain, 5)
+
+        assert test_domain.dispatch(GetBalance(account_id="acc-1")).total == 15
+        assert calls == ["balance", "balance"]
+
+    def test_a_write_invalidates_only_once_it_commits(self, test_domain):
+        test_domain.dispatch(GetBalance(account_id="acc-1"))
+        stamp_key = "protean:query-stamp:" + (
+            f"{Balance.__module__}.{Balance.__qualname__}"
+        )
+        cache = test_domain.caches["default"]
+        [before] = cache._get_raw([stamp_key])
+
+        with UnitOfWork():
+            _deposit(test_domain, 5)
+            assert cache._get_raw([stamp_key]) == [before]
+
+        assert cache._get_raw([stamp_key]) != [before]
+
+    def test_a_rolled_back_write_keeps_the_result(self, test_domain):
+        test_domain.dispatch(GetBalance(account_id="acc-1"))
+
+        uow = UnitOfWork()
+        uow.start()
+        test_domain.repository_for(Balance).add(Balance(account_id="acc-2"))
+        uow.rollback()
+
+        test_domain.dispatch(GetBalance(account_id="acc-1"))
+        assert calls == ["balance"]
+
+    def test_a_delete_invalidates_the_result(self, test_domain):
+        test_domain.dispatch(GetBalance(account_id="acc-1"))
+        repo = test_domain.repository_for(Balance)
+
+        repo._dao.delete(repo.get("acc-1"))
+
+        with pytest.raises(ObjectNotFoundError):
+            test_domain.dispatch(GetBalance(account_id="acc-1"))
+
+    def test_clearing_the_projection_invalidates_the_result(self, test_domain):
+        test_domain.dispatch(GetBalance(account_id="acc-1"))
+
+        test_domain.repository_for(Balance)._dao.delete_all()
+
+        with pytest.raises(ObjectNotFoundError):
+            test_domain.dispatch(GetBalance(account_id="acc-1"))
+
+    def test_a_write_to_any_named_projection_invalidates(self, test_domain):
+        query = GetBalanceIn(account_id="acc-1", currency="EUR")
+        assert test_domain.dispatch(query) == 20
+
+        repo = test_domain.repository_for(Rate)
+        rate = repo.get("EUR")
+        rate.value = 3.0
+        repo.add(rate)
+
+        assert test_domain.dispatch(query) == 30
+        assert calls == ["balance_in", "balance_in"]
+
+    def test_a_write_to_an_unrelated_projection_does_not(self, test_domain):
+        test_domain.dispatch(GetBalance(account_id="acc-1"))
+
+        test_domain.repository_for(Rate).add(Rate(currency="USD", value=1.0))
+
+        test_domain.dispatch(GetBalance(account_id="acc-1"))
+        assert calls == ["balance"]
+
+    def test_a_write_through_the_cache_invalidates(self, test_domain):
+        cache = test_domain.cache_for(CachedRate)
+        cache.add(CachedRate(currency="EUR", value=2.0))
+        assert test_domain.dispatch(GetCachedRate(currency="EUR")) == 2.0
+
+        cache.add(CachedRate(currency="EUR", value=4.0))
+
+        assert test_domain.dispatch(GetCachedRate(currency="EUR")) == 4.0
+        assert calls == ["cached_rate", "cached_rate"]
+
+
+class TestDeclaration:
+    @pytest.mark.parametrize("cache_ttl", [0, -5, "60", True, float("inf")])
+    def test_cache_ttl_must_be_a_positive_number(self, cache_ttl):
+        with pytest.raises(IncorrectUsageError, match="positive number of seconds"):
+            read(GetBalance, cache_ttl=cache_ttl)
+
+    def test_projections_need_a_cache_ttl(self):
+        with pytest.raises(IncorrectUsageError, match="without a `cache_ttl`"):
+            read(GetBalance, projections=[Balance])
+
+    def test_projections_must_be_projections(self, test_domain):
+        class BadQueryHandler(BaseQueryHandler):
+            @read(GetBalance, cache_ttl=60, projections=[GetBalance])
+            def get_balance(self, query):
+                pass
+
+        test_domain.register(BadQueryHandler, part_of=Balance)
+
+        with pytest.raises(
+            IncorrectUsageError, match="caches its results against `GetBalance`"
+        ):
+            test_domain.init(traverse=False)
@@ -251,6 +251,23 @@ class TestSubscriptionsMetrics:
         body = response.text
         assert "protean_subscription_pending_messages" in body
 
+    def test_metrics_contains_subscription_idle_pending(self):
+        """Prometheus output includes protean_subscription_idle_pending."""
+        mock_domain = _make_mock_domain("metric-domain")
+
+        statuses = [_lagging_status()]
+
+        with patch(
+            "protean.server.subscription_status.collect_subscription_statuses",
+            return_value=statuses,
+        ):
+            observatory = Observatory(domains=[mock_domain])
+            client = TestClient(observatory.app)
+            response = client.get("/metrics")
+
+        body = response.text
+        assert "protean_subscription_idle_pending" in body
+
     def test_metrics_contains_subscription_dlq_depth(self):
         """Prometheus output includes protean_subscription_dlq_depth."""
         mock_domain = _make_mock_domain("metric-domain")
@@ -121,6 +121,8 @@ def _make_stream_subscription(test_domain, handler_cls=ToggleEventHandler, **ove
         ),
     )
     broker = MagicMock()
+    # Per-message ACKs: no BATCH_ACK or DELAYED_REDELIVERY.
+    broker.has_capability = MagicMock(return_value=False)
     broker.ack = MagicMock(return_value=True)
     broker.nack = MagicMock(return_value=True)
     broker.publish = MagicMock()
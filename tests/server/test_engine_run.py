@@ -16,6 +16,8 @@ from protean.utils.mixins import handle
 
 counter = 0
 
+POSITION_STREAM = f"position-{__name__}.UserEventHandler-authentication"
+
 
 def count_up():
     global counter
@@ -70,8 +72,10 @@ def test_that_read_position_is_updated_after_engine_run(test_domain):
     engine = Engine(domain=test_domain, test_mode=True)
     engine.run()
 
-    messages = test_domain.event_store.store.read("$all")
-    assert len(messages) == 2
+    # The read position lands in a checkpoint, not in the event store
+    assert test_domain.event_store.store.read("$all") == messages
+    checkpoint = test_domain.event_store.store.read_checkpoint(POSITION_STREAM)
+    assert checkpoint.position == messages[0].metadata.event_store.global_position
 
 
 def test_processing_messages_from_beginning_the_first_time(test_domain):
@@ -83,8 +87,8 @@ def test_processing_messages_from_beginning_the_first_time(test_domain):
     engine = Engine(domain=test_domain, test_mode=True)
     engine.run()
 
-    messages = test_domain.event_store.store.read("$all")
-    assert len(messages) == 2
+    checkpoint = test_domain.event_store.store.read_checkpoint(POSITION_STREAM)
+    assert checkpoint is not None
 
     # Create and set a new loop
     loop = asyncio.new_event_loop()
@@ -93,8 +97,11 @@ def test_processing_messages_from_beginning_the_first_time(test_domain):
     engine = Engine(domain=test_domain, test_mode=True)
     engine.run()
 
-    messages = test_domain.event_store.store.read("$all")
-    assert len(messages) == 2
+    assert len(test_domain.event_store.store.read("$all")) == 1
+    assert (
+        test_domain.event_store.store.read_checkpoint(POSITION_STREAM).position
+        == checkpoint.position
+    )
 
 
 def test_engine_run_non_test_mode(test_domain, caplog):
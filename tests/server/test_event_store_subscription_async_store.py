@@ -0,0 +1,110 @@
+"""EventStoreSubscription reaches the event store through its async methods.
+
+An adapter with an async driver overrides ``_aread``, ``_awrite`` and
+``_aread_last_message``; the subscription must then read, checkpoint and load
+its position without handing any of it to a worker thread. The store here keeps
+its checkpoints on position streams, as an adapter without a checkpoint store
+of its own does.
+"""
+
+import asyncio
+
+import pytest
+
+from protean.adapters.event_store.memory import MemoryEventStore
+from protean.core.aggregate import BaseAggregate
+from protean.core.event import BaseEvent
+from protean.core.event_handler import BaseEventHandler
+from protean.fields import Identifier, String
+from protean.port.checkpoint_store import PositionStreamCheckpointStore
+from protean.server import Engine
+from protean.server.subscription.event_store_subscription import (
+    EventStoreSubscription,
+)
+from protean.utils import Processing
+from protean.utils.mixins import handle
+
+handled: list[str] = []
+
+
+class User(BaseAggregate):
+    email: String()
+
+
+class Registered(BaseEvent):
+    id: Identifier()
+    email: String()
+
+
+class UserEventHandler(BaseEventHandler):
+    @handle(Registered)
+    def registered(self, event: Registered) -> None:
+        handled.append(event.email)
+
+
+class NativeAsyncStore(MemoryEventStore):
+    """A memory store whose async methods run inline and record each call."""
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.async_calls: list[str] = []
+
+    def _make_checkpoint_store(self):
+        return PositionStreamCheckpointStore(self)
+
+    async def _awrite(
+        self, stream_name, message_type, data, metadata=None, expected_version=None
+    ):
+        self.async_calls.append("write")
+        return self._write(stream_name, message_type, data, metadata, expected_version)
+
+    async def _aread(self, stream_name, sql=None, position=0, no_of_messages=1000):
+        self.async_calls.append("read")
+        return self._read(stream_name, sql, position, no_of_messages)
+
+    async def _aread_last_message(self, stream_name):
+        self.async_calls.append("read_last")
+        return self._read_last_message(stream_name)
+
+
+@pytest.fixture
+def store(test_domain, monkeypatch):
+    handled.clear()
+    test_domain.config["event_processing"] = Processing.ASYNC.value
+    test_domain.register(User)
+    test_domain.register(Registered, part_of=User)
+    test_domain.register(UserEventHandler, part_of=User)
+    test_domain.init(traverse=False)
+
+    native = NativeAsyncStore(test_domain, {})
+    monkeypatch.setattr(test_domain.event_store, "_event_store", native)
+    return native
+
+
+@pytest.mark.asyncio
+async def test_subscription_uses_the_async_store_methods(
+    test_domain, store, monkeypatch
+):
+    user = User(email="john@example.com")
+    user.raise_(Registered(id=user.id, email="john@example.com"))
+    test_domain.event_store.store.append(user._events[0])
+
+    async def no_threads(*args, **kwargs):
+        raise AssertionError("the event store was reached through a thread")
+
+    monkeypatch.setattr(asyncio, "to_thread", no_threads)
+
+    engine = Engine(domain=test_domain, test_mode=True)
+    subscription = EventStoreSubscription(
+        engine,
+        "test::user",
+        UserEventHandler,
+        messages_per_tick=10,
+        position_update_interval=1,
+    )
+    await subscription.load_position_on_start()
+    await subscription.tick()
+
+    assert handled == ["john@example.com"]
+    assert {"read", "read_last", "write"} <= set(store.async_calls)
+    assert await subscription.fetch_last_position() == subscription.current_position
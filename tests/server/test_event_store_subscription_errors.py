@@ -301,11 +301,10 @@ class TestFailedPositionRecording:
         assert sub.current_position == 10
 
         # Position update was written to the store
-        pos_msgs = test_domain.event_store.store.read(
-            sub.subscriber_stream_name, position=0
+        checkpoint = test_domain.event_store.store.read_checkpoint(
+            sub.subscriber_stream_name
         )
-        assert len(pos_msgs) > 0
-        assert pos_msgs[-1].data["position"] == 10
+        assert checkpoint.position == 10
 
     @pytest.mark.asyncio
     async def test_handle_error_callback_invoked(self, test_domain):
@@ -1201,11 +1200,12 @@ class _FaultyWrite:
     Used to inject a store-write failure (a proxy for a crash) at a precise
     seam so the failed-record-before-cursor ordering can be tested. Construct it
     *before* patching so it captures the real ``_write``; toggle ``armed`` to
-    stop failing and let the store recover.
+    stop failing and let the store recover. ``method`` names another write to
+    wrap, such as a checkpoint store's ``write``.
     """
 
-    def __init__(self, store, target_stream: str) -> None:
-        self._real = store._write
+    def __init__(self, store, target_stream: str, method: str = "_write") -> None:
+        self._real = getattr(store, method)
         self._target = target_stream
         self.armed: bool = True
 
@@ -1281,10 +1281,11 @@ class TestFailureRecordOrdering:
         sub = _make_subscription(test_domain, AlwaysFailingEventHandler)
         msg = _create_message(global_position=5)
 
-        # Fail the cursor write (to the subscriber stream). It is issued only after
+        # Fail the cursor write (to the subscriber checkpoint). It is issued only after
         # the recovery record, so the record is already written when this raises.
-        faulty = _FaultyWrite(sub.store, sub.subscriber_stream_name)
-        monkeypatch.setattr(sub.store, "_write", faulty)
+        checkpoints = sub.store.checkpoints
+        faulty = _FaultyWrite(checkpoints, sub.subscriber_stream_name, "write")
+        monkeypatch.setattr(checkpoints, "write", faulty)
 
         with pytest.raises(RuntimeError, match="simulated store failure"):
             await sub.process_batch([msg])
@@ -1316,8 +1317,9 @@ class TestFailureRecordOrdering:
         msg1 = _create_message(global_position=1)
         msg2 = _create_message(global_position=2)
 
-        faulty = _FaultyWrite(sub.store, sub.subscriber_stream_name)
-        monkeypatch.setattr(sub.store, "_write", faulty)
+        checkpoints = sub.store.checkpoints
+        faulty = _FaultyWrite(checkpoints, sub.subscriber_stream_name, "write")
+        monkeypatch.setattr(checkpoints, "write", faulty)
 
         with pytest.raises(RuntimeError, match="simulated store failure"):
             await sub.process_batch([msg1, msg2])
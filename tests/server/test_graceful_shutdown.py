@@ -157,6 +157,49 @@ class TestEngineShutdownOrder:
                 "domain_close"
             )
 
+    def test_shutdown_awaits_event_store_aclose_before_domain_close(self):
+        """Loop-bound event store resources close while the loop still runs."""
+        domain = Domain(name="Test")
+        domain.init(traverse=False)
+
+        with domain.domain_context():
+            engine = Engine(domain, test_mode=True)
+            call_order = []
+
+            async def aclose():
+                call_order.append("aclose")
+
+            with (
+                patch.object(domain.event_store.store, "aclose", side_effect=aclose),
+                patch.object(
+                    domain, "close", side_effect=lambda: call_order.append("close")
+                ),
+            ):
+                engine.loop.run_until_complete(engine.shutdown())
+
+            assert call_order == ["aclose", "close"]
+
+    def test_shutdown_event_store_aclose_error_still_closes_domain(self, caplog):
+        domain = Domain(name="Test")
+        domain.init(traverse=False)
+
+        with domain.domain_context():
+            engine = Engine(domain, test_mode=True)
+
+            with (
+                patch.object(
+                    domain.event_store.store,
+                    "aclose",
+                    side_effect=RuntimeError("pool gone"),
+                ),
+                patch.object(domain, "close") as mock_close,
+                caplog.at_level(logging.ERROR),
+            ):
+                engine.loop.run_until_complete(engine.shutdown())
+
+            mock_close.assert_called_once()
+            assert any("engine.cleanup_failed" in r.message for r in caplog.records)
+
     def test_shutdown_domain_close_error_does_not_prevent_loop_stop(self, caplog):
         """Even if domain.close() raises, the loop should still stop."""
         domain = Domain(name="Test")
@@ -521,10 +564,12 @@ class TestRedisBrokerReconnectAfterClose:
         broker.name = "test"
         broker.conn_info = {"URI": "redis://localhost:6379/0"}
         broker._pool_kwargs = {}
+        broker._pool_timeout = None
         broker.redis_instance = None
         broker._consumer_name = "consumer-test"
         broker._created_groups_set = set()
         broker._group_creation_times = {}
+        broker._held_back = {}
         return broker
 
     def test_client_revives_when_instance_is_none(self):
@@ -0,0 +1,309 @@
+"""Tests for the pending reclaimer — XAUTOCLAIM-style takeover of idle messages.
+
+Covers:
+- One bounded page is claimed per stream, into the subscription's consumer
+- The scan cursor carries across cycles
+- Backfill streams are scanned when priority lanes are enabled
+- Subscriptions on brokers without PENDING_RECLAIM are skipped
+- A failing stream does not abort the cycle
+- Engine wiring honours [server.pending_reclaim]
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from protean import Domain
+from protean.core.aggregate import BaseAggregate
+from protean.core.event import BaseEvent
+from protean.core.event_handler import BaseEventHandler
+from protean.fields import String
+from protean.port.broker import BrokerCapabilities
+from protean.server.engine import Engine
+from protean.server.pending_reclaimer import PendingReclaimTask
+from protean.server.subscription.stream_subscription import StreamSubscription
+
+# ── Domain elements ──────────────────────────────────────────────────────
+
+
+class ReclaimAggregate(BaseAggregate):
+    name: String(required=True)
+
+
+class ReclaimEvent(BaseEvent):
+    name: String(required=True)
+
+
+class ReclaimHandler(BaseEventHandler):
+    pass
+
+
+# ── Helpers ──────────────────────────────────────────────────────────────
+
+
+class FakeBroker:
+    """Broker stub that serves XAUTOCLAIM-style pages from a fixed script."""
+
+    def __init__(self, pages: dict | None = None, reclaim: bool = True) -> None:
+        self.reclaim = reclaim
+        # stream -> {start_id: (next_cursor, claimed)}
+        self.pages = pages or {}
+        self.calls: list[tuple] = []
+
+    def has_capability(self, cap) -> bool:
+        return cap == BrokerCapabilities.PENDING_RECLAIM and self.reclaim
+
+    def reclaim_pending(
+        self, stream, consumer_group, consumer_name, min_idle_ms, start_id, count
+    ):
+        self.calls.append(
+            (stream, consumer_group, consumer_name, min_idle_ms, start_id, count)
+        )
+        if isinstance(self.pages.get(stream), Exception):
+            raise self.pages[stream]
+        return self.pages.get(stream, {}).get(start_id, ("0-0", []))
+
+
+def _setup_domain(reclaim_config: dict | None = None) -> Domain:
+    domain = Domain(__file__, "ReclaimTest")
+    domain.config["brokers"] = {"default": {"provider": "inline"}}
+    if reclaim_config is not None:
+        domain.config["server"]["pending_reclaim"] = reclaim_config
+    return domain
+
+
+def _subscription(engine, broker, stream="reclaim_stream") -> StreamSubscription:
+    sub = StreamSubscription(
+        engine=engine, stream_category=stream, handler=ReclaimHandler
+    )
+    sub.broker = broker
+    return sub
+
+
+def _engine(domain, subscriptions=None):
+    engine = MagicMock()
+    engine.domain = domain
+    engine._subscriptions = subscriptions or {}
+    engine.shutting_down = False
+    return engine
+
+
+# ── Tests ────────────────────────────────────────────────────────────────
+
+
+class TestPendingReclaimTaskInit:
+    @pytest.mark.no_test_domain
+    def test_defaults(self):
+        domain = _setup_domain()
+        with domain.domain_context():
+            domain.init(traverse=False)
+            task = PendingReclaimTask(_engine(domain))
+
+        assert task.min_idle_ms == 120_000
+        assert task.batch_size == 100
+        assert task.check_interval == 30
+        assert task.subscriber_name == "pending-reclaimer"
+
+    @pytest.mark.no_test_domain
+    def test_reads_config(self):
+        domain = _setup_domain(
+            {"min_idle_ms": 5000, "batch_size": 10, "check_interval_seconds": 2}
+        )
+        with domain.domain_context():
+            domain.init(traverse=False)
+            task = PendingReclaimTask(_engine(domain))
+
+        assert task.min_idle_ms == 5000
+        assert task.batch_size == 10
+        assert task.check_interval == 2
+
+
+class TestPendingReclaimCycle:
+    @pytest.mark.no_test_domain
+    @pytest.mark.asyncio
+    async def test_claims_one_page_into_the_subscription_consumer(self):
+        domain = _setup_domain({"min_idle_ms": 5000, "batch_size": 2})
+        with domain.domain_context():
+            domain.register(ReclaimAggregate)
+            domain.register(ReclaimEvent, part_of=ReclaimAggregate)
+            domain.register(ReclaimHandler, part_of=ReclaimAggregate)
+            domain.init(traverse=False)
+
+            broker = FakeBroker({"reclaim_stream": {"0-0": ("5-0", ["1-0", "2-0"])}})
+            engine = Engine(domain, test_mode=True)
+            sub = _subscription(engine, broker)
+            task = PendingReclaimTask(_engine(domain, {"sub": sub}))
+
+            assert await task._reclaim_cycle() == 2
+
+        assert broker.calls == [
+            (
+                "reclaim_stream",
+                sub.consumer_group,
+                sub.consumer_name,
+                5000,
+                "0-0",
+                2,
+            )
+        ]
+
+    @pytest.mark.no_test_domain
+    @pytest.mark.asyncio
+    async def test_cursor_carries_across_cycles(self):
+        domain = _setup_domain()
+        with domain.domain_context():
+            domain.register(ReclaimAggregate)
+            domain.register(ReclaimEvent, part_of=ReclaimAggregate)
+            domain.register(ReclaimHandler, part_of=ReclaimAggregate)
+            domain.init(traverse=False)
+
+            broker = FakeBroker(
+                {
+                    "reclaim_stream": {
+                        "0-0": ("5-0", ["1-0"]),
+                        "5-0": ("0-0", ["6-0"]),
+                    }
+                }
+            )
+            engine = Engine(domain, test_mode=True)
+            task = PendingReclaimTask(
+                _engine(domain, {"sub": _subscription(engine, broker)})
+            )
+
+            await task._reclaim_cycle()
+            await task._reclaim_cycle()
+            await task._reclaim_cycle()
+
+        # Third cycle restarts the scan after the cursor wrapped to 0-0
+        assert [call[4] for call in broker.calls] == ["0-0", "5-0", "0-0"]
+
+    @pytest.mark.no_test_domain
+    @pytest.mark.asyncio
+    async def test_backfill_stream_is_scanned_with_priority_lanes(self):
+        domain = _setup_domain()
+        domain.config["server"]["priority_lanes"] = {
+            "enabled": True,
+            "backfill_suffix": "backfill",
+        }
+        with domain.domain_context():
+            domain.register(ReclaimAggregate)
+            domain.register(ReclaimEvent, part_of=ReclaimAggregate)
+            domain.register(ReclaimHandler, part_of=ReclaimAggregate)
+            domain.init(traverse=False)
+
+            broker = FakeBroker()
+            engine = Engine(domain, test_mode=True)
+            task = PendingReclaimTask(
+                _engine(domain, {"sub": _subscription(engine, broker)})
+            )
+            await task._reclaim_cycle()
+
+        assert [call[0] for call in broker.calls] == [
+            "reclaim_stream",
+            "reclaim_stream:backfill",
+        ]
+
+    @pytest.mark.no_test_domain
+    @pytest.mark.asyncio
+    async def test_skips_brokers_without_capability(self):
+        domain = _setup_domain()
+        with domain.domain_context():
+            domain.register(ReclaimAggregate)
+            domain.register(ReclaimEvent, part_of=ReclaimAggregate)
+            domain.register(ReclaimHandler, part_of=ReclaimAggregate)
+            domain.init(traverse=False)
+
+            broker = FakeBroker(reclaim=False)
+            engine = Engine(domain, test_mode=True)
+            task = PendingReclaimTask(
+                _engine(domain, {"sub": _subscription(engine, broker)})
+            )
+
+            assert await task._reclaim_cycle() == 0
+
+        assert broker.calls == []
+
+    @pytest.mark.no_test_domain
+    @pytest.mark.asyncio
+    async def test_stream_failure_does_not_abort_cycle(self):
+        domain = _setup_domain()
+        with domain.domain_context():
+            domain.register(ReclaimAggregate)
+            domain.register(ReclaimEvent, part_of=ReclaimAggregate)
+            domain.register(ReclaimHandler, part_of=ReclaimAggregate)
+            domain.init(traverse=False)
+
+            broker = FakeBroker(
+                {
+                    "broken_stream": RuntimeError("boom"),
+                    "reclaim_stream": {"0-0": ("0-0", ["1-0"])},
+                }
+            )
+            engine = Engine(domain, test_mode=True)
+            task = PendingReclaimTask(
+                _engine(
+                    domain,
+                    {
+                        "broken": _subscription(engine, broker, "broken_stream"),
+                        "sub": _subscription(engine, broker),
+                    },
+                )
+            )
+
+            assert await task._reclaim_cycle() == 1
+
+
+class TestPendingReclaimRun:
+    @pytest.mark.no_test_domain
+    @pytest.mark.asyncio
+    async def test_shutdown_stops_the_loop(self):
+        domain = _setup_domain()
+        with domain.domain_context():
+            domain.init(traverse=False)
+            task = PendingReclaimTask(_engine(domain))
+            task.check_interval = 0
+
+            cycles = 0
+
+            async def cycle():
+                nonlocal cycles
+                cycles += 1
+                await task.shutdown()
+                return 0
+
+            task._reclaim_cycle = cycle
+            await task._run()
+
+        assert cycles == 1
+        assert task.keep_going is False
+
+
+class TestEnginePendingReclaimIntegration:
+    @pytest.mark.no_test_domain
+    def test_engine_skips_reclaimer_without_capable_broker(self):
+        domain = _setup_domain()
+        with domain.domain_context():
+            domain.init(traverse=False)
+            engine = Engine(domain, test_mode=True)
+
+        assert engine._pending_reclaim is None
+
+    @pytest.mark.no_test_domain
+    def test_engine_creates_reclaimer_for_capable_broker(self):
+        domain = _setup_domain()
+        with domain.domain_context():
+            domain.init(traverse=False)
+            domain.brokers._brokers = {"default": FakeBroker()}
+            engine = Engine(domain, test_mode=True)
+
+        assert engine._pending_reclaim is not None
+
+    @pytest.mark.no_test_domain
+    def test_engine_honours_disabled_flag(self):
+        domain = _setup_domain({"enabled": False})
+        with domain.domain_context():
+            domain.init(traverse=False)
+            domain.brokers._brokers = {"default": FakeBroker()}
+            engine = Engine(domain, test_mode=True)
+
+        assert engine._pending_reclaim is None
@@ -23,10 +23,7 @@ from protean.server.projection_status import (
     collect_projection_statuses,
 )
 from protean.server.subscription.profiles import SubscriptionType
-from protean.server.subscription_status import (
-    SubscriptionStatus,
-    _extract_position_time,
-)
+from protean.server.subscription_status import SubscriptionStatus
 from protean.utils import fqn
 
 # ---------------------------------------------------------------------------
@@ -219,51 +216,6 @@ class TestParseTime:
         assert result.tzinfo == UTC
 
 
-# ---------------------------------------------------------------------------
-# _extract_position_time
-# ---------------------------------------------------------------------------
-
-
-class TestExtractPositionTime:
-    def test_none_message(self):
-        assert _extract_position_time(None) is None
-
-    def test_top_level_time(self):
-        assert _extract_position_time({"time": "2026-01-01T00:00:00Z"}) == (
-            "2026-01-01T00:00:00Z"
-        )
-
-    def test_metadata_headers_time_dict(self):
-        msg = {"metadata": {"headers": {"time": "2026-02-02T00:00:00Z"}}}
-        assert _extract_position_time(msg) == "2026-02-02T00:00:00Z"
-
-    def test_metadata_headers_time_json_string(self):
-        msg = {"metadata": '{"headers": {"time": "2026-03-03T00:00:00Z"}}'}
-        assert _extract_position_time(msg) == "2026-03-03T00:00:00Z"
-
-    def test_missing_time_returns_none(self):
-        assert _extract_position_time({"data": {"position": 1}}) is None
-
-    def test_malformed_metadata_json_returns_none(self):
-        assert _extract_position_time({"metadata": "{not json"}) is None
-
-    def test_headers_as_json_string(self):
-        msg = {"metadata": {"headers": '{"time": "2026-04-04T00:00:00Z"}'}}
-        assert _extract_position_time(msg) == "2026-04-04T00:00:00Z"
-
-    def test_malformed_headers_json_returns_none(self):
-        assert _extract_position_time({"metadata": {"headers": "{bad"}}) is None
-
-    def test_datetime_value_normalized_to_isoformat(self):
-        dt = datetime(2026, 5, 5, 12, 0, 0, tzinfo=UTC)
-        assert _extract_position_time({"time": dt}) == dt.isoformat()
-
-    def test_metadata_datetime_value_normalized(self):
-        dt = datetime(2026, 5, 5, 12, 0, 0, tzinfo=UTC)
-        msg = {"metadata": {"headers": {"time": dt}}}
-        assert _extract_position_time(msg) == dt.isoformat()
-
-
 # ---------------------------------------------------------------------------
 # _feeder_statuses / _row_count — branch coverage
 # ---------------------------------------------------------------------------
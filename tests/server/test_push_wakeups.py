@@ -0,0 +1,246 @@
+"""Push wakeups for event-store subscriptions and outbox processors.
+
+Writes to the in-memory event store and commits of outbox rows wake the
+consumers waiting on them, so a subscription picks a message up as soon as it
+lands instead of on its next poll. While the wakeups are live, an idle
+consumer polls only every ``push_poll_interval``; a consumer whose source has
+no live push channel keeps its ``tick_interval``.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from protean.core.aggregate import BaseAggregate
+from protean.core.event import BaseEvent
+from protean.core.event_handler import BaseEventHandler
+from protean.core.unit_of_work import UnitOfWork
+from protean.fields import Identifier, String
+from protean.server import Engine
+from protean.server.outbox_processor import OutboxProcessor
+from protean.server.subscription.event_store_subscription import (
+    EventStoreSubscription,
+)
+from protean.utils.mixins import handle
+
+
+class User(BaseAggregate):
+    email: String()
+
+    def register(self):
+        self.raise_(Registered(id=self.id, email=self.email))
+
+
+class Registered(BaseEvent):
+    id: Identifier()
+    email: String()
+
+
+class Order(BaseAggregate):
+    name: String()
+
+
+class UserEventHandler(BaseEventHandler):
+    @handle(Registered)
+    def registered(self, event: Registered) -> None:
+        pass
+
+
+@pytest.fixture(autouse=True)
+def register(test_domain):
+    test_domain.register(User)
+    test_domain.register(Registered, part_of=User)
+    test_domain.register(Order)
+    test_domain.register(UserEventHandler, part_of=User)
+    test_domain.init(traverse=False)
+
+
+def _registered_event():
+    user = User(email="john@example.com")
+    user.register()
+    return user._events[0]
+
+
+@pytest.fixture
+def engine(test_domain):
+    return Engine(domain=test_domain, test_mode=True)
+
+
+@pytest.fixture
+def subscription(engine):
+    return EventStoreSubscription(engine, "test::user", UserEventHandler)
+
+
+class TestEventStoreWakeups:
+    @pytest.mark.asyncio
+    async def test_a_write_wakes_the_subscription(self, test_domain, subscription):
+        wakeup = subscription.subscribe_wakeup()
+
+        test_domain.event_store.store.append(_registered_event())
+
+        assert await wakeup.wait(1) is True
+
+    @pytest.mark.asyncio
+    async def test_a_write_to_another_category_does_not(
+        self, test_domain, subscription
+    ):
+        wakeup = subscription.subscribe_wakeup()
+
+        test_domain.event_store.store._write("test::order-1", "Placed", {})
+
+        assert await wakeup.wait(0.01) is False
+
+    @pytest.mark.asyncio
+    async def test_an_all_subscription_wakes_on_every_category(
+        self, test_domain, engine
+    ):
+        subscription = EventStoreSubscription(engine, "$all", UserEventHandler)
+        wakeup = subscription.subscribe_wakeup()
+
+        test_domain.event_store.store._write("test::order-1", "Placed", {})
+
+        assert await wakeup.wait(1) is True
+
+    @pytest.mark.asyncio
+    async def test_a_write_in_a_unit_of_work_wakes_only_once_it_commits(
+        self, test_domain, subscription
+    ):
+        wakeup = subscription.subscribe_wakeup()
+
+        with UnitOfWork():
+            test_domain.event_store.store.append(_registered_event())
+            assert await wakeup.wait(0.01) is False
+
+        assert await wakeup.wait(1) is True
+
+    @pytest.mark.asyncio
+    async def test_a_rolled_back_write_wakes_nothing(self, test_domain, subscription):
+        wakeup = subscription.subscribe_wakeup()
+
+        uow = UnitOfWork()
+        uow.start()
+        test_domain.event_store.store.append(_registered_event())
+        uow.rollback()
+
+        assert await wakeup.wait(0.01) is False
+
+    @pytest.mark.asyncio
+    async def test_shutdown_releases_a_waiting_poll(self, subscription):
+        subscription.wakeup = subscription.subscribe_wakeup()
+        subscription.tick_interval = 30
+        waiting = asyncio.create_task(subscription.wait_for_next_tick())
+        await asyncio.sleep(0)
+
+        await subscription.shutdown()
+
+        await asyncio.wait_for(waiting, 1)
+
+
+class TestPollInterval:
+    @pytest.mark.asyncio
+    async def test_idle_subscription_waits_the_push_poll_interval_while_live(
+        self, test_domain, subscription
+    ):
+        assert test_domain.event_store.store.wakeups.live  # In-memory: always
+        subscription.wakeup = Mock(live=True, wait=AsyncMock())
+        subscription._idle = True
+
+        await subscription.wait_for_next_tick()
+
+        subscription.wakeup.wait.assert_awaited_once_with(30)
+
+    @pytest.mark.asyncio
+    async def test_busy_subscription_keeps_its_tick_interval(self, subscription):
+        subscription.wakeup = Mock(live=True, wait=AsyncMock())
+        subscription.tick_interval = 0
+        subscription._idle = False
+
+        await subscription.wait_for_next_tick()
+
+        subscription.wakeup.wait.assert_awaited_once_with(0)
+
+    @pytest.mark.asyncio
+    async def test_without_a_live_channel_it_falls_back_to_polling(self, subscription):
+        subscription.wakeup = Mock(live=False, wait=AsyncMock())
+        subscription.tick_interval = 1
+        subscription._idle = True
+
+        await subscription.wait_for_next_tick()
+
+        subscription.wakeup.wait.assert_awaited_once_with(1)
+
+    def test_push_poll_interval_is_configurable(self, test_domain, engine):
+        test_domain.config["server"]["event_store_subscription"][
+            "push_poll_interval_seconds"
+        ] = 5
+
+        subscription = EventStoreSubscription(engine, "test::user", UserEventHandler)
+
+        assert subscription.push_poll_interval == 5.0
+
+    @pytest.mark.asyncio
+    async def test_a_tick_records_whether_it_found_work(
+        self, test_domain, subscription
+    ):
+        await subscription.tick()
+        assert subscription._idle is True
+
+        test_domain.event_store.store.append(_registered_event())
+        await subscription.tick()
+        assert subscription._idle is False
+
+
+class TestOutboxWakeups:
+    @pytest.fixture
+    def processor(self, test_domain):
+        test_domain.config["enable_outbox"] = True
+        test_domain.config["server"]["default_subscription_type"] = "stream"
+        test_domain._initialize_outbox()
+        engine = Engine(domain=test_domain, test_mode=True)
+        return OutboxProcessor(engine, "default", "default")
+
+    @pytest.mark.asyncio
+    async def test_committed_outbox_rows_wake_the_processor(
+        self, test_domain, processor
+    ):
+        wakeup = processor.subscribe_wakeup()
+
+        with UnitOfWork():
+            user = User(email="john@example.com")
+            user.register()
+            test_domain.repository_for(User).add(user)
+            assert await wakeup.wait(0.01) is False
+
+        assert await wakeup.wait(1) is True
+
+    @pytest.mark.asyncio
+    async def test_a_commit_without_events_does_not(self, test_domain, processor):
+        wakeup = processor.subscribe_wakeup()
+
+        test_domain.repository_for(Order).add(Order(name="Books"))
+
+        assert await wakeup.wait(0.01) is False
+
+    def test_push_poll_interval_is_read_from_outbox_config(
+        self, test_domain, processor
+    ):
+        assert processor.push_poll_interval == 5.0
+
+
+class TestEngineListeners:
+    def test_engine_starts_and_stops_the_store_listener(self, test_domain, engine):
+        listener = Mock(stop=AsyncMock())
+        store = test_domain.event_store.store
+        store.push_listener = Mock(return_value=listener)
+
+        engine._start_push_listeners()
+        listener.start.assert_called_once_with(engine.loop)
+
+        engine.loop.run_until_complete(engine.shutdown())
+        listener.stop.assert_awaited_once()
+
+    def test_sources_without_a_push_channel_start_nothing(self, engine):
+        engine._start_push_listeners()
+
+        assert engine._push_listeners == []
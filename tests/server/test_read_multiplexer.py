@@ -0,0 +1,301 @@
+"""Tests for the stream read multiplexer — one shared read per consumer group.
+
+Covers:
+- Members share one consumer name and are served by one multi-stream read
+- Results are fanned out per stream and trimmed to each member's batch size
+- Reads block briefly while some members are still busy
+- Broker errors reach every waiting member
+- Shutdown releases waiting members
+- Engine wiring honours the capability, lanes and [server.read_multiplexer]
+"""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from protean import Domain
+from protean.core.aggregate import BaseAggregate
+from protean.core.event import BaseEvent
+from protean.core.projection import BaseProjection
+from protean.core.projector import BaseProjector
+from protean.fields import Identifier, String
+from protean.port.broker import BrokerCapabilities
+from protean.server.engine import Engine
+from protean.server.subscription.read_multiplexer import StreamReadMultiplexer
+from protean.server.subscription.stream_subscription import StreamSubscription
+
+# ── Domain elements ──────────────────────────────────────────────────────
+
+
+class Order(BaseAggregate):
+    name: String()
+
+
+class Customer(BaseAggregate):
+    name: String()
+
+
+class OrderPlaced(BaseEvent):
+    name: String()
+
+
+class CustomerJoined(BaseEvent):
+    name: String()
+
+
+class Dashboard(BaseProjection):
+    dashboard_id: Identifier(identifier=True)
+
+
+class DashboardProjector(BaseProjector):
+    pass
+
+
+# ── Helpers ──────────────────────────────────────────────────────────────
+
+
+class FakeBroker:
+    """Broker stub that serves multi-stream reads from a script of rounds."""
+
+    def __init__(self, rounds: list | None = None, multi: bool = True) -> None:
+        self.multi = multi
+        self.rounds = list(rounds or [])
+        self.calls: list[tuple] = []
+
+    def has_capability(self, cap) -> bool:
+        return cap == BrokerCapabilities.MULTI_STREAM_READ and self.multi
+
+    def read_blocking_multi(
+        self, streams, consumer_group, consumer_name, timeout_ms, count
+    ):
+        self.calls.append((streams, consumer_group, consumer_name, timeout_ms, count))
+        result = self.rounds.pop(0) if self.rounds else {}
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+def _engine() -> MagicMock:
+    engine = MagicMock()
+    engine.shutting_down = False
+    return engine
+
+
+def _member(stream: str, broker, consumer_name: str | None = None) -> MagicMock:
+    member = MagicMock()
+    member.stream_category = stream
+    member.consumer_name = consumer_name or f"consumer-{stream}"
+    member.blocking_timeout_ms = 5000
+    member.broker = broker
+    return member
+
+
+def _message(identifier: str) -> tuple[str, dict]:
+    return (identifier, {"id": identifier})
+
+
+def _multiplexer(broker, streams=("orders", "customers")):
+    multiplexer = StreamReadMultiplexer(_engine(), "Dashboard", busy_timeout_ms=50)
+    members = [_member(stream, broker) for stream in streams]
+    for member in members:
+        multiplexer.attach(member)
+    return multiplexer, members
+
+
+# ── Tests ────────────────────────────────────────────────────────────────
+
+
+class TestAttach:
+    def test_members_share_the_first_consumer_name(self):
+        multiplexer, members = _multiplexer(FakeBroker())
+
+        assert multiplexer.consumer_name == "consumer-orders"
+        assert [member.consumer_name for member in members] == [
+            "consumer-orders",
+            "consumer-orders",
+        ]
+        assert all(member.read_multiplexer is multiplexer for member in members)
+        assert multiplexer.streams == ["orders", "customers"]
+
+
+class TestRead:
+    @pytest.mark.asyncio
+    async def test_one_read_serves_every_waiting_member(self):
+        broker = FakeBroker(
+            [{"orders": [_message("1-0")], "customers": [_message("2-0")]}]
+        )
+        multiplexer, (orders, customers) = _multiplexer(broker)
+
+        results = await asyncio.gather(
+            multiplexer.read(orders, 10), multiplexer.read(customers, 10)
+        )
+        await multiplexer.shutdown()
+
+        assert results == [[_message("1-0")], [_message("2-0")]]
+        assert broker.calls[0] == (
+            ["orders", "customers"],
+            "Dashboard",
+            "consumer-orders",
+            5000,
+            10,
+        )
+
+    @pytest.mark.asyncio
+    async def test_member_without_messages_gets_an_empty_batch(self):
+        broker = FakeBroker([{"orders": [_message("1-0")]}])
+        multiplexer, (orders, customers) = _multiplexer(broker)
+
+        results = await asyncio.gather(
+            multiplexer.read(orders, 10), multiplexer.read(customers, 10)
+        )
+        await multiplexer.shutdown()
+
+        assert results == [[_message("1-0")], []]
+
+    @pytest.mark.asyncio
+    async def test_batches_are_trimmed_to_each_member_size(self):
+        broker = FakeBroker(
+            [{"orders": [_message("1-0"), _message("2-0"), _message("3-0")]}]
+        )
+        multiplexer, (orders, customers) = _multiplexer(broker)
+
+        results = await asyncio.gather(
+            multiplexer.read(orders, 1), multiplexer.read(customers, 3)
+        )
+        await multiplexer.shutdown()
+
+        # The read asks for the largest batch; the smaller one is trimmed
+        assert broker.calls[0][4] == 3
+        assert results[0] == [_message("1-0")]
+
+    @pytest.mark.asyncio
+    async def test_read_blocks_briefly_while_members_are_busy(self):
+        broker = FakeBroker([{"orders": [_message("1-0")]}])
+        multiplexer, (orders, _customers) = _multiplexer(broker)
+
+        assert await multiplexer.read(orders, 10) == [_message("1-0")]
+        await multiplexer.shutdown()
+
+        assert broker.calls[0][0] == ["orders"]
+        assert broker.calls[0][3] == 50
+
+    @pytest.mark.asyncio
+    async def test_broker_errors_reach_every_waiting_member(self):
+        broker = FakeBroker([RuntimeError("boom")])
+        multiplexer, (orders, customers) = _multiplexer(broker)
+
+        results = await asyncio.gather(
+            multiplexer.read(orders, 10),
+            multiplexer.read(customers, 10),
+            return_exceptions=True,
+        )
+        await multiplexer.shutdown()
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+
+    @pytest.mark.asyncio
+    async def test_shutdown_releases_waiting_members(self):
+        multiplexer, (orders, _customers) = _multiplexer(FakeBroker())
+        multiplexer.keep_going = False
+
+        assert await multiplexer.read(orders, 10) == []
+
+
+class TestStreamSubscriptionDelegation:
+    @pytest.mark.asyncio
+    async def test_get_next_batch_goes_through_the_multiplexer(self, test_domain):
+        test_domain.register(Order)
+        test_domain.register(OrderPlaced, part_of=Order)
+        test_domain.register(Dashboard)
+        test_domain.register(
+            DashboardProjector, projector_for=Dashboard, aggregates=[Order]
+        )
+        test_domain.init(traverse=False)
+
+        engine = Engine(test_domain, test_mode=True)
+        subscription = StreamSubscription(
+            engine=engine,
+            stream_category="test::order",
+            handler=DashboardProjector,
+        )
+        subscription.broker = MagicMock()
+        subscription.read_multiplexer = MagicMock()
+
+        async def read(member, count):
+            return [_message("1-0")]
+
+        subscription.read_multiplexer.read = read
+
+        assert await subscription.get_next_batch_of_messages() == [_message("1-0")]
+        subscription.broker.read_blocking.assert_not_called()
+
+
+class TestEngineReadMultiplexers:
+    @staticmethod
+    def _domain(config: dict | None = None) -> Domain:
+        domain = Domain(__file__, "MultiplexTest")
+        domain.config["brokers"] = {"default": {"provider": "inline"}}
+        domain.config["server"]["default_subscription_type"] = "stream"
+        if config is not None:
+            domain.config["server"]["read_multiplexer"] = config
+        domain.register(Order)
+        domain.register(OrderPlaced, part_of=Order)
+        domain.register(Customer)
+        domain.register(CustomerJoined, part_of=Customer)
+        domain.register(Dashboard)
+        domain.register(
+            DashboardProjector,
+            projector_for=Dashboard,
+            aggregates=[Order, Customer],
+        )
+        return domain
+
+    @pytest.mark.no_test_domain
+    def test_projector_categories_share_a_multiplexer(self):
+        domain = self._domain()
+        with domain.domain_context():
+            domain.init(traverse=False)
+            domain.brokers._brokers = {"default": FakeBroker()}
+            engine = Engine(domain, test_mode=True)
+
+        assert len(engine._read_multiplexers) == 1
+        (multiplexer,) = engine._read_multiplexers.values()
+        members = [
+            sub
+            for sub in engine._subscriptions.values()
+            if sub.read_multiplexer is multiplexer
+        ]
+        assert len(members) == 2
+        assert len({sub.consumer_name for sub in members}) == 1
+
+    @pytest.mark.no_test_domain
+    def test_skipped_without_capable_broker(self):
+        domain = self._domain()
+        with domain.domain_context():
+            domain.init(traverse=False)
+            domain.brokers._brokers = {"default": FakeBroker(multi=False)}
+            engine = Engine(domain, test_mode=True)
+
+        assert engine._read_multiplexers == {}
+
+    @pytest.mark.no_test_domain
+    def test_skipped_when_disabled(self):
+        domain = self._domain({"enabled": False})
+        with domain.domain_context():
+            domain.init(traverse=False)
+            domain.brokers._brokers = {"default": FakeBroker()}
+            engine = Engine(domain, test_mode=True)
+
+        assert engine._read_multiplexers == {}
+
+    @pytest.mark.no_test_domain
+    def test_skipped_with_priority_lanes(self):
+        domain = self._domain()
+        domain.config["server"]["priority_lanes"] = {"enabled": True}
+        with domain.domain_context():
+            domain.init(traverse=False)
+            domain.brokers._brokers = {"default": FakeBroker()}
+            engine = Engine(domain, test_mode=True)
+
+        assert engine._read_multiplexers == {}
@@ -0,0 +1,247 @@
+"""Retry backoffs under the engine do not block the event loop.
+
+A handler retrying a version conflict or a transient failure used to
+``time.sleep`` between attempts on the engine's event loop, freezing every
+other subscription in the worker. Under the engine the backoff is now awaited
+instead, and the message is dispatched again once it has passed.
+
+Retry policies are resolved once per handler, when the domain is initialized.
+"""
+
+import asyncio
+import time
+from uuid import uuid4
+
+import pytest
+
+from protean.core.aggregate import BaseAggregate
+from protean.core.command import BaseCommand
+from protean.core.command_handler import BaseCommandHandler
+from protean.core.event import BaseEvent
+from protean.core.event_handler import BaseEventHandler
+from protean.exceptions import ConfigurationError, ExpectedVersionError
+from protean.fields import Identifier, String
+from protean.server import Engine
+from protean.utils import mixins
+from protean.utils.eventing import Message
+from protean.utils.mixins import handle
+
+calls: dict[str, int] = {}
+
+
+class Account(BaseAggregate):
+    account_id: Identifier(identifier=True)
+    name: String()
+
+    @classmethod
+    def open(cls, name: str) -> "Account":
+        account = cls(account_id=str(uuid4()), name=name)
+        account.raise_(AccountOpened(account_id=account.account_id, name=name))
+        return account
+
+
+class AccountOpened(BaseEvent):
+    account_id: Identifier(required=True)
+    name: String()
+
+
+class Charge(BaseCommand):
+    account_id: Identifier(identifier=True)
+
+
+class Ping(BaseCommand):
+    account_id: Identifier(identifier=True)
+
+
+def _count(name: str) -> int:
+    calls[name] = calls.get(name, 0) + 1
+    return calls[name]
+
+
+class FlakyChargeHandler(BaseCommandHandler):
+    """Fails transiently three times before succeeding."""
+
+    @handle(Charge)
+    def charge(self, command: Charge) -> None:
+        if _count("charge") <= 3:
+            raise ConnectionError("payment gateway unreachable")
+
+
+class PingHandler(BaseCommandHandler):
+    @handle(Ping)
+    def ping(self, command: Ping) -> None:
+        _count("ping")
+
+
+class AccountNotifications(BaseEventHandler):
+    @handle(AccountOpened)
+    def send_welcome(self, event: AccountOpened) -> None:
+        _count("welcome")
+
+    @handle(AccountOpened)
+    def sync_crm(self, event: AccountOpened) -> None:
+        if _count("crm") == 1:
+            raise ConnectionError("crm unreachable")
+
+
+class ConflictingChargeHandler(BaseCommandHandler):
+    @handle(Charge)
+    def charge(self, command: Charge) -> None:
+        if _count("conflict") == 1:
+            raise ExpectedVersionError("conflict")
+
+
+@pytest.fixture(autouse=True)
+def reset_calls():
+    calls.clear()
+
+
+@pytest.fixture
+def no_blocking_sleep(monkeypatch):
+    """Fail if a retry sleeps on the calling thread."""
+
+    def _fail(seconds: float) -> None:
+        raise AssertionError(f"retry slept {seconds}s on the event loop")
+
+    class _TimeProxy:
+        sleep = staticmethod(_fail)
+
+        def __getattr__(self, name):
+            return getattr(time, name)
+
+    monkeypatch.setattr("protean.utils.mixins.time", _TimeProxy())
+
+
+def _register(test_domain, *handlers, **options):
+    test_domain.register(Account)
+    test_domain.register(AccountOpened, part_of=Account)
+    test_domain.register(Charge, part_of=Account)
+    test_domain.register(Ping, part_of=Account)
+    for handler in handlers:
+        test_domain.register(handler, part_of=Account, **options)
+    test_domain.init(traverse=False)
+
+
+def _command_message(test_domain, command_cls):
+    command = test_domain._enrich_command(command_cls(account_id=str(uuid4())), True)
+    return Message.from_domain_object(command)
+
+
+def _event_message():
+    account = Account.open("Jane")
+    return Message.from_domain_object(account._events[0])
+
+
+class TestDeferredBackoff:
+    @pytest.mark.asyncio
+    async def test_other_subscriptions_keep_flowing_during_a_retry_storm(
+        self, test_domain, no_blocking_sleep
+    ):
+        test_domain.config["server"]["transient_retry"]["base_delay_seconds"] = 0.05
+        test_domain.register(PingHandler, part_of=Account)
+        _register(test_domain, FlakyChargeHandler, retries=3, backoff="fixed")
+        engine = Engine(domain=test_domain, test_mode=True)
+
+        storm = asyncio.create_task(
+            engine.handle_message(
+                FlakyChargeHandler, _command_message(test_domain, Charge)
+            )
+        )
+        await asyncio.sleep(0)  # first attempt fails, its backoff begins
+        for _ in range(20):
+            assert await engine.handle_message(
+                PingHandler, _command_message(test_domain, Ping)
+            )
+
+        assert calls["ping"] == 20
+        assert not storm.done()
+        assert await storm is True
+        assert calls["charge"] == 4
+
+    @pytest.mark.asyncio
+    async def test_version_conflicts_back_off_on_the_loop(
+        self, test_domain, no_blocking_sleep
+    ):
+        _register(test_domain, ConflictingChargeHandler)
+        engine = Engine(domain=test_domain, test_mode=True)
+
+        assert await engine.handle_message(
+            ConflictingChargeHandler, _command_message(test_domain, Charge)
+        )
+        assert calls["conflict"] == 2
+
+    @pytest.mark.asyncio
+    async def test_exhausted_retries_fail_the_message(
+        self, test_domain, no_blocking_sleep
+    ):
+        _register(test_domain, FlakyChargeHandler, retries=2, backoff="fixed")
+        engine = Engine(domain=test_domain, test_mode=True)
+
+        result = await engine.handle_message(
+            FlakyChargeHandler, _command_message(test_domain, Charge)
+        )
+
+        assert result is False
+        assert calls["charge"] == 3
+
+    @pytest.mark.asyncio
+    async def test_finished_siblings_are_not_run_again(
+        self, test_domain, no_blocking_sleep
+    ):
+        _register(test_domain, AccountNotifications, retries=1, backoff="fixed")
+        engine = Engine(domain=test_domain, test_mode=True)
+
+        assert await engine.handle_message(AccountNotifications, _event_message())
+        assert calls == {"welcome": 1, "crm": 2}
+
+    def test_outside_the_engine_retries_sleep_in_place(self, test_domain, mocker):
+        _register(test_domain, FlakyChargeHandler, retries=3, backoff="fixed")
+        sleep = mocker.patch("protean.utils.mixins.time.sleep")
+
+        FlakyChargeHandler._handle(
+            test_domain._enrich_command(Charge(account_id=str(uuid4())), True)
+        )
+
+        assert sleep.call_count == 3
+
+
+class TestPolicyResolution:
+    def test_policies_are_resolved_at_init(self, test_domain):
+        _register(test_domain, FlakyChargeHandler, retries=3, backoff="linear")
+
+        policy = test_domain._retry_policies[FlakyChargeHandler]
+        assert policy.transient_max == 3
+        assert policy.transient_backoff == "linear"
+        assert policy.version_max == 3
+
+    def test_invocations_do_not_read_retry_config(self, test_domain, mocker):
+        _register(test_domain, PingHandler)
+        version = mocker.spy(mixins, "_get_version_retry_config")
+        transient = mocker.spy(mixins, "_get_transient_retry_config")
+
+        for _ in range(3):
+            PingHandler._handle(
+                test_domain._enrich_command(Ping(account_id=str(uuid4())), True)
+            )
+
+        version.assert_not_called()
+        transient.assert_not_called()
+
+    def test_config_changes_apply_on_the_next_init(self, test_domain):
+        _register(test_domain, PingHandler)
+        test_domain.config["server"]["version_retry"]["max_retries"] = 7
+
+        assert test_domain._retry_policies[PingHandler].version_max == 3
+
+        test_domain.init(traverse=False)
+        assert test_domain._retry_policies[PingHandler].version_max == 7
+
+    def test_an_unresolvable_policy_fails_on_invocation(self, test_domain):
+        test_domain.config["server"]["transient_retry"]["backoff"] = "quadratic"
+        _register(test_domain, PingHandler)
+
+        assert PingHandler not in test_domain._retry_policies
+        with pytest.raises(ConfigurationError, match="Invalid transient retry"):
+            PingHandler._handle(
+                test_domain._enrich_command(Ping(account_id=str(uuid4())), True)
+            )
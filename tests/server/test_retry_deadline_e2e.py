@@ -60,8 +60,8 @@ def elements(test_domain):
     # Retry enabled with an enormous backoff so any retry would breach a
     # near-future deadline.
     test_domain.register(FlakyHandler, part_of=Order, retries=3, backoff="fixed")
-    test_domain.init(traverse=False)
     test_domain.config["server"]["transient_retry"]["base_delay_seconds"] = 3600
+    test_domain.init(traverse=False)
 
 
 @pytest.fixture(autouse=True)
@@ -0,0 +1,169 @@
+"""Tests for batched acknowledgement in ``StreamSubscription.process_batch``.
+
+On a broker advertising ``BATCH_ACK``, successful messages are acknowledged
+together with one ``ack_many`` call at the end of the batch. Brokers without
+the capability keep one ``ack`` per message.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, Mock
+from uuid import uuid4
+
+import pytest
+
+from protean import apply
+from protean.core.aggregate import BaseAggregate
+from protean.core.event import BaseEvent
+from protean.core.event_handler import BaseEventHandler
+from protean.domain import Processing
+from protean.fields import Identifier, String
+from protean.port.broker import BrokerCapabilities
+from protean.server import Engine
+from protean.server.subscription.stream_subscription import StreamSubscription
+from protean.utils.eventing import Message
+from protean.utils.mixins import handle
+
+
+class Registered(BaseEvent):
+    id = Identifier()
+    name = String()
+
+
+class User(BaseAggregate):
+    name = String()
+
+    @apply
+    def on_registered(self, event: Registered) -> None:
+        self.name = event.name
+
+
+class ToggleEventHandler(BaseEventHandler):
+    """Fails when the event's ``name`` is ``"fail"``, succeeds otherwise."""
+
+    @handle(Registered)
+    def on_registered(self, event: Registered) -> None:
+        if event.name == "fail":
+            raise RuntimeError("Handler exploded")
+
+
+class MockEngine:
+    """Minimal engine mock that delegates handling to a real Engine."""
+
+    def __init__(self, domain):
+        self.domain = domain
+        self.loop = asyncio.new_event_loop()
+        self.emitter = Mock()
+        self.shutting_down = False
+        self._real_engine = Engine(domain, test_mode=True)
+
+    async def handle_message(self, handler_cls, message, worker_id=None):
+        return await self._real_engine.handle_message(
+            handler_cls, message, worker_id=worker_id
+        )
+
+
+def _message(name: str) -> tuple[str, dict]:
+    identifier = str(uuid4())
+    user = User(id=identifier, name=name)
+    user.raise_(Registered(id=identifier, name=name))
+    message = Message.from_domain_object(user._events[-1])
+    return (identifier, message.to_dict())
+
+
+def _subscription(domain, batch_ack: bool) -> StreamSubscription:
+    sub = StreamSubscription(
+        engine=MockEngine(domain),
+        stream_category="test::user",
+        handler=ToggleEventHandler,
+        max_retries=50,
+        retry_delay_seconds=0,
+    )
+    broker = MagicMock()
+    broker.has_capability = MagicMock(
+        side_effect=lambda cap: batch_ack and cap == BrokerCapabilities.BATCH_ACK
+    )
+    broker.ack = MagicMock(return_value=True)
+    broker.ack_many = MagicMock(
+        side_effect=lambda stream, ids, group: [True] * len(ids)
+    )
+    broker.nack = MagicMock(return_value=True)
+    sub.broker = broker
+    return sub
+
+
+@pytest.fixture()
+def domain(test_domain):
+    test_domain.config["event_processing"] = Processing.ASYNC.value
+    test_domain.register(User, event_sourced=True)
+    test_domain.register(Registered, part_of=User)
+    test_domain.register(ToggleEventHandler, part_of=User)
+    test_domain.init(traverse=False)
+    yield test_domain
+
+
+@pytest.mark.asyncio
+async def test_successes_are_acked_in_one_call(domain):
+    sub = _subscription(domain, batch_ack=True)
+    messages = [_message("a"), _message("fail"), _message("b")]
+
+    successful = await sub.process_batch(messages, stream="test::user")
+
+    assert successful == 2
+    sub.broker.ack.assert_not_called()
+    sub.broker.ack_many.assert_called_once_with(
+        "test::user", [messages[0][0], messages[2][0]], sub.consumer_group
+    )
+    acked = [
+        call.kwargs["message_id"]
+        for call in sub.engine.emitter.emit.call_args_list
+        if call.kwargs["event"] == "message.acked"
+    ]
+    assert len(acked) == 2
+
+
+@pytest.mark.asyncio
+async def test_without_capability_each_message_is_acked(domain):
+    sub = _subscription(domain, batch_ack=False)
+    messages = [_message("a"), _message("b")]
+
+    successful = await sub.process_batch(messages, stream="test::user")
+
+    assert successful == 2
+    assert sub.broker.ack.call_count == 2
+    sub.broker.ack_many.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_unacked_messages_are_not_counted(domain):
+    sub = _subscription(domain, batch_ack=True)
+    sub.broker.ack_many = MagicMock(return_value=[True, False])
+    messages = [_message("a"), _message("b")]
+
+    assert await sub.process_batch(messages, stream="test::user") == 1
+
+
+@pytest.mark.asyncio
+async def test_mismatched_results_fall_back_to_single_acks(domain):
+    sub = _subscription(domain, batch_ack=True)
+    sub.broker.ack_many = MagicMock(return_value=[True])
+    messages = [_message("a"), _message("b")]
+
+    successful = await sub.process_batch(messages, stream="test::user")
+
+    assert successful == 2
+    assert sub.broker.ack.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_handled_messages_are_acked_when_the_batch_is_cut_short(domain):
+    """A failure mid-batch must not drop ACKs for messages already handled."""
+    sub = _subscription(domain, batch_ack=True)
+    sub.handle_failed_message = AsyncMock(side_effect=asyncio.CancelledError)
+    messages = [_message("a"), _message("fail"), _message("b")]
+
+    with pytest.raises(asyncio.CancelledError):
+        await sub.process_batch(messages, stream="test::user")
+
+    sub.broker.ack_many.assert_called_once_with(
+        "test::user", [messages[0][0]], sub.consumer_group
+    )
@@ -15,6 +15,7 @@ from protean.core.aggregate import BaseAggregate
 from protean.core.event import BaseEvent
 from protean.core.event_handler import BaseEventHandler
 from protean.fields import Identifier, String
+from protean.port.broker import BrokerCapabilities
 from protean.server.engine import Engine
 from protean.server.subscription.stream_subscription import StreamSubscription
 
@@ -54,10 +55,27 @@ class AlwaysFailingHandler(BaseEventHandler):
 class FakeBroker:
     """Minimal broker stub for testing retry/DLQ logic."""
 
-    def __init__(self):
+    def __init__(
+        self, delayed_redelivery: bool = False, delivery_counts: dict | None = None
+    ):
         self.acked: list[tuple] = []
         self.nacked: list[tuple] = []
+        self.nacked_delayed: list[tuple] = []
         self.published: list[tuple] = []
+        self.delayed_redelivery = delayed_redelivery
+        # Broker-side delivery counts; None means PENDING_RECLAIM is absent
+        self.delivery_counts = delivery_counts
+
+    def has_capability(self, capability):
+        if capability == BrokerCapabilities.PENDING_RECLAIM:
+            return self.delivery_counts is not None
+        return (
+            capability == BrokerCapabilities.DELAYED_REDELIVERY
+            and self.delayed_redelivery
+        )
+
+    def delivery_count(self, stream, identifier, consumer_group):
+        return self.delivery_counts.get(identifier)
 
     def _ensure_group(self, consumer_group, stream):
         pass
@@ -70,6 +88,10 @@ class FakeBroker:
         self.nacked.append((stream, identifier, consumer_group))
         return True
 
+    def nack_delayed(self, stream, identifier, consumer_group, delay_seconds):
+        self.nacked_delayed.append((stream, identifier, consumer_group, delay_seconds))
+        return True
+
     def publish(self, stream, message):
         self.published.append((stream, message))
         return "dlq-id"
@@ -100,6 +122,7 @@ def _make_subscription(
     retry_delay_seconds: float = 0,
     enable_dlq: bool = True,
     lanes_enabled: bool = False,
+    delayed_redelivery: bool = False,
 ) -> StreamSubscription:
     """Create a StreamSubscription with a FakeBroker attached."""
     engine = Engine(test_domain, test_mode=True)
@@ -118,7 +141,7 @@ def _make_subscription(
         retry_delay_seconds=retry_delay_seconds,
         enable_dlq=enable_dlq,
     )
-    sub.broker = FakeBroker()
+    sub.broker = FakeBroker(delayed_redelivery=delayed_redelivery)
     return sub
 
 
@@ -434,9 +457,9 @@ class TestDLQPublishFailure:
     async def test_dlq_publish_failure_backs_off_before_holding(
         self, test_domain, monkeypatch
     ):
-        """The exhaust-path hold NACK backs off (retry_delay_seconds) first, so a
-        downed DLQ is retried at the retry cadence rather than hammered at poll
-        speed (the stream poll loop re-reads pending with no inter-poll delay)."""
+        """The exhaust-path hold NACK backs off (retry backoff) first, so a downed
+        DLQ is retried at the retry cadence rather than hammered at poll speed
+        (the stream poll loop re-reads pending with no inter-poll delay)."""
         sub = _make_subscription(
             test_domain, AlwaysFailingHandler, max_retries=1, retry_delay_seconds=0.25
         )
@@ -455,7 +478,8 @@ class TestDLQPublishFailure:
         await sub.handle_failed_message("msg1", {"data": "x"})
 
         # Backed off before holding, and still held (NACK, no ACK).
-        assert 0.25 in sleeps
+        assert len(sleeps) == 1
+        assert 0.125 <= sleeps[0] <= 0.25
         assert len(sub.broker.nacked) == 1
         assert len(sub.broker.acked) == 0
 
@@ -493,6 +517,143 @@ class TestDLQPublishFailure:
         assert "Failed to NACK message msg1 after a failed DLQ publish" in caplog.text
 
 
+# ── Tests: Retry backoff and delayed redelivery ──────────────────────────
+
+
+class TestRetryBackoff:
+    """Exponential backoff with jitter, held back by the broker when it can."""
+
+    def test_backoff_doubles_per_attempt_with_jitter(self, test_domain):
+        sub = _make_subscription(
+            test_domain, AlwaysFailingHandler, retry_delay_seconds=1
+        )
+
+        for attempt, ceiling in [(1, 1), (2, 2), (3, 4)]:
+            delay = sub._retry_backoff(attempt)
+            assert ceiling / 2 <= delay <= ceiling
+
+    def test_backoff_is_capped(self, test_domain):
+        sub = _make_subscription(
+            test_domain, AlwaysFailingHandler, retry_delay_seconds=1
+        )
+        sub.retry_max_delay_seconds = 5
+
+        assert 2.5 <= sub._retry_backoff(20) <= 5
+
+    def test_zero_delay_disables_backoff(self, test_domain):
+        sub = _make_subscription(test_domain, AlwaysFailingHandler)
+
+        assert sub._retry_backoff(3) == 0.0
+
+    @pytest.mark.asyncio
+    async def test_retry_is_delayed_by_the_broker_without_sleeping(
+        self, test_domain, monkeypatch
+    ):
+        """A failing message does not stall the batch: the broker holds it back."""
+        sub = _make_subscription(
+            test_domain,
+            AlwaysFailingHandler,
+            retry_delay_seconds=0.5,
+            delayed_redelivery=True,
+        )
+        sleep = MagicMock()
+        monkeypatch.setattr(
+            "protean.server.subscription.stream_subscription.asyncio.sleep", sleep
+        )
+
+        await sub.handle_failed_message("msg1", {"data": "x"})
+
+        sleep.assert_not_called()
+        assert sub.broker.nacked == []
+        [(stream, identifier, group, delay)] = sub.broker.nacked_delayed
+        assert (stream, identifier, group) == (
+            "test_stream",
+            "msg1",
+            sub.consumer_group,
+        )
+        assert 0.25 <= delay <= 0.5
+
+    @pytest.mark.asyncio
+    async def test_retry_falls_back_to_sleep_without_capability(
+        self, test_domain, monkeypatch
+    ):
+        sub = _make_subscription(
+            test_domain, AlwaysFailingHandler, retry_delay_seconds=0.5
+        )
+        sleeps: list[float] = []
+
+        async def fake_sleep(delay):
+            sleeps.append(delay)
+
+        monkeypatch.setattr(
+            "protean.server.subscription.stream_subscription.asyncio.sleep",
+            fake_sleep,
+        )
+
+        await sub.handle_failed_message("msg1", {"data": "x"})
+
+        assert len(sleeps) == 1
+        assert len(sub.broker.nacked) == 1
+        assert sub.broker.nacked_delayed == []
+
+
+# ── Tests: Broker delivery counts ───────────────────────────────────────
+
+
+class TestDeliveryCountSeeding:
+    """Attempts made before a takeover count toward ``max_retries``."""
+
+    @pytest.mark.asyncio
+    async def test_reclaimed_message_resumes_from_delivery_count(self, test_domain):
+        sub = _make_subscription(test_domain, AlwaysFailingHandler, max_retries=3)
+        sub.broker = FakeBroker(delivery_counts={"msg1": 2})
+
+        await sub.handle_failed_message("msg1", {"data": "x"})
+
+        # One earlier delivery plus this failure
+        assert sub.retry_counts["msg1"] == 2
+        assert len(sub.broker.nacked) == 1
+
+    @pytest.mark.asyncio
+    async def test_poison_message_goes_to_dlq_after_takeover(self, test_domain):
+        sub = _make_subscription(test_domain, AlwaysFailingHandler, max_retries=3)
+        sub.broker = FakeBroker(delivery_counts={"msg1": 5})
+
+        await sub.handle_failed_message("msg1", {"data": "x"})
+
+        assert sub.broker.nacked == []
+        assert len(sub.broker.published) == 1
+        assert "msg1" not in sub.retry_counts
+
+    @pytest.mark.asyncio
+    async def test_first_delivery_starts_from_zero(self, test_domain):
+        sub = _make_subscription(test_domain, AlwaysFailingHandler, max_retries=3)
+        sub.broker = FakeBroker(delivery_counts={"msg1": 1})
+
+        await sub.handle_failed_message("msg1", {"data": "x"})
+
+        assert sub.retry_counts["msg1"] == 1
+
+    @pytest.mark.asyncio
+    async def test_local_count_wins_once_tracked(self, test_domain):
+        sub = _make_subscription(test_domain, AlwaysFailingHandler, max_retries=10)
+        sub.broker = FakeBroker(delivery_counts={"msg1": 1})
+
+        await sub.handle_failed_message("msg1", {"data": "x"})
+        sub.broker.delivery_counts["msg1"] = 7
+        await sub.handle_failed_message("msg1", {"data": "x"})
+
+        assert sub.retry_counts["msg1"] == 2
+
+    @pytest.mark.asyncio
+    async def test_without_capability_counts_are_local(self, test_domain):
+        sub = _make_subscription(test_domain, AlwaysFailingHandler, max_retries=3)
+
+        await sub.handle_failed_message("msg1", {"data": "x"})
+
+        assert sub.retry_counts["msg1"] == 1
+
+
 # ── Tests: Configuration ─────────────────────────────────────────────────
 
 
@@ -508,6 +669,7 @@ class TestConfiguration:
 
         assert sub.max_retries == 3
         assert sub.retry_delay_seconds == 1.0
+        assert sub.retry_max_delay_seconds == 60.0
         assert sub.enable_dlq is True
 
     def test_constructor_overrides(self, test_domain):
@@ -519,11 +681,13 @@ class TestConfiguration:
             handler=SucceedingHandler,
             max_retries=10,
             retry_delay_seconds=5.0,
+            retry_max_delay_seconds=30.0,
             enable_dlq=False,
         )
 
         assert sub.max_retries == 10
         assert sub.retry_delay_seconds == 5.0
+        assert sub.retry_max_delay_seconds == 30.0
         assert sub.enable_dlq is False
 
     def test_dlq_and_backfill_stream_naming(self, test_domain):
@@ -184,6 +184,7 @@ def _make_stream_subscription(test_domain, handler_cls=UserEventHandler, **overr
     )
     # Set a mock broker so ack/nack/publish calls work
     sub.broker = MagicMock()
+    sub.broker.has_capability = MagicMock(return_value=False)
     sub.broker.ack = MagicMock(return_value=True)
     for key, value in overrides.items():
         setattr(sub, key, value)
@@ -234,6 +235,7 @@ class TestStreamSubscriptionMessagesProcessed:
 
         # Mock the broker ack
         sub.broker = MagicMock()
+        sub.broker.has_capability = MagicMock(return_value=False)
         sub.broker.ack = MagicMock(return_value=True)
 
         await sub.process_batch([("msg-1", serialized)], stream="test::user")
@@ -257,6 +259,7 @@ class TestStreamSubscriptionMessagesProcessed:
         serialized = message.to_dict()
 
         sub.broker = MagicMock()
+        sub.broker.has_capability = MagicMock(return_value=False)
         sub.broker.nack = MagicMock(return_value=True)
         sub.retry_delay_seconds = 0
 
@@ -278,6 +281,7 @@ class TestStreamSubscriptionMessagesProcessed:
         sub = _make_stream_subscription(test_domain, UserEventHandler)
 
         sub.broker = MagicMock()
+        sub.broker.has_capability = MagicMock(return_value=False)
         sub.broker.ack = MagicMock(return_value=True)
 
         messages = []
@@ -323,6 +327,7 @@ class TestStreamSubscriptionProcessingDuration:
         serialized = message.to_dict()
 
         sub.broker = MagicMock()
+        sub.broker.has_capability = MagicMock(return_value=False)
         sub.broker.ack = MagicMock(return_value=True)
 
         await sub.process_batch([("msg-1", serialized)], stream="test::user")
@@ -369,6 +374,7 @@ class TestStreamSubscriptionRetries:
         serialized = message.to_dict()
 
         sub.broker = MagicMock()
+        sub.broker.has_capability = MagicMock(return_value=False)
         sub.broker.nack = MagicMock(return_value=True)
 
         await sub.process_batch([("msg-1", serialized)], stream="test::user")
@@ -392,6 +398,7 @@ class TestStreamSubscriptionRetries:
         serialized = message.to_dict()
 
         sub.broker = MagicMock()
+        sub.broker.has_capability = MagicMock(return_value=False)
         sub.broker.nack = MagicMock(return_value=True)
 
         # Process the same message twice (simulating re-delivery)
@@ -438,6 +445,7 @@ class TestStreamSubscriptionDLQRouted:
         serialized = message.to_dict()
 
         sub.broker = MagicMock()
+        sub.broker.has_capability = MagicMock(return_value=False)
         sub.broker.nack = MagicMock(return_value=True)
         sub.broker.ack = MagicMock(return_value=True)
         sub.broker.publish = MagicMock()
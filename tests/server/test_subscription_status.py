@@ -12,6 +12,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from protean.port.checkpoint_store import Checkpoint
 from protean.server.subscription_status import (
     SubscriptionStatus,
     _classify_status,
@@ -193,8 +194,8 @@ class TestCollectEventStoreStatus:
         mock_store = MagicMock()
         mock_domain.event_store.store = mock_store
 
-        # Position stream returns current position
-        mock_store._read_last_message.return_value = {"data": {"position": 5}}
+        # The subscription's checkpoint holds its current position
+        mock_store.read_checkpoint.return_value = Checkpoint("position-x", 5)
         # Head position
         mock_store.stream_head_position.return_value = 10
 
@@ -215,17 +216,16 @@ class TestCollectEventStoreStatus:
     def test_lag_seconds_from_last_updated_and_clock(self):
         """A lagging event-store subscription reports seconds behind the clock."""
         now = datetime(2026, 1, 1, 12, 0, 0, tzinfo=UTC)
-        last_updated = (now - timedelta(seconds=30)).isoformat()
+        last_updated = now - timedelta(seconds=30)
 
         mock_domain = MagicMock()
         mock_domain.clock.now.return_value = now
         mock_store = MagicMock()
         mock_domain.event_store.store = mock_store
 
-        mock_store._read_last_message.return_value = {
-            "data": {"position": 5},
-            "time": last_updated,
-        }
+        mock_store.read_checkpoint.return_value = Checkpoint(
+            "position-x", 5, last_updated
+        )
         mock_store.stream_head_position.return_value = 10
 
         handler_cls = MagicMock()
@@ -246,8 +246,8 @@ class TestCollectEventStoreStatus:
         mock_store = MagicMock()
         mock_domain.event_store.store = mock_store
 
-        # No "time" key, so last_updated is None even though lag is positive.
-        mock_store._read_last_message.return_value = {"data": {"position": 5}}
+        # No write time, so last_updated is None even though lag is positive.
+        mock_store.read_checkpoint.return_value = Checkpoint("position-x", 5)
         mock_store.stream_head_position.return_value = 10
 
         handler_cls = MagicMock()
@@ -267,7 +267,7 @@ class TestCollectEventStoreStatus:
         mock_store = MagicMock()
         mock_domain.event_store.store = mock_store
 
-        mock_store._read_last_message.return_value = {"data": {"position": 10}}
+        mock_store.read_checkpoint.return_value = Checkpoint("position-x", 10)
         mock_store.stream_head_position.return_value = 10
 
         handler_cls = MagicMock()
@@ -289,7 +289,7 @@ class TestCollectEventStoreStatus:
         mock_store = MagicMock()
         mock_domain.event_store.store = mock_store
 
-        mock_store._read_last_message.return_value = None
+        mock_store.read_checkpoint.return_value = None
         mock_store.stream_head_position.return_value = -1
 
         handler_cls = MagicMock()
@@ -307,7 +307,7 @@ class TestCollectEventStoreStatus:
     def test_graceful_degradation_on_error(self):
         """Returns unknown status when event store query fails."""
         mock_domain = MagicMock()
-        mock_domain.event_store.store._read_last_message.side_effect = RuntimeError(
+        mock_domain.event_store.store.read_checkpoint.side_effect = RuntimeError(
             "event store down"
         )
 
@@ -390,6 +390,55 @@ class TestCollectStreamStatus:
         assert result.pending == 2
         assert result.consumer_count == 1
 
+    def test_counts_pending_held_by_idle_consumers(self):
+        """Pending messages of consumers idle past the reclaim threshold."""
+        mock_domain = MagicMock()
+        mock_domain.config = {"server": {"pending_reclaim": {"min_idle_ms": 1000}}}
+        mock_broker = MagicMock()
+        mock_redis = MagicMock()
+
+        mock_domain.brokers.get.return_value = mock_broker
+        mock_broker.redis_instance = mock_redis
+
+        mock_redis.xlen.return_value = 100
+        mock_redis.xinfo_groups.return_value = [
+            {
+                "name": "tests.handlers.OrderHandler",
+                "pending": 7,
+                "last-delivered-id": "1234-0",
+                "lag": 0,
+                "consumers": 3,
+            }
+        ]
+        mock_redis.xinfo_consumers.return_value = [
+            {"name": "live", "pending": 2, "idle": 10},
+            {"name": "crashed", "pending": 4, "idle": 5000},
+            {"name": "gone", "pending": 1, "idle": 1000},
+        ]
+
+        handler_cls = MagicMock()
+        handler_cls.__name__ = "OrderHandler"
+        handler_cls.__module__ = "tests.handlers"
+        handler_cls.__qualname__ = "OrderHandler"
+
+        def _get_field_value(d, key, convert_to_int=False):
+            val = d.get(key)
+            if convert_to_int and val is not None:
+                return int(val)
+            return val
+
+        mock_broker._get_field_value.side_effect = _get_field_value
+
+        result = _collect_stream_status(
+            mock_domain, "order-stream", handler_cls, "order"
+        )
+
+        assert result.pending == 7
+        assert result.idle_pending == 5
+        mock_redis.xinfo_consumers.assert_called_once_with(
+            "order", "tests.handlers.OrderHandler"
+        )
+
     def test_falls_back_to_xrange_when_no_native_lag(self):
         """Falls back to xrange counting when Redis < 7.0."""
         mock_domain = MagicMock()
@@ -500,8 +500,8 @@ class TestPerHandlerBackoff:
                 raise ConnectionError("down")
 
         test_domain.register(H, part_of=User, retries=3, backoff="fixed")
-        test_domain.init(traverse=False)
         test_domain.config["server"]["transient_retry"]["base_delay_seconds"] = 0.25
+        test_domain.init(traverse=False)
 
         with pytest.raises(ConnectionError):
             H._handle(_enrich(test_domain))
@@ -517,8 +517,8 @@ class TestPerHandlerBackoff:
                 raise ConnectionError("down")
 
         test_domain.register(H, part_of=User, retries=3, backoff="linear")
-        test_domain.init(traverse=False)
         test_domain.config["server"]["transient_retry"]["base_delay_seconds"] = 0.1
+        test_domain.init(traverse=False)
 
         with pytest.raises(ConnectionError):
             H._handle(_enrich(test_domain))
@@ -534,8 +534,8 @@ class TestPerHandlerBackoff:
                 raise ConnectionError("down")
 
         test_domain.register(H, part_of=User, retries=3, backoff="exponential")
-        test_domain.init(traverse=False)
         test_domain.config["server"]["transient_retry"]["base_delay_seconds"] = 0.1
+        test_domain.init(traverse=False)
 
         with pytest.raises(ConnectionError):
             H._handle(_enrich(test_domain))
@@ -872,9 +872,9 @@ class TestRetryRespectsDeadline:
                 raise ConnectionError("transient")
 
         test_domain.register(H, part_of=User, retries=3, backoff="fixed")
-        test_domain.init(traverse=False)
         # Huge backoff so the next attempt would start past the 1s deadline.
         test_domain.config["server"]["transient_retry"]["base_delay_seconds"] = 3600
+        test_domain.init(traverse=False)
 
         g.message_in_context = _message_with_deadline(test_domain, near)
         with pytest.raises(ConnectionError):
@@ -363,10 +363,8 @@ class TestRetryDisabled:
                 raise ExpectedVersionError("conflict")
 
         test_domain.register(FailHandler, part_of=User)
-        test_domain.init(traverse=False)
-
-        # Set config AFTER init to avoid any reset
         test_domain.config["server"]["version_retry"]["enabled"] = False
+        test_domain.init(traverse=False)
 
         identifier = _create_user(test_domain)
 
@@ -388,10 +386,8 @@ class TestRetryDisabled:
                 raise ExpectedVersionError("conflict")
 
         test_domain.register(FailHandler, part_of=User)
-        test_domain.init(traverse=False)
-
-        # Set config AFTER init
         test_domain.config["server"]["version_retry"]["max_retries"] = 0
+        test_domain.init(traverse=False)
 
         identifier = _create_user(test_domain)
 
@@ -425,12 +421,10 @@ class TestExponentialBackoff:
                 raise ExpectedVersionError("conflict")
 
         test_domain.register(FailHandler, part_of=User)
-        test_domain.init(traverse=False)
-
-        # Set config AFTER init
         test_domain.config["server"]["version_retry"]["max_retries"] = 4
         test_domain.config["server"]["version_retry"]["base_delay_seconds"] = 0.1
         test_domain.config["server"]["version_retry"]["max_delay_seconds"] = 10.0
+        test_domain.init(traverse=False)
 
         identifier = _create_user(test_domain)
 
@@ -455,12 +449,10 @@ class TestExponentialBackoff:
                 raise ExpectedVersionError("conflict")
 
         test_domain.register(FailHandler, part_of=User)
-        test_domain.init(traverse=False)
-
-        # Set config AFTER init
         test_domain.config["server"]["version_retry"]["max_retries"] = 5
         test_domain.config["server"]["version_retry"]["base_delay_seconds"] = 0.5
         test_domain.config["server"]["version_retry"]["max_delay_seconds"] = 1.0
+        test_domain.init(traverse=False)
 
         identifier = _create_user(test_domain)
 
@@ -678,10 +670,8 @@ class TestEdgeCases:
                 raise ExpectedVersionError("conflict")
 
         test_domain.register(OneRetryHandler, part_of=User)
-        test_domain.init(traverse=False)
-
-        # Set config AFTER init
         test_domain.config["server"]["version_retry"]["max_retries"] = 1
+        test_domain.init(traverse=False)
 
         identifier = _create_user(test_domain)
 
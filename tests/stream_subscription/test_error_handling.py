@@ -161,8 +161,11 @@ async def test_message_deserialization_failure_continues_processing(
         # Initialize with working broker
         await subscription.initialize()
 
-        # Mock the broker ack method to always return True
+        # Mock the broker ack methods to always succeed
         subscription.broker.ack = lambda *args: True
+        subscription.broker.ack_many = lambda stream, identifiers, group: (
+            [True] * len(identifiers)
+        )
 
         # Create a batch with one valid and one invalid message
         messages = [
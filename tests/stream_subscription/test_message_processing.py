@@ -267,13 +267,18 @@ async def test_process_batch_with_mixed_messages(
 
         await subscription.initialize()
 
-        # Mock the broker ack method to always return True
+        # Mock the broker ack methods to always succeed
         original_ack = subscription.broker.ack
+        original_ack_many = subscription.broker.ack_many
 
         def mock_ack(stream, identifier, consumer_group):
             return True
 
+        def mock_ack_many(stream, identifiers, consumer_group):
+            return [True] * len(identifiers)
+
         subscription.broker.ack = mock_ack
+        subscription.broker.ack_many = mock_ack_many
 
         # Create mixed batch
         order_2 = Order(order_id=str(uuid4()), customer_id="cust-2", amount=200)
@@ -289,8 +294,9 @@ async def test_process_batch_with_mixed_messages(
         # Process batch
         result = await subscription.process_batch(messages)
 
-        # Restore original method
+        # Restore original methods
         subscription.broker.ack = original_ack
+        subscription.broker.ack_many = original_ack_many
 
         # Should process 2 valid messages
         assert result == 2
@@ -372,7 +378,7 @@ def test_retry_count_increment(test_domain, engine):
 
 @pytest.mark.redis
 async def test_retry_message_nack_behavior(test_domain, engine):
-    """Test that retry message calls nack on broker."""
+    """Test that retry message hands the delayed nack to the broker."""
     with test_domain.domain_context():
         subscription = StreamSubscription(
             engine=engine,
@@ -383,15 +389,17 @@ async def test_retry_message_nack_behavior(test_domain, engine):
 
         await subscription.initialize()
 
-        # Track nack calls
+        # Track nack calls; Redis holds the message back itself
         nack_calls = []
-        original_nack = subscription.broker.nack
+        original_nack_delayed = subscription.broker.nack_delayed
 
-        def track_nack(stream, identifier, consumer_group):
-            nack_calls.append((stream, identifier, consumer_group))
-            return original_nack(stream, identifier, consumer_group)
+        def track_nack_delayed(stream, identifier, consumer_group, delay_seconds):
+            nack_calls.append((stream, identifier, consumer_group, delay_seconds))
+            return original_nack_delayed(
+                stream, identifier, consumer_group, delay_seconds
+            )
 
-        subscription.broker.nack = track_nack
+        subscription.broker.nack_delayed = track_nack_delayed
 
         # Test retry
         await subscription._retry_message("msg-retry", 1)
@@ -400,6 +408,7 @@ async def test_retry_message_nack_behavior(test_domain, engine):
         assert nack_calls[0][0] == "orders"
         assert nack_calls[0][1] == "msg-retry"
         assert nack_calls[0][2] == subscription.consumer_group
+        assert 0 < nack_calls[0][3] <= 0.001
 
 
 @pytest.mark.redis
@@ -3,7 +3,8 @@
 Finding #13: write_position() and fetch_last_position() must not block the event loop.
 Finding #14: get_next_batch_of_messages() must not block the event loop.
 
-All three methods wrap their synchronous event store calls in asyncio.to_thread().
+Read positions go through the store's async checkpoint methods, and batch reads
+wrap the synchronous event store read in asyncio.to_thread().
 """
 
 import asyncio
@@ -74,15 +75,22 @@ class TestWritePositionAsync:
         assert inspect.iscoroutinefunction(subscription.write_position)
 
     @pytest.mark.asyncio
-    async def test_write_position_uses_to_thread(self, subscription):
-        """write_position() wraps store._write() in asyncio.to_thread()."""
-        with patch("asyncio.to_thread", wraps=asyncio.to_thread) as mock_to_thread:
+    async def test_write_position_writes_the_checkpoint_asynchronously(
+        self, subscription
+    ):
+        """write_position() awaits the store's async checkpoint write."""
+        with patch.object(
+            subscription.store,
+            "awrite_checkpoint",
+            wraps=subscription.store.awrite_checkpoint,
+        ) as awrite_checkpoint:
             await subscription.write_position(5)
 
-        # Verify to_thread was called with store._write
-        mock_to_thread.assert_called_once()
-        args = mock_to_thread.call_args
-        assert args[0][0] == subscription.store._write
+        awrite_checkpoint.assert_awaited_once()
+        assert awrite_checkpoint.call_args[0][:2] == (
+            subscription.subscriber_stream_name,
+            5,
+        )
 
     @pytest.mark.asyncio
     async def test_write_position_resets_counter(self, subscription):
@@ -109,14 +117,18 @@ class TestFetchLastPositionAsync:
         assert inspect.iscoroutinefunction(subscription.fetch_last_position)
 
     @pytest.mark.asyncio
-    async def test_fetch_last_position_uses_to_thread(self, subscription):
-        """fetch_last_position() wraps store._read_last_message() in asyncio.to_thread()."""
-        with patch("asyncio.to_thread", wraps=asyncio.to_thread) as mock_to_thread:
+    async def test_fetch_last_position_reads_the_checkpoint_asynchronously(
+        self, subscription
+    ):
+        """fetch_last_position() awaits the store's async checkpoint read."""
+        with patch.object(
+            subscription.store,
+            "aread_checkpoint",
+            wraps=subscription.store.aread_checkpoint,
+        ) as aread_checkpoint:
             await subscription.fetch_last_position()
 
-        mock_to_thread.assert_called_once()
-        args = mock_to_thread.call_args
-        assert args[0][0] == subscription.store._read_last_message
+        aread_checkpoint.assert_awaited_once_with(subscription.subscriber_stream_name)
 
     @pytest.mark.asyncio
     async def test_fetch_last_position_returns_minus_one_initially(self, subscription):
@@ -115,3 +115,95 @@ def test_loading_the_cli_does_not_pull_optional_stacks():
     """
     pulled = _optional_stacks_pulled_by("from protean.cli import app")
     assert pulled == "", f"loading the CLI pulled optional stacks: {pulled}"
+
+
+# Heavy internal modules that only the domain, the engine, or the IR tooling need.
+# `import protean` and the CLI's `--help` path must reach none of them eagerly.
+HEAVY_INTERNAL_MODULES = [
+    "protean.domain",
+    "protean.server.engine",
+    "protean.ir.builder",
+]
+
+
+def _internal_modules_pulled_by(import_stmt: str) -> str:
+    """Return the heavy internal modules `import_stmt` pulls, checked in a subprocess."""
+    code = (
+        f"import sys; {import_stmt};"
+        f"watched={HEAVY_INTERNAL_MODULES!r};"
+        "print(','.join(m for m in watched if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return result.stdout.strip()
+
+
+def test_import_protean_resolves_the_public_api_lazily():
+    """``import protean`` defers the domain, engine and IR builder to first use."""
+    pulled = _internal_modules_pulled_by("import protean")
+    assert pulled == "", f"import protean eagerly pulled: {pulled}"
+
+
+def test_loading_the_cli_does_not_pull_the_domain_or_engine():
+    """``protean --help`` only needs the command table, not a domain or engine."""
+    pulled = _internal_modules_pulled_by("from protean.cli import app")
+    assert pulled == "", f"loading the CLI eagerly pulled: {pulled}"
+
+
+def test_every_public_name_resolves():
+    for name in protean.__all__:
+        assert getattr(protean, name) is not None, name
+    assert "Domain" in dir(protean)
+
+
+def test_unknown_attribute_raises_attribute_error():
+    with pytest.raises(AttributeError, match="no attribute 'NotAThing'"):
+        protean.NotAThing
+
+
+# Cumulative import-time budgets, in microseconds, as reported by
+# ``python -X importtime``. Measured at well under a third of these on a
+# developer laptop; the headroom absorbs slow CI runners while still catching
+# an eager import of the domain, engine or an optional stack (each of which
+# alone costs more than the whole ``import protean`` budget).
+IMPORT_PROTEAN_BUDGET_US = 100_000
+CLI_HELP_BUDGET_US = 3_000_000
+
+
+def _cumulative_import_us(args: list[str], module: str) -> int:
+    """Run ``python -X importtime <args>`` and return *module*'s cumulative time."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    for line in result.stderr.splitlines():
+        # "import time:   self [us] | cumulative | imported package"
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.split("|")
+        if name.strip() == module and cumulative.strip().isdigit():
+            return int(cumulative)
+    raise AssertionError(f"{module} not found in -X importtime output")
+
+
+def test_import_protean_stays_within_budget():
+    cost = _cumulative_import_us(["-c", "import protean"], "protean")
+    assert cost < IMPORT_PROTEAN_BUDGET_US, (
+        f"import protean took {cost / 1000:.1f}ms "
+        f"(budget {IMPORT_PROTEAN_BUDGET_US / 1000:.0f}ms)"
+    )
+
+
+def test_protean_help_stays_within_budget():
+    """``protean --help`` (via ``python -m protean``) renders within the budget."""
+    cost = _cumulative_import_us(["-m", "protean", "--help"], "protean.cli")
+    assert cost < CLI_HELP_BUDGET_US, (
+        f"protean --help spent {cost / 1000:.1f}ms importing "
+        f"(budget {CLI_HELP_BUDGET_US / 1000:.0f}ms)"
+    )
@@ -0,0 +1,229 @@
+"""Tests for the push wakeup hub and the Postgres ``NOTIFY`` listener."""
+
+import asyncio
+import socket
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from protean.utils.wakeup import PgNotifyListener, Wakeups
+
+# ---------------------------------------------------------------------------
+# Wakeups
+# ---------------------------------------------------------------------------
+
+
+class TestWakeups:
+    @pytest.mark.asyncio
+    async def test_notify_wakes_consumers_of_the_topic(self):
+        hub = Wakeups()
+        orders = hub.subscribe(["order"])
+        customers = hub.subscribe(["customer"])
+        everything = hub.subscribe()
+
+        hub.notify("order")
+
+        assert await orders.wait(1) is True
+        assert await everything.wait(1) is True
+        assert await customers.wait(0.01) is False
+
+    @pytest.mark.asyncio
+    async def test_a_wakeup_while_busy_is_kept(self):
+        hub = Wakeups()
+        waiter = hub.subscribe(["order"])
+        hub.notify("order")
+        hub.notify("order")
+
+        assert await waiter.wait(1) is True
+        # Both notifications are served by the one read that follows
+        assert await waiter.wait(0.01) is False
+
+    @pytest.mark.asyncio
+    async def test_zero_timeout_only_yields(self):
+        hub = Wakeups()
+        waiter = hub.subscribe()
+
+        assert await waiter.wait(0) is False
+        hub.notify("order")
+        assert await waiter.wait(0) is True
+        assert await waiter.wait(0) is False
+
+    @pytest.mark.asyncio
+    async def test_notify_from_another_thread(self):
+        hub = Wakeups()
+        waiter = hub.subscribe(["order"])
+
+        threading.Thread(target=hub.notify, args=("order",)).start()
+
+        assert await waiter.wait(1) is True
+
+    @pytest.mark.asyncio
+    async def test_notify_all_wakes_every_topic(self):
+        hub = Wakeups()
+        waiter = hub.subscribe(["order"])
+
+        hub.notify_all()
+
+        assert await waiter.wait(1) is True
+
+    @pytest.mark.asyncio
+    async def test_close_releases_a_waiting_consumer_and_leaves_the_hub(self):
+        hub = Wakeups()
+        waiter = hub.subscribe(["order"])
+        waiting = asyncio.create_task(waiter.wait(30))
+        await asyncio.sleep(0)
+
+        waiter.close()
+
+        assert await asyncio.wait_for(waiting, 1) is True
+        assert hub._waiters == set()
+
+    @pytest.mark.asyncio
+    async def test_live_is_read_from_the_hub(self):
+        hub = Wakeups()
+        waiter = hub.subscribe()
+        assert waiter.live is False
+
+        hub.live = True
+
+        assert waiter.live is True
+
+    def test_notify_after_the_loop_closed_is_ignored(self):
+        hub = Wakeups()
+
+        async def subscribe():
+            return hub.subscribe()
+
+        asyncio.run(subscribe())
+
+        hub.notify("order")  # Does not raise
+
+
+# ---------------------------------------------------------------------------
+# PgNotifyListener
+# ---------------------------------------------------------------------------
+
+
+class FakeConnection:
+    """The slice of a psycopg2 connection the listener uses.
+
+    A socket pair stands in for the server socket: ``push`` queues a
+    notification and makes the socket readable, ``drop`` makes the next
+    ``poll`` fail as it does when the server goes away.
+    """
+
+    def __init__(self):
+        self._server, self._client = socket.socketpair()
+        self.notifies = []
+        self.autocommit = False
+        self.executed = []
+        self.broken = False
+        self.closed = False
+
+    def fileno(self):
+        return self._client.fileno()
+
+    def cursor(self):
+        connection = self
+
+        class Cursor:
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                return False
+
+            def execute(self, sql):
+                connection.executed.append(sql)
+
+        return Cursor()
+
+    def poll(self):
+        self._client.recv(1024)
+        if self.broken:
+            raise OSError("server closed the connection unexpectedly")
+
+    def push(self, payload):
+        self.notifies.append(SimpleNamespace(channel="events", payload=payload))
+        self._server.send(b"!")
+
+    def drop(self):
+        self.broken = True
+        self._server.send(b"!")
+
+    def close(self):
+        self.closed = True
+        self._client.close()
+        self._server.close()
+
+
+async def _until(condition, timeout=2.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        assert asyncio.get_running_loop().time() < deadline, "timed out"
+        await asyncio.sleep(0.01)
+
+
+class TestPgNotifyListener:
+    def test_channel_must_be_an_identifier(self):
+        with pytest.raises(ValueError, match="channel name"):
+            PgNotifyListener(FakeConnection, "events; DROP TABLE x", Wakeups())
+
+    @pytest.mark.asyncio
+    async def test_delivers_payloads_as_topics(self):
+        connection = FakeConnection()
+        hub = Wakeups()
+        listener = PgNotifyListener(lambda: connection, "events", hub)
+        waiter = hub.subscribe(["order"])
+
+        listener.start(asyncio.get_running_loop())
+        await _until(lambda: hub.live)
+        await waiter.wait(0)  # Clear the wakeup sent on connecting
+        connection.push("order")
+
+        assert await waiter.wait(1) is True
+        assert connection.autocommit is True
+        assert connection.executed == ['LISTEN "events"']
+        await listener.stop()
+        assert connection.closed
+
+    @pytest.mark.asyncio
+    async def test_reconnects_and_wakes_everyone_when_the_connection_drops(self):
+        connections = [FakeConnection(), FakeConnection()]
+        opened = iter(connections)
+        hub = Wakeups()
+        listener = PgNotifyListener(lambda: next(opened), "events", hub)
+        waiter = hub.subscribe(["order"])
+
+        listener.start(asyncio.get_running_loop())
+        await _until(lambda: hub.live)
+        await waiter.wait(0)
+        connections[0].drop()
+        await _until(lambda: connections[0].closed)
+
+        await _until(lambda: hub.live)
+        # Writes made while disconnected are only seen by polling: wake them
+        assert await waiter.wait(1) is True
+        await listener.stop()
+        assert hub.live is False
+
+    @pytest.mark.asyncio
+    async def test_retries_a_failed_connect(self, monkeypatch):
+        monkeypatch.setattr(PgNotifyListener, "MAX_BACKOFF_SECONDS", 0)
+        attempts = []
+
+        def connect():
+            attempts.append(1)
+            if len(attempts) < 3:
+                raise OSError("connection refused")
+            return FakeConnection()
+
+        hub = Wakeups()
+        listener = PgNotifyListener(connect, "events", hub)
+
+        listener.start(asyncio.get_running_loop())
+        await _until(lambda: hub.live)
+
+        assert len(attempts) == 3
+        await listener.stop()
@@ -0,0 +1,143 @@
+"""Value object equality and hashing.
+
+Equality compares field values directly; the hash is computed once per
+instance and covers nested value objects, lists and dicts.
+"""
+
+import copy
+import pickle
+import time
+
+import pytest
+
+from protean.core.value_object import BaseValueObject
+from protean.fields import Dict, Integer, List, String, ValueObject
+
+
+class Money(BaseValueObject):
+    currency: String(max_length=3)
+    amount: Integer()
+
+
+class Price(BaseValueObject):
+    label: String(max_length=50)
+    money = ValueObject(Money)
+
+
+class Basket(BaseValueObject):
+    prices: List(content_type=ValueObject(Money))
+    tags: List(content_type=String)
+    attributes: Dict()
+
+
+@pytest.fixture(autouse=True)
+def register_elements(test_domain):
+    test_domain.register(Money)
+    test_domain.register(Price)
+    test_domain.register(Basket)
+    test_domain.init(traverse=False)
+
+
+def _basket(amount=10):
+    return Basket(
+        prices=[Money(currency="USD", amount=amount)],
+        tags=["fresh", "local"],
+        attributes={"aisle": 4, "sizes": ["s", "m"]},
+    )
+
+
+class TestEquality:
+    def test_equal_field_values_are_equal(self):
+        assert Money(currency="USD", amount=10) == Money(currency="USD", amount=10)
+        assert Money(currency="USD", amount=10) != Money(currency="USD", amount=11)
+
+    def test_nested_value_objects_compare_by_value(self):
+        first = Price(label="Tea", money=Money(currency="USD", amount=10))
+        second = Price(label="Tea", money=Money(currency="USD", amount=10))
+
+        assert first == second
+        assert first != Price(label="Tea", money=Money(currency="EUR", amount=10))
+
+    def test_different_hashes_are_unequal(self):
+        first = Money(currency="USD", amount=10)
+        second = Money(currency="USD", amount=11)
+        hash(first), hash(second)
+
+        assert first != second
+
+
+class TestHashing:
+    def test_nested_value_objects_are_hashable(self):
+        first = Price(label="Tea", money=Money(currency="USD", amount=10))
+        second = Price(label="Tea", money=Money(currency="USD", amount=10))
+
+        assert hash(first) == hash(second)
+        assert len({first, second}) == 1
+
+    def test_list_and_dict_fields_are_hashable(self):
+        assert hash(_basket()) == hash(_basket())
+        assert _basket() in {_basket(): "found"}
+        assert _basket(amount=11) not in {_basket()}
+
+    def test_the_hash_is_computed_once(self, mocker):
+        money = Money(currency="USD", amount=10)
+        first = hash(money)
+        spy = mocker.patch(
+            "protean.core.value_object._hashable", side_effect=AssertionError
+        )
+
+        assert hash(money) == first
+        spy.assert_not_called()
+
+    def test_the_cached_hash_is_not_pickled(self):
+        money = Money(currency="USD", amount=10)
+        hash(money)
+
+        restored = pickle.loads(pickle.dumps(money))
+
+        assert "_hash" not in restored.__dict__
+        assert restored == money
+        assert hash(restored) == hash(money)
+
+    def test_a_copy_with_updates_rehashes(self):
+        money = Money(currency="USD", amount=10)
+        hash(money)
+
+        updated = money.model_copy(update={"amount": 11})
+
+        assert hash(updated) == hash(Money(currency="USD", amount=11))
+        assert hash(copy.copy(money)) == hash(money)
+
+
+@pytest.mark.slow
+class TestHashingBenchmark:
+    """Set and dict membership on value object keys, against hashing and
+    comparing through ``to_dict()`` as value objects used to."""
+
+    KEYS = 1_000
+    LOOKUPS = 20
+
+    @staticmethod
+    def _to_dict_hash(vo):
+        return hash(frozenset(vo.to_dict().items()))
+
+    def test_membership_is_faster_than_to_dict_hashing(self):
+        keys = [Money(currency="USD", amount=n) for n in range(self.KEYS)]
+        lookups = [Money(currency="USD", amount=n) for n in range(self.KEYS)]
+        members = set(keys)
+        by_dict = {self._to_dict_hash(vo): vo.to_dict() for vo in keys}
+
+        start = time.perf_counter()
+        for _ in range(self.LOOKUPS):
+            for vo in lookups:
+                assert by_dict[self._to_dict_hash(vo)] == vo.to_dict()
+        to_dict_rate = self.KEYS * self.LOOKUPS / (time.perf_counter() - start)
+
+        start = time.perf_counter()
+        for _ in range(self.LOOKUPS):
+            for vo in lookups:
+                assert vo in members
+        cached_rate = self.KEYS * self.LOOKUPS / (time.perf_counter() - start)
+        print(f"\nlookups: {to_dict_rate:,.0f}/s to_dict, {cached_rate:,.0f}/s cached")
+
+        assert cached_rate > to_dict_rate